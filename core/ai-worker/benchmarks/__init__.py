@@ -0,0 +1,4 @@
+"""
+AgentOS AI Worker - Benchmarks
+Week 7 Implementation: Offline Provider for Deterministic Benchmarks
+"""
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - OpenAI-compatible Stub Backend
+Week 7 Implementation: Offline Provider for Deterministic Benchmarks
+
+This module provides a localhost server that implements the OpenAI chat
+completions, completions, embeddings and models endpoints. Latency is drawn
+from a configurable, seeded distribution; responses can be streamed token by
+token; server errors and 429 rate limits can be injected at fixed rates.
+
+Point any wrapper at it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1.
+
+Usage:
+    python -m benchmarks.openai_stub --port 8089 --latency-ms 200 --rate-limit-rate 0.05
+"""
+
+import json
+import math
+import time
+import uuid
+import random
+import asyncio
+import hashlib
+import logging
+import argparse
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LatencyConfig:
+    """Latency distribution for stub responses (seconds)"""
+    distribution: str = "fixed"  # 'fixed', 'uniform', 'normal', 'lognormal'
+    mean: float = 0.05
+    stddev: float = 0.01
+    minimum: float = 0.0
+    maximum: float = 30.0
+    per_token: float = 0.0  # delay between streamed tokens
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency value"""
+        if self.distribution == "fixed":
+            value = self.mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.stddev, self.mean + self.stddev)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.stddev)
+        elif self.distribution == "lognormal":
+            # Parameterised by the mean/stddev of the resulting distribution
+            variance = self.stddev ** 2
+            mu = math.log(self.mean ** 2 / math.sqrt(variance + self.mean ** 2)) if self.mean > 0 else 0.0
+            sigma = math.sqrt(math.log(1 + variance / self.mean ** 2)) if self.mean > 0 else 0.0
+            value = rng.lognormvariate(mu, sigma)
+        else:
+            raise ValueError(f"Unknown latency distribution '{self.distribution}'")
+        return min(self.maximum, max(self.minimum, value))
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the OpenAI stub"""
+    latency: LatencyConfig = field(default_factory=LatencyConfig)
+    error_rate: float = 0.0          # fraction of requests answered with 500
+    rate_limit_rate: float = 0.0     # fraction of requests answered with 429
+    retry_after: float = 0.1         # retry-after seconds sent with 429s
+    response_text: Optional[str] = None  # fixed completion text (default: echo)
+    completion_tokens: int = 32      # length of generated text when echoing
+    seed: int = 42
+
+
+@dataclass
+class StubStatistics:
+    """Counters kept by the stub"""
+    requests: int = 0
+    completed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    streamed: int = 0
+    server_time: float = 0.0  # total injected latency for completed requests
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "completed": self.completed,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "streamed": self.streamed,
+            "server_time": self.server_time,
+            "average_server_latency": self.server_time / self.completed if self.completed else 0.0
+        }
+
+
+def _count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+class OpenAIStubServer:
+    """
+    Localhost OpenAI-compatible stub.
+
+    Use as an async context manager; `base_url` is ready to hand to an
+    OpenAI client or to export as OPENAI_BASE_URL.
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self.host = host
+        self.port = port
+        self.stats = StubStatistics()
+        self._rng = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def create_app(self) -> web.Application:
+        """Build the aiohttp application"""
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._chat_completions)
+        app.router.add_post("/v1/completions", self._completions)
+        app.router.add_post("/v1/embeddings", self._embeddings)
+        app.router.add_get("/v1/models", self._models)
+        app.router.add_get("/stub/stats", self._stats)
+        return app
+
+    async def start(self) -> str:
+        """Start serving; returns the base URL"""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]
+        logger.info(f"OpenAI stub listening on {self.base_url}")
+        return self.base_url
+
+    async def stop(self):
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "OpenAIStubServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def reset_statistics(self):
+        self.stats = StubStatistics()
+
+    # Request handling
+
+    def _injected_failure(self) -> Optional[web.Response]:
+        """Return an error response if this request should fail"""
+        roll = self._rng.random()
+        if roll < self.config.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return web.json_response(
+                {"error": {"message": "Rate limit reached (stub)", "type": "requests", "code": "rate_limit_exceeded"}},
+                status=429,
+                headers={"retry-after": str(self.config.retry_after)}
+            )
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            self.stats.errors += 1
+            return web.json_response(
+                {"error": {"message": "Internal server error (stub)", "type": "server_error"}},
+                status=500
+            )
+        return None
+
+    def _generate_text(self, prompt: str, max_tokens: Optional[int]) -> str:
+        if self.config.response_text is not None:
+            return self.config.response_text
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        words = f"Stub response {digest} to: {prompt}".split()
+        limit = min(self.config.completion_tokens, max_tokens or self.config.completion_tokens)
+        return " ".join(words[:max(1, limit)])
+
+    async def _begin(self, request: web.Request):
+        self.stats.requests += 1
+        body = await request.json()
+        failure = self._injected_failure()
+        delay = self.config.latency.sample(self._rng)
+        await asyncio.sleep(delay)
+        return body, failure, delay
+
+    async def _chat_completions(self, request: web.Request) -> web.StreamResponse:
+        body, failure, delay = await self._begin(request)
+        if failure is not None:
+            return failure
+
+        messages: List[Dict[str, Any]] = body.get("messages") or []
+        prompt = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+        text = self._generate_text(prompt, body.get("max_tokens"))
+        model = body.get("model", "gpt-3.5-turbo")
+        prompt_tokens = sum(_count_tokens(m.get("content") or "") for m in messages)
+
+        if body.get("stream"):
+            return await self._stream(request, model, text, chat=True, delay=delay)
+
+        self._record(delay)
+        return web.json_response({
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": _count_tokens(text),
+                "total_tokens": prompt_tokens + _count_tokens(text)
+            }
+        })
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        body, failure, delay = await self._begin(request)
+        if failure is not None:
+            return failure
+
+        prompts = body.get("prompt") or ""
+        if isinstance(prompts, str):
+            prompts = [prompts]
+        model = body.get("model", "gpt-3.5-turbo-instruct")
+        texts = [self._generate_text(p, body.get("max_tokens")) for p in prompts]
+
+        if body.get("stream"):
+            return await self._stream(request, model, texts[0], chat=False, delay=delay)
+
+        self._record(delay)
+        prompt_tokens = sum(_count_tokens(p) for p in prompts)
+        completion_tokens = sum(_count_tokens(t) for t in texts)
+        return web.json_response({
+            "id": f"cmpl-{uuid.uuid4().hex[:24]}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {"index": i, "text": text, "logprobs": None, "finish_reason": "stop"}
+                for i, text in enumerate(texts)
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    async def _stream(self, request: web.Request, model: str, text: str,
+                      chat: bool, delay: float) -> web.StreamResponse:
+        """Send text as server-sent events, one token per chunk"""
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+
+        completion_id = f"{'chatcmpl' if chat else 'cmpl'}-{uuid.uuid4().hex[:24]}"
+        tokens = text.split(" ")
+        for index, token in enumerate(tokens):
+            piece = token if index == 0 else f" {token}"
+            if chat:
+                delta = {"content": piece} if index else {"role": "assistant", "content": piece}
+                chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+            else:
+                chunk = {"id": completion_id, "object": "text_completion", "created": int(time.time()),
+                         "model": model, "choices": [{"index": 0, "text": piece, "logprobs": None, "finish_reason": None}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            if self.config.latency.per_token > 0:
+                await asyncio.sleep(self.config.latency.per_token)
+                delay += self.config.latency.per_token
+
+        final_choice = ({"index": 0, "delta": {}, "finish_reason": "stop"} if chat
+                        else {"index": 0, "text": "", "logprobs": None, "finish_reason": "stop"})
+        final = {"id": completion_id, "object": "chat.completion.chunk" if chat else "text_completion",
+                 "created": int(time.time()), "model": model, "choices": [final_choice]}
+        await response.write(f"data: {json.dumps(final)}\n\n".encode("utf-8"))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+
+        self.stats.streamed += 1
+        self._record(delay)
+        return response
+
+    async def _embeddings(self, request: web.Request) -> web.Response:
+        body, failure, delay = await self._begin(request)
+        if failure is not None:
+            return failure
+
+        inputs = body.get("input") or ""
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = int(body.get("dimensions") or 64)
+        data = []
+        for index, text in enumerate(inputs):
+            # Deterministic pseudo-embedding seeded by the text
+            rng = random.Random(hashlib.sha256(str(text).encode("utf-8")).digest())
+            data.append({"object": "embedding", "index": index,
+                         "embedding": [rng.uniform(-1, 1) for _ in range(dimensions)]})
+
+        self._record(delay)
+        tokens = sum(_count_tokens(str(t)) for t in inputs)
+        return web.json_response({
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "text-embedding-ada-002"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens}
+        })
+
+    async def _models(self, request: web.Request) -> web.Response:
+        models = ["gpt-3.5-turbo", "gpt-4", "gpt-3.5-turbo-instruct", "text-embedding-ada-002"]
+        return web.json_response({
+            "object": "list",
+            "data": [{"id": m, "object": "model", "created": 0, "owned_by": "agentos-stub"} for m in models]
+        })
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats.to_dict())
+
+    def _record(self, delay: float):
+        self.stats.completed += 1
+        self.stats.server_time += delay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mean latency")
+    parser.add_argument("--latency-stddev-ms", type=float, default=10.0)
+    parser.add_argument("--distribution", default="fixed", choices=["fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--per-token-ms", type=float, default=0.0, help="delay between streamed tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=LatencyConfig(
+            distribution=args.distribution,
+            mean=args.latency_ms / 1000.0,
+            stddev=args.latency_stddev_ms / 1000.0,
+            per_token=args.per_token_ms / 1000.0
+        ),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    server = OpenAIStubServer(config, host=args.host, port=args.port)
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(server.create_app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
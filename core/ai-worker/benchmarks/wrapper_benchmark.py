@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Framework Wrapper Benchmark
+Week 7 Implementation: Offline Provider for Deterministic Benchmarks
+
+This module drives every registered framework wrapper against the local
+OpenAI stub so latency, throughput and framework overhead can be measured
+without network access or API spend. Stub-side latency is subtracted from
+the client-observed latency to isolate the wrapper's own cost.
+
+Usage:
+    python -m benchmarks.wrapper_benchmark --tasks 50 --concurrency 8 --latency-ms 100
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
+
+# Add the ai-worker directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.openai_stub import OpenAIStubServer, StubConfig, LatencyConfig
+from frameworks import FRAMEWORK_REGISTRY
+from frameworks.base_wrapper import AgentConfig, TaskRequest
+from frameworks.llm_client import close_llm_clients
+from frameworks.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Module-level flags gating initialize() in wrappers whose OpenAI-backed
+# execution path does not need the framework package itself
+_OPENAI_FALLBACK_FLAGS = {
+    "autogen": ("frameworks.autogen_wrapper", "AUTOGEN_AVAILABLE"),
+    "crewai": ("frameworks.crewai_wrapper", "CREWAI_AVAILABLE"),
+}
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark run parameters"""
+    tasks: int = 20
+    concurrency: int = 4
+    warmup: int = 2
+    task_template: str = "Summarize benchmark item {index}"
+    frameworks: Optional[List[str]] = None  # default: every registered framework
+    allow_openai_fallback: bool = True
+
+
+@dataclass
+class FrameworkBenchmarkResult:
+    """Measurements for one framework"""
+    framework: str
+    status: str = "completed"  # 'completed', 'unavailable', 'failed'
+    reason: Optional[str] = None
+    tasks: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    wall_time: float = 0.0
+    throughput: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_max: float = 0.0
+    server_latency_avg: float = 0.0
+    overhead_avg: float = 0.0  # client latency minus stub latency, per task
+    stub: Dict[str, Any] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class WrapperBenchmark:
+    """Runs the benchmark for each framework against a shared stub"""
+
+    def __init__(self, server: OpenAIStubServer, config: Optional[BenchmarkConfig] = None):
+        self.server = server
+        self.config = config or BenchmarkConfig()
+
+    async def _create_wrapper(self, framework: str):
+        entry = FRAMEWORK_REGISTRY.get(framework) or {}
+        wrapper_class = entry.get("wrapper")
+        if wrapper_class is None:
+            raise RuntimeError(f"{framework} wrapper not importable")
+
+        wrapper = wrapper_class(AgentConfig(
+            name=f"bench_{framework}",
+            description=f"Benchmark agent for {framework}",
+            capabilities=["text_processing"]
+        ))
+
+        flag = _OPENAI_FALLBACK_FLAGS.get(framework) if self.config.allow_openai_fallback else None
+        if flag is None:
+            await wrapper.initialize()
+            return wrapper
+
+        module = sys.modules[flag[0]]
+        original = getattr(module, flag[1])
+        setattr(module, flag[1], True)
+        try:
+            await wrapper.initialize()
+        finally:
+            setattr(module, flag[1], original)
+        return wrapper
+
+    async def run_framework(self, framework: str) -> FrameworkBenchmarkResult:
+        """Benchmark one framework"""
+        result = FrameworkBenchmarkResult(framework=framework)
+        try:
+            wrapper = await self._create_wrapper(framework)
+        except Exception as e:
+            result.status = "unavailable"
+            result.reason = str(e)
+            return result
+
+        try:
+            for index in range(self.config.warmup):
+                await wrapper.execute(TaskRequest(task=self.config.task_template.format(index=f"warmup-{index}")))
+
+            self.server.reset_statistics()
+            semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+            latencies: List[float] = []
+
+            async def run_one(index: int):
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await wrapper.execute(TaskRequest(task=self.config.task_template.format(index=index)))
+                    latencies.append(time.perf_counter() - start)
+                    if response.status == "completed":
+                        result.succeeded += 1
+                    else:
+                        result.failed += 1
+                        if len(result.errors) < 5:
+                            result.errors.append(response.error_message or "unknown error")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(run_one(i) for i in range(self.config.tasks)))
+            result.wall_time = time.perf_counter() - start
+        except Exception as e:
+            result.status = "failed"
+            result.reason = str(e)
+            return result
+        finally:
+            try:
+                await wrapper.cleanup()
+            except Exception as e:
+                logger.warning(f"Cleanup failed for {framework}: {e}")
+
+        stub = self.server.stats.to_dict()
+        result.tasks = self.config.tasks
+        result.throughput = self.config.tasks / result.wall_time if result.wall_time > 0 else 0.0
+        result.latency_p50 = percentile(latencies, 0.50)
+        result.latency_p95 = percentile(latencies, 0.95)
+        result.latency_max = max(latencies) if latencies else 0.0
+        result.server_latency_avg = stub["average_server_latency"]
+        if stub["completed"]:
+            # Spread the stub time over tasks; a task may issue several calls
+            calls_per_task = stub["completed"] / self.config.tasks
+            result.overhead_avg = statistics.mean(latencies) - result.server_latency_avg * calls_per_task
+        result.stub = stub
+        if result.succeeded == 0:
+            result.status = "failed"
+        return result
+
+    async def run(self) -> Dict[str, Any]:
+        """Benchmark every selected framework"""
+        frameworks = self.config.frameworks or list(FRAMEWORK_REGISTRY.keys())
+        results = []
+        for framework in frameworks:
+            logger.info(f"Benchmarking {framework}")
+            results.append(await self.run_framework(framework))
+
+        return {
+            "config": asdict(self.config),
+            "stub": {
+                "base_url": self.server.base_url,
+                "latency": asdict(self.server.config.latency),
+                "error_rate": self.server.config.error_rate,
+                "rate_limit_rate": self.server.config.rate_limit_rate
+            },
+            "rate_limiter": get_rate_limiter().get_statistics(),
+            "frameworks": {r.framework: asdict(r) for r in results}
+        }
+
+
+async def run_benchmark(stub_config: Optional[StubConfig] = None,
+                        config: Optional[BenchmarkConfig] = None) -> Dict[str, Any]:
+    """Start a stub, point the OpenAI clients at it and benchmark the wrappers"""
+    previous = {name: os.environ.get(name) for name in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    async with OpenAIStubServer(stub_config) as server:
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ["OPENAI_API_KEY"] = "sk-benchmark-stub"
+        try:
+            return await WrapperBenchmark(server, config).run()
+        finally:
+            await close_llm_clients()
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a summary table"""
+    print(f"{'framework':<12}{'status':<13}{'ok/fail':<10}{'p50 ms':>9}{'p95 ms':>9}{'tasks/s':>9}{'overhead ms':>13}")
+    for name, r in report["frameworks"].items():
+        if r["status"] == "unavailable":
+            print(f"{name:<12}{'unavailable':<13}{r['reason']}")
+            continue
+        print(
+            f"{name:<12}{r['status']:<13}{r['succeeded']}/{r['failed']:<8}"
+            f"{r['latency_p50'] * 1000:>9.1f}{r['latency_p95'] * 1000:>9.1f}"
+            f"{r['throughput']:>9.1f}{r['overhead_avg'] * 1000:>13.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark framework wrappers against the OpenAI stub")
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--frameworks", nargs="*", help="subset of frameworks to run")
+    parser.add_argument("--no-openai-fallback", action="store_true",
+                        help="skip wrappers whose framework package is not installed")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-stddev-ms", type=float, default=10.0)
+    parser.add_argument("--distribution", default="fixed", choices=["fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report to this path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    stub_config = StubConfig(
+        latency=LatencyConfig(
+            distribution=args.distribution,
+            mean=args.latency_ms / 1000.0,
+            stddev=args.latency_stddev_ms / 1000.0
+        ),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed
+    )
+    config = BenchmarkConfig(
+        tasks=args.tasks,
+        concurrency=args.concurrency,
+        warmup=args.warmup,
+        frameworks=args.frameworks,
+        allow_openai_fallback=not args.no_openai_fallback
+    )
+
+    report = asyncio.run(run_benchmark(stub_config, config))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Persistent Agent Registry
+Week 7 Implementation: Warm Restarts without Re-creating Agents
+
+This module provides a dict-compatible agent registry that writes a compact
+snapshot (agent config plus conversation state) per agent to local disk or
+Redis. On startup only the index of agent ids is loaded; each agent is
+re-hydrated from its snapshot the first time it is accessed, so a restart
+does not re-initialize every agent at once.
+"""
+
+import os
+import json
+import logging
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from urllib.parse import quote, unquote
+
+from .executor import run_in_shared_executor
+from .state_persistence import atomic_write_bytes, encode_state, load_state
+
+logger = logging.getLogger(__name__)
+
+
+class RegistryUnavailableError(Exception):
+    """Raised when a persisted agent's snapshot cannot be read right now (retryable)"""
+
+
+@dataclass
+class RegistryConfig:
+    """Configuration for agent registry persistence"""
+    backend: str = "none"  # 'none', 'file', 'redis'
+    directory: str = "agent_registry"
+    redis_url: str = "redis://localhost:6379/0"
+    key: str = "agentos:agent_registry"
+
+    @classmethod
+    def from_env(cls, prefix: str = "AGENTOS_REGISTRY") -> "RegistryConfig":
+        """Build configuration from <prefix>_* environment variables"""
+        return cls(
+            backend=os.getenv(f"{prefix}_BACKEND", "none").lower(),
+            directory=os.getenv(f"{prefix}_DIR", "agent_registry"),
+            redis_url=os.getenv(f"{prefix}_REDIS_URL", "redis://localhost:6379/0"),
+            key=os.getenv(f"{prefix}_KEY", "agentos:agent_registry")
+        )
+
+
+class FileSnapshotStore:
+    """One JSON snapshot file per agent in a directory"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, agent_id: str) -> str:
+        return os.path.join(self.directory, f"{quote(agent_id, safe='')}.json")
+
+    def list_ids(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [
+            unquote(name[:-len(".json")])
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and not name.startswith(".tmp-")
+        ]
+
+    def load(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        return load_state(self._path(agent_id))
+
+    def save(self, agent_id: str, snapshot: Dict[str, Any]):
+        atomic_write_bytes(self._path(agent_id), encode_state(snapshot))
+
+    def delete(self, agent_id: str):
+        try:
+            os.unlink(self._path(agent_id))
+        except FileNotFoundError:
+            pass
+
+
+class RedisSnapshotStore:
+    """All agent snapshots as fields of one Redis hash"""
+
+    def __init__(self, redis_url: str, key: str, client: Any = None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(redis_url, decode_responses=True)
+        self.client = client
+        self.key = key
+
+    def list_ids(self) -> List[str]:
+        return list(self.client.hkeys(self.key))
+
+    def load(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        data = self.client.hget(self.key, agent_id)
+        return json.loads(data) if data else None
+
+    def save(self, agent_id: str, snapshot: Dict[str, Any]):
+        self.client.hset(self.key, agent_id, encode_state(snapshot).decode("utf-8"))
+
+    def delete(self, agent_id: str):
+        self.client.hdel(self.key, agent_id)
+
+
+class PersistentAgentRegistry(MutableMapping):
+    """
+    Agent registry with lazy restore.
+
+    Behaves like the plain dict it replaces. Live wrappers are kept in
+    memory; ids known only from the store are restored through `factory`
+    (snapshot -> wrapper) on first access. Wrappers provide `to_snapshot()`;
+    call `save(agent_id)` after state changes and `flush()` on shutdown.
+    """
+
+    def __init__(self, factory: Callable[[Dict[str, Any]], Any], store: Any = None):
+        self.factory = factory
+        self.store = store
+        self._live: Dict[str, Any] = {}
+        self._persisted: Set[str] = set()
+        self._saving: Set[str] = set()
+        self._resave: Set[str] = set()
+
+        self.restored = 0
+        self.snapshots_written = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def load_index(self) -> int:
+        """Load the ids of persisted agents (snapshots are read lazily)"""
+        if self.store is None:
+            return 0
+        try:
+            ids = self.store.list_ids()
+        except Exception as e:
+            logger.warning(f"Failed to load agent registry index: {e}")
+            return 0
+        self._persisted = {agent_id for agent_id in ids if agent_id not in self._live}
+        logger.info(f"Agent registry index loaded with {len(self._persisted)} persisted agents")
+        return len(self._persisted)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._live or agent_id in self._persisted
+
+    def __getitem__(self, agent_id: str) -> Any:
+        if agent_id in self._live:
+            return self._live[agent_id]
+        if agent_id not in self._persisted:
+            raise KeyError(agent_id)
+        return self._restore(agent_id)
+
+    def __setitem__(self, agent_id: str, wrapper: Any):
+        self._live[agent_id] = wrapper
+        self._persisted.discard(agent_id)
+
+    def __delitem__(self, agent_id: str):
+        if agent_id not in self:
+            raise KeyError(agent_id)
+        self._live.pop(agent_id, None)
+        self._persisted.discard(agent_id)
+        if self.store is not None:
+            self._delete_snapshot(agent_id)
+
+    async def get_agent(self, agent_id: str) -> Any:
+        """Like registry[agent_id], but reads a persisted snapshot off the event loop"""
+        if agent_id in self._live:
+            return self._live[agent_id]
+        if agent_id not in self._persisted:
+            raise KeyError(agent_id)
+        snapshot = await run_in_shared_executor(self._load, agent_id)
+        if agent_id in self._live:
+            # Restored by a concurrent lookup while this one was loading
+            return self._live[agent_id]
+        return self._hydrate(agent_id, snapshot)
+
+    async def remove(self, agent_id: str) -> bool:
+        """Like del registry[agent_id], with the store delete off the event loop"""
+        if agent_id not in self:
+            return False
+        self._live.pop(agent_id, None)
+        self._persisted.discard(agent_id)
+        if self.store is not None:
+            await run_in_shared_executor(self._delete_snapshot, agent_id)
+        return True
+
+    def _delete_snapshot(self, agent_id: str):
+        try:
+            self.store.delete(agent_id)
+        except Exception as e:
+            logger.warning(f"Failed to delete snapshot for agent {agent_id}: {e}")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._live)
+        yield from [agent_id for agent_id in self._persisted if agent_id not in self._live]
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._persisted)
+
+    def clear(self):
+        """Remove every agent, including persisted snapshots"""
+        for agent_id in list(self):
+            del self[agent_id]
+
+    def _restore(self, agent_id: str) -> Any:
+        return self._hydrate(agent_id, self._load(agent_id))
+
+    def _load(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Read a snapshot; a store error keeps the id so the lookup can be retried"""
+        try:
+            return self.store.load(agent_id)
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Failed to load snapshot for agent {agent_id}: {e}")
+            raise RegistryUnavailableError(f"Snapshot for agent {agent_id} is unavailable: {e}") from e
+
+    def _hydrate(self, agent_id: str, snapshot: Optional[Dict[str, Any]]) -> Any:
+        if snapshot is None:
+            # The snapshot is really gone (expired or deleted elsewhere)
+            self._persisted.discard(agent_id)
+            raise KeyError(agent_id)
+
+        wrapper = self.factory(snapshot)
+        self._live[agent_id] = wrapper
+        self._persisted.discard(agent_id)
+        self.restored += 1
+        logger.info(f"Restored agent {agent_id} from snapshot")
+        return wrapper
+
+    def _write(self, agent_id: str, snapshot: Dict[str, Any]):
+        try:
+            self.store.save(agent_id, snapshot)
+            self.snapshots_written += 1
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Failed to persist agent {agent_id}: {e}")
+
+    async def save(self, agent_id: str) -> bool:
+        """
+        Snapshot a live agent and write it off the event loop.
+
+        The snapshot is taken on the loop, under the wrapper's run_lock when
+        it has one (runs mutate its state on executor threads); saves
+        requested while one is in flight for the same agent are coalesced
+        into a single follow-up write.
+        """
+        if self.store is None or agent_id not in self._live:
+            return False
+        if agent_id in self._saving:
+            self._resave.add(agent_id)
+            self.coalesced += 1
+            return False
+
+        self._saving.add(agent_id)
+        try:
+            while True:
+                self._resave.discard(agent_id)
+                wrapper = self._live.get(agent_id)
+                if wrapper is None:
+                    return False
+                await run_in_shared_executor(self._write, agent_id, await self._snapshot(wrapper))
+                if agent_id not in self._resave:
+                    return True
+        finally:
+            self._saving.discard(agent_id)
+
+    @staticmethod
+    async def _snapshot(wrapper: Any) -> Dict[str, Any]:
+        lock = getattr(wrapper, "run_lock", None)
+        if lock is None:
+            return wrapper.to_snapshot()
+        async with lock:
+            return wrapper.to_snapshot()
+
+    async def flush(self):
+        """Write snapshots of every live agent (off the event loop)"""
+        if self.store is None:
+            return
+        for agent_id, wrapper in list(self._live.items()):
+            try:
+                snapshot = await self._snapshot(wrapper)
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Failed to snapshot agent {agent_id}: {e}")
+                continue
+            await run_in_shared_executor(self._write, agent_id, snapshot)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        return {
+            "backend": type(self.store).__name__ if self.store is not None else None,
+            "live_agents": len(self._live),
+            "pending_restore": len(self._persisted),
+            "restored": self.restored,
+            "snapshots_written": self.snapshots_written,
+            "coalesced": self.coalesced,
+            "failures": self.failures
+        }
+
+
+def create_snapshot_store(config: RegistryConfig) -> Any:
+    """Create the snapshot store for a configuration (None when disabled)"""
+    if config.backend == "file":
+        return FileSnapshotStore(config.directory)
+    if config.backend == "redis":
+        return RedisSnapshotStore(config.redis_url, config.key)
+    if config.backend not in ("", "none"):
+        logger.warning(f"Unknown agent registry backend '{config.backend}', persistence disabled")
+    return None
+
+
+def create_agent_registry(factory: Callable[[Dict[str, Any]], Any],
+                          config: Optional[RegistryConfig] = None) -> PersistentAgentRegistry:
+    """Create an agent registry and load the index of persisted agents"""
+    config = config or RegistryConfig.from_env()
+    try:
+        store = create_snapshot_store(config)
+    except Exception as e:
+        logger.warning(f"Agent registry persistence unavailable: {e}")
+        store = None
+
+    registry = PersistentAgentRegistry(factory, store)
+    registry.load_index()
+    return registry
@@ -18,6 +18,10 @@ from .base_wrapper import (
     BaseFrameworkWrapper, FrameworkType, AgentConfig,
     TaskRequest, TaskResponse, InitializationError, ExecutionError
 )
+from .llm_client import get_async_openai_client
+from .rate_limiter import get_rate_limiter
+from .conversation_history import TokenBudgetedHistory
+from .tool_sandbox import calculate as sandboxed_calculate, format_text_analysis
 
 # AutoGen imports with fallback
 try:
@@ -61,7 +65,7 @@ class AutoGenAgentWrapper(BaseFrameworkWrapper):
         self.group_chat_manager = None
         self.code_executor = None
         self.llm_config = None
-        self.conversation_history = []
+        self.conversation_history = TokenBudgetedHistory(model=agent_config.model)
 
     def _get_framework_type(self) -> FrameworkType:
         """Return AutoGen framework type"""
@@ -171,14 +175,18 @@ Always strive to complete tasks effectively and provide value to the user."""
         """Convert AgentOS capability to AutoGen tool function"""
         tool_map = {
             "web_search": lambda query: f"AutoGen web search results for: {query}",
-            "calculations": lambda expr: f"AutoGen calculation result: {eval(expr, {'__builtins__': {}}, {})}",
-            "text_processing": lambda text: f"AutoGen text analysis: {len(text)} characters, {len(text.split())} words",
+            "calculations": lambda expr: f"AutoGen calculation result: {sandboxed_calculate(expr)}",
+            "text_processing": lambda text: format_text_analysis("AutoGen", text),
             "file_operations": lambda op, path="": f"AutoGen file operation: {op} on {path}",
             "api_calls": lambda url, method="GET": f"AutoGen API call: {method} {url}",
             "code_generation": lambda task: f"AutoGen code generation for: {task}"
         }
         return tool_map.get(capability)
 
+    def _resolve_tool(self, name: str) -> Optional[callable]:
+        """AutoGen tool functions are registered by capability name"""
+        return getattr(self, '_tool_functions', {}).get(name)
+
     def _register_tool_function(self, capability: str, tool_function: callable):
         """Register tool function with AutoGen agent"""
         if not hasattr(self, '_tool_functions'):
@@ -190,26 +198,65 @@ Always strive to complete tasks effectively and provide value to the user."""
         if not self.is_initialized:
             await self.initialize()
 
+        return await self._execute_task(task_request)
+
+    async def execute_many(self, task_requests: List[TaskRequest],
+                           concurrency: int = 4) -> List[TaskResponse]:
+        """
+        Execute a batch of tasks against one conversation snapshot.
+
+        History is packed once for the whole batch instead of per task, and
+        every task sees the conversation as it was before the batch; the
+        batch's turns are then recorded in request order.
+        """
+        if not task_requests:
+            return []
+        if not self.is_initialized:
+            await self.initialize()
+
+        history = self.conversation_history.to_messages()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(task_request: TaskRequest) -> TaskResponse:
+            async with semaphore:
+                return await self._execute_task(task_request, history=history)
+
+        responses = list(await asyncio.gather(*(run_one(r) for r in task_requests)))
+        for task_request, response in zip(task_requests, responses):
+            if response.status == "completed":
+                self.conversation_history.append(
+                    task_request.task,
+                    response.result,
+                    task_type=response.metadata["autogen_mode"]
+                )
+        return responses
+
+    async def _execute_task(self, task_request: TaskRequest,
+                            history: Optional[List[Dict[str, str]]] = None) -> TaskResponse:
+        """Execute one task; with a batch history snapshot the turn is recorded by the caller"""
         task_id = str(uuid.uuid4())
         start_time = time.time()
 
         try:
+            # Run planned tool calls concurrently before the model sees the task
+            task, tool_metadata = await self._apply_tool_calls(task_request)
+
             # Determine if this is a conversational or code generation task
             is_code_task = self._is_code_generation_task(task_request.task)
 
             # Real AutoGen-style execution with OpenAI integration
             if is_code_task:
-                result = await self._execute_code_generation_task(task_request.task)
+                result = await self._execute_code_generation_task(task)
             else:
-                result = await self._execute_conversation_task(task_request.task)
+                result = await self._execute_conversation_task(task, history=history)
 
             # Add to conversation history
-            self.conversation_history.append({
-                "task": task_request.task,
-                "result": result,
-                "timestamp": time.time(),
-                "task_type": "code_generation" if is_code_task else "conversation"
-            })
+            if history is None:
+                self.conversation_history.append(
+                    task_request.task,
+                    result,
+                    task_type="code_generation" if is_code_task else "conversation"
+                )
 
             execution_time = time.time() - start_time
 
@@ -221,8 +268,9 @@ Always strive to complete tasks effectively and provide value to the user."""
                 metadata={
                     "autogen_mode": "code_generation" if is_code_task else "conversation",
                     "assistant_name": self.assistant_agent["name"],
-                    "conversation_rounds": len(self.conversation_history),
-                    "tools_available": list(getattr(self, '_tool_functions', {}).keys())
+                    "conversation_rounds": self.conversation_history.total_turns,
+                    "tools_available": list(getattr(self, '_tool_functions', {}).keys()),
+                    **tool_metadata
                 }
             )
 
@@ -256,7 +304,7 @@ Always strive to complete tasks effectively and provide value to the user."""
             if self.group_chat:
                 self.group_chat["messages"] = []
 
-            self.conversation_history = []
+            self.conversation_history.clear()
             self.is_initialized = False
             logger.info(f"AutoGen agent {self.agent_id} cleaned up successfully")
             return True
@@ -268,27 +316,28 @@ Always strive to complete tasks effectively and provide value to the user."""
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get AutoGen-specific memory usage"""
         conversation_length = len(self.conversation_history)
+        history_stats = self.conversation_history.get_statistics()
 
         return {
             "working_memory": conversation_length,
-            "episodic_memory": 0,
+            "episodic_memory": history_stats["evicted_turns"],
             "semantic_memory": 0,
             "conversation_history": conversation_length,
+            "history_tokens": history_stats["history_tokens"],
+            "summary_tokens": history_stats["summary_tokens"],
             "tools_registered": len(getattr(self, '_tool_functions', {}))
         }
 
     async def _execute_code_generation_task(self, task: str) -> str:
         """Execute code generation task using OpenAI API"""
         try:
-            import openai
-
             # Check for API key
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 return "Error: OpenAI API key not configured"
 
-            # Create OpenAI client
-            client = openai.OpenAI(api_key=api_key)
+            # Shared pooled client
+            client = get_async_openai_client(api_key)
 
             # Create system message for code generation
             system_message = f"""You are an expert programmer and code generator.
@@ -303,14 +352,22 @@ Generate clean, well-commented, production-ready code. Include:
 
 Respond with the complete code solution."""
 
-            # Make API call
-            response = client.chat.completions.create(
-                model=self.llm_config.get("model", "gpt-3.5-turbo"),
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": task}
-                ],
-                temperature=self.llm_config.get("temperature", 0.1),
+            model = self.llm_config.get("model", "gpt-3.5-turbo")
+            messages = [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": task}
+            ]
+
+            # Make API call through the shared rate limiter
+            response = await get_rate_limiter().execute(
+                model,
+                lambda: client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=self.llm_config.get("temperature", 0.1),
+                    max_tokens=2000
+                ),
+                messages=messages,
                 max_tokens=2000
             )
 
@@ -320,37 +377,40 @@ Respond with the complete code solution."""
         except Exception as e:
             return f"Code generation error: {str(e)}"
 
-    async def _execute_conversation_task(self, task: str) -> str:
+    async def _execute_conversation_task(self, task: str,
+                                         history: Optional[List[Dict[str, str]]] = None) -> str:
         """Execute conversation task using OpenAI API"""
         try:
-            import openai
-
             # Check for API key
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 return "Error: OpenAI API key not configured"
 
-            # Create OpenAI client
-            client = openai.OpenAI(api_key=api_key)
+            # Shared pooled client
+            client = get_async_openai_client(api_key)
 
             # Build conversation context
             messages = [
                 {"role": "system", "content": self.assistant_agent["system_message"]}
             ]
 
-            # Add recent conversation history
-            for conv in self.conversation_history[-5:]:  # Last 5 conversations
-                messages.append({"role": "user", "content": conv["task"]})
-                messages.append({"role": "assistant", "content": conv["result"]})
+            # Add recent conversation history packed to the token budget
+            messages.extend(history if history is not None else self.conversation_history.to_messages())
 
             # Add current task
             messages.append({"role": "user", "content": task})
 
-            # Make API call
-            response = client.chat.completions.create(
-                model=self.llm_config.get("model", "gpt-3.5-turbo"),
+            # Make API call through the shared rate limiter
+            model = self.llm_config.get("model", "gpt-3.5-turbo")
+            response = await get_rate_limiter().execute(
+                model,
+                lambda: client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=self.llm_config.get("temperature", 0.7),
+                    max_tokens=1500
+                ),
                 messages=messages,
-                temperature=self.llm_config.get("temperature", 0.7),
                 max_tokens=1500
             )
 
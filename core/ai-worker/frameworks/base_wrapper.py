@@ -11,10 +11,14 @@ import uuid
 import time
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from pydantic import BaseModel, field_validator
 from enum import Enum
 
+from .tool_executor import (
+    ParallelToolExecutor, ToolCall, ToolCallResult, ToolExecutorConfig, format_tool_results
+)
+
 class FrameworkType(str, Enum):
     """Supported AI frameworks"""
     LANGCHAIN = "langchain"
@@ -123,12 +127,89 @@ class BaseFrameworkWrapper(ABC):
         """
         pass
 
+    async def execute_many(self, task_requests: List[TaskRequest],
+                           concurrency: int = 4) -> List[TaskResponse]:
+        """
+        Execute a batch of tasks on this agent.
+
+        The agent is initialized once for the whole batch and up to
+        `concurrency` tasks run at a time; responses are returned in request
+        order. Wrappers override this for framework-native batching.
+        """
+        if not task_requests:
+            return []
+        if not self.is_initialized:
+            await self.initialize()
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(task_request: TaskRequest) -> TaskResponse:
+            async with semaphore:
+                return await self._execute_in_batch(task_request)
+
+        return list(await asyncio.gather(*(run_one(r) for r in task_requests)))
+
+    async def _execute_in_batch(self, task_request: TaskRequest) -> TaskResponse:
+        """Run one batch item, turning an escaped exception into a failed response"""
+        start_time = time.time()
+        try:
+            return await self.execute(task_request)
+        except Exception as e:
+            return self._create_task_response(
+                task_id=str(uuid.uuid4()),
+                result=None,
+                status="failed",
+                execution_time=time.time() - start_time,
+                error_message=str(e),
+                metadata={"error_type": type(e).__name__}
+            )
+
     # Common utility methods
     async def _capability_to_tool(self, capability: str) -> Optional[Any]:
         """Convert AgentOS capability to framework-specific tool"""
         # Base implementation - override in specific wrappers
         return None
 
+    def _resolve_tool(self, name: str) -> Optional[Callable[..., Any]]:
+        """Find a tool callable by name - override for framework-specific tool shapes"""
+        for tool in self.tools:
+            if isinstance(tool, dict):
+                if tool.get("name") == name:
+                    return tool.get("function")
+            elif getattr(tool, "name", None) == name:
+                return getattr(tool, "func", None)
+        return None
+
+    async def execute_tools(self, calls: List[Union[ToolCall, Dict[str, Any]]]) -> List[ToolCallResult]:
+        """Run a batch of tool calls, independent ones concurrently, results in order"""
+        executor = getattr(self, "_tool_executor", None)
+        if executor is None:
+            executor = self._tool_executor = ParallelToolExecutor(self._resolve_tool, ToolExecutorConfig())
+        return await executor.run([
+            call if isinstance(call, ToolCall) else ToolCall.from_dict(call)
+            for call in calls
+        ])
+
+    async def _apply_tool_calls(self, task_request: TaskRequest) -> Tuple[str, Dict[str, Any]]:
+        """Run planned context["tool_calls"] and append their results to the task"""
+        calls = (task_request.context or {}).get("tool_calls")
+        if not calls:
+            return task_request.task, {}
+
+        results = await self.execute_tools(calls)
+        task = f"{task_request.task}\n\nTool results:\n{format_tool_results(results)}"
+        return task, {
+            "tool_calls": [
+                {
+                    "name": r.name,
+                    "status": r.status,
+                    "execution_time": r.execution_time,
+                    "error": r.error
+                }
+                for r in results
+            ]
+        }
+
     def _create_task_response(self, task_id: str, result: Any, status: str,
                             execution_time: float, error_message: str = None,
                             metadata: Dict[str, Any] = None) -> TaskResponse:
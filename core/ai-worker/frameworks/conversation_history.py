@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Token-budgeted Conversation History
+Week 7 Implementation: Bounded Conversation Memory for Agent Wrappers
+
+This module provides a conversation history that stores per-turn token
+counts, replays only the most recent turns that fit a token budget and
+compacts evicted turns into a bounded rolling summary.
+"""
+
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .token_counter import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HistoryConfig:
+    """Limits for a token-budgeted conversation history"""
+    token_budget: int = 2000          # history tokens replayed per request
+    max_turns: int = 20               # turns kept verbatim
+    max_turn_tokens: int = 800        # cap on stored tokens per task/result
+    summary_token_limit: int = 400    # cap on the rolling summary
+    summary_line_tokens: int = 60     # tokens kept per compacted turn
+
+
+@dataclass
+class ConversationTurn:
+    """A single task/result exchange with cached token counts"""
+    task: str
+    result: str
+    timestamp: float = field(default_factory=time.time)
+    task_type: str = "conversation"
+    task_tokens: int = 0
+    result_tokens: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.task_tokens + self.result_tokens
+
+
+class TokenBudgetedHistory:
+    """
+    Bounded conversation history.
+
+    At most max_turns turns are kept verbatim (each truncated to
+    max_turn_tokens); older turns are folded into an extractive summary
+    capped at summary_token_limit, so memory stays bounded however long
+    the conversation runs.
+    """
+
+    def __init__(self, config: Optional[HistoryConfig] = None, model: str = "gpt-3.5-turbo"):
+        self.config = config or HistoryConfig()
+        self.model = model
+        self.turns: Deque[ConversationTurn] = deque()
+        self.summary_lines: Deque[Tuple[str, int]] = deque()
+        self.summary_tokens = 0
+        self.total_tokens = 0
+        self.total_turns = 0
+        self.evicted_turns = 0
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def _bounded(self, text: str) -> Tuple[str, int]:
+        text = text or ""
+        tokens = count_tokens(text, self.model)
+        if tokens > self.config.max_turn_tokens:
+            text = truncate_to_tokens(text, self.config.max_turn_tokens, self.model)
+            tokens = count_tokens(text, self.model)
+        return text, tokens
+
+    def append(self, task: str, result: str, task_type: str = "conversation",
+               timestamp: Optional[float] = None) -> ConversationTurn:
+        """Record a turn, compacting the oldest turns if over max_turns"""
+        task, task_tokens = self._bounded(task)
+        result, result_tokens = self._bounded(result)
+        turn = ConversationTurn(
+            task=task,
+            result=result,
+            timestamp=timestamp if timestamp is not None else time.time(),
+            task_type=task_type,
+            task_tokens=task_tokens,
+            result_tokens=result_tokens
+        )
+        self.turns.append(turn)
+        self.total_tokens += turn.tokens
+        self.total_turns += 1
+
+        while len(self.turns) > self.config.max_turns:
+            self._compact(self.turns.popleft())
+        return turn
+
+    def _compact(self, turn: ConversationTurn):
+        """Fold an evicted turn into the rolling summary"""
+        self.total_tokens -= turn.tokens
+        self.evicted_turns += 1
+
+        task = " ".join(turn.task.split())
+        result = " ".join(turn.result.split())
+        half = max(1, self.config.summary_line_tokens // 2)
+        line = (f"- User: {truncate_to_tokens(task, half, self.model)} | "
+                f"Assistant: {truncate_to_tokens(result, half, self.model)}")
+        line_tokens = count_tokens(line, self.model)
+
+        self.summary_lines.append((line, line_tokens))
+        self.summary_tokens += line_tokens
+        # Drop the oldest summary lines once the summary is over budget
+        while self.summary_tokens > self.config.summary_token_limit and self.summary_lines:
+            _, dropped = self.summary_lines.popleft()
+            self.summary_tokens -= dropped
+
+    @property
+    def summary(self) -> str:
+        return "\n".join(line for line, _ in self.summary_lines)
+
+    def to_messages(self, token_budget: Optional[int] = None) -> List[Dict[str, str]]:
+        """Build chat messages for the most recent turns that fit the budget"""
+        budget = self.config.token_budget if token_budget is None else token_budget
+
+        # Most recent turns take priority over the summary
+        packed: List[ConversationTurn] = []
+        for turn in reversed(self.turns):
+            if turn.tokens > budget:
+                break
+            budget -= turn.tokens
+            packed.append(turn)
+
+        messages: List[Dict[str, str]] = []
+        if self.summary_lines and self.summary_tokens <= budget:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of earlier conversation:\n{self.summary}"
+            })
+        for turn in reversed(packed):
+            messages.append({"role": "user", "content": turn.task})
+            messages.append({"role": "assistant", "content": turn.result})
+        return messages
+
+    def clear(self):
+        """Forget all turns and the summary"""
+        self.turns.clear()
+        self.summary_lines.clear()
+        self.summary_tokens = 0
+        self.total_tokens = 0
+        self.total_turns = 0
+        self.evicted_turns = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize turns, summary and counters to plain data"""
+        return {
+            "config": asdict(self.config),
+            "model": self.model,
+            "turns": [asdict(turn) for turn in self.turns],
+            "summary_lines": [list(entry) for entry in self.summary_lines],
+            "total_turns": self.total_turns,
+            "evicted_turns": self.evicted_turns
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TokenBudgetedHistory":
+        """Rebuild a history from to_dict() output without recounting tokens"""
+        history = cls(HistoryConfig(**data.get("config", {})), model=data.get("model", "gpt-3.5-turbo"))
+        for turn_data in data.get("turns", []):
+            turn = ConversationTurn(**turn_data)
+            history.turns.append(turn)
+            history.total_tokens += turn.tokens
+        for line, tokens in data.get("summary_lines", []):
+            history.summary_lines.append((line, tokens))
+            history.summary_tokens += tokens
+        history.total_turns = data.get("total_turns", len(history.turns))
+        history.evicted_turns = data.get("evicted_turns", 0)
+        return history
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get history size statistics"""
+        return {
+            "turns": len(self.turns),
+            "total_turns": self.total_turns,
+            "evicted_turns": self.evicted_turns,
+            "history_tokens": self.total_tokens,
+            "summary_tokens": self.summary_tokens,
+            "token_budget": self.config.token_budget
+        }
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Crew Task DAG Scheduler
+Week 7 Implementation: Dependency-aware Concurrent Crew Execution
+
+This module provides a scheduler for crew tasks with declared
+dependencies. Independent branches run concurrently, each task receives
+the outputs of the tasks it depends on, and the run reports the critical
+path so multi-step workflows take the length of their longest chain
+rather than the sum of every step.
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CrewTaskSpec:
+    """A crew task node with its dependencies"""
+    task_id: str
+    description: str
+    depends_on: List[str] = field(default_factory=list)
+    expected_output: str = "A comprehensive response to the given task"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], index: int = 0) -> "CrewTaskSpec":
+        """Build a spec from a request payload entry"""
+        depends_on = data.get("depends_on") or data.get("dependencies") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        return cls(
+            task_id=str(data.get("id") or data.get("task_id") or f"task_{index + 1}"),
+            description=data["description"],
+            depends_on=[str(dep) for dep in depends_on],
+            expected_output=data.get("expected_output") or cls.expected_output
+        )
+
+
+@dataclass
+class CrewTaskResult:
+    """Outcome of one crew task"""
+    task_id: str
+    output: Any = None
+    status: str = "completed"  # 'completed', 'failed', 'skipped'
+    error: Optional[str] = None
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.finished_at - self.started_at)
+
+
+@dataclass
+class DAGExecutionResult:
+    """Outcome of a full DAG run"""
+    results: Dict[str, CrewTaskResult]
+    topological_order: List[str]
+    critical_path: List[str]
+    critical_path_time: float
+    total_task_time: float
+    wall_time: float
+    sink_ids: List[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return all(r.status == "completed" for r in self.results.values())
+
+    def sink_outputs(self) -> Dict[str, Any]:
+        """Outputs of tasks that no other task depends on"""
+        return {
+            task_id: self.results[task_id].output
+            for task_id in self.sink_ids
+            if self.results[task_id].status == "completed"
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Timing summary for response metadata"""
+        return {
+            "task_count": len(self.results),
+            "completed_tasks": sum(1 for r in self.results.values() if r.status == "completed"),
+            "failed_tasks": sum(1 for r in self.results.values() if r.status == "failed"),
+            "skipped_tasks": sum(1 for r in self.results.values() if r.status == "skipped"),
+            "critical_path": self.critical_path,
+            "critical_path_time": self.critical_path_time,
+            "total_task_time": self.total_task_time,
+            "wall_time": self.wall_time,
+            # >1 means branches overlapped
+            "parallel_speedup": (self.total_task_time / self.wall_time) if self.wall_time > 0 else 1.0,
+            "tasks": {
+                task_id: {
+                    "status": r.status,
+                    "duration": r.duration,
+                    "error": r.error
+                }
+                for task_id, r in self.results.items()
+            }
+        }
+
+
+TaskRunner = Callable[[CrewTaskSpec, Dict[str, Any]], Awaitable[Any]]
+
+
+def topological_order(specs: List[CrewTaskSpec]) -> List[str]:
+    """Validate the graph and return a topological order (Kahn's algorithm)"""
+    by_id: Dict[str, CrewTaskSpec] = {}
+    for spec in specs:
+        if spec.task_id in by_id:
+            raise ValueError(f"Duplicate crew task id '{spec.task_id}'")
+        by_id[spec.task_id] = spec
+
+    indegree = {task_id: 0 for task_id in by_id}
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+    for spec in specs:
+        for dep in spec.depends_on:
+            if dep not in by_id:
+                raise ValueError(f"Crew task '{spec.task_id}' depends on unknown task '{dep}'")
+            indegree[spec.task_id] += 1
+            dependents[dep].append(spec.task_id)
+
+    ready = [spec.task_id for spec in specs if indegree[spec.task_id] == 0]
+    order: List[str] = []
+    while ready:
+        task_id = ready.pop(0)
+        order.append(task_id)
+        for dependent in dependents[task_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(specs):
+        cyclic = sorted(task_id for task_id, degree in indegree.items() if degree > 0)
+        raise ValueError(f"Crew task dependencies contain a cycle involving: {cyclic}")
+    return order
+
+
+class CrewDAGScheduler:
+    """
+    Dependency-aware crew task scheduler.
+
+    Tasks start as soon as all their dependencies complete (bounded by
+    max_concurrency). The runner receives the task spec and a mapping of
+    dependency id -> output. If a task fails, the tasks downstream of it
+    are skipped.
+    """
+
+    def __init__(self, runner: TaskRunner, max_concurrency: int = 4):
+        self.runner = runner
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def run(self, specs: List[CrewTaskSpec]) -> DAGExecutionResult:
+        """Execute all tasks respecting dependencies"""
+        order = topological_order(specs)
+        by_id = {spec.task_id: spec for spec in specs}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+        remaining = {spec.task_id: len(spec.depends_on) for spec in specs}
+        for spec in specs:
+            for dep in spec.depends_on:
+                dependents[dep].append(spec.task_id)
+
+        results: Dict[str, CrewTaskResult] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        running: Dict[asyncio.Task, str] = {}
+        start_time = time.time()
+
+        async def run_task(spec: CrewTaskSpec) -> CrewTaskResult:
+            async with semaphore:
+                upstream = {dep: results[dep].output for dep in spec.depends_on}
+                started = time.time()
+                try:
+                    output = await self.runner(spec, upstream)
+                    return CrewTaskResult(spec.task_id, output, started_at=started, finished_at=time.time())
+                except Exception as e:
+                    logger.warning(f"Crew task '{spec.task_id}' failed: {e}")
+                    return CrewTaskResult(
+                        spec.task_id, status="failed", error=str(e),
+                        started_at=started, finished_at=time.time()
+                    )
+
+        def skip_downstream(task_id: str):
+            for dependent in dependents[task_id]:
+                if dependent not in results:
+                    results[dependent] = CrewTaskResult(
+                        dependent, status="skipped",
+                        error=f"Dependency '{task_id}' did not complete"
+                    )
+                    skip_downstream(dependent)
+
+        def launch(task_id: str):
+            running[asyncio.ensure_future(run_task(by_id[task_id]))] = task_id
+
+        for task_id in order:
+            if remaining[task_id] == 0:
+                launch(task_id)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    result = future.result()
+                    results[task_id] = result
+                    if result.status != "completed":
+                        skip_downstream(task_id)
+                        continue
+                    for dependent in dependents[task_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0 and dependent not in results:
+                            launch(dependent)
+        finally:
+            for future in running:
+                future.cancel()
+
+        wall_time = time.time() - start_time
+        critical_path, critical_time = self._critical_path(order, by_id, results)
+
+        return DAGExecutionResult(
+            results={task_id: results[task_id] for task_id in order},
+            topological_order=order,
+            critical_path=critical_path,
+            critical_path_time=critical_time,
+            total_task_time=sum(r.duration for r in results.values()),
+            wall_time=wall_time,
+            sink_ids=[task_id for task_id in order if not dependents[task_id]]
+        )
+
+    @staticmethod
+    def _critical_path(order: List[str], by_id: Dict[str, CrewTaskSpec],
+                       results: Dict[str, CrewTaskResult]):
+        """Longest dependency chain by measured task duration"""
+        path_time: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for task_id in order:
+            best_dep, best_time = None, 0.0
+            for dep in by_id[task_id].depends_on:
+                if path_time[dep] > best_time:
+                    best_dep, best_time = dep, path_time[dep]
+            path_time[task_id] = best_time + results[task_id].duration
+            previous[task_id] = best_dep
+
+        if not path_time:
+            return [], 0.0
+        end = max(path_time, key=path_time.get)
+        path = []
+        node: Optional[str] = end
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return list(reversed(path)), path_time[end]
@@ -18,6 +18,11 @@ from .base_wrapper import (
     BaseFrameworkWrapper, FrameworkType, AgentConfig,
     TaskRequest, TaskResponse, InitializationError, ExecutionError
 )
+from .llm_client import get_async_openai_client
+from .rate_limiter import get_rate_limiter
+from .executor import run_in_shared_executor
+from .crew_dag import CrewTaskSpec, CrewDAGScheduler
+from .tool_sandbox import calculate as sandboxed_calculate, format_text_analysis
 
 # CrewAI imports with fallback
 try:
@@ -56,6 +61,8 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
     def __init__(self, agent_config: AgentConfig):
         super().__init__(agent_config)
         self.crewai_agent = None
+        # Agents not leased to a running graph node (CrewAI agents are stateful)
+        self._idle_node_agents: List[Any] = []
         self.crew = None
         self.tasks = []
         self.role = self._determine_role()
@@ -122,14 +129,7 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
                 from crewai import Agent, Task, Crew
 
                 # Create real CrewAI agent
-                self.crewai_agent = Agent(
-                    role=self.role,
-                    goal=self.goal,
-                    backstory=self.backstory,
-                    verbose=True,
-                    allow_delegation=False,
-                    tools=[]
-                )
+                self.crewai_agent = self._create_crewai_agent(verbose=True)
 
                 # Create real CrewAI crew
                 self.crew = Crew(
@@ -199,12 +199,12 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
             "calculations": {
                 "name": "calculator",
                 "description": "Perform mathematical calculations using CrewAI",
-                "function": lambda expr: f"CrewAI calculation result: {eval(expr, {'__builtins__': {}}, {})}"
+                "function": lambda expr: f"CrewAI calculation result: {sandboxed_calculate(expr)}"
             },
             "text_processing": {
                 "name": "text_processor",
                 "description": "Process and analyze text using CrewAI",
-                "function": lambda text: f"CrewAI text analysis: {len(text)} characters, {len(text.split())} words"
+                "function": lambda text: format_text_analysis("CrewAI", text)
             },
             "file_operations": {
                 "name": "file_operations",
@@ -228,11 +228,18 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
         start_time = time.time()
 
         try:
+            context = task_request.context or {}
+            if context.get("crew_tasks"):
+                return await self._execute_task_graph(task_id, task_request, start_time)
+
+            # Run planned tool calls concurrently before the crew sees the task
+            task, tool_metadata = await self._apply_tool_calls(task_request)
+
             # Real CrewAI execution with fallback
             if self.use_real_crewai:
-                result = await self._execute_with_real_crewai(task_request.task)
+                result = await self._execute_with_real_crewai(task)
             else:
-                result = await self._execute_with_openai_alternative(task_request.task)
+                result = await self._execute_with_openai_alternative(task)
 
             execution_time = time.time() - start_time
 
@@ -245,7 +252,8 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
                     "crewai_role": self.role,
                     "crewai_goal": self.goal,
                     "tools_used": [tool["name"] for tool in self.tools],
-                    "process_type": "sequential"
+                    "process_type": "sequential",
+                    **tool_metadata
                 }
             )
 
@@ -262,11 +270,99 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
                 metadata={"error_type": type(e).__name__}
             )
 
+    async def _execute_task_graph(self, task_id: str, task_request: TaskRequest,
+                                  start_time: float) -> TaskResponse:
+        """Execute context["crew_tasks"] as a dependency graph"""
+        context = task_request.context or {}
+        specs = [
+            CrewTaskSpec.from_dict(entry, index)
+            for index, entry in enumerate(context["crew_tasks"])
+        ]
+        scheduler = CrewDAGScheduler(
+            self._run_graph_task,
+            max_concurrency=int(context.get("max_concurrency", 4))
+        )
+
+        timeout = task_request.timeout or self.agent_config.timeout
+        dag_result = await self._execute_with_timeout(scheduler.run(specs), timeout)
+        self.tasks = [spec.task_id for spec in specs]
+
+        outputs = dag_result.sink_outputs()
+        if len(outputs) == 1:
+            result = next(iter(outputs.values()))
+        else:
+            result = "\n\n".join(f"[{sink}]\n{output}" for sink, output in outputs.items())
+
+        errors = [
+            f"{r.task_id}: {r.error}" for r in dag_result.results.values()
+            if r.status == "failed"
+        ]
+        return self._create_task_response(
+            task_id=task_id,
+            result=result if outputs else None,
+            status="completed" if dag_result.succeeded else "failed",
+            execution_time=time.time() - start_time,
+            error_message="; ".join(errors) or None,
+            metadata={
+                "crewai_role": self.role,
+                "crewai_goal": self.goal,
+                "tools_used": [tool["name"] for tool in self.tools],
+                "process_type": "dag",
+                **dag_result.get_statistics()
+            }
+        )
+
+    def _compose_graph_task(self, spec: CrewTaskSpec, upstream: Dict[str, Any]) -> str:
+        """Task description with the outputs of its dependencies"""
+        if not upstream:
+            return spec.description
+        context_sections = "\n\n".join(f"[{dep}]\n{output}" for dep, output in upstream.items())
+        return f"{spec.description}\n\nContext from previous tasks:\n{context_sections}"
+
+    def _create_crewai_agent(self, verbose: bool = False) -> Any:
+        """CrewAI agent with this wrapper's role, goal and backstory"""
+        return Agent(
+            role=self.role,
+            goal=self.goal,
+            backstory=self.backstory,
+            verbose=verbose,
+            allow_delegation=False,
+            tools=[]
+        )
+
+    async def _run_graph_task(self, spec: CrewTaskSpec, upstream: Dict[str, Any]) -> str:
+        """Run one graph node with real CrewAI or the OpenAI alternative"""
+        description = self._compose_graph_task(spec, upstream)
+        if not self.use_real_crewai:
+            return await self._run_openai_task(description)
+
+        # A crew per node so independent branches can kick off concurrently;
+        # each running node gets an agent of its own from the idle pool
+        agent = self._idle_node_agents.pop() if self._idle_node_agents else self._create_crewai_agent()
+        try:
+            crew = Crew(
+                agents=[agent],
+                tasks=[Task(description=description, agent=agent,
+                            expected_output=spec.expected_output)],
+                verbose=False,
+                process="sequential"
+            )
+            result = await run_in_shared_executor(crew.kickoff)
+        except asyncio.CancelledError:
+            # The kickoff thread may still be running; do not reuse its agent
+            raise
+        except Exception:
+            self._idle_node_agents.append(agent)
+            raise
+        self._idle_node_agents.append(agent)
+        return str(result)
+
     async def cleanup(self) -> bool:
         """Clean up CrewAI resources"""
         try:
             if self.crew:
                 self.crew["tasks"] = []
+            self._idle_node_agents = []
 
             self.is_initialized = False
             logger.info(f"CrewAI agent {self.agent_id} cleaned up successfully")
@@ -301,8 +397,8 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
             # Add task to crew
             self.crew.tasks = [crewai_task]
 
-            # Execute with CrewAI
-            result = self.crew.kickoff()
+            # Execute with CrewAI off the event loop
+            result = await run_in_shared_executor(self.crew.kickoff)
 
             return f"CrewAI {self.role} Result:\n\n{result}"
 
@@ -312,37 +408,55 @@ class CrewAIAgentWrapper(BaseFrameworkWrapper):
     async def _execute_with_openai_alternative(self, task: str) -> str:
         """Execute task using OpenAI as CrewAI alternative"""
         try:
-            import openai
-
             # Check for API key
             api_key = self.crewai_agent.get("llm_config", {}).get("api_key")
             if not api_key:
                 return "Error: OpenAI API key not configured for CrewAI alternative"
 
-            # Create OpenAI client
-            client = openai.OpenAI(api_key=api_key)
+            result = await self._run_openai_task(task)
+            return f"CrewAI {self.role} (OpenAI Alternative) Result:\n\n{result}"
+
+        except Exception as e:
+            return f"CrewAI alternative execution error: {str(e)}"
+
+    async def _run_openai_task(self, task: str) -> str:
+        """Run one task against OpenAI in this agent's role (raises on failure)"""
+        api_key = self.crewai_agent.get("llm_config", {}).get("api_key")
+        if not api_key:
+            raise ExecutionError(
+                "OpenAI API key not configured for CrewAI alternative",
+                framework="crewai",
+                agent_id=self.agent_id
+            )
 
-            # Create role-based system message
-            system_message = f"""You are a {self.role} with the following background:
+        # Shared pooled client
+        client = get_async_openai_client(api_key)
+
+        # Create role-based system message
+        system_message = f"""You are a {self.role} with the following background:
 {self.backstory}
 
 Your goal: {self.goal}
 
 You are working as part of a CrewAI team. Approach this task with your specific role expertise and provide detailed, professional results."""
 
-            # Make API call
-            response = client.chat.completions.create(
-                model=self.crewai_agent["llm_config"].get("model", "gpt-3.5-turbo"),
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": task}
-                ],
+        model = self.crewai_agent["llm_config"].get("model", "gpt-3.5-turbo")
+        messages = [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": task}
+        ]
+
+        # Make API call through the shared rate limiter
+        response = await get_rate_limiter().execute(
+            model,
+            lambda: client.chat.completions.create(
+                model=model,
+                messages=messages,
                 temperature=self.crewai_agent["llm_config"].get("temperature", 0.7),
                 max_tokens=1500
-            )
-
-            result = response.choices[0].message.content
-            return f"CrewAI {self.role} (OpenAI Alternative) Result:\n\n{result}"
+            ),
+            messages=messages,
+            max_tokens=1500
+        )
 
-        except Exception as e:
-            return f"CrewAI alternative execution error: {str(e)}"
+        return response.choices[0].message.content
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Shared Executor
+Week 7 Implementation: Process-wide Thread Pool for Blocking Framework Calls
+
+This module provides a single bounded thread pool that framework wrappers
+use to offload blocking calls (synchronous agent runs, file I/O) from the
+event loop, instead of each wrapper using the loop's default executor.
+"""
+
+import os
+import asyncio
+import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Global executor instance
+_executor_instance: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """Get global shared thread pool (sized by AGENTOS_EXECUTOR_WORKERS)"""
+    global _executor_instance
+    if _executor_instance is None:
+        with _executor_lock:
+            if _executor_instance is None:
+                max_workers = int(os.getenv("AGENTOS_EXECUTOR_WORKERS", str(DEFAULT_MAX_WORKERS)))
+                _executor_instance = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="agentos-worker"
+                )
+                logger.info(f"Created shared executor with {max_workers} workers")
+    return _executor_instance
+
+
+async def run_in_shared_executor(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the shared executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_shared_executor(),
+        functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_shared_executor(wait: bool = True):
+    """Shut down the shared executor (a new one is created on next use)"""
+    global _executor_instance
+    with _executor_lock:
+        executor, _executor_instance = _executor_instance, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
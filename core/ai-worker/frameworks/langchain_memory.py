@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Windowed Summary Memory for LangChain
+Week 7 Implementation: Token-bounded LangChain Conversation Memory
+
+This module provides a LangChain memory backend that replaces
+ConversationBufferMemory. It keeps a sliding window of recent turns plus a
+rolling summary (see conversation_history.TokenBudgetedHistory), caches
+per-message token counts and bounds the prompt size by tokens.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from .conversation_history import TokenBudgetedHistory, HistoryConfig
+
+# LangChain imports with fallback
+try:
+    from langchain.schema import BaseMemory
+    LANGCHAIN_MEMORY_AVAILABLE = True
+except ImportError:
+    LANGCHAIN_MEMORY_AVAILABLE = False
+
+    class BaseMemory:
+        """Minimal stand-in used when LangChain is not installed"""
+
+        def __init__(self, **kwargs):
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
+logger = logging.getLogger(__name__)
+
+
+class WindowedSummaryMemory(BaseMemory):
+    """
+    Token-bounded conversation memory for LangChain agents.
+
+    Exposes the same `memory_key` string buffer as ConversationBufferMemory
+    ("Human: ..."/"AI: ..." lines), but only the most recent turns that fit
+    `token_budget` are rendered; older turns are compacted into a summary.
+    """
+
+    memory_key: str = "chat_history"
+    human_prefix: str = "Human"
+    ai_prefix: str = "AI"
+    input_key: Optional[str] = None
+    output_key: Optional[str] = None
+    history: Any = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def __init__(self, token_budget: int = 2000, max_turns: int = 20,
+                 model: str = "gpt-3.5-turbo", **kwargs):
+        super().__init__(**kwargs)
+        if self.history is None:
+            self.history = TokenBudgetedHistory(
+                HistoryConfig(token_budget=token_budget, max_turns=max_turns),
+                model=model
+            )
+
+    @property
+    def memory_variables(self) -> List[str]:
+        return [self.memory_key]
+
+    def _input_value(self, inputs: Dict[str, Any]) -> str:
+        if self.input_key:
+            return str(inputs[self.input_key])
+        candidates = [key for key in inputs if key not in (self.memory_key, "stop")]
+        return str(inputs[candidates[0]]) if candidates else ""
+
+    def _output_value(self, outputs: Dict[str, Any]) -> str:
+        if self.output_key:
+            return str(outputs[self.output_key])
+        if len(outputs) == 1:
+            return str(next(iter(outputs.values())))
+        return str(outputs.get("output", ""))
+
+    @property
+    def buffer(self) -> str:
+        """Token-bounded transcript rendered as a prompt string"""
+        prefixes = {"system": "System", "user": self.human_prefix, "assistant": self.ai_prefix}
+        return "\n".join(
+            f"{prefixes[message['role']]}: {message['content']}"
+            for message in self.history.to_messages()
+        )
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {self.memory_key: self.buffer}
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        self.history.append(self._input_value(inputs), self._output_value(outputs))
+
+    def clear(self) -> None:
+        self.history.clear()
+
+    @property
+    def message_count(self) -> int:
+        """Number of verbatim messages currently held"""
+        return len(self.history) * 2
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get memory size statistics"""
+        stats = self.history.get_statistics()
+        stats["messages"] = self.message_count
+        return stats
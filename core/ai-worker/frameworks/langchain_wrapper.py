@@ -12,9 +12,6 @@ import uuid
 import time
 import asyncio
 import logging
-import ast
-import operator
-import math
 import json
 import requests
 from pathlib import Path
@@ -25,6 +22,10 @@ from .base_wrapper import (
     BaseFrameworkWrapper, FrameworkType, AgentConfig,
     TaskRequest, TaskResponse, InitializationError, ExecutionError
 )
+from .llm_client import langchain_client_kwargs
+from .langchain_memory import WindowedSummaryMemory
+from .executor import run_in_shared_executor
+from .tool_sandbox import calculate as sandboxed_calculate
 
 # Real tool implementations
 try:
@@ -37,7 +38,6 @@ except ImportError:
 try:
     from langchain.agents import initialize_agent, AgentType
     from langchain.llms import OpenAI
-    from langchain.memory import ConversationBufferMemory
     from langchain.tools import Tool
     from langchain.schema import AgentAction, AgentFinish
     LANGCHAIN_AVAILABLE = True
@@ -90,15 +90,16 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
                     agent_id=self.agent_id
                 )
 
-            # Initialize LLM
+            # Initialize LLM on the shared connection pool
             self.llm = OpenAI(
                 temperature=self.agent_config.temperature,
                 model_name=self.agent_config.model,
-                openai_api_key=os.getenv("OPENAI_API_KEY")
+                openai_api_key=os.getenv("OPENAI_API_KEY"),
+                **langchain_client_kwargs(os.getenv("OPENAI_API_KEY"))
             )
 
-            # Initialize memory
-            self.memory = ConversationBufferMemory(memory_key="chat_history")
+            # Initialize token-bounded memory (sliding window + rolling summary)
+            self.memory = WindowedSummaryMemory(memory_key="chat_history", model=self.agent_config.model)
 
             # Convert capabilities to tools
             await self._setup_capabilities()
@@ -184,36 +185,8 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
         def calculate_real(expression: str) -> str:
             """Real calculator with safe evaluation and math functions"""
             try:
-                # Safe mathematical operations
-                allowed_operators = {
-                    ast.Add: operator.add,
-                    ast.Sub: operator.sub,
-                    ast.Mult: operator.mul,
-                    ast.Div: operator.truediv,
-                    ast.Pow: operator.pow,
-                    ast.USub: operator.neg,
-                    ast.UAdd: operator.pos,
-                }
-
-                # Safe mathematical functions
-                allowed_functions = {
-                    'sin': math.sin,
-                    'cos': math.cos,
-                    'tan': math.tan,
-                    'sqrt': math.sqrt,
-                    'log': math.log,
-                    'log10': math.log10,
-                    'exp': math.exp,
-                    'abs': abs,
-                    'round': round,
-                    'floor': math.floor,
-                    'ceil': math.ceil,
-                    'pi': math.pi,
-                    'e': math.e,
-                }
-
-                # Parse and evaluate safely
-                result = self._safe_eval(expression, allowed_operators, allowed_functions)
+                # Parsed and evaluated in the tool sandbox
+                result = sandboxed_calculate(expression)
                 return f"Calculation result: {result}"
 
             except Exception as e:
@@ -376,10 +349,13 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
                     agent_id=self.agent_id
                 )
 
+            # Run planned tool calls concurrently before the agent loop
+            task, tool_metadata = await self._apply_tool_calls(task_request)
+
             # Execute with timeout
             timeout = task_request.timeout or self.agent_config.timeout
             result = await self._execute_with_timeout(
-                self._run_langchain_task(task_request.task),
+                self._run_langchain_task(task),
                 timeout
             )
 
@@ -393,7 +369,8 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
                 metadata={
                     "langchain_agent_type": "conversational-react-description",
                     "tools_used": [tool.name for tool in self.tools],
-                    "memory_length": len(self.memory.chat_memory.messages) if self.memory else 0
+                    "memory_length": self.memory.message_count if self.memory else 0,
+                    **tool_metadata
                 }
             )
 
@@ -413,13 +390,8 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
     async def _run_langchain_task(self, task: str) -> str:
         """Run LangChain task asynchronously"""
         try:
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self.langchain_agent.run,
-                task
-            )
+            # Run in the shared thread pool to avoid blocking
+            result = await run_in_shared_executor(self.langchain_agent.run, task)
             return result
         except Exception as e:
             raise ExecutionError(
@@ -444,61 +416,21 @@ class LangChainAgentWrapper(BaseFrameworkWrapper):
 
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get LangChain-specific memory usage"""
-        memory_messages = 0
-        if self.memory and hasattr(self.memory, 'chat_memory'):
-            memory_messages = len(self.memory.chat_memory.messages)
-
+        if not self.memory:
+            return {
+                "working_memory": 0,
+                "episodic_memory": 0,
+                "semantic_memory": 0,
+                "conversation_length": 0
+            }
+
+        stats = self.memory.get_statistics()
         return {
-            "working_memory": memory_messages,
-            "episodic_memory": 0,  # LangChain doesn't have explicit episodic memory
+            "working_memory": stats["messages"],
+            "episodic_memory": stats["evicted_turns"],  # turns compacted into the summary
             "semantic_memory": 0,  # LangChain doesn't have explicit semantic memory
-            "conversation_length": memory_messages
+            "conversation_length": stats["messages"],
+            "memory_tokens": stats["history_tokens"],
+            "summary_tokens": stats["summary_tokens"],
+            "token_budget": stats["token_budget"]
         }
-
-    def _safe_eval(self, expression: str, allowed_operators: dict, allowed_functions: dict):
-        """Safely evaluate mathematical expressions"""
-        try:
-            # Parse the expression
-            tree = ast.parse(expression, mode='eval')
-
-            # Evaluate the AST
-            return self._eval_node(tree.body, allowed_operators, allowed_functions)
-
-        except Exception as e:
-            raise ValueError(f"Invalid expression: {str(e)}")
-
-    def _eval_node(self, node, allowed_operators: dict, allowed_functions: dict):
-        """Recursively evaluate AST nodes"""
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            return node.value
-        elif isinstance(node, ast.Num):  # Python < 3.8
-            return node.n
-        elif isinstance(node, ast.Name):
-            if node.id in allowed_functions:
-                return allowed_functions[node.id]
-            else:
-                raise ValueError(f"Name '{node.id}' not allowed")
-        elif isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left, allowed_operators, allowed_functions)
-            right = self._eval_node(node.right, allowed_operators, allowed_functions)
-            op_type = type(node.op)
-            if op_type in allowed_operators:
-                return allowed_operators[op_type](left, right)
-            else:
-                raise ValueError(f"Operator {op_type.__name__} not allowed")
-        elif isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand, allowed_operators, allowed_functions)
-            op_type = type(node.op)
-            if op_type in allowed_operators:
-                return allowed_operators[op_type](operand)
-            else:
-                raise ValueError(f"Unary operator {op_type.__name__} not allowed")
-        elif isinstance(node, ast.Call):
-            func = self._eval_node(node.func, allowed_operators, allowed_functions)
-            args = [self._eval_node(arg, allowed_operators, allowed_functions) for arg in node.args]
-            if callable(func):
-                return func(*args)
-            else:
-                raise ValueError(f"Function call not allowed")
-        else:
-            raise ValueError(f"Node type {type(node).__name__} not allowed")
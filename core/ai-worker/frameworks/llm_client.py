@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Shared LLM Client Registry
+Week 7 Implementation: Process-wide OpenAI Connection Pooling
+
+This module provides a process-wide registry of OpenAI clients keyed by
+API key and base URL, so every framework wrapper reuses the same tuned
+HTTP connection pool instead of building a new client per call.
+"""
+
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    openai = None
+    OPENAI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMClientConfig:
+    """Connection pool configuration for shared OpenAI clients"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    request_timeout: float = 120.0
+    max_retries: int = 2
+    # Async calls are retried centrally by the rate limiter
+    async_max_retries: int = 0
+
+
+ClientKey = Tuple[str, Optional[str]]
+
+
+class LLMClientRegistry:
+    """
+    Registry of shared OpenAI clients.
+
+    Clients are created lazily on first use and keyed by (api_key, base_url).
+    Async clients serve the wrappers that call OpenAI directly; sync clients
+    serve framework LLM objects that run their own blocking calls in worker
+    threads.
+    """
+
+    def __init__(self, config: Optional[LLMClientConfig] = None):
+        self.config = config or LLMClientConfig()
+        self._async_clients: Dict[ClientKey, "openai.AsyncOpenAI"] = {}
+        self._sync_clients: Dict[ClientKey, "openai.OpenAI"] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry
+        )
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.config.request_timeout, connect=self.config.connect_timeout)
+
+    def _resolve_key(self, api_key: Optional[str], base_url: Optional[str]) -> ClientKey:
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OpenAI API key not configured")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        return api_key, base_url
+
+    def get_async_client(self, api_key: Optional[str] = None,
+                         base_url: Optional[str] = None) -> "openai.AsyncOpenAI":
+        """Get (or create) the shared AsyncOpenAI client for a key/base URL"""
+        if not OPENAI_AVAILABLE:
+            raise ImportError("openai package not available. Install with: pip install openai")
+
+        key = self._resolve_key(api_key, base_url)
+        client = self._async_clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None:
+                client = openai.AsyncOpenAI(
+                    api_key=key[0],
+                    base_url=key[1],
+                    max_retries=self.config.async_max_retries,
+                    timeout=self._timeout(),
+                    http_client=httpx.AsyncClient(limits=self._limits(), timeout=self._timeout())
+                )
+                self._async_clients[key] = client
+                logger.info(f"Created shared AsyncOpenAI client (base_url={key[1] or 'default'})")
+        return client
+
+    def get_sync_client(self, api_key: Optional[str] = None,
+                        base_url: Optional[str] = None) -> "openai.OpenAI":
+        """Get (or create) the shared sync OpenAI client for a key/base URL"""
+        if not OPENAI_AVAILABLE:
+            raise ImportError("openai package not available. Install with: pip install openai")
+
+        key = self._resolve_key(api_key, base_url)
+        client = self._sync_clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is None:
+                client = openai.OpenAI(
+                    api_key=key[0],
+                    base_url=key[1],
+                    max_retries=self.config.max_retries,
+                    timeout=self._timeout(),
+                    http_client=httpx.Client(limits=self._limits(), timeout=self._timeout())
+                )
+                self._sync_clients[key] = client
+                logger.info(f"Created shared OpenAI client (base_url={key[1] or 'default'})")
+        return client
+
+    async def close(self):
+        """Close all pooled clients and release their connections"""
+        with self._lock:
+            async_clients = list(self._async_clients.values())
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+
+        for client in async_clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close AsyncOpenAI client: {e}")
+        for client in sync_clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close OpenAI client: {e}")
+
+    def get_statistics(self):
+        """Get registry statistics"""
+        return {
+            "async_clients": len(self._async_clients),
+            "sync_clients": len(self._sync_clients),
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections
+        }
+
+
+# Global registry instance
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Get global LLM client registry instance"""
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = LLMClientRegistry()
+    return _registry_instance
+
+
+def get_async_openai_client(api_key: Optional[str] = None,
+                            base_url: Optional[str] = None) -> "openai.AsyncOpenAI":
+    """Get the shared AsyncOpenAI client for a key/base URL"""
+    return get_llm_client_registry().get_async_client(api_key, base_url)
+
+
+def get_openai_client(api_key: Optional[str] = None,
+                      base_url: Optional[str] = None) -> "openai.OpenAI":
+    """Get the shared sync OpenAI client for a key/base URL"""
+    return get_llm_client_registry().get_sync_client(api_key, base_url)
+
+
+def langchain_client_kwargs(api_key: Optional[str] = None,
+                            base_url: Optional[str] = None) -> Dict[str, object]:
+    """Shared completion clients for LangChain's OpenAI LLM (client/async_client fields)"""
+    return {
+        "client": get_openai_client(api_key, base_url).completions,
+        "async_client": get_async_openai_client(api_key, base_url).completions
+    }
+
+
+async def close_llm_clients():
+    """Close all shared LLM clients"""
+    if _registry_instance is not None:
+        await _registry_instance.close()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - LLM Rate Limiter
+Week 7 Implementation: Per-model Token Buckets and Central Retry Scheduling
+
+This module provides a process-wide rate limiter that tracks requests per
+minute and tokens per minute for each model. Calls queue fairly (FIFO) per
+model, token usage is estimated with tiktoken before the call and reconciled
+afterwards, and 429/transient failures are retried here with jittered
+exponential backoff so individual wrappers do not retry independently.
+"""
+
+import os
+import time
+import random
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from .token_counter import count_message_tokens
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class ModelRateLimit:
+    """Rate limits for a single model"""
+    requests_per_minute: int = 3500
+    tokens_per_minute: int = 90000
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff policy"""
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay for a zero-based retry attempt"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for the LLM rate limiter"""
+    default_limit: ModelRateLimit = field(default_factory=ModelRateLimit)
+    model_limits: Dict[str, ModelRateLimit] = field(default_factory=dict)
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+
+    @classmethod
+    def from_env(cls) -> "RateLimitConfig":
+        """Build configuration from LLM_RATE_LIMIT_* environment variables"""
+        return cls(
+            default_limit=ModelRateLimit(
+                requests_per_minute=int(os.getenv("LLM_RATE_LIMIT_RPM", "3500")),
+                tokens_per_minute=int(os.getenv("LLM_RATE_LIMIT_TPM", "90000"))
+            ),
+            retry_policy=RetryPolicy(
+                max_attempts=int(os.getenv("LLM_RATE_LIMIT_MAX_ATTEMPTS", "4"))
+            )
+        )
+
+
+class TokenBucket:
+    """Continuously refilling token bucket"""
+
+    def __init__(self, capacity: float, refill_per_second: float,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self._updated = now
+
+    def time_until_available(self, amount: float) -> float:
+        """Seconds until `amount` tokens can be consumed"""
+        self._refill()
+        # Requests larger than the bucket are admitted once it is full
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float):
+        """Consume tokens (may go negative for oversized requests)"""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float):
+        """Return unused tokens to the bucket"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _ModelState:
+    """Buckets, queue lock and cooldown for one model"""
+
+    def __init__(self, limit: ModelRateLimit, clock: Callable[[], float]):
+        self.requests = TokenBucket(limit.requests_per_minute, limit.requests_per_minute / 60.0, clock)
+        self.tokens = TokenBucket(limit.tokens_per_minute, limit.tokens_per_minute / 60.0, clock)
+        self.cooldown_until = 0.0
+        self.lock: Optional[asyncio.Lock] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waiting = 0
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.rate_limited = 0
+        self.retries = 0
+
+    def get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self.lock is None or self.loop is not loop:
+            self.lock = asyncio.Lock()
+            self.loop = loop
+        return self.lock
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return float(value) / 1000.0
+        except (TypeError, ValueError):
+            pass
+    value = headers.get("retry-after")
+    if value is not None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    # Connection errors and timeouts carry no status code
+    name = type(error).__name__
+    return name in ("APIConnectionError", "APITimeoutError") or isinstance(error, asyncio.TimeoutError)
+
+
+class LLMRateLimiter:
+    """
+    Shared per-model rate limiter and retry scheduler.
+
+    Each model has a request bucket (RPM) and a token bucket (TPM). Callers
+    acquire capacity in FIFO order; a 429 puts the whole model into a shared
+    cooldown so queued callers back off together instead of storming.
+    """
+
+    def __init__(self, config: Optional[RateLimitConfig] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        self.config = config or RateLimitConfig()
+        self._clock = clock
+        self._sleep = sleep
+        self._models: Dict[str, _ModelState] = {}
+        self._lock = threading.Lock()
+
+    def set_model_limit(self, model: str, limit: ModelRateLimit):
+        """Override limits for a model (resets its buckets)"""
+        with self._lock:
+            self.config.model_limits[model] = limit
+            self._models.pop(model, None)
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            with self._lock:
+                state = self._models.get(model)
+                if state is None:
+                    limit = self.config.model_limits.get(model, self.config.default_limit)
+                    state = _ModelState(limit, self._clock)
+                    self._models[model] = state
+        return state
+
+    async def acquire(self, model: str, estimated_tokens: int = 0):
+        """Wait (in FIFO order) until a request of estimated_tokens may be sent"""
+        state = self._state(model)
+        state.waiting += 1
+        try:
+            async with state.get_lock():
+                while True:
+                    delay = max(
+                        state.cooldown_until - self._clock(),
+                        state.requests.time_until_available(1),
+                        state.tokens.time_until_available(estimated_tokens)
+                    )
+                    if delay <= 0:
+                        break
+                    await self._sleep(delay)
+                state.requests.consume(1)
+                state.tokens.consume(estimated_tokens)
+                state.total_requests += 1
+        finally:
+            state.waiting -= 1
+
+    def reconcile(self, model: str, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Correct the token bucket once actual usage is known"""
+        if not isinstance(actual_tokens, int):
+            return
+        state = self._state(model)
+        difference = estimated_tokens - actual_tokens
+        if difference > 0:
+            state.tokens.refund(difference)
+        elif difference < 0:
+            state.tokens.consume(-difference)
+        state.total_tokens += actual_tokens
+
+    def penalize(self, model: str, delay: float):
+        """Put a model into cooldown after a rate limit response"""
+        state = self._state(model)
+        state.cooldown_until = max(state.cooldown_until, self._clock() + delay)
+        state.rate_limited += 1
+
+    def estimate_tokens(self, model: str, messages: Optional[List[Dict[str, str]]] = None,
+                        max_tokens: int = 0) -> int:
+        """Estimate tokens counted against TPM (prompt plus completion budget)"""
+        prompt_tokens = count_message_tokens(messages, model) if messages else 0
+        return prompt_tokens + max_tokens
+
+    async def execute(self, model: str, call: Callable[[], Awaitable[T]],
+                      messages: Optional[List[Dict[str, str]]] = None,
+                      max_tokens: int = 0,
+                      estimated_tokens: Optional[int] = None) -> T:
+        """Run an LLM call under the model's limits with central retries"""
+        if estimated_tokens is None:
+            estimated_tokens = self.estimate_tokens(model, messages, max_tokens)
+        policy = self.config.retry_policy
+        state = self._state(model)
+
+        attempt = 0
+        while True:
+            await self.acquire(model, estimated_tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                # Nothing was generated, give back the completion budget
+                self.reconcile(model, estimated_tokens, 0)
+                if not _is_retryable(e) or attempt + 1 >= policy.max_attempts:
+                    raise
+                delay = policy.backoff(attempt)
+                if _status_code(e) == 429:
+                    delay = max(delay, _retry_after(e) or 0.0)
+                    self.penalize(model, delay)
+                else:
+                    await self._sleep(delay)
+                state.retries += 1
+                attempt += 1
+                logger.warning(f"LLM call for {model} failed ({e}); retry {attempt} in {delay:.2f}s")
+                continue
+
+            usage = getattr(result, "usage", None)
+            self.reconcile(model, estimated_tokens, getattr(usage, "total_tokens", None))
+            return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-model limiter statistics"""
+        now = self._clock()
+        return {
+            model: {
+                "requests": state.total_requests,
+                "tokens": state.total_tokens,
+                "waiting": state.waiting,
+                "rate_limited": state.rate_limited,
+                "retries": state.retries,
+                "cooldown_remaining": max(0.0, state.cooldown_until - now),
+                "available_requests": state.requests.tokens,
+                "available_tokens": state.tokens.tokens
+            }
+            for model, state in self._models.items()
+        }
+
+
+# Global rate limiter instance
+_rate_limiter_instance = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> LLMRateLimiter:
+    """Get global LLM rate limiter instance"""
+    global _rate_limiter_instance
+    if _rate_limiter_instance is None:
+        with _rate_limiter_lock:
+            if _rate_limiter_instance is None:
+                _rate_limiter_instance = LLMRateLimiter(RateLimitConfig.from_env())
+    return _rate_limiter_instance
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Debounced State Persistence
+Week 7 Implementation: Off-loop, Atomic Agent State Snapshots
+
+This module provides a persister that coalesces frequent state changes
+into occasional snapshots written from a background thread. Writes go to a
+temporary file that is atomically renamed into place, optionally gzipped.
+"""
+
+import os
+import gzip
+import json
+import time
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PersistenceConfig:
+    """Configuration for debounced state persistence"""
+    debounce_seconds: float = 2.0      # quiet period before writing
+    max_delay_seconds: float = 10.0    # upper bound under continuous updates
+    compress: bool = False
+
+    @classmethod
+    def from_env(cls, prefix: str = "AGENTOS_STATE") -> "PersistenceConfig":
+        """Build configuration from <prefix>_* environment variables"""
+        return cls(
+            debounce_seconds=float(os.getenv(f"{prefix}_DEBOUNCE_SECONDS", "2.0")),
+            max_delay_seconds=float(os.getenv(f"{prefix}_MAX_DELAY_SECONDS", "10.0")),
+            compress=os.getenv(f"{prefix}_COMPRESS", "false").lower() in ("1", "true", "yes")
+        )
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write bytes to path atomically (temp file + fsync + rename)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def encode_state(state: Any, compress: bool = False) -> bytes:
+    """Serialize state to JSON bytes, optionally gzipped"""
+    data = json.dumps(state, default=str).encode("utf-8")
+    return gzip.compress(data) if compress else data
+
+
+def load_state(path: str) -> Optional[Any]:
+    """Load a state snapshot written by encode_state (None if missing)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    return json.loads(data.decode("utf-8"))
+
+
+class DebouncedStatePersister:
+    """
+    Debounced, atomic state persister.
+
+    mark_dirty() is cheap and may be called after every step; the snapshot
+    is taken by state_provider and written from a timer thread once the
+    state has been quiet for debounce_seconds (or max_delay_seconds after
+    the first unsaved change).
+    """
+
+    def __init__(self, path: str, state_provider: Callable[[], Any],
+                 config: Optional[PersistenceConfig] = None):
+        self.config = config or PersistenceConfig()
+        if self.config.compress and not path.endswith(".gz"):
+            path = f"{path}.gz"
+        self.path = path
+        self.state_provider = state_provider
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty_since: Optional[float] = None
+        self._closed = False
+
+        self.writes = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.bytes_written = 0
+        self.last_write_time: Optional[float] = None
+
+    def mark_dirty(self):
+        """Record a state change and (re)schedule a debounced write"""
+        with self._lock:
+            if self._closed:
+                return
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            else:
+                self.coalesced += 1
+            self._schedule(now)
+
+    def _schedule(self, now: float):
+        """(Re)start the write timer; caller holds _lock and has set _dirty_since"""
+        deadline = self._dirty_since + self.config.max_delay_seconds
+        delay = max(0.0, min(self.config.debounce_seconds, deadline - now))
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._timer_fired)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _timer_fired(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(f"Background state write to {self.path} failed: {e}")
+
+    def flush(self) -> bool:
+        """Write the current state now if there are unsaved changes"""
+        with self._lock:
+            if self._dirty_since is None:
+                return False
+            self._dirty_since = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        with self._write_lock:
+            try:
+                data = encode_state(self.state_provider(), self.config.compress)
+                atomic_write_bytes(self.path, data)
+            except Exception:
+                self.failures += 1
+                # Keep the change pending and retry it after another debounce
+                with self._lock:
+                    now = time.monotonic()
+                    if self._dirty_since is None:
+                        self._dirty_since = now
+                    if not self._closed and self._timer is None:
+                        self._schedule(now)
+                raise
+
+            self.writes += 1
+            self.bytes_written += len(data)
+            self.last_write_time = time.time()
+        return True
+
+    def close(self):
+        """Cancel pending timers and write any unsaved state"""
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+
+    @property
+    def pending(self) -> bool:
+        return self._dirty_since is not None
+
+    def get_size(self) -> int:
+        """Size of the last written snapshot in bytes"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get persister statistics"""
+        return {
+            "path": self.path,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "bytes_written": self.bytes_written,
+            "pending": self.pending,
+            "last_write_time": self.last_write_time
+        }
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Swarm Fan-out
+Week 7 Implementation: Parallel Multi-agent Execution for Swarms
+
+This module provides the building blocks for running one task across
+several sub-agents concurrently: splitting a task into sub-tasks, bounded
+concurrent execution with per-sub-agent deadlines, and pluggable reducers
+that aggregate sub-agent results.
+"""
+
+import re
+import time
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Numbered ("1." / "2)") or bulleted ("-", "*", "•") list items
+_LIST_ITEM = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s+(.+?)\s*$")
+
+
+@dataclass
+class FanOutConfig:
+    """Configuration for swarm fan-out execution"""
+    max_concurrency: int = 4
+    max_subtasks: int = 8
+    subtask_timeout: float = 60.0  # deadline per sub-agent, from its start
+    reducer: str = "concatenate"
+
+    @classmethod
+    def from_context(cls, context: Optional[Dict[str, Any]],
+                     defaults: Optional["FanOutConfig"] = None) -> "FanOutConfig":
+        """Apply per-request overrides from task context["fan_out"]"""
+        base = defaults or cls()
+        overrides = (context or {}).get("fan_out") or {}
+        return cls(
+            max_concurrency=int(overrides.get("max_concurrency", base.max_concurrency)),
+            max_subtasks=int(overrides.get("max_subtasks", base.max_subtasks)),
+            subtask_timeout=float(overrides.get("subtask_timeout", base.subtask_timeout)),
+            reducer=overrides.get("reducer", base.reducer)
+        )
+
+
+@dataclass
+class SubTaskResult:
+    """Outcome of one sub-agent run"""
+    index: int
+    subtask: str
+    result: Any = None
+    status: str = "completed"  # 'completed', 'failed', 'timeout'
+    error: Optional[str] = None
+    execution_time: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "completed"
+
+
+def split_task(task: str, context: Optional[Dict[str, Any]] = None,
+               max_subtasks: int = 8) -> List[str]:
+    """
+    Split a task into sub-tasks.
+
+    Explicit context["subtasks"] wins; otherwise numbered or bulleted list
+    items in the task text become sub-tasks. A task without list items is
+    returned as a single sub-task.
+    """
+    explicit = (context or {}).get("subtasks")
+    if explicit:
+        subtasks = [str(item).strip() for item in explicit if str(item).strip()]
+    else:
+        subtasks = []
+        for line in task.splitlines():
+            match = _LIST_ITEM.match(line)
+            if match:
+                subtasks.append(match.group(1))
+
+    if not subtasks:
+        return [task]
+    if len(subtasks) > max_subtasks:
+        # Fold the overflow into the last sub-task rather than dropping it
+        head, tail = subtasks[:max_subtasks - 1], subtasks[max_subtasks - 1:]
+        subtasks = head + ["\n".join(tail)]
+    return subtasks
+
+
+def concatenate_reducer(results: List[SubTaskResult]) -> str:
+    """Join successful results in sub-task order"""
+    sections = [
+        f"[{r.index + 1}] {r.subtask}\n{r.result}"
+        for r in results if r.succeeded
+    ]
+    return "\n\n".join(sections)
+
+
+def first_success_reducer(results: List[SubTaskResult]) -> Any:
+    """Return the first successful result"""
+    for r in results:
+        if r.succeeded:
+            return r.result
+    return None
+
+
+def majority_vote_reducer(results: List[SubTaskResult]) -> Any:
+    """Return the most common successful result"""
+    votes = Counter(str(r.result).strip() for r in results if r.succeeded)
+    if not votes:
+        return None
+    return votes.most_common(1)[0][0]
+
+
+Reducer = Callable[[List[SubTaskResult]], Any]
+
+REDUCERS: Dict[str, Reducer] = {
+    "concatenate": concatenate_reducer,
+    "first_success": first_success_reducer,
+    "majority_vote": majority_vote_reducer,
+}
+
+
+def register_reducer(name: str, reducer: Reducer):
+    """Register a named reducer"""
+    REDUCERS[name] = reducer
+
+
+def get_reducer(reducer: Union[str, Reducer]) -> Reducer:
+    """Resolve a reducer by name (or pass a callable through)"""
+    if callable(reducer):
+        return reducer
+    if reducer not in REDUCERS:
+        raise ValueError(f"Unknown reducer '{reducer}'. Available: {sorted(REDUCERS)}")
+    return REDUCERS[reducer]
+
+
+async def fan_out(subtasks: List[str],
+                  worker: Callable[[int, str], Awaitable[Any]],
+                  config: Optional[FanOutConfig] = None) -> List[SubTaskResult]:
+    """
+    Run worker(index, subtask) for every sub-task concurrently.
+
+    At most max_concurrency workers run at once; each gets subtask_timeout
+    seconds from the moment it starts. Failures and timeouts are reported
+    per sub-task instead of failing the whole fan-out. Results are returned
+    in sub-task order.
+    """
+    config = config or FanOutConfig()
+    semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+
+    async def run_one(index: int, subtask: str) -> SubTaskResult:
+        async with semaphore:
+            start_time = time.time()
+            try:
+                result = await asyncio.wait_for(worker(index, subtask), timeout=config.subtask_timeout)
+                return SubTaskResult(index, subtask, result, execution_time=time.time() - start_time)
+            except asyncio.TimeoutError:
+                return SubTaskResult(
+                    index, subtask, status="timeout",
+                    error=f"Sub-task timed out after {config.subtask_timeout} seconds",
+                    execution_time=time.time() - start_time
+                )
+            except Exception as e:
+                logger.warning(f"Sub-task {index} failed: {e}")
+                return SubTaskResult(
+                    index, subtask, status="failed", error=str(e),
+                    execution_time=time.time() - start_time
+                )
+
+    return list(await asyncio.gather(*(run_one(i, s) for i, s in enumerate(subtasks))))
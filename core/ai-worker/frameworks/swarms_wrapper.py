@@ -18,6 +18,10 @@ from .base_wrapper import (
     BaseFrameworkWrapper, FrameworkType, AgentConfig,
     TaskRequest, TaskResponse, InitializationError, ExecutionError
 )
+from .executor import run_in_shared_executor
+from .state_persistence import DebouncedStatePersister, PersistenceConfig
+from .swarm_fanout import FanOutConfig, split_task, get_reducer, fan_out
+from .tool_sandbox import calculate as sandboxed_calculate, format_text_analysis
 
 # Swarms imports with fallback
 try:
@@ -56,6 +60,11 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
         self.llm = None
         self.flow = None
         self.tasks = []
+        self.state_persister: Optional[DebouncedStatePersister] = None
+        self.sub_agents: List[Any] = []
+        # Sub-agents not leased to a running sub-task (shared by all requests)
+        self._idle_sub_agents: List[Any] = []
+        self.fan_out_config = FanOutConfig()
 
     def _get_framework_type(self) -> FrameworkType:
         """Return Swarms framework type"""
@@ -93,16 +102,25 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
                 agent_description=self.agent_config.description,
                 llm=self.llm,
                 max_loops=self.agent_config.max_iterations,
-                autosave=True,
+                # State is persisted by the debounced background persister
+                autosave=False,
                 verbose=True,
                 dynamic_temperature_enabled=True,
                 saved_state_path=f"agent_states/{self.agent_id}.json",
                 user_name="agentos_user",
-                retry_attempts=3,
+                # The OpenAI client already backs off on 429s; stacking
+                # agent-level retries on top multiplies load under pressure
+                retry_attempts=1,
                 context_length=8000,
                 return_step_meta=True
             )
 
+            self.state_persister = DebouncedStatePersister(
+                f"agent_states/{self.agent_id}.json",
+                self._capture_agent_state,
+                PersistenceConfig.from_env("SWARMS_STATE")
+            )
+
             # Convert capabilities to tools
             await self._setup_capabilities()
 
@@ -181,8 +199,8 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
         """Create calculator tool for Swarms"""
         def calculate(expression: str) -> str:
             try:
-                # Safe evaluation of mathematical expressions
-                result = eval(expression, {"__builtins__": {}}, {})
+                # Safe evaluation in the tool sandbox
+                result = sandboxed_calculate(expression)
                 return f"Calculation result: {result}"
             except Exception as e:
                 return f"Calculation error: {str(e)}"
@@ -201,7 +219,7 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
         def process_text(text: str, operation: str = "analyze") -> str:
             # Basic text processing
             if operation == "analyze":
-                return f"Swarms text analysis: {len(text)} characters, {len(text.split())} words"
+                return format_text_analysis("Swarms", text)
             elif operation == "summarize":
                 return f"Swarms summary: {text[:100]}..."
             else:
@@ -330,9 +348,26 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
         start_time = time.time()
 
         try:
+            if self._is_parallel_request(task_request):
+                timeout = task_request.timeout or self.agent_config.timeout
+                result, metadata = await self._execute_with_timeout(
+                    self._run_parallel_task(task_request),
+                    timeout
+                )
+                return self._create_task_response(
+                    task_id=task_id,
+                    result=result,
+                    status="completed",
+                    execution_time=time.time() - start_time,
+                    metadata=metadata
+                )
+
+            # Run planned tool calls concurrently before the agent loop
+            task, tool_metadata = await self._apply_tool_calls(task_request)
+
             # Create Swarms task
             swarm_task = Task(
-                task=task_request.task,
+                task=task,
                 agent=self.swarm_agent,
                 context=task_request.context or {}
             )
@@ -354,7 +389,8 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
                 metadata={
                     "swarm_agent_id": self.swarm_agent.agent_name,
                     "tools_used": [tool["name"] for tool in self.tools],
-                    "iterations": getattr(result, 'iterations', 1)
+                    "iterations": getattr(result, 'iterations', 1),
+                    **tool_metadata
                 }
             )
 
@@ -373,9 +409,11 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
 
     async def _run_swarm_task(self, task: Task) -> str:
         """Run Swarms task asynchronously"""
-        # Swarms run method - adapt based on actual Swarms API
+        # Swarms run is blocking; keep it off the event loop
         try:
-            result = self.swarm_agent.run(task.task)
+            result = await run_in_shared_executor(self.swarm_agent.run, task.task)
+            if self.state_persister:
+                self.state_persister.mark_dirty()
             return result
         except Exception as e:
             raise ExecutionError(
@@ -384,14 +422,114 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
                 agent_id=self.agent_id
             )
 
+    def _is_parallel_request(self, task_request: TaskRequest) -> bool:
+        """Check whether a request asks for parallel fan-out"""
+        context = task_request.context or {}
+        return context.get("execution_mode") == "parallel" or bool(context.get("subtasks"))
+
+    def _create_sub_agent(self, index: int) -> Any:
+        """Create a sub-agent sharing this wrapper's LLM"""
+        return Agent(
+            agent_name=f"{self.agent_config.name}-sub-{index}",
+            agent_description=self.agent_config.description,
+            llm=self.llm,
+            max_loops=self.agent_config.max_iterations,
+            autosave=False,
+            verbose=False,
+            user_name="agentos_user",
+            retry_attempts=1,
+            context_length=8000,
+            return_step_meta=True
+        )
+
+    def _lease_sub_agent(self) -> Any:
+        """
+        Take an idle sub-agent for exclusive use, creating one if none is idle
+
+        Sub-agents are stateful; the pool is shared by concurrent requests,
+        so a sub-agent never runs two sub-tasks at once. Never waits.
+        """
+        if self._idle_sub_agents:
+            return self._idle_sub_agents.pop()
+        sub_agent = self._create_sub_agent(len(self.sub_agents))
+        self.sub_agents.append(sub_agent)
+        return sub_agent
+
+    def _release_sub_agent(self, sub_agent: Any):
+        self._idle_sub_agents.append(sub_agent)
+
+    def _retire_sub_agent(self, sub_agent: Any):
+        """Drop a sub-agent whose thread may still be running"""
+        if sub_agent in self.sub_agents:
+            self.sub_agents.remove(sub_agent)
+
+    async def _run_parallel_task(self, task_request: TaskRequest):
+        """Split a task into sub-tasks and run them on concurrent sub-agents"""
+        config = FanOutConfig.from_context(task_request.context, self.fan_out_config)
+        reducer = get_reducer(config.reducer)
+        subtasks = split_task(task_request.task, task_request.context, config.max_subtasks)
+
+        async def worker(index: int, subtask: str) -> Any:
+            # Leasing never waits, so the sub-task deadline covers only the run
+            sub_agent = self._lease_sub_agent()
+            try:
+                result = await run_in_shared_executor(sub_agent.run, subtask)
+            except asyncio.CancelledError:
+                # Past its deadline the thread may still be running; retire
+                # the sub-agent instead of handing it to another sub-task
+                self._retire_sub_agent(sub_agent)
+                raise
+            except Exception:
+                self._release_sub_agent(sub_agent)
+                raise
+            self._release_sub_agent(sub_agent)
+            return result
+
+        results = await fan_out(subtasks, worker, config)
+        if not any(r.succeeded for r in results):
+            errors = "; ".join(f"[{r.index + 1}] {r.error}" for r in results)
+            raise ExecutionError(
+                f"All {len(results)} Swarms sub-tasks failed: {errors}",
+                framework="swarms",
+                agent_id=self.agent_id
+            )
+
+        if self.state_persister:
+            self.state_persister.mark_dirty()
+
+        return reducer(results), {
+            "execution_mode": "parallel",
+            "reducer": config.reducer if isinstance(config.reducer, str) else getattr(config.reducer, "__name__", "custom"),
+            "max_concurrency": config.max_concurrency,
+            "subtask_count": len(results),
+            "completed_subtasks": sum(1 for r in results if r.succeeded),
+            "failed_subtasks": sum(1 for r in results if r.status == "failed"),
+            "timed_out_subtasks": sum(1 for r in results if r.status == "timeout"),
+            "subtasks": [
+                {
+                    "subtask": r.subtask,
+                    "status": r.status,
+                    "execution_time": r.execution_time,
+                    "error": r.error
+                }
+                for r in results
+            ],
+            "tools_used": [tool["name"] for tool in self.tools]
+        }
+
     async def cleanup(self) -> bool:
         """Clean up Swarms resources"""
         try:
-            if self.swarm_agent:
+            if self.state_persister:
+                # Flush pending state off the event loop
+                await run_in_shared_executor(self.state_persister.close)
+            elif self.swarm_agent:
                 # Save agent state
                 if hasattr(self.swarm_agent, 'save_state'):
                     self.swarm_agent.save_state()
 
+            self.sub_agents = []
+            self._idle_sub_agents = []
             self.is_initialized = False
             logger.info(f"Swarms agent {self.agent_id} cleaned up successfully")
             return True
@@ -409,9 +547,26 @@ class SwarmAgentWrapper(BaseFrameworkWrapper):
             "agent_state_size": self._get_agent_state_size()
         }
 
+    def _capture_agent_state(self) -> Dict[str, Any]:
+        """Snapshot agent state for the background persister"""
+        if self.swarm_agent is not None and callable(getattr(self.swarm_agent, "to_dict", None)):
+            return self.swarm_agent.to_dict()
+
+        state = {
+            "agent_id": self.agent_id,
+            "agent_name": self.agent_config.name,
+            "saved_at": time.time()
+        }
+        short_memory = getattr(self.swarm_agent, "short_memory", None)
+        if short_memory is not None and hasattr(short_memory, "return_history_as_string"):
+            state["history"] = short_memory.return_history_as_string()
+        return state
+
     def _get_agent_state_size(self) -> int:
         """Get size of agent state in bytes"""
         try:
+            if self.state_persister:
+                return self.state_persister.get_size()
             if self.swarm_agent and hasattr(self.swarm_agent, 'saved_state_path'):
                 import os
                 if os.path.exists(self.swarm_agent.saved_state_path):
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Token Counting Utilities
+Week 7 Implementation: tiktoken-based Token Estimation
+
+This module provides cached tiktoken encoders for estimating prompt sizes.
+When tiktoken or its encoding files are unavailable (e.g. offline workers)
+it falls back to a character-based estimate.
+"""
+
+import logging
+import functools
+from typing import Dict, List, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Per-message overhead used by OpenAI chat formats
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+TOKENS_REPLY_PRIMING = 3
+
+
+@functools.lru_cache(maxsize=32)
+def get_encoding(model: str):
+    """Get the tiktoken encoding for a model, or None if unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.warning(f"tiktoken encoding for {model} unavailable: {e}")
+        return None
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {DEFAULT_ENCODING} unavailable: {e}")
+        return None
+
+
+def count_tokens(text: Optional[str], model: str = "gpt-3.5-turbo") -> int:
+    """Count tokens in a text for the given model"""
+    if not text:
+        return 0
+    encoding = get_encoding(model)
+    if encoding is None:
+        # Roughly four characters per token for English text
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo") -> int:
+    """Count tokens for a list of chat messages including format overhead"""
+    total = TOKENS_REPLY_PRIMING
+    for message in messages:
+        total += TOKENS_PER_MESSAGE
+        total += count_tokens(message.get("content") or "", model)
+        if message.get("name"):
+            total += TOKENS_PER_NAME
+    return total
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-3.5-turbo") -> str:
+    """Truncate text so that it fits within max_tokens"""
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
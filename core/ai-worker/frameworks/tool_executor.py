@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Parallel Tool Executor
+Week 7 Implementation: Concurrent Tool Calls within one Agent Step
+
+This module provides an executor for a batch of tool invocations issued in
+one agent step. Independent calls run concurrently, bounded by an overall
+limit and a per-tool limit; calls may declare dependencies on earlier calls
+in the batch. Results are returned in call order, so a multi-tool step takes
+as long as its slowest chain instead of the sum of all calls.
+"""
+
+import time
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .executor import run_in_shared_executor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolCall:
+    """A single tool invocation"""
+    name: str
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    depends_on: List[int] = field(default_factory=list)  # indexes of earlier calls
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolCall":
+        """Build a call from a request payload entry"""
+        args = data.get("args", [])
+        if not isinstance(args, (list, tuple)):
+            args = [args]
+        depends_on = data.get("depends_on", [])
+        if isinstance(depends_on, int):
+            depends_on = [depends_on]
+        return cls(
+            name=data.get("name") or data["tool"],
+            args=list(args),
+            kwargs=dict(data.get("kwargs") or {}),
+            depends_on=[int(index) for index in depends_on]
+        )
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of one tool invocation"""
+    index: int
+    name: str
+    result: Any = None
+    status: str = "completed"  # 'completed', 'failed', 'timeout', 'skipped'
+    error: Optional[str] = None
+    execution_time: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "completed"
+
+
+@dataclass
+class ToolExecutorConfig:
+    """Concurrency limits for parallel tool execution"""
+    max_concurrency: int = 8
+    per_tool_limit: int = 4
+    tool_limits: Dict[str, int] = field(default_factory=dict)  # per-tool overrides
+    timeout: float = 30.0  # per call, from its start
+
+
+ToolResolver = Callable[[str], Optional[Callable[..., Any]]]
+
+
+class ParallelToolExecutor:
+    """
+    Runs batches of tool calls concurrently.
+
+    Tools are resolved by name through `resolver`. Coroutine functions are
+    awaited; plain callables run on the shared executor. Per-tool limits are
+    held across batches, so concurrent steps of the same agent share them.
+    """
+
+    def __init__(self, resolver: ToolResolver, config: Optional[ToolExecutorConfig] = None):
+        self.resolver = resolver
+        self.config = config or ToolExecutorConfig()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._tool_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _limits(self, name: str):
+        # asyncio primitives are bound to one loop; start fresh on a new one
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._global_limit = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._tool_limits = {}
+        if name not in self._tool_limits:
+            limit = self.config.tool_limits.get(name, self.config.per_tool_limit)
+            self._tool_limits[name] = asyncio.Semaphore(max(1, limit))
+        return self._global_limit, self._tool_limits[name]
+
+    async def _invoke(self, func: Callable[..., Any], call: ToolCall) -> Any:
+        if inspect.iscoroutinefunction(func):
+            return await func(*call.args, **call.kwargs)
+        result = await run_in_shared_executor(func, *call.args, **call.kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _run_one(self, index: int, call: ToolCall) -> ToolCallResult:
+        func = self.resolver(call.name)
+        if func is None:
+            return ToolCallResult(index, call.name, status="failed", error=f"Unknown tool '{call.name}'")
+
+        global_limit, tool_limit = self._limits(call.name)
+        # Per-tool slot first, so calls queued on a saturated tool do not hold global slots
+        async with tool_limit, global_limit:
+            start_time = time.time()
+            try:
+                result = await asyncio.wait_for(self._invoke(func, call), timeout=self.config.timeout)
+                return ToolCallResult(index, call.name, result, execution_time=time.time() - start_time)
+            except asyncio.TimeoutError:
+                return ToolCallResult(
+                    index, call.name, status="timeout",
+                    error=f"Tool call timed out after {self.config.timeout} seconds",
+                    execution_time=time.time() - start_time
+                )
+            except Exception as e:
+                logger.warning(f"Tool call {index} ({call.name}) failed: {e}")
+                return ToolCallResult(
+                    index, call.name, status="failed", error=str(e),
+                    execution_time=time.time() - start_time
+                )
+
+    async def run(self, calls: List[ToolCall]) -> List[ToolCallResult]:
+        """Execute a batch; results are returned in call order"""
+        for index, call in enumerate(calls):
+            for dep in call.depends_on:
+                if not 0 <= dep < index:
+                    raise ValueError(f"Tool call {index} may only depend on earlier calls (got {dep})")
+
+        futures: List[asyncio.Future] = []
+
+        async def run_after_dependencies(index: int, call: ToolCall) -> ToolCallResult:
+            if call.depends_on:
+                upstream = await asyncio.gather(*(futures[dep] for dep in call.depends_on))
+                failed = [r for r in upstream if not r.succeeded]
+                if failed:
+                    return ToolCallResult(
+                        index, call.name, status="skipped",
+                        error=f"Dependency call {failed[0].index} did not complete"
+                    )
+            return await self._run_one(index, call)
+
+        for index, call in enumerate(calls):
+            futures.append(asyncio.ensure_future(run_after_dependencies(index, call)))
+        return list(await asyncio.gather(*futures))
+
+
+def format_tool_results(results: List[ToolCallResult]) -> str:
+    """Render results as prompt text, in call order"""
+    lines = []
+    for r in results:
+        outcome = r.result if r.succeeded else f"{r.status}: {r.error}"
+        lines.append(f"[{r.index + 1}] {r.name}: {outcome}")
+    return "\n".join(lines)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Tool Sandbox
+Week 7 Implementation: Process-pool Isolation for CPU-heavy Tools
+
+This module provides a warm process pool for CPU-bound tool invocations
+(expression evaluation, analysis of large texts). Each call runs under a
+per-call CPU-time limit and a wall-clock timeout, and results are capped in
+size, so a pathological input cannot pin a core or hold the GIL for other
+requests on the worker. Cheap invocations stay on a fast in-thread path.
+"""
+
+import os
+import ast
+import math
+import pickle
+import signal
+import logging
+import operator
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    resource = None
+    RESOURCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ToolSandboxError(Exception):
+    """Raised when a sandboxed tool call cannot complete"""
+
+
+class ToolTimeoutError(ToolSandboxError):
+    """Raised when a sandboxed tool call exceeds its CPU or wall-clock limit"""
+
+
+class ToolResultTooLargeError(ToolSandboxError):
+    """Raised when a sandboxed tool result exceeds max_result_bytes"""
+
+
+@dataclass
+class SandboxConfig:
+    """Configuration for the tool sandbox"""
+    enabled: bool = True
+    max_workers: int = 2
+    wall_timeout: float = 5.0        # seconds, measured by the caller
+    cpu_time_limit: int = 2          # CPU seconds per call (1s granularity)
+    memory_limit_mb: int = 0         # address-space cap per worker (0 = none)
+    max_result_bytes: int = 64 * 1024
+    inline_threshold: int = 2000     # inputs up to this many chars run in-thread
+    start_method: str = "spawn"
+
+    @classmethod
+    def from_env(cls, prefix: str = "AGENTOS_SANDBOX") -> "SandboxConfig":
+        """Build configuration from <prefix>_* environment variables"""
+        return cls(
+            enabled=os.getenv(f"{prefix}_ENABLED", "true").lower() in ("1", "true", "yes"),
+            max_workers=int(os.getenv(f"{prefix}_WORKERS", "2")),
+            wall_timeout=float(os.getenv(f"{prefix}_WALL_TIMEOUT", "5.0")),
+            cpu_time_limit=int(os.getenv(f"{prefix}_CPU_SECONDS", "2")),
+            memory_limit_mb=int(os.getenv(f"{prefix}_MEMORY_MB", "0")),
+            max_result_bytes=int(os.getenv(f"{prefix}_MAX_RESULT_BYTES", str(64 * 1024))),
+            inline_threshold=int(os.getenv(f"{prefix}_INLINE_THRESHOLD", "2000"))
+        )
+
+
+# Worker process side
+
+def _raise_cpu_exceeded(signum, frame):
+    raise ToolTimeoutError("Tool exceeded its CPU time limit")
+
+
+def _worker_init(memory_limit_mb: int):
+    """Process pool initializer: memory cap and CPU-limit signal handler"""
+    if not RESOURCE_AVAILABLE:
+        return
+    if memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    signal.signal(signal.SIGXCPU, _raise_cpu_exceeded)
+
+
+def _run_limited(cpu_time_limit: int, max_result_bytes: int,
+                 func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    """Run func in a worker under a per-call CPU limit and result size cap"""
+    limited = RESOURCE_AVAILABLE and cpu_time_limit > 0
+    if limited:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        # RLIMIT_CPU counts the worker's lifetime CPU; move the soft limit
+        # past what has been used so far. The hard limit is left alone so it
+        # can be raised again afterwards.
+        soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_time_limit
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        if limited:
+            resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+    size = len(pickle.dumps(result))
+    if size > max_result_bytes:
+        raise ToolResultTooLargeError(f"Tool result is {size} bytes (limit {max_result_bytes})")
+    return result
+
+
+def _noop() -> bool:
+    return True
+
+
+class ToolSandbox:
+    """
+    Warm process pool for CPU-bound tools.
+
+    call() blocks the calling thread (tools are invoked from framework
+    threads, not the event loop). A call that exceeds wall_timeout cannot be
+    interrupted inside the worker, so the pool is recycled: its processes
+    are terminated and a fresh pool is started for the next call.
+    """
+
+    def __init__(self, config: Optional[SandboxConfig] = None):
+        self.config = config or SandboxConfig()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.sandboxed_calls = 0
+        self.inline_calls = 0
+        self.timeouts = 0
+        self.recycles = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    mp_context=multiprocessing.get_context(self.config.start_method),
+                    initializer=_worker_init,
+                    initargs=(self.config.memory_limit_mb,)
+                )
+                logger.info(f"Started tool sandbox with {self.config.max_workers} workers")
+            return self._pool
+
+    def warm(self):
+        """Start every worker process now instead of on first use"""
+        pool = self._get_pool()
+        for future in [pool.submit(_noop) for _ in range(self.config.max_workers)]:
+            future.result()
+
+    def _recycle(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+        # The executor has no public way to stop a busy worker
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.recycles += 1
+        logger.warning("Tool sandbox pool recycled")
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a picklable module-level function in the sandbox"""
+        if not self.config.enabled:
+            self.inline_calls += 1
+            return func(*args, **kwargs)
+
+        self.sandboxed_calls += 1
+        for attempt in range(2):
+            pool = self._get_pool()
+            future = pool.submit(
+                _run_limited, self.config.cpu_time_limit, self.config.max_result_bytes,
+                func, args, kwargs
+            )
+            try:
+                return future.result(timeout=self.config.wall_timeout)
+            except FutureTimeoutError:
+                self.timeouts += 1
+                self._recycle(pool)
+                raise ToolTimeoutError(f"Tool exceeded its {self.config.wall_timeout}s wall-clock limit")
+            except BrokenProcessPool:
+                # A worker died (or another call recycled the pool); retry once
+                self._recycle(pool)
+                if attempt:
+                    raise ToolSandboxError("Tool worker process terminated unexpectedly")
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get sandbox statistics"""
+        return {
+            "enabled": self.config.enabled,
+            "workers": self.config.max_workers,
+            "running": self._pool is not None,
+            "sandboxed_calls": self.sandboxed_calls,
+            "inline_calls": self.inline_calls,
+            "timeouts": self.timeouts,
+            "recycles": self.recycles
+        }
+
+
+# Global sandbox instance
+_sandbox_instance: Optional[ToolSandbox] = None
+_sandbox_lock = threading.Lock()
+
+
+def get_tool_sandbox() -> ToolSandbox:
+    """Get global tool sandbox instance"""
+    global _sandbox_instance
+    if _sandbox_instance is None:
+        with _sandbox_lock:
+            if _sandbox_instance is None:
+                _sandbox_instance = ToolSandbox(SandboxConfig.from_env())
+    return _sandbox_instance
+
+
+def shutdown_tool_sandbox(wait: bool = True):
+    """Shut down the global sandbox (a new pool is started on next use)"""
+    if _sandbox_instance is not None:
+        _sandbox_instance.shutdown(wait=wait)
+
+
+def sandboxed_tool(func: Callable[..., Any],
+                   inline_when: Optional[Callable[..., bool]] = None) -> Callable[..., Any]:
+    """
+    Wrap a module-level tool function so it runs in the sandbox.
+
+    inline_when(*args, **kwargs) returning True keeps that invocation on
+    the calling thread (for inputs known to be cheap).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        sandbox = get_tool_sandbox()
+        if inline_when is not None and inline_when(*args, **kwargs):
+            sandbox.inline_calls += 1
+            return func(*args, **kwargs)
+        return sandbox.call(func, *args, **kwargs)
+    return wrapper
+
+
+# CPU-bound tool implementations (module level so workers can unpickle them)
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_FUNCTIONS = {
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'sqrt': math.sqrt,
+    'log': math.log,
+    'log10': math.log10,
+    'exp': math.exp,
+    'abs': abs,
+    'round': round,
+    'floor': math.floor,
+    'ceil': math.ceil,
+    'pi': math.pi,
+    'e': math.e,
+}
+
+# Integer powers whose result would exceed this many bits are refused
+MAX_POWER_BITS = 100_000
+
+
+def _eval_node(node: ast.AST) -> Any:
+    """Recursively evaluate an arithmetic AST node"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, complex)):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in _FUNCTIONS:
+            return _FUNCTIONS[node.id]
+        raise ValueError(f"Name '{node.id}' not allowed")
+    if isinstance(node, ast.BinOp):
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        op_type = type(node.op)
+        if op_type not in _OPERATORS:
+            raise ValueError(f"Operator {op_type.__name__} not allowed")
+        if op_type is ast.Pow and isinstance(left, int) and isinstance(right, int) and abs(left) > 1:
+            if right * math.log2(abs(left)) > MAX_POWER_BITS:
+                raise ValueError("Exponent too large")
+        return _OPERATORS[op_type](left, right)
+    if isinstance(node, ast.UnaryOp):
+        operand = _eval_node(node.operand)
+        op_type = type(node.op)
+        if op_type not in _OPERATORS:
+            raise ValueError(f"Unary operator {op_type.__name__} not allowed")
+        return _OPERATORS[op_type](operand)
+    if isinstance(node, ast.Call):
+        func = _eval_node(node.func)
+        args = [_eval_node(arg) for arg in node.args]
+        if not callable(func):
+            raise ValueError("Function call not allowed")
+        return func(*args)
+    raise ValueError(f"Node type {type(node).__name__} not allowed")
+
+
+def evaluate_expression(expression: str) -> Any:
+    """Safely evaluate an arithmetic expression (no names beyond math functions)"""
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {e.msg}")
+    return _eval_node(tree.body)
+
+
+def text_statistics(text: str) -> Dict[str, int]:
+    """Character, word, line and sentence counts for a text"""
+    return {
+        "characters": len(text),
+        "words": len(text.split()),
+        "lines": text.count("\n") + 1 if text else 0,
+        "sentences": sum(text.count(mark) for mark in ".!?")
+    }
+
+
+def _is_cheap_expression(expression: str) -> bool:
+    return len(expression) <= 100 and "**" not in expression
+
+
+def _is_small_text(text: str, *args, **kwargs) -> bool:
+    return len(text) <= get_tool_sandbox().config.inline_threshold
+
+
+calculate = sandboxed_tool(evaluate_expression, inline_when=_is_cheap_expression)
+analyze_text = sandboxed_tool(text_statistics, inline_when=_is_small_text)
+
+
+def format_text_analysis(label: str, text: str) -> str:
+    """'<label> text analysis: N characters, M words' via the sandbox"""
+    stats = analyze_text(text)
+    return f"{label} text analysis: {stats['characters']} characters, {stats['words']} words"
@@ -24,17 +24,22 @@ logger = logging.getLogger(__name__)
 try:
     from langchain.agents import initialize_agent, AgentType, Tool
     from langchain.llms import OpenAI
-    from langchain.memory import ConversationBufferMemory
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
     Tool = None
     OpenAI = None
-    ConversationBufferMemory = None
     initialize_agent = None
     AgentType = None
     logger.warning("LangChain not available")
 
+# Token-bounded LangChain memory (independent of the multi-framework imports)
+try:
+    from frameworks.langchain_memory import WindowedSummaryMemory
+except ImportError as e:
+    WindowedSummaryMemory = None
+    logger.warning(f"LangChain windowed memory not available: {e}")
+
 # Multi-framework imports
 try:
     from frameworks import (
@@ -52,9 +57,22 @@ try:
         TaskResponse as FrameworkTaskResponse,
         FrameworkType
     )
+    from frameworks.llm_client import langchain_client_kwargs, close_llm_clients
+    from frameworks.executor import run_in_shared_executor, shutdown_shared_executor
+    from frameworks.conversation_history import TokenBudgetedHistory
+    from frameworks.agent_registry import create_agent_registry
+    from frameworks.tool_sandbox import calculate as sandboxed_calculate, shutdown_tool_sandbox
     MULTI_FRAMEWORK_AVAILABLE = True
 except ImportError:
     MULTI_FRAMEWORK_AVAILABLE = False
+    langchain_client_kwargs = None
+    close_llm_clients = None
+    run_in_shared_executor = None
+    shutdown_shared_executor = None
+    TokenBudgetedHistory = None
+    create_agent_registry = None
+    sandboxed_calculate = None
+    shutdown_tool_sandbox = None
     SWARMS_AVAILABLE = False
     CREWAI_AVAILABLE = False
     AUTOGEN_AVAILABLE = False
@@ -136,13 +154,40 @@ class LangChainAgentWrapper:
         self.tools = []
         self.agent = None
         self.memory = None
-
-        if LANGCHAIN_AVAILABLE and OpenAI is not None and ConversationBufferMemory is not None:
-            self.llm = OpenAI(temperature=0.7) if os.getenv("OPENAI_API_KEY") else None
-            self.memory = ConversationBufferMemory(memory_key="chat_history")
+        # One run at a time per agent: runs share its conversation memory.
+        # The registry also holds it while snapshotting the agent
+        self.run_lock = asyncio.Lock()
+
+        if LANGCHAIN_AVAILABLE and OpenAI is not None and WindowedSummaryMemory is not None:
+            if os.getenv("OPENAI_API_KEY"):
+                shared_clients = langchain_client_kwargs() if langchain_client_kwargs else {}
+                self.llm = OpenAI(temperature=0.7, **shared_clients)
+            else:
+                self.llm = None
+            self.memory = WindowedSummaryMemory(memory_key="chat_history")
         else:
             self.llm = None
 
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Compact snapshot of config and conversation state for the registry"""
+        history = getattr(self.memory, "history", None)
+        return {
+            "agent_id": self.agent_id,
+            "framework": "langchain",
+            "config": self.agent_config.model_dump(),
+            "history": history.to_dict() if history is not None else None,
+            "saved_at": time.time()
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "LangChainAgentWrapper":
+        """Re-hydrate a wrapper from a registry snapshot (initialized on first execute)"""
+        wrapper = cls(AgentConfig(**snapshot["config"]))
+        wrapper.agent_id = snapshot["agent_id"]
+        if snapshot.get("history") and wrapper.memory is not None and TokenBudgetedHistory is not None:
+            wrapper.memory.history = TokenBudgetedHistory.from_dict(snapshot["history"])
+        return wrapper
+
     async def initialize(self):
         """Initialize LangChain agent with capabilities"""
         if not LANGCHAIN_AVAILABLE:
@@ -167,6 +212,18 @@ class LangChainAgentWrapper:
                 verbose=True
             )
 
+    def _get_memory_usage(self) -> Dict[str, Any]:
+        """Get conversation memory usage"""
+        if not self.memory or not hasattr(self.memory, "get_statistics"):
+            return {"messages": 0, "memory_tokens": 0, "summary_tokens": 0}
+
+        stats = self.memory.get_statistics()
+        return {
+            "messages": stats["messages"],
+            "memory_tokens": stats["history_tokens"],
+            "summary_tokens": stats["summary_tokens"]
+        }
+
     async def _capability_to_tool(self, capability: str):
         """Convert AgentOS capability to LangChain tool"""
         tool_map = {
@@ -222,8 +279,11 @@ class LangChainAgentWrapper:
 
         def calculate(expression: str) -> str:
             try:
-                # Safe evaluation of mathematical expressions
-                result = eval(expression, {"__builtins__": {}}, {})
+                # Safe evaluation, in the tool sandbox when available
+                if sandboxed_calculate is not None:
+                    result = sandboxed_calculate(expression)
+                else:
+                    result = eval(expression, {"__builtins__": {}}, {})
                 return str(result)
             except Exception as e:
                 return f"Error: {str(e)}"
@@ -288,7 +348,12 @@ class LangChainAgentWrapper:
 
         try:
             if self.agent and hasattr(self.agent, 'run'):
-                result = self.agent.run(task)
+                # agent.run blocks (LLM calls, sandboxed tools); keep it off the event loop
+                async with self.run_lock:
+                    if run_in_shared_executor is not None:
+                        result = await run_in_shared_executor(self.agent.run, task)
+                    else:
+                        result = await asyncio.to_thread(self.agent.run, task)
             else:
                 result = f"Agent not properly initialized or LangChain not available"
             execution_time = time.time() - start_time
@@ -313,8 +378,49 @@ class LangChainAgentWrapper:
             }
 
 
-# Global agent registry
-agent_registry: Dict[str, LangChainAgentWrapper] = {}
+# Global agent registry (persisted when AGENTOS_REGISTRY_BACKEND is set)
+agent_registry: Dict[str, LangChainAgentWrapper] = (
+    create_agent_registry(LangChainAgentWrapper.from_snapshot) if create_agent_registry else {}
+)
+
+
+async def lookup_agent(agent_id: str) -> Optional[LangChainAgentWrapper]:
+    """Find an agent, restoring a persisted one off the event loop (None if unknown)"""
+    get_agent = getattr(agent_registry, "get_agent", None)
+    if get_agent is None:
+        return agent_registry.get(agent_id)
+    try:
+        return await get_agent(agent_id)
+    except KeyError:
+        return None
+    except Exception as e:
+        # Snapshot store unreachable; the agent is still registered, so retry later
+        raise HTTPException(status_code=503, detail=f"Agent registry unavailable: {e}")
+
+
+async def persist_agent(agent_id: str):
+    """Write the agent's registry snapshot (no-op without persistence)"""
+    save = getattr(agent_registry, "save", None)
+    if save is None:
+        return
+    try:
+        await save(agent_id)
+    except Exception as e:
+        # The task already completed; a missed snapshot only costs a later restore
+        logger.warning(f"Failed to persist agent {agent_id}: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Persist agents and release shared LLM connection pools, worker threads and processes"""
+    if hasattr(agent_registry, "flush"):
+        await agent_registry.flush()
+    if close_llm_clients:
+        await close_llm_clients()
+    if shutdown_shared_executor:
+        shutdown_shared_executor(wait=False)
+    if shutdown_tool_sandbox:
+        shutdown_tool_sandbox(wait=False)
 
 
 @app.get("/health")
@@ -351,6 +457,7 @@ async def create_agent(config: AgentConfig):
 
         # Store in registry
         agent_registry[agent_wrapper.agent_id] = agent_wrapper
+        await persist_agent(agent_wrapper.agent_id)
 
         return {
             "agent_id": agent_wrapper.agent_id,
@@ -369,11 +476,12 @@ async def execute_task(agent_id: str, request: TaskRequest):
     """Execute a task using specified agent"""
     try:
         # Check if agent exists
-        if agent_id not in agent_registry:
+        agent_wrapper = await lookup_agent(agent_id)
+        if agent_wrapper is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        agent_wrapper = agent_registry[agent_id]
         result = await agent_wrapper.execute(request.task)
+        await persist_agent(agent_id)
 
         return TaskResponse(**result)
     except HTTPException:
@@ -385,10 +493,10 @@ async def execute_task(agent_id: str, request: TaskRequest):
 @app.get("/agents/{agent_id}")
 async def get_agent(agent_id: str):
     """Get agent details"""
-    if agent_id not in agent_registry:
+    agent_wrapper = await lookup_agent(agent_id)
+    if agent_wrapper is None:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    agent_wrapper = agent_registry[agent_id]
     return {
         "agent_id": agent_id,
         "name": agent_wrapper.agent_config.name,
@@ -403,10 +511,14 @@ async def get_agent(agent_id: str):
 @app.delete("/agents/{agent_id}")
 async def delete_agent(agent_id: str):
     """Delete an agent"""
-    if agent_id not in agent_registry:
+    remove = getattr(agent_registry, "remove", None)
+    if remove is not None:
+        deleted = await remove(agent_id)
+    else:
+        deleted = agent_registry.pop(agent_id, None) is not None
+    if not deleted:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    del agent_registry[agent_id]
     return {"message": "Agent deleted successfully", "agent_id": agent_id}
 
 
@@ -538,9 +650,8 @@ async def execute_agent_task(request: ExecutionRequest):
 
     try:
         # Create temporary agent config if not provided
-        if request.agent_id and request.agent_id in agent_registry:
-            agent_wrapper = agent_registry[request.agent_id]
-        else:
+        agent_wrapper = await lookup_agent(request.agent_id) if request.agent_id else None
+        if agent_wrapper is None:
             # Create temporary agent with default capabilities
             capabilities = request.capabilities or ["web_search", "calculations", "text_processing"]
             temp_config = AgentConfig(
@@ -555,6 +666,8 @@ async def execute_agent_task(request: ExecutionRequest):
 
         # Execute the task
         result = await agent_wrapper.execute(request.input)
+        if request.agent_id and request.agent_id in agent_registry:
+            await persist_agent(request.agent_id)
         execution_time = time.time() - start_time
 
         return ExecutionResponse(
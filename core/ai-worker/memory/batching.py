@@ -0,0 +1,57 @@
+"""
+Batch Helpers for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module provides the partial-failure result type returned by the bulk
+memory APIs and a bounded concurrent map used where an upstream service
+has no batch endpoint.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class BatchStoreResult:
+    """Outcome of a bulk store; memory_ids is aligned with the input batch"""
+    memory_ids: List[Optional[str]] = field(default_factory=list)
+    errors: Dict[int, str] = field(default_factory=dict)  # input index -> error
+
+    @property
+    def stored(self) -> int:
+        return sum(1 for memory_id in self.memory_ids if memory_id is not None)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "memory_ids": self.memory_ids,
+            "errors": {str(index): error for index, error in self.errors.items()},
+            "stored": self.stored,
+            "failed": self.failed
+        }
+
+
+async def gather_bounded(func: Callable[[Any], Awaitable[Any]],
+                         items: Sequence[Any],
+                         concurrency: int) -> List[Any]:
+    """
+    Run func over items with at most `concurrency` in flight.
+
+    Results keep input order; an exception is returned in place of the
+    result of the item that raised it.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items), return_exceptions=True))
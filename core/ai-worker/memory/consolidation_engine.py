@@ -9,14 +9,16 @@ into semantic knowledge, extract patterns, and optimize memory storage.
 import asyncio
 import json
 import logging
-import re
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 
-import aiohttp
 from universal_memory import MemoryEntry, MemoryType, FrameworkType, ConsolidationResult
+from http_session import SharedHTTPSession
+from batching import gather_bounded
+from template_matcher import match_texts, template_key
 
 
 @dataclass
@@ -51,18 +53,31 @@ class MemoryConsolidationEngine:
     - Strategic forgetting based on importance decay
     """
 
+    # API writes in flight during a consolidation (the API has no batch endpoint)
+    BATCH_CONCURRENCY = 8
+    # Memories per consolidation from which template matching runs on `executor`
+    EXECUTOR_THRESHOLD = 200
+
     def __init__(self,
                  api_base_url: str = "http://localhost:8000",
-                 llm_endpoint: str = None):
+                 llm_endpoint: str = None,
+                 http_session: Optional[SharedHTTPSession] = None,
+                 executor: Optional[Executor] = None):
         """
         Initialize Memory Consolidation Engine
 
         Args:
             api_base_url: Base URL for AgentOS API
             llm_endpoint: Optional LLM endpoint for pattern analysis
+            http_session: Shared HTTP session (one is created if omitted)
+            executor: Optional (process pool) executor for template matching
+                over large time windows
         """
         self.api_base_url = api_base_url.rstrip('/')
+        self.http = http_session or SharedHTTPSession()
+        self._owns_http = http_session is None
         self.llm_endpoint = llm_endpoint
+        self.executor = executor
         self.logger = logging.getLogger(__name__)
 
         # Consolidation rules
@@ -162,18 +177,16 @@ class MemoryConsolidationEngine:
             semantic_memories = await self._extract_semantic_knowledge(patterns, framework)
             self.logger.info(f"Extracted {len(semantic_memories)} semantic memories")
 
-            # Step 4: Store new semantic memories
-            new_memory_ids = []
-            for semantic_memory in semantic_memories:
-                memory_id = await self._store_consolidated_memory(semantic_memory, framework)
-                new_memory_ids.append(memory_id)
+            # Step 4: Store new semantic memories and update importance scores
+            # of the supporting episodic memories, both with bounded concurrency
+            new_memory_ids, _ = await asyncio.gather(
+                self._store_consolidated_memories(semantic_memories, framework),
+                self._update_memory_importance(episodic_memories, patterns)
+            )
 
             # Step 5: Calculate consolidation score
             consolidation_score = self._calculate_consolidation_score(patterns, semantic_memories)
 
-            # Step 6: Update memory importance scores
-            await self._update_memory_importance(episodic_memories, patterns)
-
             completed_at = datetime.now()
 
             result = ConsolidationResult(
@@ -205,24 +218,24 @@ class MemoryConsolidationEngine:
         cutoff_time = datetime.now() - time_window
 
         # Query episodic memories from API
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "framework": framework.value,
-                "memory_type": "episodic",
-                "since": cutoff_time.isoformat(),
-                "limit": 100
-            }
+        params = {
+            "framework": framework.value,
+            "memory_type": "episodic",
+            "since": cutoff_time.isoformat(),
+            "limit": 100
+        }
 
-            async with session.get(
-                f"{self.api_base_url}/api/v1/memory/episodic",
-                params=params
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return [self._dict_to_memory_entry(mem) for mem in data.get("memories", [])]
-                else:
-                    self.logger.warning(f"Failed to retrieve episodic memories: {response.status}")
-                    return []
+        session = await self.http.get()
+        async with session.get(
+            f"{self.api_base_url}/api/v1/memory/episodic",
+            params=params
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return [self._dict_to_memory_entry(mem) for mem in data.get("memories", [])]
+            else:
+                self.logger.warning(f"Failed to retrieve episodic memories: {response.status}")
+                return []
 
     async def _identify_patterns(self, memories: List[MemoryEntry]) -> List[MemoryPattern]:
         """Identify patterns in episodic memories"""
@@ -238,9 +251,9 @@ class MemoryConsolidationEngine:
         temporal_patterns = await self._find_temporal_patterns(memories)
         patterns.extend(temporal_patterns)
 
-        # Identify causal patterns
-        causal_patterns = await self._find_causal_patterns(memories)
-        patterns.extend(causal_patterns)
+        # Identify patterns stated in the text (all pattern templates)
+        template_patterns = await self._find_template_patterns(memories)
+        patterns.extend(template_patterns)
 
         # Identify conceptual patterns
         conceptual_patterns = await self._find_conceptual_patterns(concept_groups)
@@ -286,28 +299,40 @@ class MemoryConsolidationEngine:
 
         return patterns
 
-    async def _find_causal_patterns(self, memories: List[MemoryEntry]) -> List[MemoryPattern]:
-        """Find causal patterns using text analysis"""
-        patterns = []
+    async def _find_template_patterns(self, memories: List[MemoryEntry]) -> List[MemoryPattern]:
+        """Find patterns matching the text templates, in one regex pass per memory"""
+        key = template_key(self.pattern_templates)
+        contents = [memory.content for memory in memories]
+        if self.executor is not None and len(contents) >= self.EXECUTOR_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            matches = await loop.run_in_executor(self.executor, match_texts, key, contents)
+        else:
+            matches = match_texts(key, contents)
 
-        for template_type, templates in self.pattern_templates.items():
-            if template_type == "causal":
-                for memory in memories:
-                    for template in templates:
-                        matches = re.findall(template, memory.content.lower())
-                        if matches:
-                            for match in matches:
-                                if len(match) == 2:  # Cause and effect
-                                    cause, effect = match
-                                    pattern = MemoryPattern(
-                                        pattern_type="causal",
-                                        description=f"Causal relationship: {cause} → {effect}",
-                                        confidence=0.8,
-                                        supporting_memories=[memory.id],
-                                        extracted_knowledge=f"Understanding: {cause} typically results in {effect}",
-                                        concepts=[cause.strip(), effect.strip()]
-                                    )
-                                    patterns.append(pattern)
+        patterns = []
+        for memory, memory_matches in zip(memories, matches):
+            for pattern_type, groups in memory_matches:
+                if pattern_type == "causal":
+                    if len(groups) == 2:  # Cause and effect
+                        cause, effect = groups
+                        patterns.append(MemoryPattern(
+                            pattern_type="causal",
+                            description=f"Causal relationship: {cause} → {effect}",
+                            confidence=0.8,
+                            supporting_memories=[memory.id],
+                            extracted_knowledge=f"Understanding: {cause} typically results in {effect}",
+                            concepts=list(groups)
+                        ))
+                else:
+                    relation = " → ".join(groups)
+                    patterns.append(MemoryPattern(
+                        pattern_type=pattern_type,
+                        description=f"{pattern_type.capitalize()} relationship: {relation}",
+                        confidence=0.7,
+                        supporting_memories=[memory.id],
+                        extracted_knowledge=f"Observed {pattern_type} relationship: {relation}",
+                        concepts=list(groups)
+                    ))
 
         return patterns
 
@@ -396,16 +421,34 @@ class MemoryConsolidationEngine:
                                        semantic_memory: Dict[str, Any],
                                        framework: FrameworkType) -> str:
         """Store consolidated semantic memory"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_base_url}/api/v1/memory/semantic/store",
-                json=semantic_memory
-            ) as response:
-                if response.status == 201:
-                    data = await response.json()
-                    return data["memory_id"]
-                else:
-                    raise Exception(f"Failed to store consolidated memory: {response.status}")
+        session = await self.http.get()
+        async with session.post(
+            f"{self.api_base_url}/api/v1/memory/semantic/store",
+            json=semantic_memory
+        ) as response:
+            if response.status == 201:
+                data = await response.json()
+                return data["memory_id"]
+            else:
+                raise Exception(f"Failed to store consolidated memory: {response.status}")
+
+    async def _store_consolidated_memories(self,
+                                         semantic_memories: List[Dict[str, Any]],
+                                         framework: FrameworkType) -> List[str]:
+        """Store consolidated memories concurrently; returns the IDs of those stored"""
+        outcomes = await gather_bounded(
+            lambda semantic_memory: self._store_consolidated_memory(semantic_memory, framework),
+            semantic_memories,
+            self.BATCH_CONCURRENCY
+        )
+
+        memory_ids = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to store consolidated memory: {outcome}")
+            else:
+                memory_ids.append(outcome)
+        return memory_ids
 
     def _calculate_consolidation_score(self,
                                      patterns: List[MemoryPattern],
@@ -438,16 +481,21 @@ class MemoryConsolidationEngine:
             for memory_id in pattern.supporting_memories:
                 memory_pattern_map[memory_id].append(pattern)
 
-        # Update importance scores
+        # One update per memory, however often it appears
+        updates = {}
         for memory in episodic_memories:
-            if memory.id in memory_pattern_map:
+            if memory.id in memory_pattern_map and memory.id not in updates:
                 supporting_patterns = memory_pattern_map[memory.id]
                 importance_boost = sum(p.confidence * 0.1 for p in supporting_patterns)
-                new_importance = min(memory.importance + importance_boost, 1.0)
-
-                # Update memory importance via real API call
-                await self._update_memory_importance_api(memory.id, new_importance)
-                self.logger.debug(f"Updated memory {memory.id} importance: {memory.importance:.2f} → {new_importance:.2f}")
+                updates[memory.id] = min(memory.importance + importance_boost, 1.0)
+                self.logger.debug(f"Updating memory {memory.id} importance: {memory.importance:.2f} → {updates[memory.id]:.2f}")
+
+        # Update memory importance via real API calls
+        await gather_bounded(
+            lambda update: self._update_memory_importance_api(*update),
+            list(updates.items()),
+            self.BATCH_CONCURRENCY
+        )
 
     async def _store_consolidation_record(self, result: ConsolidationResult):
         """Store consolidation record for tracking"""
@@ -484,20 +532,20 @@ class MemoryConsolidationEngine:
     async def _update_memory_importance_api(self, memory_id: str, new_importance: float):
         """Update memory importance via AgentOS API"""
         try:
-            async with aiohttp.ClientSession() as session:
-                update_data = {
-                    "importance": new_importance,
-                    "updated_at": datetime.now().isoformat()
-                }
+            update_data = {
+                "importance": new_importance,
+                "updated_at": datetime.now().isoformat()
+            }
 
-                async with session.patch(
-                    f"{self.api_base_url}/api/v1/memory/{memory_id}",
-                    json=update_data
-                ) as response:
-                    if response.status == 200:
-                        self.logger.debug(f"Successfully updated memory {memory_id} importance to {new_importance:.2f}")
-                    else:
-                        self.logger.warning(f"Failed to update memory {memory_id} importance: {response.status}")
+            session = await self.http.get()
+            async with session.patch(
+                f"{self.api_base_url}/api/v1/memory/{memory_id}",
+                json=update_data
+            ) as response:
+                if response.status == 200:
+                    self.logger.debug(f"Successfully updated memory {memory_id} importance to {new_importance:.2f}")
+                else:
+                    self.logger.warning(f"Failed to update memory {memory_id} importance: {response.status}")
 
         except Exception as e:
             self.logger.error(f"Error updating memory importance for {memory_id}: {str(e)}")
@@ -505,15 +553,26 @@ class MemoryConsolidationEngine:
     async def _store_consolidation_record_api(self, record: Dict[str, Any]):
         """Store consolidation record via AgentOS API"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_base_url}/api/v1/memory/consolidation/records",
-                    json=record
-                ) as response:
-                    if response.status == 201:
-                        self.logger.debug(f"Successfully stored consolidation record: {record['consolidation_id']}")
-                    else:
-                        self.logger.warning(f"Failed to store consolidation record: {response.status}")
+            session = await self.http.get()
+            async with session.post(
+                f"{self.api_base_url}/api/v1/memory/consolidation/records",
+                json=record
+            ) as response:
+                if response.status == 201:
+                    self.logger.debug(f"Successfully stored consolidation record: {record['consolidation_id']}")
+                else:
+                    self.logger.warning(f"Failed to store consolidation record: {response.status}")
 
         except Exception as e:
             self.logger.error(f"Error storing consolidation record: {str(e)}")
+
+    async def close(self):
+        """Release the HTTP session if this engine owns it"""
+        if self._owns_http:
+            await self.http.close()
+
+    async def __aenter__(self) -> "MemoryConsolidationEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
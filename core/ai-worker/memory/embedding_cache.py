@@ -0,0 +1,231 @@
+"""
+Embedding Cache for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module caches embeddings by (model, SHA-256 of normalized text) so
+identical text is embedded once. Vectors are kept as compact float16 or
+float32 bytes in an in-process LRU, optionally backed by a SQLite file that
+survives restarts and is shared by workers on the same host. Wrappers put
+the cache in front of mem0's embedder and the local fallback embedders.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace (case is kept: it can change embeddings)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_key(model: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: LRU of encoded vectors, then an optional
+    SQLite file. Thread-safe, since mem0 embeds from executor threads.
+    """
+
+    def __init__(self, max_entries: int = 10000, dtype: str = "float16", path: Optional[str] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the embedding cache. Install with: pip install numpy")
+        if dtype not in ("float16", "float32"):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+        self.path = path
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dtype TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _encode(self, vector) -> bytes:
+        return np.asarray(vector, dtype=self.dtype).tobytes()
+
+    def _decode(self, data: bytes, dtype=None) -> "np.ndarray":
+        return np.frombuffer(data, dtype=dtype or self.dtype).astype(np.float32)
+
+    def _remember(self, key: str, data: bytes):
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional["np.ndarray"]]:
+        """Cached vectors aligned with texts, None for misses"""
+        keys = [embedding_key(model, text) for text in texts]
+        results: List[Optional["np.ndarray"]] = [None] * len(keys)
+        with self._lock:
+            missing = []
+            for index, key in enumerate(keys):
+                data = self._entries.get(key)
+                if data is None:
+                    missing.append(index)
+                    continue
+                self._entries.move_to_end(key)
+                results[index] = self._decode(data)
+                self.stats["hits"] += 1
+
+            if missing and self._db is not None:
+                wanted = list({keys[index] for index in missing})
+                placeholders = ",".join("?" * len(wanted))
+                rows = self._db.execute(
+                    f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({placeholders})", wanted
+                ).fetchall()
+                found = {}
+                for key, dtype, data in rows:
+                    vector = self._decode(data, np.dtype(dtype))
+                    found[key] = vector
+                    self._remember(key, self._encode(vector))
+                still_missing = []
+                for index in missing:
+                    if keys[index] in found:
+                        results[index] = found[keys[index]]
+                        self.stats["disk_hits"] += 1
+                    else:
+                        still_missing.append(index)
+                missing = still_missing
+
+            self.stats["misses"] += len(missing)
+        return results
+
+    def get(self, model: str, text: str) -> Optional["np.ndarray"]:
+        return self.get_many(model, [text])[0]
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Any]):
+        entries = [(embedding_key(model, text), self._encode(vector)) for text, vector in zip(texts, vectors)]
+        with self._lock:
+            for key, data in entries:
+                self._remember(key, data)
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, dtype, vector) VALUES (?, ?, ?)",
+                        [(key, self.dtype.name, data) for key, data in entries]
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist embeddings: {e}")
+
+    def put(self, model: str, text: str, vector: Any):
+        self.put_many(model, [text], [vector])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": (self.stats["hits"] + self.stats["disk_hits"]) / max(lookups, 1),
+            "bytes": sum(len(data) for data in self._entries.values())
+        }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class CachedEmbedder:
+    """Local embedder (embed(texts) -> matrix) with cached rows"""
+
+    def __init__(self, embedder, cache: EmbeddingCache, model: Optional[str] = None):
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model or embedder.name
+
+    @property
+    def name(self) -> str:
+        return self.embedder.name
+
+    @property
+    def dim(self) -> int:
+        return self.embedder.dim
+
+    def _lookup(self, texts: Sequence[str]):
+        cached = self.cache.get_many(self.model, texts)
+        missing = [index for index, vector in enumerate(cached) if vector is None]
+        # Embed each distinct missing text once
+        unique = list(dict.fromkeys(texts[index] for index in missing))
+        return cached, missing, unique
+
+    def _fill(self, texts, cached, missing, unique, vectors) -> "np.ndarray":
+        if unique:
+            self.cache.put_many(self.model, unique, vectors)
+            by_text = dict(zip(unique, vectors))
+            for index in missing:
+                cached[index] = by_text[texts[index]]
+        return np.vstack(cached).astype(np.float32, copy=False) if cached else \
+            np.zeros((0, self.dim), dtype=np.float32)
+
+    def embed(self, texts: Sequence[str]) -> "np.ndarray":
+        cached, missing, unique = self._lookup(texts)
+        vectors = self.embedder.embed(unique) if unique else None
+        return self._fill(texts, cached, missing, unique, vectors)
+
+    async def embed_async(self, texts: Sequence[str]) -> "np.ndarray":
+        """Cache lookup inline; misses go to the embedder's async path or an executor"""
+        cached, missing, unique = self._lookup(texts)
+        vectors = None
+        if unique:
+            if hasattr(self.embedder, "embed_async"):
+                vectors = await self.embedder.embed_async(unique)
+            else:
+                loop = asyncio.get_running_loop()
+                vectors = await loop.run_in_executor(None, self.embedder.embed, unique)
+        return self._fill(texts, cached, missing, unique, vectors)
+
+
+class CachedMem0Embedder:
+    """
+    Wraps mem0's embedding model (embed(text, ...) -> list of floats).
+
+    Installed as Memory.embedding_model, so both memory writes and search
+    queries inside mem0 go through the cache.
+    """
+
+    def __init__(self, embedder, cache: EmbeddingCache, model: str):
+        self._embedder = embedder
+        self._cache = cache
+        self._model = model
+
+    def embed(self, text, *args, **kwargs):
+        if not isinstance(text, str):
+            return self._embedder.embed(text, *args, **kwargs)
+        vector = self._cache.get(self._model, text)
+        if vector is None:
+            vector = self._embedder.embed(text, *args, **kwargs)
+            self._cache.put(self._model, text, vector)
+            return vector
+        return vector.tolist()
+
+    def __getattr__(self, name):
+        return getattr(self._embedder, name)
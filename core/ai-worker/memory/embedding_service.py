@@ -0,0 +1,212 @@
+"""
+Local Embedding Service for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module runs a local CPU embedder on a dedicated thread. Concurrent
+embed requests from the memory engines are coalesced into micro-batches
+(bounded by size and by wait time), so the model is loaded once per
+process and encodes many texts per call. It works fully offline.
+"""
+
+import os
+import time
+import queue
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from .local_embeddings import create_local_embedder
+except ImportError:
+    from local_embeddings import create_local_embedder
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class EmbeddingServiceConfig:
+    """Micro-batching configuration for the local embedding service"""
+    max_batch_size: int = 64  # texts per model call
+    max_wait_ms: float = 5.0  # how long the first request waits for company
+
+    @classmethod
+    def from_env(cls, prefix: str = "AGENTOS_EMBEDDING") -> "EmbeddingServiceConfig":
+        """Build configuration from <prefix>_* environment variables"""
+        return cls(
+            max_batch_size=int(os.getenv(f"{prefix}_MAX_BATCH", "64")),
+            max_wait_ms=float(os.getenv(f"{prefix}_MAX_WAIT_MS", "5.0"))
+        )
+
+
+class EmbeddingService:
+    """
+    Micro-batching front end for a local embedder.
+
+    The embedder is built, loaded and used only on the service thread;
+    name and dim block until it is loaded (wait_ready does not). Callers
+    submit texts from any thread (submit / embed) or from a running loop
+    (embed_async); each request resolves with its own rows of the batch.
+    """
+
+    def __init__(self, embedder_factory: Callable[[], object],
+                 config: Optional[EmbeddingServiceConfig] = None,
+                 name: str = "agentos-embedder"):
+        self.config = config or EmbeddingServiceConfig.from_env()
+        self._factory = embedder_factory
+        self._requests: "queue.Queue" = queue.Queue()
+        self._embedder = None
+        self._load_error: Optional[BaseException] = None
+        self._loaded = threading.Event()
+        self._closed = False
+        self.stats = {"requests": 0, "texts": 0, "batches": 0}
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _wait_loaded(self):
+        self._loaded.wait()
+        if self._load_error is not None:
+            raise RuntimeError(f"Embedding model failed to load: {self._load_error}")
+        return self._embedder
+
+    async def wait_ready(self):
+        """Wait for the model to load without blocking the event loop"""
+        if not self._loaded.is_set():
+            await asyncio.to_thread(self._loaded.wait)
+        return self._wait_loaded()
+
+    @property
+    def name(self) -> str:
+        return self._wait_loaded().name
+
+    @property
+    def dim(self) -> int:
+        return self._wait_loaded().dim
+
+    def submit(self, texts: Sequence[str]) -> Future:
+        """Queue texts for embedding; the future resolves to a float32 matrix"""
+        if self._closed:
+            raise RuntimeError("Embedding service is closed")
+        future: Future = Future()
+        self._requests.put((list(texts), future))
+        return future
+
+    def embed(self, texts: Sequence[str]):
+        """Blocking embed (same interface as the local embedders)"""
+        return self.submit(texts).result()
+
+    async def embed_async(self, texts: Sequence[str]):
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def _run(self):
+        try:
+            embedder = self._factory()
+            # Lazy embedders load their model on first use; do it here, not in a caller
+            embedder.dim
+            self._embedder = embedder
+        except BaseException as e:
+            self._load_error = e
+            logger.error(f"Failed to load embedding model: {e}")
+        finally:
+            self._loaded.set()
+
+        while True:
+            request = self._requests.get()
+            if request is _STOP:
+                return
+            batch, stop = self._collect(request)
+            self._process(batch)
+            if stop:
+                return
+
+    def _collect(self, first: Tuple[List[str], Future]) -> Tuple[List[Tuple[List[str], Future]], bool]:
+        """Gather requests until the batch is full or max_wait has passed"""
+        batch = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.config.max_wait_ms / 1000
+        while size < self.config.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+            size += len(request[0])
+        return batch, False
+
+    def _process(self, batch: List[Tuple[List[str], Future]]):
+        live = [(texts, future) for texts, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        if self._load_error is not None:
+            for _, future in live:
+                future.set_exception(RuntimeError(f"Embedding model failed to load: {self._load_error}"))
+            return
+
+        texts = [text for request_texts, _ in live for text in request_texts]
+        try:
+            vectors = self._embedder.embed(texts)
+        except Exception as e:
+            for _, future in live:
+                future.set_exception(e)
+            return
+
+        self.stats["requests"] += len(live)
+        self.stats["texts"] += len(texts)
+        self.stats["batches"] += 1
+        offset = 0
+        for request_texts, future in live:
+            count = len(request_texts)
+            future.set_result(vectors[offset:offset + count])
+            offset += count
+
+    def get_statistics(self) -> Dict[str, float]:
+        return {
+            **self.stats,
+            "mean_batch_size": self.stats["texts"] / max(self.stats["batches"], 1),
+            "pending": self._requests.qsize()
+        }
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Finish queued requests and stop the service thread"""
+        if not self._closed:
+            self._closed = True
+            self._requests.put(_STOP)
+        self._thread.join(timeout)
+
+
+_services: Dict[str, EmbeddingService] = {}
+_services_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: Optional[str] = None) -> EmbeddingService:
+    """
+    Process-wide embedding service for a local model
+
+    Every memory component asking for the same model shares one service,
+    so the model is loaded once and their requests are batched together.
+    """
+    key = model_name or "hashing"
+    with _services_lock:
+        service = _services.get(key)
+        if service is None or service._closed:
+            service = EmbeddingService(lambda: create_local_embedder(model_name))
+            _services[key] = service
+        return service
+
+
+def close_embedding_services():
+    """Stop all shared embedding services (e.g. on worker shutdown)"""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.close()
@@ -0,0 +1,186 @@
+"""
+Binary Memory Entry Codec for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module serializes memory entries for Redis caches and working memory
+in a compact, versioned binary layout: enums as ordinals, timestamps as
+integer microseconds since the epoch and embeddings as raw float32 bytes.
+Compared to asdict + JSON, cached search results with embeddings are several
+times smaller and decode without float or ISO-datetime parsing.
+"""
+
+import sys
+import json
+import struct
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+
+# First byte is NUL, which never starts a JSON document, so binary values can
+# be told apart from entries cached by older releases
+MAGIC = b"\x00\xa7"
+VERSION = 1
+
+KIND_ENTRY = 1
+KIND_LIST = 2
+
+_HEADER = struct.Struct("<2sBB")  # magic, version, kind
+_FIXED = struct.Struct("<BBBdqqi")  # memory type, framework, flags, importance, created, updated, embedding length
+_LENGTH = struct.Struct("<I")
+
+_CREATED_NONE = 1
+_UPDATED_NONE = 2
+_CREATED_UTC = 4
+_UPDATED_UTC = 8
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_SWAP = sys.byteorder != "little"
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def is_encoded(value: Any) -> bool:
+    """True for values written by this codec (as opposed to legacy JSON)"""
+    return isinstance(value, (bytes, bytearray)) and value[:2] == MAGIC
+
+
+def _encode_time(value: Optional[datetime]) -> Tuple[int, bool]:
+    """Microseconds since the epoch and whether the value was timezone-aware"""
+    if value is None:
+        return 0, False
+    if value.tzinfo is None:
+        return (value - _EPOCH) // _MICROSECOND, False
+    return (value - _EPOCH_UTC) // _MICROSECOND, True
+
+
+def _decode_time(micros: int, utc: bool) -> datetime:
+    return (_EPOCH_UTC if utc else _EPOCH) + timedelta(microseconds=micros)
+
+
+class MemoryEntryCodec:
+    """
+    Encoder/decoder for one memory entry class.
+
+    Enum ordinals follow member definition order: append new members at the
+    end of the enums, and bump VERSION if existing members are reordered.
+    Metadata stays JSON inside the binary record (it is free-form).
+    """
+
+    def __init__(self, entry_cls: Type, memory_types: Type, frameworks: Type):
+        self.entry_cls = entry_cls
+        self.memory_types = list(memory_types)
+        self.frameworks = list(frameworks)
+        self._memory_type_ordinals = {member: index for index, member in enumerate(self.memory_types)}
+        self._framework_ordinals = {member: index for index, member in enumerate(self.frameworks)}
+
+    # Encoding
+    def _encode_body(self, entry, parts: List[bytes]):
+        created, created_utc = _encode_time(entry.created_at)
+        updated, updated_utc = _encode_time(entry.updated_at)
+        flags = (
+            (_CREATED_NONE if entry.created_at is None else 0) |
+            (_UPDATED_NONE if entry.updated_at is None else 0) |
+            (_CREATED_UTC if created_utc else 0) |
+            (_UPDATED_UTC if updated_utc else 0)
+        )
+        embedding = entry.embedding
+        parts.append(_FIXED.pack(
+            self._memory_type_ordinals[entry.memory_type],
+            self._framework_ordinals[entry.framework],
+            flags,
+            entry.importance,
+            created,
+            updated,
+            -1 if embedding is None else len(embedding)
+        ))
+
+        strings = [entry.id or "", entry.content or ""]
+        strings.extend(entry.concepts or [])
+        strings.append(json.dumps(entry.metadata or {}, default=str))
+        parts.append(_LENGTH.pack(len(entry.concepts or [])))
+        for text in strings:
+            data = text.encode("utf-8")
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+
+        if embedding is not None:
+            vector = array("f", embedding)
+            if _SWAP:
+                vector.byteswap()
+            parts.append(vector.tobytes())
+
+    def encode(self, entry) -> bytes:
+        parts = [_HEADER.pack(MAGIC, VERSION, KIND_ENTRY)]
+        self._encode_body(entry, parts)
+        return b"".join(parts)
+
+    def encode_many(self, entries: Sequence) -> bytes:
+        parts = [_HEADER.pack(MAGIC, VERSION, KIND_LIST), _LENGTH.pack(len(entries))]
+        for entry in entries:
+            self._encode_body(entry, parts)
+        return b"".join(parts)
+
+    # Decoding
+    def _decode_body(self, view: memoryview, offset: int):
+        memory_type, framework, flags, importance, created, updated, dim = _FIXED.unpack_from(view, offset)
+        offset += _FIXED.size
+
+        (concept_count,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        strings = []
+        for _ in range(concept_count + 3):
+            (length,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            strings.append(str(view[offset:offset + length], "utf-8"))
+            offset += length
+
+        embedding = None
+        if dim >= 0:
+            vector = array("f")
+            vector.frombytes(view[offset:offset + dim * 4])
+            if _SWAP:
+                vector.byteswap()
+            embedding = vector.tolist()
+            offset += dim * 4
+
+        entry = self.entry_cls(
+            id=strings[0],
+            content=strings[1],
+            memory_type=self.memory_types[memory_type],
+            framework=self.frameworks[framework],
+            concepts=strings[2:-1],
+            importance=importance,
+            embedding=embedding,
+            metadata=json.loads(strings[-1]),
+            created_at=None if flags & _CREATED_NONE else _decode_time(created, bool(flags & _CREATED_UTC)),
+            updated_at=None if flags & _UPDATED_NONE else _decode_time(updated, bool(flags & _UPDATED_UTC))
+        )
+        return entry, offset
+
+    def _read_header(self, data: Buffer, kind: int) -> memoryview:
+        view = memoryview(data)
+        magic, version, found = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a binary memory entry")
+        if version != VERSION:
+            raise ValueError(f"Unsupported memory entry codec version: {version}")
+        if found != kind:
+            raise ValueError(f"Expected record kind {kind}, found {found}")
+        return view
+
+    def decode(self, data: Buffer):
+        view = self._read_header(data, KIND_ENTRY)
+        entry, _ = self._decode_body(view, _HEADER.size)
+        return entry
+
+    def decode_many(self, data: Buffer) -> List:
+        view = self._read_header(data, KIND_LIST)
+        (count,) = _LENGTH.unpack_from(view, _HEADER.size)
+        offset = _HEADER.size + _LENGTH.size
+        entries = []
+        for _ in range(count):
+            entry, offset = self._decode_body(view, offset)
+            entries.append(entry)
+        return entries
@@ -9,10 +9,11 @@ integrating them with the mem0 memory engine.
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from mem0_memory_engine import Mem0MemoryEngine, FrameworkType
+from batching import BatchStoreResult
 
 
 class BaseMemoryAdapter(ABC):
@@ -36,10 +37,68 @@ class BaseMemoryAdapter(ABC):
         pass
     
     @abstractmethod
-    async def get_agent_memory(self, user_id: str, agent_id: str) -> Dict[str, Any]:
-        """Get memory specific to an agent"""
+    async def get_agent_memory(self, user_id: str, agent_id: str, limit: int = 50,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get memory specific to an agent (one page, newest first)"""
         pass
 
+    def _build_memory(self, messages: List[Dict[str, str]],
+                      agent_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Content and metadata stored for one conversation"""
+        raise NotImplementedError
+
+    async def _list_agent_memories(self, user_id: str, agent_id: str, id_field: str,
+                                   limit: int, cursor: Optional[str]) -> Dict[str, Any]:
+        """
+        One page of an agent's memories from its timeline
+
+        Memories stored before the timelines existed (or without Redis) are on
+        no timeline, so an empty first page falls back to the framework
+        listing filtered on metadata[id_field].
+        """
+        page = await self.memory_engine.list_memories(
+            framework=self.framework,
+            user_id=user_id,
+            agent_id=agent_id,
+            limit=limit,
+            cursor=cursor
+        )
+        if page["memories"] or cursor is not None:
+            return page
+
+        memories = await self.memory_engine.get_framework_memories(
+            framework=self.framework,
+            user_id=user_id,
+            limit=limit
+        )
+        return {
+            "memories": [mem for mem in memories if mem.get("metadata", {}).get(id_field) == agent_id],
+            "next_cursor": None
+        }
+
+    async def store_conversations(self, user_id: str, conversations: List[List[Dict[str, str]]],
+                                  agent_id: Optional[str] = None) -> BatchStoreResult:
+        """
+        Store many conversations with one bulk engine call
+
+        Returns:
+            BatchStoreResult aligned with conversations
+        """
+        batch = []
+        for messages in conversations:
+            content, metadata = self._build_memory(messages, agent_id)
+            batch.append({
+                "content": content,
+                "framework": self.framework,
+                "user_id": user_id,
+                "agent_id": agent_id,
+                "metadata": metadata
+            })
+
+        result = await self.memory_engine.store_memories(batch)
+        self.logger.info(f"Stored {result.stored} {self.framework.value} conversations in bulk")
+        return result
+
 
 class LangChainMemoryAdapter(BaseMemoryAdapter):
     """Memory adapter for LangChain framework"""
@@ -61,19 +120,8 @@ class LangChainMemoryAdapter(BaseMemoryAdapter):
             Memory ID
         """
         try:
-            # Combine messages into conversation context
-            conversation = "\n".join([
-                f"{msg.get('role', 'user')}: {msg.get('content', '')}"
-                for msg in messages
-            ])
-            
-            metadata = {
-                "type": "conversation",
-                "message_count": len(messages),
-                "agent_type": "langchain_agent",
-                "conversation_id": agent_id or f"langchain_{int(datetime.now().timestamp())}"
-            }
-            
+            conversation, metadata = self._build_memory(messages, agent_id)
+
             memory_id = await self.memory_engine.store_memory(
                 content=conversation,
                 framework=self.framework,
@@ -88,6 +136,22 @@ class LangChainMemoryAdapter(BaseMemoryAdapter):
         except Exception as e:
             self.logger.error(f"Failed to store LangChain conversation: {e}")
             raise
+
+    def _build_memory(self, messages: List[Dict[str, str]],
+                      agent_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        # Combine messages into conversation context
+        conversation = "\n".join([
+            f"{msg.get('role', 'user')}: {msg.get('content', '')}"
+            for msg in messages
+        ])
+
+        metadata = {
+            "type": "conversation",
+            "message_count": len(messages),
+            "agent_type": "langchain_agent",
+            "conversation_id": agent_id or f"langchain_{int(datetime.now().timestamp())}"
+        }
+        return conversation, metadata
     
     async def retrieve_context(self, user_id: str, query: str, 
                              limit: int = 5) -> List[Dict[str, Any]]:
@@ -116,26 +180,19 @@ class LangChainMemoryAdapter(BaseMemoryAdapter):
             self.logger.error(f"Failed to retrieve LangChain context: {e}")
             return []
     
-    async def get_agent_memory(self, user_id: str, agent_id: str) -> Dict[str, Any]:
+    async def get_agent_memory(self, user_id: str, agent_id: str, limit: int = 50,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get LangChain agent-specific memory"""
         try:
-            memories = await self.memory_engine.get_framework_memories(
-                framework=self.framework,
-                user_id=user_id,
-                limit=50
-            )
-            
-            # Filter by agent_id
-            agent_memories = [
-                mem for mem in memories
-                if mem.get("metadata", {}).get("conversation_id") == agent_id
-            ]
+            page = await self._list_agent_memories(user_id, agent_id, "conversation_id", limit, cursor)
+            agent_memories = page["memories"]
             
             return {
                 "agent_id": agent_id,
                 "framework": "langchain",
                 "memory_count": len(agent_memories),
                 "memories": agent_memories,
+                "next_cursor": page["next_cursor"],
                 "last_interaction": agent_memories[0].get("metadata", {}).get("timestamp") if agent_memories else None
             }
             
@@ -154,16 +211,8 @@ class SwarmsMemoryAdapter(BaseMemoryAdapter):
                                agent_id: Optional[str] = None) -> str:
         """Store Swarms agent interaction"""
         try:
-            # Swarms focuses on agent collaboration
-            interaction_summary = self._create_swarm_summary(messages)
-            
-            metadata = {
-                "type": "swarm_interaction",
-                "agent_count": len(set(msg.get("agent_id") for msg in messages if msg.get("agent_id"))),
-                "interaction_type": "collaborative",
-                "swarm_id": agent_id or f"swarm_{int(datetime.now().timestamp())}"
-            }
-            
+            interaction_summary, metadata = self._build_memory(messages, agent_id)
+
             memory_id = await self.memory_engine.store_memory(
                 content=interaction_summary,
                 framework=self.framework,
@@ -178,6 +227,19 @@ class SwarmsMemoryAdapter(BaseMemoryAdapter):
         except Exception as e:
             self.logger.error(f"Failed to store Swarms interaction: {e}")
             raise
+
+    def _build_memory(self, messages: List[Dict[str, str]],
+                      agent_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        # Swarms focuses on agent collaboration
+        interaction_summary = self._create_swarm_summary(messages)
+
+        metadata = {
+            "type": "swarm_interaction",
+            "agent_count": len(set(msg.get("agent_id") for msg in messages if msg.get("agent_id"))),
+            "interaction_type": "collaborative",
+            "swarm_id": agent_id or f"swarm_{int(datetime.now().timestamp())}"
+        }
+        return interaction_summary, metadata
     
     async def retrieve_context(self, user_id: str, query: str, 
                              limit: int = 5) -> List[Dict[str, Any]]:
@@ -206,26 +268,19 @@ class SwarmsMemoryAdapter(BaseMemoryAdapter):
             self.logger.error(f"Failed to retrieve Swarms context: {e}")
             return []
     
-    async def get_agent_memory(self, user_id: str, agent_id: str) -> Dict[str, Any]:
+    async def get_agent_memory(self, user_id: str, agent_id: str, limit: int = 30,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get Swarms agent memory with collaboration history"""
         try:
-            memories = await self.memory_engine.get_framework_memories(
-                framework=self.framework,
-                user_id=user_id,
-                limit=30
-            )
-            
-            # Filter by swarm_id
-            swarm_memories = [
-                mem for mem in memories
-                if mem.get("metadata", {}).get("swarm_id") == agent_id
-            ]
+            page = await self._list_agent_memories(user_id, agent_id, "swarm_id", limit, cursor)
+            swarm_memories = page["memories"]
             
             return {
                 "swarm_id": agent_id,
                 "framework": "swarms",
                 "interaction_count": len(swarm_memories),
                 "memories": swarm_memories,
+                "next_cursor": page["next_cursor"],
                 "collaboration_patterns": self._analyze_collaboration_patterns(swarm_memories)
             }
             
@@ -268,16 +323,8 @@ class CrewAIMemoryAdapter(BaseMemoryAdapter):
                                agent_id: Optional[str] = None) -> str:
         """Store CrewAI crew task execution"""
         try:
-            # CrewAI focuses on role-based task execution
-            task_summary = self._create_crew_task_summary(messages)
-            
-            metadata = {
-                "type": "crew_task",
-                "roles_involved": self._extract_roles(messages),
-                "task_complexity": len(messages),
-                "crew_id": agent_id or f"crew_{int(datetime.now().timestamp())}"
-            }
-            
+            task_summary, metadata = self._build_memory(messages, agent_id)
+
             memory_id = await self.memory_engine.store_memory(
                 content=task_summary,
                 framework=self.framework,
@@ -292,6 +339,19 @@ class CrewAIMemoryAdapter(BaseMemoryAdapter):
         except Exception as e:
             self.logger.error(f"Failed to store CrewAI task: {e}")
             raise
+
+    def _build_memory(self, messages: List[Dict[str, str]],
+                      agent_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        # CrewAI focuses on role-based task execution
+        task_summary = self._create_crew_task_summary(messages)
+
+        metadata = {
+            "type": "crew_task",
+            "roles_involved": self._extract_roles(messages),
+            "task_complexity": len(messages),
+            "crew_id": agent_id or f"crew_{int(datetime.now().timestamp())}"
+        }
+        return task_summary, metadata
     
     async def retrieve_context(self, user_id: str, query: str, 
                              limit: int = 5) -> List[Dict[str, Any]]:
@@ -320,26 +380,19 @@ class CrewAIMemoryAdapter(BaseMemoryAdapter):
             self.logger.error(f"Failed to retrieve CrewAI context: {e}")
             return []
     
-    async def get_agent_memory(self, user_id: str, agent_id: str) -> Dict[str, Any]:
+    async def get_agent_memory(self, user_id: str, agent_id: str, limit: int = 40,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get CrewAI crew memory with role analysis"""
         try:
-            memories = await self.memory_engine.get_framework_memories(
-                framework=self.framework,
-                user_id=user_id,
-                limit=40
-            )
-            
-            # Filter by crew_id
-            crew_memories = [
-                mem for mem in memories
-                if mem.get("metadata", {}).get("crew_id") == agent_id
-            ]
+            page = await self._list_agent_memories(user_id, agent_id, "crew_id", limit, cursor)
+            crew_memories = page["memories"]
             
             return {
                 "crew_id": agent_id,
                 "framework": "crewai",
                 "task_count": len(crew_memories),
                 "memories": crew_memories,
+                "next_cursor": page["next_cursor"],
                 "role_analysis": self._analyze_role_performance(crew_memories)
             }
             
@@ -397,18 +450,10 @@ class AutoGenMemoryAdapter(BaseMemoryAdapter):
                                agent_id: Optional[str] = None) -> str:
         """Store AutoGen multi-agent conversation"""
         try:
-            # AutoGen focuses on multi-agent conversations
-            conversation_analysis = self._analyze_autogen_conversation(messages)
-            
-            metadata = {
-                "type": "autogen_conversation",
-                "turn_count": len(messages),
-                "agent_types": conversation_analysis["agent_types"],
-                "conversation_id": agent_id or f"autogen_{int(datetime.now().timestamp())}"
-            }
-            
+            summary, metadata = self._build_memory(messages, agent_id)
+
             memory_id = await self.memory_engine.store_memory(
-                content=conversation_analysis["summary"],
+                content=summary,
                 framework=self.framework,
                 user_id=user_id,
                 agent_id=agent_id,
@@ -421,6 +466,19 @@ class AutoGenMemoryAdapter(BaseMemoryAdapter):
         except Exception as e:
             self.logger.error(f"Failed to store AutoGen conversation: {e}")
             raise
+
+    def _build_memory(self, messages: List[Dict[str, str]],
+                      agent_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        # AutoGen focuses on multi-agent conversations
+        conversation_analysis = self._analyze_autogen_conversation(messages)
+
+        metadata = {
+            "type": "autogen_conversation",
+            "turn_count": len(messages),
+            "agent_types": conversation_analysis["agent_types"],
+            "conversation_id": agent_id or f"autogen_{int(datetime.now().timestamp())}"
+        }
+        return conversation_analysis["summary"], metadata
     
     async def retrieve_context(self, user_id: str, query: str, 
                              limit: int = 5) -> List[Dict[str, Any]]:
@@ -449,26 +507,19 @@ class AutoGenMemoryAdapter(BaseMemoryAdapter):
             self.logger.error(f"Failed to retrieve AutoGen context: {e}")
             return []
     
-    async def get_agent_memory(self, user_id: str, agent_id: str) -> Dict[str, Any]:
+    async def get_agent_memory(self, user_id: str, agent_id: str, limit: int = 35,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get AutoGen conversation memory"""
         try:
-            memories = await self.memory_engine.get_framework_memories(
-                framework=self.framework,
-                user_id=user_id,
-                limit=35
-            )
-            
-            # Filter by conversation_id
-            conversation_memories = [
-                mem for mem in memories
-                if mem.get("metadata", {}).get("conversation_id") == agent_id
-            ]
+            page = await self._list_agent_memories(user_id, agent_id, "conversation_id", limit, cursor)
+            conversation_memories = page["memories"]
             
             return {
                 "conversation_id": agent_id,
                 "framework": "autogen",
                 "conversation_count": len(conversation_memories),
                 "memories": conversation_memories,
+                "next_cursor": page["next_cursor"],
                 "conversation_patterns": self._analyze_conversation_patterns(conversation_memories)
             }
             
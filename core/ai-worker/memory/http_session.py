@@ -0,0 +1,101 @@
+"""
+Shared HTTP Session for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module provides a lifecycle-managed aiohttp session with a tuned
+connection pool, shared by UniversalMemory and the consolidation engine so
+memory calls on the prompt-building path reuse keep-alive connections and
+cached DNS lookups instead of opening a new session per request.
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPSessionConfig:
+    """Connection pool configuration for the memory API session"""
+    limit: int = 100  # total connections
+    limit_per_host: int = 32
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    connect_timeout: float = 5.0
+    total_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls, prefix: str = "AGENTOS_MEMORY_HTTP") -> "HTTPSessionConfig":
+        """Build configuration from <prefix>_* environment variables"""
+        return cls(
+            limit=int(os.getenv(f"{prefix}_LIMIT", "100")),
+            limit_per_host=int(os.getenv(f"{prefix}_LIMIT_PER_HOST", "32")),
+            keepalive_timeout=float(os.getenv(f"{prefix}_KEEPALIVE", "30.0")),
+            dns_cache_ttl=int(os.getenv(f"{prefix}_DNS_TTL", "300")),
+            connect_timeout=float(os.getenv(f"{prefix}_CONNECT_TIMEOUT", "5.0")),
+            total_timeout=float(os.getenv(f"{prefix}_TIMEOUT", "30.0"))
+        )
+
+
+class SharedHTTPSession:
+    """
+    Lazily created, reusable aiohttp session.
+
+    The session is opened on first use and reused until close(). aiohttp
+    sessions are bound to the loop they were created on, so a session from
+    another (or a closed) loop is replaced transparently.
+    """
+
+    def __init__(self, config: Optional[HTTPSessionConfig] = None):
+        self.config = config or HTTPSessionConfig.from_env()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.sessions_created = 0
+
+    def _create(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.config.limit,
+            limit_per_host=self.config.limit_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            ttl_dns_cache=self.config.dns_cache_ttl
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.config.total_timeout,
+            connect=self.config.connect_timeout
+        )
+        self.sessions_created += 1
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Get the shared session, opening it if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session left on another loop cannot be closed from this one
+            self._session = self._create()
+            self._loop = loop
+        return self._session
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def close(self):
+        """Close the session and release pooled connections"""
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Failed to close memory HTTP session: {e}")
+
+    async def __aenter__(self) -> "SharedHTTPSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,234 @@
+"""
+Redis Keyword Index for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module maintains an inverted index over fallback memories in Redis:
+one set of memory IDs per token, per user and per framework, written in the
+same pipeline as the memory record and expiring with it. Keyword queries
+intersect the token sets with the caller's scope, fetch only the matching
+records and rank them with BM25, so query cost follows the number of
+matches rather than the size of the store. Listings without a query read
+per-scope sorted sets ordered by timestamp, fetching only `limit` records.
+"""
+
+import re
+import json
+import math
+import time
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "with"
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Casefolded word tokens without stopwords or single characters"""
+    return [
+        token for token in _TOKEN.findall(text.casefold())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+class KeywordIndex:
+    """
+    Inverted index of memory records stored under `{record_prefix}{id}`.
+
+    Sets are refreshed to the record TTL on every write, so a set lives as
+    long as its newest member. Members whose record has expired are removed
+    lazily, from the sets a query touched, when the query finds them missing.
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+    # Candidates fetched per requested result, ranked by matched-token IDF
+    CANDIDATES_PER_RESULT = 5
+    MIN_CANDIDATES = 50
+
+    def __init__(self, record_prefix: str = "fallback_memory:",
+                 index_prefix: str = "fallback_index:", ttl: int = 86400):
+        self.record_prefix = record_prefix
+        self.index_prefix = index_prefix
+        self.ttl = ttl
+
+    def token_key(self, token: str) -> str:
+        return f"{self.index_prefix}token:{token}"
+
+    def user_key(self, user_id: str) -> str:
+        return f"{self.index_prefix}user:{user_id}"
+
+    def framework_key(self, framework: str) -> str:
+        return f"{self.index_prefix}framework:{framework}"
+
+    @property
+    def all_key(self) -> str:
+        return f"{self.index_prefix}all"
+
+    def recent_key(self, user_id: Optional[str] = None, framework: Optional[str] = None) -> str:
+        """Sorted set of the scope's memory IDs, scored by timestamp (ms)"""
+        return f"{self.index_prefix}recent:{user_id or '*'}:{framework or '*'}"
+
+    def _recent_keys(self, metadata: Dict[str, Any]) -> List[str]:
+        user_id, framework = metadata.get("user_id"), metadata.get("framework")
+        scopes = dict.fromkeys([(None, None), (user_id, None), (None, framework), (user_id, framework)])
+        return [self.recent_key(*scope) for scope in scopes]
+
+    @staticmethod
+    def _recency_score(metadata: Dict[str, Any]) -> int:
+        try:
+            return int(datetime.fromisoformat(metadata["timestamp"]).timestamp() * 1000)
+        except (KeyError, TypeError, ValueError):
+            return int(time.time() * 1000)
+
+    def _entry_keys(self, content: str, metadata: Dict[str, Any]) -> List[str]:
+        keys = [self.token_key(token) for token in set(tokenize(content))]
+        if metadata.get("user_id"):
+            keys.append(self.user_key(metadata["user_id"]))
+        if metadata.get("framework"):
+            keys.append(self.framework_key(metadata["framework"]))
+        keys.append(self.all_key)
+        return keys
+
+    def queue_add(self, pipe, memory_id: str, content: str, metadata: Dict[str, Any]):
+        """Queue the index writes for one record on `pipe`"""
+        for key in self._entry_keys(content, metadata):
+            pipe.sadd(key, memory_id)
+            pipe.expire(key, self.ttl)
+        score = self._recency_score(metadata)
+        for key in self._recent_keys(metadata):
+            pipe.zadd(key, {memory_id: score})
+            pipe.expire(key, self.ttl)
+
+    def queue_remove(self, pipe, memory_id: str, content: str, metadata: Dict[str, Any]):
+        """Queue removal of one record from every set it was added to"""
+        for key in self._entry_keys(content, metadata):
+            pipe.srem(key, memory_id)
+        for key in self._recent_keys(metadata):
+            pipe.zrem(key, memory_id)
+
+    def _scope_keys(self, user_id: Optional[str], framework: Optional[str]) -> List[str]:
+        keys = []
+        if user_id:
+            keys.append(self.user_key(user_id))
+        if framework:
+            keys.append(self.framework_key(framework))
+        return keys
+
+    async def search(self, redis, query: str, user_id: Optional[str] = None,
+                     framework: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        BM25-ranked records containing any query token, within scope
+
+        Returns:
+            Records as {"id", "content", "metadata", "score"}, best first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return await self.recent(redis, user_id, framework, limit)
+
+        scope = self._scope_keys(user_id, framework)
+        pipe = redis.pipeline(transaction=False)
+        for token in tokens:
+            if scope:
+                pipe.sinter(self.token_key(token), *scope)
+            else:
+                pipe.smembers(self.token_key(token))
+        for token in tokens:
+            pipe.scard(self.token_key(token))
+        pipe.scard(self.all_key)
+        replies = await pipe.execute()
+
+        matches = replies[:len(tokens)]
+        doc_freqs = replies[len(tokens):-1]
+        total = max(replies[-1], 1)
+        idf = {
+            token: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for token, df in zip(tokens, doc_freqs)
+        }
+
+        # Pre-rank by the IDF of matched tokens to bound the records fetched
+        prescores: Dict[str, float] = {}
+        for token, members in zip(tokens, matches):
+            for memory_id in members:
+                prescores[memory_id] = prescores.get(memory_id, 0.0) + idf[token]
+        if not prescores:
+            return []
+        budget = max(limit * self.CANDIDATES_PER_RESULT, self.MIN_CANDIDATES)
+        candidates = sorted(prescores, key=lambda memory_id: (-prescores[memory_id], memory_id))[:budget]
+
+        records, _ = await self._fetch(redis, candidates, [self.token_key(token) for token in tokens] + scope)
+        if not records:
+            return []
+
+        term_counts = {record["id"]: Counter(tokenize(record["content"])) for record in records}
+        lengths = {memory_id: sum(counts.values()) for memory_id, counts in term_counts.items()}
+        average_length = max(sum(lengths.values()) / len(lengths), 1.0)
+
+        for record in records:
+            counts = term_counts[record["id"]]
+            norm = self.K1 * (1 - self.B + self.B * lengths[record["id"]] / average_length)
+            record["score"] = sum(
+                idf[token] * counts[token] * (self.K1 + 1) / (counts[token] + norm)
+                for token in tokens if counts[token]
+            )
+
+        records.sort(key=lambda record: -record["score"])
+        return records[:limit]
+
+    async def recent(self, redis, user_id: Optional[str] = None, framework: Optional[str] = None,
+                     limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent records within scope (no query), newest first"""
+        key = self.recent_key(user_id, framework)
+        records: List[Dict[str, Any]] = []
+        start = 0
+        while len(records) < limit:
+            memory_ids = await redis.zrevrangebyscore(key, "+inf", "-inf", start=start, num=limit - len(records))
+            if not memory_ids:
+                break
+            found, stale = await self._fetch(redis, memory_ids, self._scope_keys(user_id, framework), [key])
+            records.extend(found)
+            # Stale members were removed from the sorted set, shifting later ranks down
+            start += len(memory_ids) - len(stale)
+        return records
+
+    async def _fetch(self, redis, memory_ids: List[str], touched_keys: Iterable[str],
+                     touched_sorted_keys: Iterable[str] = ()) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        MGET records; members whose record is gone are dropped from the touched keys
+
+        Returns:
+            The records found (in memory_ids order) and the stale IDs pruned
+        """
+        values = await redis.mget([f"{self.record_prefix}{memory_id}" for memory_id in memory_ids])
+        records, stale = [], []
+        for memory_id, raw in zip(memory_ids, values):
+            if raw is None:
+                stale.append(memory_id)
+                continue
+            try:
+                data = json.loads(raw)
+                records.append({"id": memory_id, "content": data["content"], "metadata": data.get("metadata") or {}})
+            except (ValueError, KeyError, TypeError):
+                continue
+
+        if stale:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for key in set(touched_keys) | {self.all_key}:
+                    pipe.srem(key, *stale)
+                for key in touched_sorted_keys:
+                    pipe.zrem(key, *stale)
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to prune expired memories from keyword index: {e}")
+                stale = []
+        return records, stale
@@ -0,0 +1,123 @@
+"""
+Local CPU Embeddings for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module provides embedders that run in-process on the CPU, used when
+mem0 (and its hosted embedding model) is unavailable. A sentence-transformers
+model is used when installed; otherwise a dependency-free feature-hashing
+embedder over words and character trigrams keeps the fallback path working.
+All embedders return L2-normalized float32 rows, so inner product is cosine.
+"""
+
+import re
+import hashlib
+import logging
+import threading
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing embedder (no model download, no extra dependencies).
+
+    Words and character trigrams are hashed with a stable digest into `dim`
+    signed buckets. Lexical rather than semantic, but far better ranked than
+    substring matching and cheap enough to run inline.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim: int = 384):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for local embeddings. Install with: pip install numpy")
+        self.dim = dim
+
+    def _features(self, text: str) -> List[str]:
+        words = _TOKEN.findall(text.casefold())
+        features = [f"w:{word}" for word in words]
+        for word in words:
+            padded = f"#{word}#"
+            features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def _embed_one(self, text: str, row: "np.ndarray"):
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            sign = 1.0 if digest[4] & 1 else -1.0
+            # Whole words weigh more than their trigrams
+            row[bucket] += sign * (2.0 if feature[0] == "w" else 0.5)
+
+    def embed(self, texts: Sequence[str]) -> "np.ndarray":
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            self._embed_one(text, matrix[i])
+        return _normalize_rows(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """sentence-transformers model, loaded on first use"""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str = "cpu"):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers not available. Install with: pip install sentence-transformers")
+        self.name = model_name
+        self.device = device
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = SentenceTransformer(self.name, device=self.device)
+                    logger.info(f"Loaded local embedding model {self.name}")
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: Sequence[str]) -> "np.ndarray":
+        vectors = self.model.encode(list(texts), convert_to_numpy=True, show_progress_bar=False)
+        return _normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+
+def create_local_embedder(model_name: Optional[str] = None, dim: int = 384):
+    """
+    Build the configured local embedder.
+
+    model_name "hashing" (or None) selects the hashing embedder; any other
+    name is loaded with sentence-transformers, falling back to hashing when
+    the package is not installed.
+    """
+    if model_name and model_name != "hashing":
+        if SENTENCE_TRANSFORMERS_AVAILABLE:
+            return SentenceTransformerEmbedder(model_name)
+        logger.warning(f"sentence-transformers not available; using hashing embeddings instead of {model_name}")
+    return HashingEmbedder(dim)
@@ -7,10 +7,12 @@ providing intelligent memory management across all AI frameworks.
 """
 
 import json
+import uuid
+import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -25,7 +27,26 @@ except ImportError:
     MEM0_AVAILABLE = False
 
 import httpx
-from redis import Redis
+from redis.asyncio import Redis
+
+try:
+    from .redis_pool import get_redis_pool
+    from .search_cache import ALL_SCOPE, search_cache_key, bump_generations, write_scopes
+    from .batching import BatchStoreResult, gather_bounded
+    from .keyword_index import KeywordIndex
+    from .embedding_cache import EmbeddingCache, CachedEmbedder, CachedMem0Embedder
+    from .embedding_service import get_embedding_service
+    from .write_behind import WriteBehindQueue, WriteBehindWriter
+    from .vector_index import NUMPY_AVAILABLE, create_vector_index
+except ImportError:
+    from redis_pool import get_redis_pool
+    from search_cache import ALL_SCOPE, search_cache_key, bump_generations, write_scopes
+    from batching import BatchStoreResult, gather_bounded
+    from keyword_index import KeywordIndex
+    from embedding_cache import EmbeddingCache, CachedEmbedder, CachedMem0Embedder
+    from embedding_service import get_embedding_service
+    from write_behind import WriteBehindQueue, WriteBehindWriter
+    from vector_index import NUMPY_AVAILABLE, create_vector_index
 
 
 class FrameworkType(Enum):
@@ -46,9 +67,25 @@ class MemoryConfig:
     memory_decay: bool = True
     importance_threshold: float = 0.5
     max_memories: int = 10000
-
-
-@dataclass
+    # Fallback search when mem0 is unavailable: "vector" (in-process index),
+    # "keyword" (Redis inverted index) or "scan"
+    fallback_search: str = "vector"
+    local_embedding_model: str = "hashing"  # or a sentence-transformers model name
+    vector_index_backend: str = "auto"  # auto, numpy, faiss
+    fallback_min_score: float = 0.1
+    # Embeddings cached by (model, text digest); 0 disables the cache
+    embedding_cache_size: int = 10000
+    embedding_cache_dtype: str = "float16"  # float16, float32
+    embedding_cache_path: Optional[str] = None  # SQLite file for a persistent tier
+    # Write-behind: store_memory returns once the write is queued locally
+    write_behind: bool = False
+    write_behind_path: Optional[str] = None  # SQLite queue file; None keeps the queue in memory
+    write_behind_workers: int = 4
+    write_behind_batch_size: int = 32
+    write_behind_max_attempts: int = 5
+
+
+@dataclass(slots=True)
 class AgentOSMemoryEntry:
     """AgentOS memory entry with framework context"""
     id: str
@@ -72,6 +109,16 @@ class Mem0MemoryEngine:
     - Intelligent forgetting and importance scoring
     """
 
+    # Keys fetched per MGET when scanning fallback memories
+    SCAN_BATCH_SIZE = 200
+    # mem0 calls in flight during bulk operations (mem0 has no batch API)
+    BATCH_CONCURRENCY = 8
+    # Metadata fields whose values get a per-agent timeline (adapters store
+    # their conversation/swarm/crew IDs under these)
+    AGENT_INDEX_FIELDS = ("agent_id", "conversation_id", "swarm_id", "crew_id")
+    # Lifetime of fallback memory records in Redis
+    FALLBACK_TTL = 86400
+
     def __init__(self,
                  config: MemoryConfig = None,
                  redis_host: str = "localhost",
@@ -87,14 +134,10 @@ class Mem0MemoryEngine:
         self.config = config or MemoryConfig()
         self.logger = logging.getLogger(__name__)
 
-        # Initialize Redis for caching
-        try:
-            self.redis = Redis(host=redis_host, port=redis_port,
-                             db=0, decode_responses=True)
-            self.redis.ping()
-        except Exception as e:
-            self.logger.warning(f"Redis not available: {e}")
-            self.redis = None
+        # Initialize Redis for caching (async client on the shared pool;
+        # connectivity is checked on first use)
+        self.redis = Redis(connection_pool=get_redis_pool(redis_host, redis_port, 0))
+        self._redis_checked = False
 
         # Initialize mem0 if available
         if MEM0_AVAILABLE and Mem0Config:
@@ -120,6 +163,36 @@ class Mem0MemoryEngine:
             self.logger.warning("mem0 not available, using fallback memory")
             self.memory = None
 
+        # Identical text is embedded once, by mem0 and by the local embedder
+        self.embedding_cache = self._create_embedding_cache()
+        if self.embedding_cache is not None and hasattr(self.memory, "embedding_model"):
+            self.memory.embedding_model = CachedMem0Embedder(
+                self.memory.embedding_model, self.embedding_cache, self.config.embedding_model
+            )
+
+        # Queued writes are flushed by a worker pool started on first use
+        # (including writes an earlier process left in a durable queue)
+        self.write_behind = None
+        self._write_behind_resumed = False
+        if self.config.write_behind:
+            self.write_behind = WriteBehindWriter(
+                WriteBehindQueue(self.config.write_behind_path),
+                self._flush_queued_writes,
+                workers=self.config.write_behind_workers,
+                batch_size=self.config.write_behind_batch_size,
+                max_attempts=self.config.write_behind_max_attempts
+            )
+
+        # Token/user/framework sets kept in Redis next to the fallback records
+        self.keyword_index = KeywordIndex(ttl=self.FALLBACK_TTL)
+
+        # In-process vector index over fallback memories, loaded from Redis
+        # on the first fallback search
+        self.fallback_index = None
+        self._fallback_embedder = None
+        self._fallback_index_loaded = False
+        self._fallback_index_lock = asyncio.Lock()
+
         # Memory operation statistics
         self.stats = {
             "memories_stored": 0,
@@ -148,43 +221,37 @@ class Mem0MemoryEngine:
         Returns:
             Memory ID
         """
-        if metadata is None:
-            metadata = {}
-
         # Add framework context to metadata
-        enhanced_metadata = {
-            **metadata,
-            "framework": framework.value,
-            "user_id": user_id,
-            "agent_id": agent_id,
-            "timestamp": datetime.now().isoformat(),
-            "source": "agentos"
-        }
+        enhanced_metadata = self._enhance_metadata(metadata, framework, user_id, agent_id)
+
+        if self.write_behind is not None:
+            return (await self._enqueue_writes([(content, framework, user_id, agent_id, enhanced_metadata)]))[0]
 
         try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False) if redis else None
+
             if self.memory:
-                # Use mem0 for intelligent storage
-                result = self.memory.add(
-                    messages=[{"role": "user", "content": content}],
-                    user_id=user_id,
-                    agent_id=agent_id or f"{framework.value}_agent",
-                    metadata=enhanced_metadata
+                # Use mem0 for intelligent storage (its add blocks, so run it off the loop)
+                loop = asyncio.get_running_loop()
+                memory_id = await loop.run_in_executor(
+                    None, self._add_to_mem0, content, framework, user_id, agent_id, enhanced_metadata
                 )
-                memory_id = result.get("id", f"mem0_{int(time.time() * 1000)}")
             else:
                 # Fallback to simple storage
-                memory_id = f"fallback_{int(time.time() * 1000)}"
-                await self._store_fallback_memory(memory_id, content, enhanced_metadata)
-
-            # Cache for quick access
-            if self.redis:
-                cache_key = f"memory:{memory_id}"
-                memory_data = {
-                    "id": memory_id,
-                    "content": content,
-                    "metadata": enhanced_metadata
-                }
-                self.redis.setex(cache_key, 3600, json.dumps(memory_data))
+                memory_id = self._new_fallback_id()
+                await self._store_fallback_memory(memory_id, content, enhanced_metadata, pipe=pipe)
+
+            # Cache for quick access (sent with the fallback write in one round-trip)
+            if pipe is not None:
+                self._queue_cache_entry(pipe, memory_id, content, enhanced_metadata)
+                self._queue_timeline_entry(pipe, memory_id, enhanced_metadata)
+                # Searches cached before this write are no longer current
+                bump_generations(pipe, write_scopes((user_id,), framework.value))
+                await pipe.execute()
+
+                if not self.memory:
+                    await self._index_fallback_memories([(memory_id, content, enhanced_metadata)])
 
             self.stats["memories_stored"] += 1
             self.logger.info(f"Stored memory {memory_id} for {framework.value}")
@@ -195,6 +262,176 @@ class Mem0MemoryEngine:
             self.logger.error(f"Failed to store memory: {e}")
             raise
 
+    async def store_memories(self,
+                             batch: Sequence[Union[AgentOSMemoryEntry, Dict[str, Any]]]) -> BatchStoreResult:
+        """
+        Store many memories with as few round-trips as possible
+
+        Args:
+            batch: AgentOSMemoryEntry objects (their id is ignored) or dicts
+                   with store_memory's keyword arguments
+
+        Returns:
+            BatchStoreResult with ids aligned to the batch and per-item errors
+        """
+        result = BatchStoreResult(memory_ids=[None] * len(batch))
+        records = []  # (index, memory_id, content, framework, user_id, metadata)
+
+        entries = {}
+        for index, item in enumerate(batch):
+            try:
+                entries[index] = self._as_memory_entry(item)
+            except Exception as e:
+                result.errors[index] = f"Invalid memory: {e}"
+
+        if self.write_behind is not None:
+            indexes = list(entries)
+            memory_ids = await self._enqueue_writes([
+                (entry.content, entry.framework, entry.user_id, entry.agent_id,
+                 self._enhance_metadata(entry.metadata, entry.framework, entry.user_id, entry.agent_id))
+                for entry in entries.values()
+            ])
+            for index, memory_id in zip(indexes, memory_ids):
+                result.memory_ids[index] = memory_id
+            return result
+
+        if self.memory:
+            # mem0 has no bulk add; run the calls concurrently off the loop
+            loop = asyncio.get_running_loop()
+
+            async def add(index):
+                entry = entries[index]
+                metadata = self._enhance_metadata(entry.metadata, entry.framework, entry.user_id, entry.agent_id)
+                memory_id = await loop.run_in_executor(
+                    None, self._add_to_mem0,
+                    entry.content, entry.framework, entry.user_id, entry.agent_id, metadata
+                )
+                return memory_id, metadata
+
+            indexes = list(entries)
+            outcomes = await gather_bounded(add, indexes, self.BATCH_CONCURRENCY)
+            for index, outcome in zip(indexes, outcomes):
+                if isinstance(outcome, Exception):
+                    result.errors[index] = str(outcome)
+                else:
+                    entry = entries[index]
+                    records.append((index, outcome[0], entry.content, entry.framework, entry.user_id, outcome[1]))
+        else:
+            for index, entry in entries.items():
+                metadata = self._enhance_metadata(entry.metadata, entry.framework, entry.user_id, entry.agent_id)
+                records.append((index, self._new_fallback_id(), entry.content, entry.framework, entry.user_id, metadata))
+
+        # Fallback records, cache entries and generation bumps in one pipeline
+        redis = await self._get_redis()
+        if redis and records:
+            pipe = redis.pipeline(transaction=False)
+            scopes = set()
+            for _, memory_id, content, framework, user_id, metadata in records:
+                if not self.memory:
+                    await self._store_fallback_memory(memory_id, content, metadata, pipe=pipe)
+                self._queue_cache_entry(pipe, memory_id, content, metadata)
+                self._queue_timeline_entry(pipe, memory_id, metadata)
+                scopes.update(write_scopes((user_id,), framework.value))
+            bump_generations(pipe, sorted(scopes))
+            try:
+                await pipe.execute()
+            except Exception as e:
+                if not self.memory:
+                    # The fallback store is Redis itself: nothing was stored
+                    for index, *_ in records:
+                        result.errors[index] = f"Redis write failed: {e}"
+                    records = []
+                else:
+                    self.logger.warning(f"Failed to cache stored memories: {e}")
+
+            if not self.memory and records:
+                await self._index_fallback_memories(
+                    [(memory_id, content, metadata) for _, memory_id, content, _, _, metadata in records]
+                )
+
+        for index, memory_id, *_ in records:
+            result.memory_ids[index] = memory_id
+
+        self.stats["memories_stored"] += result.stored
+        self.logger.info(f"Stored {result.stored} memories in bulk ({result.failed} failed)")
+        return result
+
+    async def get_memories(self, memory_ids: Sequence[str],
+                           user_id: Optional[str] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch many memories by ID
+
+        The cache and fallback tiers are read with one pipelined pair of MGETs;
+        remaining IDs are fetched from mem0 concurrently and written back to
+        the cache.
+
+        Args:
+            memory_ids: Memory identifiers
+            user_id: User identifier (passed to mem0)
+
+        Returns:
+            Memories aligned with memory_ids, None where not found
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(memory_ids)
+        if not memory_ids:
+            return results
+
+        redis = await self._get_redis()
+        if redis:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                pipe.mget([f"memory:{memory_id}" for memory_id in memory_ids])
+                pipe.mget([f"fallback_memory:{memory_id}" for memory_id in memory_ids])
+                cached, fallback = await pipe.execute()
+                for index, memory_id in enumerate(memory_ids):
+                    if cached[index]:
+                        results[index] = json.loads(cached[index])
+                    elif fallback[index]:
+                        results[index] = {"id": memory_id, **json.loads(fallback[index])}
+            except Exception as e:
+                self.logger.error(f"Error reading memories from Redis: {e}")
+
+        missing = [index for index, memory in enumerate(results) if memory is None]
+        if missing and self.write_behind is not None:
+            # Writes deleted while being flushed are gone even though still queued
+            missing = [index for index in missing if not self.write_behind.is_cancelled(memory_ids[index])]
+            queued = self.write_behind.queue.get_many([memory_ids[index] for index in missing])
+            for index in missing:
+                if memory_ids[index] in queued:
+                    results[index] = self._queued_memory(memory_ids[index], queued[memory_ids[index]])
+            missing = [index for index in missing if results[index] is None]
+
+        if missing and self.memory and hasattr(self.memory, 'get'):
+            aliases = await self._resolve_aliases(redis, [memory_ids[index] for index in missing])
+            loop = asyncio.get_running_loop()
+
+            async def fetch(index):
+                mem0_id = aliases.get(memory_ids[index], memory_ids[index])
+                return await loop.run_in_executor(
+                    None, lambda: self.memory.get(mem0_id, user_id=user_id)
+                )
+
+            outcomes = await gather_bounded(fetch, missing, self.BATCH_CONCURRENCY)
+            found = []
+            for index, outcome in zip(missing, outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Error retrieving memory {memory_ids[index]}: {outcome}")
+                elif outcome:
+                    results[index] = outcome
+                    found.append(index)
+
+            if redis and found:
+                try:
+                    pipe = redis.pipeline(transaction=False)
+                    for index in found:
+                        pipe.setex(f"memory:{memory_ids[index]}", 3600, json.dumps(results[index], default=str))
+                    await pipe.execute()
+                except Exception as e:
+                    self.logger.warning(f"Failed to cache fetched memories: {e}")
+
+        self.stats["memories_retrieved"] += sum(1 for memory in results if memory is not None)
+        return results
+
     async def retrieve_memories(self,
                                query: str,
                                user_id: str,
@@ -214,9 +451,11 @@ class Mem0MemoryEngine:
         """
         try:
             # Check cache first
-            cache_key = f"search:{hash(query)}:{user_id}:{framework}:{limit}"
-            if self.redis:
-                cached_result = self.redis.get(cache_key)
+            redis = await self._get_redis()
+            if redis:
+                scope = (user_id, framework.value if framework else ALL_SCOPE)
+                cache_key = await search_cache_key(redis, scope, query, limit=limit)
+                cached_result = await redis.get(cache_key)
                 if cached_result:
                     self.stats["cache_hits"] += 1
                     return json.loads(cached_result)
@@ -242,8 +481,8 @@ class Mem0MemoryEngine:
                 memories = await self._search_fallback_memories(query, user_id, framework, limit)
 
             # Cache results
-            if self.redis:
-                self.redis.setex(cache_key, 300, json.dumps(memories))
+            if redis:
+                await redis.setex(cache_key, 300, json.dumps(memories))
 
             self.stats["memories_retrieved"] += len(memories)
             return memories
@@ -268,13 +507,17 @@ class Mem0MemoryEngine:
             Framework-specific memories
         """
         try:
+            if await self._get_redis():
+                try:
+                    page = await self.list_memories(framework, user_id, limit=limit)
+                    if page["memories"]:
+                        return page["memories"]
+                except Exception as e:
+                    self.logger.warning(f"Memory timeline unavailable: {e}")
+
+            # Nothing indexed yet (e.g. memories stored before the timelines existed)
             if self.memory:
-                # Get all memories and filter by framework
-                all_memories = self.memory.get_all(user_id=user_id, limit=limit * 2)
-                framework_memories = [
-                    mem for mem in all_memories
-                    if mem.get("metadata", {}).get("framework") == framework.value
-                ][:limit]
+                framework_memories = self._get_mem0_framework_memories(framework, user_id, limit)
             else:
                 framework_memories = await self._get_fallback_framework_memories(
                     framework, user_id, limit
@@ -286,6 +529,66 @@ class Mem0MemoryEngine:
             self.logger.error(f"Failed to get framework memories: {e}")
             return []
 
+    async def list_memories(self,
+                            framework: FrameworkType,
+                            user_id: str,
+                            agent_id: Optional[str] = None,
+                            limit: int = 20,
+                            cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Page through a framework's (or one agent's) memories, newest first
+
+        Reads the per-user timeline sorted sets written with every memory,
+        so each page fetches exactly `limit` memories.
+
+        Args:
+            framework: AI framework
+            user_id: User identifier
+            agent_id: Agent, conversation, swarm or crew identifier (optional)
+            limit: Page size
+            cursor: next_cursor of the previous page
+
+        Returns:
+            {"memories": [...], "next_cursor": str or None}
+        """
+        redis = await self._get_redis()
+        if not redis:
+            return {"memories": [], "next_cursor": None}
+
+        key = self._timeline_key(user_id, framework.value, agent_id)
+        max_score, skip = self._decode_cursor(cursor)
+        memories: List[Dict[str, Any]] = []
+        exhausted = False
+
+        while len(memories) < limit:
+            wanted = limit - len(memories)
+            entries = await redis.zrevrangebyscore(key, max_score, "-inf", start=skip, num=wanted, withscores=True)
+            if not entries:
+                exhausted = True
+                break
+
+            fetched = await self.get_memories([member for member, _ in entries], user_id)
+            stale = [member for (member, _), memory in zip(entries, fetched) if memory is None]
+            memories.extend(memory for memory in fetched if memory is not None)
+
+            # Keyset cursor: last score plus how many entries at that score were consumed
+            last_score = entries[-1][1]
+            at_last = sum(1 for member, score in entries if score == last_score and member not in stale)
+            skip = (skip if last_score == max_score else 0) + at_last
+            max_score = last_score
+
+            if stale:
+                # Expired or deleted memories are dropped from the timeline lazily
+                await redis.zrem(key, *stale)
+            if len(entries) < wanted:
+                exhausted = True
+                break
+
+        return {
+            "memories": memories,
+            "next_cursor": None if exhausted else self._encode_cursor(max_score, skip)
+        }
+
     async def consolidate_memories(self,
                                  user_id: str,
                                  framework: Optional[FrameworkType] = None) -> Dict[str, Any]:
@@ -331,34 +634,528 @@ class Mem0MemoryEngine:
             "cache_hit_rate": cache_hit_rate,
             "mem0_available": MEM0_AVAILABLE and self.memory is not None,
             "redis_available": self.redis is not None,
+            "fallback_index": self.fallback_index.get_statistics() if self.fallback_index is not None else None,
+            "embedding_cache": self.embedding_cache.get_statistics() if self.embedding_cache is not None else None,
+            "write_behind": self.write_behind.get_statistics() if self.write_behind is not None else None,
             "total_operations": sum(self.stats.values())
         }
 
+    async def close(self):
+        """Release this engine's Redis client (the shared pool stays open)"""
+        if self.write_behind is not None:
+            # Flush what we can; anything left stays in the durable queue
+            await self.write_behind.stop()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+        if self.redis is not None:
+            try:
+                await self.redis.aclose()
+            except Exception as e:
+                self.logger.warning(f"Failed to close Redis client: {e}")
+
+    def _enhance_metadata(self, metadata: Optional[Dict[str, Any]], framework: FrameworkType,
+                          user_id: str, agent_id: Optional[str]) -> Dict[str, Any]:
+        """Metadata with the framework context every memory carries"""
+        return {
+            **(metadata or {}),
+            "framework": framework.value,
+            "user_id": user_id,
+            "agent_id": agent_id,
+            "timestamp": datetime.now().isoformat(),
+            "source": "agentos"
+        }
+
+    def _add_to_mem0(self, content: str, framework: FrameworkType, user_id: str,
+                     agent_id: Optional[str], metadata: Dict[str, Any]) -> str:
+        """Store one memory in mem0 and return its ID"""
+        result = self.memory.add(
+            messages=[{"role": "user", "content": content}],
+            user_id=user_id,
+            agent_id=agent_id or f"{framework.value}_agent",
+            metadata=metadata
+        )
+        return result.get("id", f"mem0_{int(time.time() * 1000)}")
+
+    @staticmethod
+    def _new_fallback_id(prefix: str = "fallback") -> str:
+        # The random suffix keeps IDs unique within one millisecond (bulk stores)
+        return f"{prefix}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _as_memory_entry(item: Union[AgentOSMemoryEntry, Dict[str, Any]]) -> AgentOSMemoryEntry:
+        if isinstance(item, AgentOSMemoryEntry):
+            return item
+        framework = item["framework"]
+        return AgentOSMemoryEntry(
+            id="",
+            content=item["content"],
+            framework=framework if isinstance(framework, FrameworkType) else FrameworkType(framework),
+            user_id=item["user_id"],
+            agent_id=item.get("agent_id"),
+            metadata=dict(item.get("metadata") or {})
+        )
+
+    @staticmethod
+    def _queue_cache_entry(pipe, memory_id: str, content: str, metadata: Dict[str, Any]):
+        memory_data = {
+            "id": memory_id,
+            "content": content,
+            "metadata": metadata
+        }
+        pipe.setex(f"memory:{memory_id}", 3600, json.dumps(memory_data))
+
+    @staticmethod
+    def _timeline_key(user_id: str, framework: str, agent_id: Optional[str] = None) -> str:
+        key = f"memory_timeline:{user_id}:{framework}"
+        return f"{key}:agent:{agent_id}" if agent_id else key
+
+    def _timeline_keys(self, metadata: Dict[str, Any]) -> List[str]:
+        """The framework timeline and agent timelines a memory belongs to"""
+        user_id, framework = metadata["user_id"], metadata["framework"]
+        agents = dict.fromkeys(metadata.get(field) for field in self.AGENT_INDEX_FIELDS)
+        keys = [self._timeline_key(user_id, framework)]
+        keys.extend(self._timeline_key(user_id, framework, agent) for agent in agents if agent)
+        return keys
+
+    def _queue_timeline_entry(self, pipe, memory_id: str, metadata: Dict[str, Any]):
+        """Add a memory to its framework timeline and its agents' timelines"""
+        try:
+            score = datetime.fromisoformat(metadata["timestamp"]).timestamp() * 1000
+        except (KeyError, TypeError, ValueError):
+            score = time.time() * 1000
+        for key in self._timeline_keys(metadata):
+            pipe.zadd(key, {memory_id: int(score)})
+            if not self.memory:
+                # Fallback records expire; so does a timeline nobody writes to
+                pipe.expire(key, self.FALLBACK_TTL)
+
+    def _queue_timeline_removal(self, pipe, memory_id: str, metadata: Optional[Dict[str, Any]]):
+        """Remove a deleted memory from its timelines (when its metadata says which)"""
+        if not metadata or not metadata.get("user_id") or not metadata.get("framework"):
+            return  # left to lazy pruning in list_memories
+        for key in self._timeline_keys(metadata):
+            pipe.zrem(key, memory_id)
+
+    @staticmethod
+    def _encode_cursor(score: float, skip: int) -> str:
+        return f"{int(score)}:{skip}"
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]):
+        if not cursor:
+            return "+inf", 0
+        try:
+            score, skip = cursor.split(":")
+            return int(score), int(skip)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def _get_mem0_framework_memories(self, framework: FrameworkType, user_id: str,
+                                     limit: int) -> List[Dict[str, Any]]:
+        """Filter mem0's get_all by framework, widening the fetch until `limit` match"""
+        fetch = limit * 2
+        while True:
+            all_memories = self.memory.get_all(user_id=user_id, limit=fetch)
+            framework_memories = [
+                mem for mem in all_memories
+                if mem.get("metadata", {}).get("framework") == framework.value
+            ]
+            if len(framework_memories) >= limit or len(all_memories) < fetch:
+                return framework_memories[:limit]
+            fetch *= 2
+
+    async def _get_redis(self) -> Optional[Redis]:
+        """Redis client, or None if Redis turned out to be unreachable"""
+        if self.write_behind is not None and not self._write_behind_resumed:
+            self._write_behind_resumed = True
+            if self.write_behind.resume():
+                self.logger.info(f"Resuming {self.write_behind.queue.count()} queued memory writes")
+        if self.redis is not None and not self._redis_checked:
+            self._redis_checked = True
+            try:
+                await self.redis.ping()
+            except Exception as e:
+                self.logger.warning(f"Redis not available: {e}")
+                self.redis = None
+        return self.redis
+
+    # ===================================
+    # WRITE-BEHIND (config.write_behind)
+    # ===================================
+
+    async def _enqueue_writes(self, writes: List[tuple]) -> List[str]:
+        """
+        Queue (content, framework, user_id, agent_id, metadata) writes
+
+        IDs are assigned here and stay valid after the flush (mem0 IDs are
+        reached through a memory_alias:{id} key). Each write is cached under
+        memory:{id} right away so reads do not wait for the flush.
+        """
+        queued = []
+        for content, framework, user_id, agent_id, metadata in writes:
+            memory_id = self._new_fallback_id("wb" if self.memory else "fallback")
+            queued.append((memory_id, {
+                "id": memory_id,
+                "content": content,
+                "framework": framework.value,
+                "user_id": user_id,
+                "agent_id": agent_id,
+                "metadata": metadata
+            }))
+        self.write_behind.submit_many(queued)
+
+        redis = await self._get_redis()
+        if redis:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for memory_id, payload in queued:
+                    self._queue_cache_entry(pipe, memory_id, payload["content"], payload["metadata"])
+                    self._queue_timeline_entry(pipe, memory_id, payload["metadata"])
+                await pipe.execute()
+            except Exception as e:
+                self.logger.warning(f"Failed to cache queued memories: {e}")
+
+        self.stats["memories_stored"] += len(queued)
+        return [memory_id for memory_id, _ in queued]
+
+    async def _flush_queued_writes(self, payloads: List[Dict[str, Any]]) -> List[Optional[Exception]]:
+        """
+        Persist a batch of queued writes; one outcome (None or the error) per payload
+
+        Writes deleted while the batch is in flight are skipped, or removed
+        again once written.
+        """
+        outcomes: List[Optional[Exception]] = [None] * len(payloads)
+        cancelled = self.write_behind.is_cancelled
+        redis = await self._get_redis()
+
+        if self.memory:
+            loop = asyncio.get_running_loop()
+
+            async def add(payload):
+                if cancelled(payload["id"]):
+                    return None
+                mem0_id = await loop.run_in_executor(
+                    None, self._add_to_mem0, payload["content"], FrameworkType(payload["framework"]),
+                    payload["user_id"], payload["agent_id"], payload["metadata"]
+                )
+                if cancelled(payload["id"]):
+                    # Deleted during the add: undo it rather than record an alias
+                    await loop.run_in_executor(
+                        None, lambda: self.memory.delete(mem0_id, user_id=payload["user_id"])
+                    )
+                    return None
+                return mem0_id
+
+            results = await gather_bounded(add, payloads, self.BATCH_CONCURRENCY)
+            aliases = {}
+            for index, result in enumerate(results):
+                if isinstance(result, Exception):
+                    outcomes[index] = result
+                elif result is not None:
+                    aliases[payloads[index]["id"]] = result
+        elif not redis:
+            return [ConnectionError("Redis not available")] * len(payloads)
+
+        written = []
+        if redis:
+            pipe = redis.pipeline(transaction=False)
+            scopes = set()
+            for index, payload in enumerate(payloads):
+                if outcomes[index] is not None or cancelled(payload["id"]):
+                    continue
+                if self.memory:
+                    pipe.set(f"memory_alias:{payload['id']}", aliases[payload["id"]])
+                else:
+                    await self._store_fallback_memory(payload["id"], payload["content"], payload["metadata"], pipe=pipe)
+                written.append(payload)
+                scopes.update(write_scopes((payload["user_id"],), payload["framework"]))
+            # Flushed memories become searchable now
+            bump_generations(pipe, sorted(scopes))
+            try:
+                await pipe.execute()
+            except Exception as e:
+                if not self.memory:
+                    return [e] * len(payloads)
+                self.logger.warning(f"Failed to record flushed memory aliases: {e}")
+
+            late = [payload for payload in written if cancelled(payload["id"])]
+            if late:
+                await self._discard_flushed_writes(redis, late, aliases if self.memory else {})
+
+        if not self.memory:
+            await self._index_fallback_memories([
+                (payload["id"], payload["content"], payload["metadata"])
+                for payload in written if not cancelled(payload["id"])
+            ])
+        return outcomes
+
+    async def _discard_flushed_writes(self, redis: Redis, payloads: List[Dict[str, Any]],
+                                      aliases: Dict[str, str]) -> None:
+        """Remove writes that were deleted while their flush was writing them"""
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for payload in payloads:
+                if self.memory:
+                    pipe.delete(f"memory_alias:{payload['id']}")
+                else:
+                    pipe.delete(f"fallback_memory:{payload['id']}")
+                    self.keyword_index.queue_remove(pipe, payload["id"], payload["content"], payload["metadata"])
+                pipe.delete(f"memory:{payload['id']}")
+            await pipe.execute()
+            if self.memory:
+                loop = asyncio.get_running_loop()
+                for payload in payloads:
+                    await loop.run_in_executor(
+                        None, lambda: self.memory.delete(aliases[payload["id"]], user_id=payload["user_id"])
+                    )
+        except Exception as e:
+            self.logger.error(f"Failed to discard memory writes deleted during their flush: {e}")
+
+    async def _resolve_aliases(self, redis: Optional[Redis], memory_ids: List[str]) -> Dict[str, str]:
+        """mem0 IDs of flushed write-behind memories"""
+        queued_ids = [memory_id for memory_id in memory_ids if memory_id.startswith("wb_")]
+        if not redis or not queued_ids:
+            return {}
+        try:
+            values = await redis.mget([f"memory_alias:{memory_id}" for memory_id in queued_ids])
+        except Exception as e:
+            self.logger.warning(f"Failed to resolve memory aliases: {e}")
+            return {}
+        return {memory_id: value for memory_id, value in zip(queued_ids, values) if value}
+
+    @staticmethod
+    def _queued_memory(memory_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": memory_id, "content": payload["content"], "metadata": payload["metadata"], "pending": True}
+
+    async def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued writes to be persisted
+
+        Returns:
+            True if nothing is left pending
+        """
+        if self.write_behind is None:
+            return True
+        return await self.write_behind.drain(timeout)
+
     # ===================================
     # FALLBACK METHODS (when mem0 unavailable)
     # ===================================
 
-    async def _store_fallback_memory(self, memory_id: str, content: str, metadata: Dict[str, Any]):
-        """Store memory without mem0"""
-        if self.redis:
-            key = f"fallback_memory:{memory_id}"
-            data = {"content": content, "metadata": metadata}
-            self.redis.setex(key, 86400, json.dumps(data))  # 24 hour TTL
+    async def _store_fallback_memory(self, memory_id: str, content: str, metadata: Dict[str, Any],
+                                     pipe=None):
+        """Store memory without mem0 (queued on `pipe` when one is given)"""
+        key = f"fallback_memory:{memory_id}"
+        data = {"content": content, "metadata": metadata}
+        if pipe is not None:
+            pipe.setex(key, self.FALLBACK_TTL, json.dumps(data))
+            self.keyword_index.queue_add(pipe, memory_id, content, metadata)
+            return
+
+        redis = await self._get_redis()
+        if redis:
+            pipe = redis.pipeline(transaction=False)
+            pipe.setex(key, self.FALLBACK_TTL, json.dumps(data))
+            self.keyword_index.queue_add(pipe, memory_id, content, metadata)
+            await pipe.execute()
 
     async def _search_fallback_memories(self, query: str, user_id: str,
                                       framework: Optional[FrameworkType],
                                       limit: int) -> List[Dict[str, Any]]:
-        """Simple fallback search"""
-        if not self.redis:
+        """Fallback search: vector index when enabled, otherwise the keyword index"""
+        redis = await self._get_redis()
+        if not redis:
             return []
 
+        if await self._get_fallback_index() is not None:
+            return await self._search_fallback_index(redis, query, user_id, framework, limit)
+
+        if self.config.fallback_search == "scan":
+            return await self._scan_fallback_memories(redis, query, framework, limit)
+
+        return await self.keyword_index.search(
+            redis, query, user_id, framework.value if framework else None, limit
+        )
+
+    async def _get_fallback_index(self):
+        """Vector index for fallback memories, or None when it is disabled"""
+        if self.fallback_index is None:
+            if self.memory or self.config.fallback_search != "vector" or not NUMPY_AVAILABLE:
+                return None
+            # Shared per process: one model load, requests batched across engines
+            embedder = get_embedding_service(self.config.local_embedding_model)
+            # The first load can take seconds; wait for it off the event loop
+            await embedder.wait_ready()
+            if self.fallback_index is not None:  # created while this call was waiting
+                return self.fallback_index
+            if self.embedding_cache is not None:
+                embedder = CachedEmbedder(embedder, self.embedding_cache, f"{embedder.name}:{embedder.dim}")
+            self._fallback_embedder = embedder
+            self.fallback_index = create_vector_index(
+                self._fallback_embedder.dim, self.config.vector_index_backend
+            )
+        return self.fallback_index
+
+    def _create_embedding_cache(self) -> Optional[EmbeddingCache]:
+        if self.config.embedding_cache_size <= 0 or not NUMPY_AVAILABLE:
+            return None
+        try:
+            return EmbeddingCache(
+                max_entries=self.config.embedding_cache_size,
+                dtype=self.config.embedding_cache_dtype,
+                path=self.config.embedding_cache_path
+            )
+        except Exception as e:
+            self.logger.warning(f"Embedding cache disabled: {e}")
+            return None
+
+    async def _embed(self, texts: List[str]):
+        return await self._fallback_embedder.embed_async(texts)
+
+    async def _index_fallback_memories(self, records: List[tuple],
+                                       ttls: Optional[List[int]] = None) -> None:
+        """Add (memory_id, content, metadata) records to the vector index"""
+        index = await self._get_fallback_index()
+        if index is None or not records:
+            return
+
+        try:
+            vectors = await self._embed([content for _, content, _ in records])
+            now = time.time()
+            index.add(
+                [memory_id for memory_id, _, _ in records],
+                vectors,
+                [metadata.get("user_id") for _, _, metadata in records],
+                [metadata.get("framework") for _, _, metadata in records],
+                [now + (ttl if ttl and ttl > 0 else self.FALLBACK_TTL) for ttl in ttls]
+                if ttls else [now + self.FALLBACK_TTL] * len(records)
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to index fallback memories: {e}")
+
+    async def rebuild_fallback_index(self) -> int:
+        """
+        Reload the vector index from the fallback records in Redis
+
+        The index is loaded on the first fallback search and kept current by
+        this engine's writes; call this to pick up records written by other
+        processes.
+
+        Returns:
+            Number of indexed memories
+        """
+        index = await self._get_fallback_index()
+        redis = await self._get_redis()
+        if index is None or not redis:
+            return 0
+
+        async with self._fallback_index_lock:
+            await self._load_fallback_index(redis)
+        return len(index)
+
+    async def _load_fallback_index(self, redis: Redis) -> None:
+        """Replace the index contents with every fallback record in Redis"""
+        self.fallback_index.clear()
+        batch = []
+        async for key in redis.scan_iter(match="fallback_memory:*", count=self.SCAN_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH_SIZE:
+                await self._index_fallback_batch(redis, batch)
+                batch = []
+        if batch:
+            await self._index_fallback_batch(redis, batch)
+        self._fallback_index_loaded = True
+        self.logger.info(f"Indexed {len(self.fallback_index)} fallback memories")
+
+    async def _index_fallback_batch(self, redis: Redis, keys: List[str]) -> None:
+        """Index one scanned batch: records and their TTLs in one round-trip"""
+        pipe = redis.pipeline(transaction=False)
+        pipe.mget(keys)
+        for key in keys:
+            pipe.ttl(key)
+        values, *ttls = await pipe.execute()
+
+        records, record_ttls = [], []
+        for key, raw, ttl in zip(keys, values, ttls):
+            if raw is None:
+                continue
+            try:
+                data = json.loads(raw)
+                records.append((key.split(":")[-1], data["content"], data.get("metadata") or {}))
+                record_ttls.append(ttl)
+            except (ValueError, KeyError, TypeError):
+                continue
+        await self._index_fallback_memories(records, record_ttls)
+
+    async def _search_fallback_index(self, redis: Redis, query: str, user_id: str,
+                                     framework: Optional[FrameworkType],
+                                     limit: int) -> List[Dict[str, Any]]:
+        """Rank fallback memories with the vector index, then MGET the hits"""
+        if not self._fallback_index_loaded:
+            async with self._fallback_index_lock:
+                if not self._fallback_index_loaded:
+                    await self._load_fallback_index(redis)
+
+        framework_value = framework.value if framework else None
+        if query.strip():
+            vector = (await self._embed([query]))[0]
+            hits = self.fallback_index.search(
+                vector, limit, user_id=user_id, framework=framework_value,
+                min_score=self.config.fallback_min_score
+            )
+        else:
+            # No query: most recent memories in scope
+            hits = [(memory_id, None) for memory_id in
+                    self.fallback_index.recent(limit, user_id=user_id, framework=framework_value)]
+        if not hits:
+            return []
+
+        values = await redis.mget([f"fallback_memory:{memory_id}" for memory_id, _ in hits])
+        memories, stale = [], []
+        for (memory_id, score), raw in zip(hits, values):
+            if raw is None:  # expired or deleted by another process
+                stale.append(memory_id)
+                continue
+            data = json.loads(raw)
+            memory = {"id": memory_id, "content": data["content"], "metadata": data["metadata"]}
+            if score is not None:
+                memory["score"] = score
+            memories.append(memory)
+
+        if stale:
+            self.fallback_index.remove(stale)
+        return memories
+
+    async def _scan_fallback_memories(self, redis: Redis, query: str,
+                                      framework: Optional[FrameworkType],
+                                      limit: int) -> List[Dict[str, Any]]:
+        """Keyword scan over every fallback record (fallback_search="scan")"""
         # Simple keyword matching (in production would use proper search)
         memories = []
         pattern = "fallback_memory:*"
-
-        for key in self.redis.scan_iter(match=pattern):
+        batch = []
+
+        async for key in redis.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH_SIZE:
+                self._match_fallback_batch(batch, await redis.mget(batch), query, framework, memories)
+                batch = []
+                if len(memories) >= limit:
+                    return memories[:limit]
+
+        if batch:
+            self._match_fallback_batch(batch, await redis.mget(batch), query, framework, memories)
+        return memories[:limit]
+
+    def _match_fallback_batch(self, keys: List[str], values: List[Optional[str]], query: str,
+                              framework: Optional[FrameworkType], memories: List[Dict[str, Any]]):
+        """Append the keyword matches of one MGET batch to `memories`"""
+        for key, raw in zip(keys, values):
+            if raw is None:  # expired between SCAN and MGET
+                continue
             try:
-                data = json.loads(self.redis.get(key))
+                data = json.loads(raw)
                 if query.lower() in data["content"].lower():
                     if not framework or data["metadata"].get("framework") == framework.value:
                         memories.append({
@@ -366,13 +1163,9 @@ class Mem0MemoryEngine:
                             "content": data["content"],
                             "metadata": data["metadata"]
                         })
-                        if len(memories) >= limit:
-                            break
             except:
                 continue
 
-        return memories
-
     async def _get_fallback_framework_memories(self, framework: FrameworkType,
                                              user_id: str, limit: int) -> List[Dict[str, Any]]:
         """Get framework memories without mem0"""
@@ -382,24 +1175,43 @@ class Mem0MemoryEngine:
         """
         Clean up expired memories from Redis cache
         """
-        if not self.redis:
+        if self.fallback_index is not None:
+            self.fallback_index.evict_expired()
+
+        redis = await self._get_redis()
+        if not redis:
             return
 
         try:
-            # Scan for fallback memory keys
+            # Scan for fallback memory keys, checking TTLs one batch per round-trip
             pattern = "fallback_memory:*"
-            async for key in self.redis.scan_iter(match=pattern):
-                # Check if key exists (it might have expired)
-                if await self.redis.exists(key):
-                    # Get TTL to check if it's about to expire
-                    ttl = await self.redis.ttl(key)
-                    if ttl == -1:  # No expiration set
-                        # Set default expiration of 24 hours
-                        await self.redis.expire(key, 86400)
+            batch = []
+            async for key in redis.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.SCAN_BATCH_SIZE:
+                    await self._expire_persistent_keys(redis, batch)
+                    batch = []
+            if batch:
+                await self._expire_persistent_keys(redis, batch)
 
         except Exception as e:
             self.logger.error(f"Error during memory cleanup: {e}")
 
+    async def _expire_persistent_keys(self, redis: Redis, keys: List[str]) -> None:
+        """Give keys without an expiration the default 24 hour TTL"""
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+
+        # -1: no expiration set; -2: already expired
+        persistent = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+        if persistent:
+            pipe = redis.pipeline(transaction=False)
+            for key in persistent:
+                pipe.expire(key, self.FALLBACK_TTL)
+            await pipe.execute()
+
     async def get_memory_by_id(self, memory_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific memory by ID
@@ -411,7 +1223,15 @@ class Mem0MemoryEngine:
         Returns:
             Memory entry or None if not found
         """
+        if self.write_behind is not None:
+            if self.write_behind.is_cancelled(memory_id):
+                return None  # deleted while being flushed
+            queued = self.write_behind.queue.get(memory_id)
+            if queued:
+                return self._queued_memory(memory_id, queued)
+
         if self.memory:
+            memory_id = (await self._resolve_aliases(await self._get_redis(), [memory_id])).get(memory_id, memory_id)
             try:
                 # Use mem0's get method if available
                 if hasattr(self.memory, 'get'):
@@ -430,10 +1250,11 @@ class Mem0MemoryEngine:
                 self.logger.error(f"Error retrieving memory by ID: {e}")
 
         # Fallback to Redis
-        if self.redis:
+        redis = await self._get_redis()
+        if redis:
             try:
                 key = f"fallback_memory:{memory_id}"
-                data = self.redis.get(key)  # Redis is sync, not async
+                data = await redis.get(key)
                 if data:
                     return json.loads(data)
             except Exception as e:
@@ -452,22 +1273,98 @@ class Mem0MemoryEngine:
         Returns:
             True if deleted successfully, False otherwise
         """
+        queued = self.write_behind.queue.get(memory_id) if self.write_behind is not None else None
+        if self.write_behind is not None and self.write_behind.cancel(memory_id):
+            # Never flushed: dropping the queued write, its cache entry and timelines is enough
+            redis = await self._get_redis()
+            if redis:
+                try:
+                    pipe = redis.pipeline(transaction=False)
+                    pipe.delete(f"memory:{memory_id}")
+                    self._queue_timeline_removal(pipe, memory_id, queued and queued["metadata"])
+                    await pipe.execute()
+                except Exception as e:
+                    self.logger.warning(f"Failed to drop cached memory {memory_id}: {e}")
+            await self._invalidate_user_searches(user_id)
+            return True
+
         if self.memory:
             try:
                 # Use mem0's delete method if available
                 if hasattr(self.memory, 'delete'):
-                    self.memory.delete(memory_id, user_id=user_id)
+                    redis = await self._get_redis()
+                    mem0_id = (await self._resolve_aliases(redis, [memory_id])).get(memory_id, memory_id)
+                    metadata = await self._stored_metadata(redis, memory_id, mem0_id, user_id) if redis else None
+                    self.memory.delete(mem0_id, user_id=user_id)
+                    if redis:
+                        # get_memories reads memory:{id} before asking mem0
+                        pipe = redis.pipeline(transaction=False)
+                        pipe.delete(f"memory:{memory_id}")
+                        self._queue_timeline_removal(pipe, memory_id, metadata)
+                        if mem0_id != memory_id:
+                            pipe.delete(f"memory_alias:{memory_id}")
+                        await pipe.execute()
+                    await self._invalidate_user_searches(user_id)
                     return True
             except Exception as e:
                 self.logger.error(f"Error deleting memory from mem0: {e}")
 
         # Fallback to Redis deletion
-        if self.redis:
+        redis = await self._get_redis()
+        if redis:
             try:
                 key = f"fallback_memory:{memory_id}"
-                result = self.redis.delete(key)  # Redis is sync, not async
-                return result > 0
+                # The record's content names the keyword sets to clean up
+                raw = await redis.getdel(key)
+                if self.fallback_index is not None:
+                    self.fallback_index.remove([memory_id])
+                if raw is None:
+                    await redis.delete(f"memory:{memory_id}")
+                    return False
+
+                data = json.loads(raw)
+                pipe = redis.pipeline(transaction=False)
+                pipe.delete(f"memory:{memory_id}")
+                self.keyword_index.queue_remove(pipe, memory_id, data["content"], data.get("metadata") or {})
+                self._queue_timeline_removal(pipe, memory_id, data.get("metadata"))
+                await pipe.execute()
+                await self._invalidate_user_searches(user_id)
+                return True
             except Exception as e:
                 self.logger.error(f"Error deleting memory from Redis: {e}")
 
         return False
+
+    async def _stored_metadata(self, redis: Redis, memory_id: str, mem0_id: str,
+                               user_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata of a memory about to be deleted: from the cache, else from mem0"""
+        try:
+            cached = await redis.get(f"memory:{memory_id}")
+            if cached:
+                return json.loads(cached).get("metadata")
+        except Exception as e:
+            self.logger.warning(f"Failed to read cached memory {memory_id}: {e}")
+        if not hasattr(self.memory, 'get'):
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+            stored = await loop.run_in_executor(None, lambda: self.memory.get(mem0_id, user_id=user_id))
+        except Exception as e:
+            self.logger.warning(f"Failed to read memory {memory_id} before deleting it: {e}")
+            return None
+        metadata = stored.get("metadata") if isinstance(stored, dict) else None
+        return metadata if isinstance(metadata, dict) else None
+
+    async def _invalidate_user_searches(self, user_id: str) -> None:
+        """Bump every search generation of a user (the deleted memory's framework is unknown)"""
+        redis = await self._get_redis()
+        if not redis:
+            return
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            scopes = write_scopes((user_id,), None) + [(user_id, fw.value) for fw in FrameworkType]
+            bump_generations(pipe, scopes)
+            await pipe.execute()
+        except Exception as e:
+            self.logger.warning(f"Failed to invalidate cached searches for {user_id}: {e}")
@@ -0,0 +1,60 @@
+"""
+Shared Redis Connection Pools for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module provides process-wide redis.asyncio connection pools keyed by
+host, port and database, so every memory engine talks to Redis without
+blocking the event loop and without opening a pool per engine instance.
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, Tuple
+
+from redis.asyncio import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, int, int]
+
+_pools: Dict[PoolKey, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_redis_pool(host: str = "localhost", port: int = 6379, db: int = 0) -> ConnectionPool:
+    """Get (or create) the shared connection pool for a Redis database"""
+    key = (host, port, db)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                decode_responses=True,
+                max_connections=int(os.getenv("AGENTOS_MEMORY_REDIS_MAX_CONNECTIONS", "50")),
+                socket_timeout=float(os.getenv("AGENTOS_MEMORY_REDIS_TIMEOUT", "5.0")),
+                socket_connect_timeout=float(os.getenv("AGENTOS_MEMORY_REDIS_TIMEOUT", "5.0")),
+                health_check_interval=30
+            )
+            _pools[key] = pool
+            logger.info(f"Created shared Redis pool for {host}:{port}/{db}")
+    return pool
+
+
+async def close_redis_pools():
+    """Disconnect every shared pool (pools are recreated on next use)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        try:
+            await pool.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to close Redis pool: {e}")
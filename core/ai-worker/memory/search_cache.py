@@ -0,0 +1,63 @@
+"""
+Search Cache Keys for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module builds search cache keys that are stable across processes and
+restarts, and invalidates them through per-scope generation counters kept
+in Redis: writes bump the counter, so later searches read a new key and
+entries cached before the write are never served again.
+"""
+
+import re
+import json
+import hashlib
+from typing import Any, Iterable, Optional, Sequence
+
+# Scope component used for searches that span every framework
+ALL_SCOPE = "all"
+
+# Generation counters outlive any cached search result by a wide margin
+GENERATION_TTL = 7 * 24 * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so equivalent queries share a key"""
+    return _WHITESPACE.sub(" ", (query or "").strip()).casefold()
+
+
+def query_digest(query: str, **filters: Any) -> str:
+    """Stable digest of a normalized query and its filters"""
+    payload = json.dumps(
+        {"query": normalize_query(query), "filters": filters},
+        sort_keys=True, default=str, separators=(",", ":")
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def generation_key(scope: Sequence[str]) -> str:
+    """Redis key of the generation counter for a scope"""
+    return "search_gen:" + ":".join(scope)
+
+
+async def search_cache_key(redis, scope: Sequence[str], query: str, **filters: Any) -> str:
+    """Cache key for a search in `scope` at the scope's current generation"""
+    generation = await redis.get(generation_key(scope))
+    return f"search:{':'.join(scope)}:g{generation or 0}:{query_digest(query, **filters)}"
+
+
+def bump_generations(pipe, scopes: Iterable[Sequence[str]]):
+    """Queue generation increments on a pipeline, invalidating cached searches"""
+    for scope in scopes:
+        key = generation_key(scope)
+        pipe.incr(key)
+        pipe.expire(key, GENERATION_TTL)
+
+
+def write_scopes(prefix: Sequence[str], framework: Optional[str]) -> list:
+    """Scopes a write affects: its framework's searches and cross-framework ones"""
+    scopes = [tuple(prefix) + (ALL_SCOPE,)]
+    if framework:
+        scopes.append(tuple(prefix) + (framework,))
+    return scopes
@@ -0,0 +1,90 @@
+"""
+Template Matcher for AgentOS Memory Consolidation
+Week 7: Memory System Performance
+
+This module compiles the consolidation engine's pattern templates (causal,
+temporal, conceptual, behavioral) into a single regex that finds every
+template match in one pass over a memory's lowercased text. Template
+groups are confined to a clause, so long contents cannot trigger runaway
+backtracking. match_texts is a module-level function so large batches can
+be matched in a process pool.
+"""
+
+import re
+import functools
+from typing import Dict, List, Sequence, Tuple
+
+# Template groups written as "(.+)" are rewritten to stay within one clause
+TEMPLATE_GROUP = "(.+)"
+_CLAUSE_CHARS = r"[^.!?;\n]"
+_CLAUSE_START = r"(?<![^.!?;\n]) *"
+
+TemplateKey = Tuple[Tuple[str, Tuple[str, ...]], ...]
+TemplateMatch = Tuple[str, Tuple[str, ...]]
+
+
+def template_key(templates: Dict[str, Sequence[str]]) -> TemplateKey:
+    """Hashable, picklable form of a pattern_templates mapping"""
+    return tuple((pattern_type, tuple(patterns)) for pattern_type, patterns in templates.items())
+
+
+def _rewrite(template: str) -> Tuple[str, int]:
+    """Regex source for one template and its number of groups"""
+    pieces = template.lower().split(TEMPLATE_GROUP)
+    # Every template may consume the spaces that open a clause, so a literal
+    # template competes with group-first ones from the same position
+    source = _CLAUSE_START if pieces[0] == "" else f"(?:{_CLAUSE_START})?"
+    for index, piece in enumerate(pieces[:-1]):
+        last = index == len(pieces) - 2 and pieces[-1] == ""
+        source += piece + f"({_CLAUSE_CHARS}+{'' if last else '?'})"
+    return source + pieces[-1], len(pieces) - 1
+
+
+class TemplateMatcher:
+    """
+    All templates compiled into one alternation.
+
+    Templates that start with literal text are tried before those that
+    start with a group, so "if X, then Y" is a behavioral match rather than
+    a temporal "X then Y", at the start of the text or of any later clause.
+    Matches do not overlap.
+    """
+
+    def __init__(self, key: TemplateKey):
+        entries = [
+            (pattern_type, template)
+            for pattern_type, patterns in key for template in patterns
+        ]
+        entries.sort(key=lambda entry: entry[1].startswith(TEMPLATE_GROUP))
+
+        alternatives = []
+        self._templates: Dict[int, Tuple[str, int]] = {}  # wrapper group -> (type, group count)
+        group = 1
+        for pattern_type, template in entries:
+            source, count = _rewrite(template)
+            alternatives.append(f"({source})")
+            self._templates[group] = (pattern_type, count)
+            group += count + 1
+        self.regex = re.compile("|".join(alternatives))
+
+    def match(self, text: str) -> List[TemplateMatch]:
+        """(pattern type, stripped groups) for each template match in text"""
+        matches = []
+        for found in self.regex.finditer(text.lower()):
+            pattern_type, count = self._templates[found.lastindex]
+            groups = tuple(value.strip() for value in found.groups()[found.lastindex:found.lastindex + count])
+            if all(groups):
+                matches.append((pattern_type, groups))
+        return matches
+
+
+@functools.lru_cache(maxsize=16)
+def get_template_matcher(key: TemplateKey) -> TemplateMatcher:
+    """Compiled matcher for a set of templates (compiled once per process)"""
+    return TemplateMatcher(key)
+
+
+def match_texts(key: TemplateKey, texts: Sequence[str]) -> List[List[TemplateMatch]]:
+    """Template matches for each text (picklable entry point for process pools)"""
+    matcher = get_template_matcher(key)
+    return [matcher.match(text) for text in texts]
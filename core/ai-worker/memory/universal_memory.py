@@ -7,11 +7,12 @@ using mem0 as the core memory engine for intelligent memory management.
 """
 
 import json
+import uuid
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Sequence
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 try:
@@ -20,7 +21,23 @@ except ImportError:
     # Fallback if mem0 is not installed
     Memory = None
 
-from redis import Redis
+from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
+
+try:
+    from .http_session import SharedHTTPSession
+    from .redis_pool import get_redis_pool
+    from .search_cache import ALL_SCOPE, search_cache_key, bump_generations, write_scopes
+    from .batching import BatchStoreResult, gather_bounded
+    from .embedding_service import EmbeddingService
+    from .entry_codec import MemoryEntryCodec, is_encoded
+except ImportError:
+    from http_session import SharedHTTPSession
+    from redis_pool import get_redis_pool
+    from search_cache import ALL_SCOPE, search_cache_key, bump_generations, write_scopes
+    from batching import BatchStoreResult, gather_bounded
+    from embedding_service import EmbeddingService
+    from entry_codec import MemoryEntryCodec, is_encoded
 
 
 class MemoryType(Enum):
@@ -40,7 +57,7 @@ class FrameworkType(Enum):
     UNIVERSAL = "universal"
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """Universal memory entry structure"""
     id: str
@@ -61,6 +78,10 @@ class MemoryEntry:
             self.updated_at = datetime.now()
 
 
+# Binary format of entries in working memory and the Redis caches
+ENTRY_CODEC = MemoryEntryCodec(MemoryEntry, MemoryType, FrameworkType)
+
+
 @dataclass
 class ConsolidationResult:
     """Result of memory consolidation process"""
@@ -86,11 +107,16 @@ class UniversalMemory:
     - Strategic forgetting based on importance and access patterns
     """
 
+    # API stores in flight during bulk operations (the API has no batch endpoint)
+    BATCH_CONCURRENCY = 8
+
     def __init__(self,
                  api_base_url: str = "http://localhost:8000",
                  redis_host: str = "localhost",
                  redis_port: int = 6379,
-                 redis_db: int = 0):
+                 redis_db: int = 0,
+                 http_session: Optional[SharedHTTPSession] = None,
+                 embedding_service: Optional[EmbeddingService] = None):
         """
         Initialize Universal Memory Interface
 
@@ -99,9 +125,15 @@ class UniversalMemory:
             redis_host: Redis host for caching
             redis_port: Redis port
             redis_db: Redis database number
+            http_session: Shared HTTP session (one is created if omitted)
+            embedding_service: Local embedding service; when given, stored
+                entries get an embedding
         """
         self.api_base_url = api_base_url.rstrip('/')
-        self.redis = Redis(host=redis_host, port=redis_port, db=redis_db, decode_responses=True)
+        self.http = http_session or SharedHTTPSession()
+        self._owns_http = http_session is None
+        self.embedding_service = embedding_service
+        self.redis = Redis(connection_pool=get_redis_pool(redis_host, redis_port, redis_db))
         self.logger = logging.getLogger(__name__)
 
         # Framework-specific adapters (will be initialized lazily)
@@ -154,11 +186,16 @@ class UniversalMemory:
         )
 
         try:
+            await self._attach_embeddings([memory_entry])
+
+            # Redis writes for this memory go out in one round-trip
+            pipe = self.redis.pipeline(transaction=False)
+
             # Store based on memory type
             if memory_type == MemoryType.SEMANTIC:
                 memory_id = await self._store_semantic_memory(memory_entry)
             elif memory_type == MemoryType.WORKING:
-                memory_id = await self._store_working_memory(memory_entry)
+                memory_id = await self._store_working_memory(memory_entry, pipe)
             else:
                 memory_id = await self._store_episodic_memory(memory_entry)
 
@@ -168,7 +205,10 @@ class UniversalMemory:
             # Cache the memory for quick access
             cache_key = f"memory:{memory_id}"
             memory_entry.id = memory_id
-            await self._cache_memory(cache_key, memory_entry)
+            await self._cache_memory(cache_key, memory_entry, pipe)
+            # Searches cached before this write are no longer current
+            bump_generations(pipe, write_scopes((), framework.value))
+            await pipe.execute()
 
             self.logger.info(f"Stored {memory_type.value} memory {memory_id} for {framework.value}")
             return memory_id
@@ -177,6 +217,95 @@ class UniversalMemory:
             self.logger.error(f"Failed to store memory: {e}")
             raise
 
+    async def store_memories(self, entries: Sequence[MemoryEntry]) -> BatchStoreResult:
+        """
+        Store many memory entries
+
+        API-backed memories are stored concurrently over the pooled session;
+        working memories, cache entries and search invalidation for the
+        whole batch go to Redis in one pipeline.
+
+        Args:
+            entries: Memory entries (their id is assigned here)
+
+        Returns:
+            BatchStoreResult with ids aligned to entries and per-item errors
+        """
+        result = BatchStoreResult(memory_ids=[None] * len(entries))
+        await self._attach_embeddings(entries)
+        pipe = self.redis.pipeline(transaction=False)
+        stored: Dict[int, str] = {}
+        working = []
+
+        async def store_via_api(index):
+            entry = entries[index]
+            if entry.memory_type == MemoryType.SEMANTIC:
+                return await self._store_semantic_memory(entry)
+            return await self._store_episodic_memory(entry)
+
+        api_indexes = []
+        for index, entry in enumerate(entries):
+            if entry.memory_type == MemoryType.WORKING:
+                stored[index] = await self._store_working_memory(entry, pipe)
+                working.append(index)
+            else:
+                api_indexes.append(index)
+
+        outcomes = await gather_bounded(store_via_api, api_indexes, self.BATCH_CONCURRENCY)
+        for index, outcome in zip(api_indexes, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[index] = str(outcome)
+            else:
+                stored[index] = outcome
+
+        scopes = set()
+        for index, memory_id in stored.items():
+            entry = entries[index]
+            entry.id = memory_id
+            await self._cache_memory(f"memory:{memory_id}", entry, pipe)
+            scopes.update(write_scopes((), entry.framework.value))
+        bump_generations(pipe, sorted(scopes))
+
+        try:
+            await pipe.execute()
+        except Exception as e:
+            # Working memories live only in Redis; API-backed ones are stored
+            for index in working:
+                result.errors[index] = f"Redis write failed: {e}"
+                del stored[index]
+            self.logger.warning(f"Failed to cache stored memories: {e}")
+
+        for index, memory_id in stored.items():
+            result.memory_ids[index] = memory_id
+
+        self.stats["memories_stored"] += result.stored
+        self.logger.info(f"Stored {result.stored} memories in bulk ({result.failed} failed)")
+        return result
+
+    async def get_memories(self, memory_ids: Sequence[str]) -> List[Optional[MemoryEntry]]:
+        """
+        Fetch cached memory entries with a single MGET
+
+        Args:
+            memory_ids: Memory identifiers
+
+        Returns:
+            Entries aligned with memory_ids, None where not cached
+        """
+        if not memory_ids:
+            return []
+
+        values = await self._mget_raw([f"memory:{memory_id}" for memory_id in memory_ids])
+        entries = []
+        for value in values:
+            try:
+                entries.append(self._load_entry(value) if value else None)
+            except Exception:
+                entries.append(None)
+
+        self.stats["memories_retrieved"] += sum(1 for entry in entries if entry is not None)
+        return entries
+
     async def retrieve_memory(self,
                              query: str,
                              framework: FrameworkType = None,
@@ -198,7 +327,13 @@ class UniversalMemory:
         """
         try:
             # Check cache first
-            cache_key = f"search:{hash(query)}:{framework}:{memory_type}:{limit}"
+            scope = (framework.value if framework else ALL_SCOPE,)
+            cache_key = await search_cache_key(
+                self.redis, scope, query,
+                memory_type=memory_type.value if memory_type else None,
+                limit=limit,
+                threshold=similarity_threshold
+            )
             cached_result = await self._get_cached_search(cache_key)
             if cached_result:
                 self.stats["cache_hits"] += 1
@@ -216,22 +351,22 @@ class UniversalMemory:
             if framework:
                 search_params["framework"] = framework.value
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_base_url}/api/v1/memory/semantic/search",
-                    json=search_params
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        memories = [self._dict_to_memory_entry(mem) for mem in data.get("memories", [])]
+            session = await self.http.get()
+            async with session.post(
+                f"{self.api_base_url}/api/v1/memory/semantic/search",
+                json=search_params
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    memories = [self._dict_to_memory_entry(mem) for mem in data.get("memories", [])]
 
-                        # Cache the result
-                        await self._cache_search_result(cache_key, memories)
+                    # Cache the result
+                    await self._cache_search_result(cache_key, memories)
 
-                        self.stats["memories_retrieved"] += len(memories)
-                        return memories
-                    else:
-                        raise Exception(f"API error: {response.status}")
+                    self.stats["memories_retrieved"] += len(memories)
+                    return memories
+                else:
+                    raise Exception(f"API error: {response.status}")
 
         except Exception as e:
             self.logger.error(f"Failed to retrieve memories: {e}")
@@ -256,31 +391,31 @@ class UniversalMemory:
                 "time_window_hours": time_window.total_seconds() / 3600
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_base_url}/api/v1/memory/consolidation/trigger",
-                    json=consolidation_params
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        result = ConsolidationResult(
-                            consolidation_id=data["consolidation_id"],
-                            framework=framework,
-                            episodic_count=data["episodic_count"],
-                            semantic_count=data["semantic_count"],
-                            consolidation_score=data["consolidation_score"],
-                            patterns_found=data.get("patterns_found", []),
-                            new_memories_created=data.get("new_memories_created", 0),
-                            started_at=datetime.fromisoformat(data["started_at"])
-                        )
-
-                        self.stats["consolidations_performed"] += 1
-                        self.logger.info(f"Consolidated {result.episodic_count} episodic memories for {framework.value}")
-
-                        return result
-                    else:
-                        raise Exception(f"Consolidation API error: {response.status}")
+            session = await self.http.get()
+            async with session.post(
+                f"{self.api_base_url}/api/v1/memory/consolidation/trigger",
+                json=consolidation_params
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+
+                    result = ConsolidationResult(
+                        consolidation_id=data["consolidation_id"],
+                        framework=framework,
+                        episodic_count=data["episodic_count"],
+                        semantic_count=data["semantic_count"],
+                        consolidation_score=data["consolidation_score"],
+                        patterns_found=data.get("patterns_found", []),
+                        new_memories_created=data.get("new_memories_created", 0),
+                        started_at=datetime.fromisoformat(data["started_at"])
+                    )
+
+                    self.stats["consolidations_performed"] += 1
+                    self.logger.info(f"Consolidated {result.episodic_count} episodic memories for {framework.value}")
+
+                    return result
+                else:
+                    raise Exception(f"Consolidation API error: {response.status}")
 
         except Exception as e:
             self.logger.error(f"Failed to consolidate memories: {e}")
@@ -297,14 +432,14 @@ class UniversalMemory:
             Framework memory information
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_base_url}/api/v1/memory/frameworks/{framework.value}"
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        raise Exception(f"Framework memory API error: {response.status}")
+            session = await self.http.get()
+            async with session.get(
+                f"{self.api_base_url}/api/v1/memory/frameworks/{framework.value}"
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    raise Exception(f"Framework memory API error: {response.status}")
 
         except Exception as e:
             self.logger.error(f"Failed to get framework memory: {e}")
@@ -314,34 +449,49 @@ class UniversalMemory:
     # PRIVATE HELPER METHODS
     # ===================================
 
+    async def _attach_embeddings(self, entries: Sequence[MemoryEntry]):
+        """Embed entries that have no embedding yet, in one service request"""
+        if self.embedding_service is None:
+            return
+        pending = [entry for entry in entries if entry.embedding is None]
+        if not pending:
+            return
+        try:
+            vectors = await self.embedding_service.embed_async([entry.content for entry in pending])
+            for entry, vector in zip(pending, vectors):
+                entry.embedding = vector.tolist()
+        except Exception as e:
+            self.logger.warning(f"Failed to embed memories: {e}")
+
     async def _store_semantic_memory(self, memory_entry: MemoryEntry) -> str:
         """Store semantic memory via API"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_base_url}/api/v1/memory/semantic/store",
-                json={
-                    "content": memory_entry.content,
-                    "concepts": memory_entry.concepts,
-                    "framework": memory_entry.framework.value,
-                    "source_type": memory_entry.metadata.get("source_type", "user_input"),
-                    "importance": memory_entry.importance
-                }
-            ) as response:
-                if response.status == 201:
-                    data = await response.json()
-                    return data["memory_id"]
-                else:
-                    raise Exception(f"Semantic memory API error: {response.status}")
+        session = await self.http.get()
+        async with session.post(
+            f"{self.api_base_url}/api/v1/memory/semantic/store",
+            json={
+                "content": memory_entry.content,
+                "concepts": memory_entry.concepts,
+                "framework": memory_entry.framework.value,
+                "source_type": memory_entry.metadata.get("source_type", "user_input"),
+                "importance": memory_entry.importance
+            }
+        ) as response:
+            if response.status == 201:
+                data = await response.json()
+                return data["memory_id"]
+            else:
+                raise Exception(f"Semantic memory API error: {response.status}")
 
-    async def _store_working_memory(self, memory_entry: MemoryEntry) -> str:
-        """Store working memory in Redis"""
-        memory_id = f"working_{int(time.time() * 1000)}"
+    async def _store_working_memory(self, memory_entry: MemoryEntry, pipe=None) -> str:
+        """Store working memory in Redis (queued on `pipe` when one is given)"""
+        memory_id = f"working_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
         cache_key = f"working_memory:{memory_entry.framework.value}:{memory_id}"
 
-        memory_data = asdict(memory_entry)
-        memory_data["id"] = memory_id
-
-        self.redis.setex(cache_key, 3600, json.dumps(memory_data, default=str))  # 1 hour TTL
+        payload = ENTRY_CODEC.encode(replace(memory_entry, id=memory_id))
+        if pipe is not None:
+            pipe.setex(cache_key, 3600, payload)  # 1 hour TTL
+        else:
+            await self.redis.setex(cache_key, 3600, payload)
         return memory_id
 
     async def _store_episodic_memory(self, memory_entry: MemoryEntry) -> str:
@@ -350,26 +500,42 @@ class UniversalMemory:
         # In production, would have separate episodic storage
         return await self._store_semantic_memory(memory_entry)
 
-    async def _cache_memory(self, cache_key: str, memory_entry: MemoryEntry):
-        """Cache memory entry in Redis"""
-        memory_data = asdict(memory_entry)
-        self.redis.setex(cache_key, 300, json.dumps(memory_data, default=str))  # 5 min TTL
+    async def _cache_memory(self, cache_key: str, memory_entry: MemoryEntry, pipe=None):
+        """Cache memory entry in Redis (queued on `pipe` when one is given)"""
+        payload = ENTRY_CODEC.encode(memory_entry)
+        if pipe is not None:
+            pipe.setex(cache_key, 300, payload)  # 5 min TTL
+        else:
+            await self.redis.setex(cache_key, 300, payload)
 
     async def _get_cached_search(self, cache_key: str) -> Optional[List[MemoryEntry]]:
         """Get cached search results"""
-        cached_data = self.redis.get(cache_key)
+        cached_data = await self._get_raw(cache_key)
         if cached_data:
             try:
-                data = json.loads(cached_data)
-                return [self._dict_to_memory_entry(mem) for mem in data]
+                if is_encoded(cached_data):
+                    return ENTRY_CODEC.decode_many(cached_data)
+                return [self._dict_to_memory_entry(mem) for mem in json.loads(cached_data)]
             except:
                 return None
         return None
 
     async def _cache_search_result(self, cache_key: str, memories: List[MemoryEntry]):
         """Cache search results"""
-        memory_data = [asdict(mem) for mem in memories]
-        self.redis.setex(cache_key, 60, json.dumps(memory_data, default=str))  # 1 min TTL
+        await self.redis.setex(cache_key, 60, ENTRY_CODEC.encode_many(memories))  # 1 min TTL
+
+    async def _get_raw(self, key: str) -> Optional[bytes]:
+        """GET without response decoding (binary entries are not UTF-8)"""
+        return await self.redis.execute_command("GET", key, **{NEVER_DECODE: []})
+
+    async def _mget_raw(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self.redis.execute_command("MGET", *keys, **{NEVER_DECODE: []})
+
+    def _load_entry(self, value) -> MemoryEntry:
+        """Decode a cached entry (binary, or JSON written by older releases)"""
+        if is_encoded(value):
+            return ENTRY_CODEC.decode(value)
+        return self._dict_to_memory_entry(json.loads(value))
 
     def _dict_to_memory_entry(self, data: Dict[str, Any]) -> MemoryEntry:
         """Convert dictionary to MemoryEntry"""
@@ -393,3 +559,15 @@ class UniversalMemory:
             "cache_hit_rate": self.stats["cache_hits"] / max(self.stats["cache_hits"] + self.stats["cache_misses"], 1),
             "total_operations": sum(self.stats.values())
         }
+
+    async def close(self):
+        """Release the HTTP session (if owned) and this client's Redis connections"""
+        if self._owns_http:
+            await self.http.close()
+        await self.redis.aclose()
+
+    async def __aenter__(self) -> "UniversalMemory":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,332 @@
+"""
+In-process Vector Index for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module provides the vector index behind Mem0MemoryEngine's fallback
+search. Vectors live in process memory next to per-row user, framework and
+expiry metadata, so a query costs one matrix product (or an HNSW lookup with
+FAISS for large sets) instead of a Redis round-trip per stored memory.
+Entries are added and removed incrementally as memories are written and
+deleted.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    FAISS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+NO_CODE = -1
+
+
+class VectorIndex:
+    """
+    Exact inner-product index over L2-normalized float32 vectors (NumPy).
+
+    Rows are kept dense: removal moves the last row into the freed slot.
+    User and framework filters are evaluated as integer-code masks. Rows past
+    their expiry are evicted by the next search or recent call (or by
+    evict_expired) without touching Redis.
+    """
+
+    backend = "numpy"
+
+    def __init__(self, dim: int, initial_capacity: int = 1024):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the vector index. Install with: pip install numpy")
+        self.dim = dim
+        self._vectors = np.zeros((initial_capacity, dim), dtype=np.float32)
+        self._users = np.full(initial_capacity, NO_CODE, dtype=np.int32)
+        self._frameworks = np.full(initial_capacity, NO_CODE, dtype=np.int32)
+        self._expires = np.full(initial_capacity, np.inf, dtype=np.float64)
+        self._added = np.zeros(initial_capacity, dtype=np.float64)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._codes: Dict[str, int] = {}
+        self._next_expiry = np.inf  # earliest expiry among current rows
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    def _code(self, value: Optional[str], create: bool) -> int:
+        if value is None:
+            return NO_CODE
+        code = self._codes.get(value)
+        if code is None and create:
+            code = self._codes[value] = len(self._codes)
+        return NO_CODE - 1 if code is None else code  # unknown value matches nothing
+
+    def _grow(self, needed: int):
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._vectors = np.resize(self._vectors, (capacity, self.dim))
+        for name, fill in (("_users", NO_CODE), ("_frameworks", NO_CODE), ("_expires", np.inf), ("_added", 0.0)):
+            old = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    def add(self, memory_ids: Sequence[str], vectors: "np.ndarray",
+            user_ids: Sequence[Optional[str]], frameworks: Sequence[Optional[str]],
+            expires_at: Optional[Sequence[float]] = None):
+        """Add (or replace) entries; vectors must be L2-normalized rows"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(memory_ids), self.dim)
+        now = time.time()
+        with self._lock:
+            self._grow(len(self._ids) + len(memory_ids))
+            for i, memory_id in enumerate(memory_ids):
+                row = self._rows.get(memory_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._ids.append(memory_id)
+                    self._rows[memory_id] = row
+                self._vectors[row] = vectors[i]
+                self._users[row] = self._code(user_ids[i], create=True)
+                self._frameworks[row] = self._code(frameworks[i], create=True)
+                self._expires[row] = expires_at[i] if expires_at is not None else np.inf
+                self._next_expiry = min(self._next_expiry, self._expires[row])
+                self._added[row] = now
+                self._on_set(row)
+
+    def remove(self, memory_ids: Sequence[str]) -> int:
+        """Remove entries; unknown ids are ignored"""
+        removed = 0
+        with self._lock:
+            for memory_id in memory_ids:
+                row = self._rows.pop(memory_id, None)
+                if row is None:
+                    continue
+                self._on_remove(row)
+                last = len(self._ids) - 1
+                if row != last:
+                    moved_id = self._ids[last]
+                    self._ids[row] = moved_id
+                    self._rows[moved_id] = row
+                    for array in (self._vectors, self._users, self._frameworks, self._expires, self._added):
+                        array[row] = array[last]
+                    self._on_move(last, row)
+                self._ids.pop()
+                removed += 1
+        return removed
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """Remove rows whose expiry has passed; returns how many were removed"""
+        now = time.time() if now is None else now
+        with self._lock:
+            if now < self._next_expiry:
+                return 0
+            size = len(self._ids)
+            expired = np.flatnonzero(self._expires[:size] <= now)
+            removed = self.remove([self._ids[row] for row in expired])
+            self._next_expiry = float(self._expires[:len(self._ids)].min()) if self._ids else np.inf
+            return removed
+
+    def _mask(self, user_id: Optional[str], framework: Optional[str], now: float) -> "np.ndarray":
+        self.evict_expired(now)
+        size = len(self._ids)
+        mask = np.ones(size, dtype=bool)
+        if user_id is not None:
+            mask &= self._users[:size] == self._code(user_id, create=False)
+        if framework is not None:
+            mask &= self._frameworks[:size] == self._code(framework, create=False)
+        return mask
+
+    def search(self, query: "np.ndarray", k: int, user_id: Optional[str] = None,
+               framework: Optional[str] = None, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """Top-k (memory_id, score) by cosine similarity, best first"""
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            if not self._ids or k <= 0:
+                return []
+            mask = self._mask(user_id, framework, time.time())
+            return self._search(query, k, mask, min_score)
+
+    def _search(self, query, k, mask, min_score) -> List[Tuple[str, float]]:
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            return []
+        scores = self._vectors[rows] @ query
+        if rows.size > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(rows.size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top if scores[i] >= min_score]
+
+    def recent(self, limit: int, user_id: Optional[str] = None,
+               framework: Optional[str] = None) -> List[str]:
+        """Most recently added ids matching the filters"""
+        with self._lock:
+            if not self._ids:
+                return []
+            rows = np.flatnonzero(self._mask(user_id, framework, time.time()))
+            rows = rows[np.argsort(-self._added[rows], kind="stable")][:limit]
+            return [self._ids[row] for row in rows]
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+            self._rows.clear()
+            self._next_expiry = np.inf
+            self._on_clear()
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {"backend": self.backend, "size": len(self._ids), "dim": self.dim}
+
+    # Hooks for index structures kept alongside the rows
+    def _on_set(self, row: int):
+        pass
+
+    def _on_remove(self, row: int):
+        pass
+
+    def _on_move(self, old_row: int, new_row: int):
+        pass
+
+    def _on_clear(self):
+        pass
+
+
+class FaissVectorIndex(VectorIndex):
+    """
+    VectorIndex with an HNSW graph for approximate search on large sets.
+
+    Below `ann_threshold` rows the exact NumPy search is used. HNSW graphs do
+    not support deletion, so removed or replaced rows are tombstoned and the
+    graph is rebuilt once tombstones exceed `rebuild_ratio` of its entries.
+    Filtered queries oversample and post-filter, widening until enough rows
+    match or every row has been considered.
+    """
+
+    backend = "faiss"
+
+    def __init__(self, dim: int, ann_threshold: int = 20000, hnsw_m: int = 32,
+                 ef_search: int = 64, rebuild_ratio: float = 0.3, initial_capacity: int = 1024):
+        if not FAISS_AVAILABLE:
+            raise ImportError("faiss not available. Install with: pip install faiss-cpu")
+        super().__init__(dim, initial_capacity)
+        self.ann_threshold = ann_threshold
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.rebuild_ratio = rebuild_ratio
+        self._graph = None
+        self._graph_rows: List[Optional[int]] = []  # graph label -> row (None when tombstoned)
+        self._row_labels: Dict[int, int] = {}
+        self._tombstones = 0
+
+    def _on_set(self, row: int):
+        if self._graph is not None:
+            self._tombstone(row)
+            self._append_to_graph([row])
+
+    def _on_remove(self, row: int):
+        if self._graph is not None:
+            self._tombstone(row)
+
+    def _on_move(self, old_row: int, new_row: int):
+        label = self._row_labels.pop(old_row, None)
+        if label is not None:
+            self._row_labels[new_row] = label
+            self._graph_rows[label] = new_row
+
+    def _on_clear(self):
+        self._graph = None
+        self._graph_rows = []
+        self._row_labels = {}
+        self._tombstones = 0
+
+    def _tombstone(self, row: int):
+        label = self._row_labels.pop(row, None)
+        if label is not None:
+            self._graph_rows[label] = None
+            self._tombstones += 1
+
+    def _append_to_graph(self, rows: List[int]):
+        self._graph.add(self._vectors[rows])
+        for row in rows:
+            self._row_labels[row] = len(self._graph_rows)
+            self._graph_rows.append(row)
+
+    def _build_graph(self):
+        graph = faiss.IndexHNSWFlat(self.dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        graph.hnsw.efSearch = self.ef_search
+        self._graph = graph
+        self._graph_rows = []
+        self._row_labels = {}
+        self._tombstones = 0
+        self._append_to_graph(list(range(len(self._ids))))
+        logger.info(f"Built HNSW graph over {len(self._ids)} memories")
+
+    def _search(self, query, k, mask, min_score) -> List[Tuple[str, float]]:
+        size = len(self._ids)
+        if size < self.ann_threshold:
+            return super()._search(query, k, mask, min_score)
+
+        if self._graph is None or self._tombstones > self.rebuild_ratio * max(len(self._graph_rows), 1):
+            self._build_graph()
+
+        matching = int(mask.sum())
+        if matching == 0:
+            return []
+        want = min(k, matching)
+        fetch = min(max(k * 4, want), len(self._graph_rows))
+        while True:
+            self._graph.hnsw.efSearch = max(self.ef_search, fetch)
+            scores, labels = self._graph.search(query.reshape(1, -1), fetch)
+            hits = []
+            for score, label in zip(scores[0], labels[0]):
+                if label < 0:
+                    continue
+                row = self._graph_rows[label]
+                if row is None or not mask[row] or score < min_score:
+                    continue
+                hits.append((self._ids[row], float(score)))
+                if len(hits) == want:
+                    return hits
+            if fetch >= len(self._graph_rows):
+                return hits
+            fetch = min(fetch * 4, len(self._graph_rows))
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            **super().get_statistics(),
+            "graph_entries": len(self._graph_rows),
+            "tombstones": self._tombstones
+        }
+
+
+def create_vector_index(dim: int, backend: str = "auto", ann_threshold: int = 20000) -> VectorIndex:
+    """
+    Build a vector index.
+
+    backend "numpy" always searches exactly; "faiss" adds an HNSW graph above
+    ann_threshold rows; "auto" picks faiss when it is installed.
+    """
+    if backend in ("auto", "faiss"):
+        if FAISS_AVAILABLE:
+            return FaissVectorIndex(dim, ann_threshold=ann_threshold)
+        if backend == "faiss":
+            logger.warning("faiss not available; using the NumPy vector index")
+    return VectorIndex(dim)
@@ -0,0 +1,284 @@
+"""
+Write-behind Queue for AgentOS Memory Services
+Week 7: Memory System Performance
+
+This module lets the memory engine acknowledge a store as soon as the write
+is recorded in a durable local queue (SQLite). A pool of asyncio workers
+drains the queue in batches, retrying failed writes with exponential
+backoff and setting aside writes that keep failing, so agent responses do
+not wait on mem0's LLM-based extraction.
+"""
+
+import json
+import time
+import asyncio
+import logging
+import sqlite3
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DEAD = "dead"
+
+
+class WriteBehindQueue:
+    """
+    Durable queue of pending writes keyed by memory ID.
+
+    With path=None the queue lives in memory (no durability across
+    restarts); otherwise it is a SQLite file in WAL mode.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path:
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS writes ("
+                " id TEXT PRIMARY KEY, payload TEXT NOT NULL, status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0, next_attempt REAL NOT NULL,"
+                " error TEXT, created_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS writes_due ON writes (status, next_attempt)")
+            self._db.commit()
+
+    def put_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]):
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO writes (id, payload, status, attempts, next_attempt, created_at)"
+                " VALUES (?, ?, ?, 0, ?, ?)",
+                [(record_id, json.dumps(payload), PENDING, now, now) for record_id, payload in items]
+            )
+            self._db.commit()
+
+    def put(self, record_id: str, payload: Dict[str, Any]):
+        self.put_many([(record_id, payload)])
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Payload of a write that has not been flushed yet"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload FROM writes WHERE id = ? AND status = ?", (record_id, PENDING)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, record_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        if not record_ids:
+            return {}
+        placeholders = ",".join("?" * len(record_ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, payload FROM writes WHERE status = ? AND id IN ({placeholders})",
+                (PENDING, *record_ids)
+            ).fetchall()
+        return {record_id: json.loads(payload) for record_id, payload in rows}
+
+    def remove(self, record_id: str) -> bool:
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM writes WHERE id = ?", (record_id,))
+            self._db.commit()
+        return cursor.rowcount > 0
+
+    def due(self, limit: int, exclude: Set[str]) -> List[Tuple[str, Dict[str, Any], int]]:
+        """Oldest pending writes whose retry time has come, skipping `exclude`"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, payload, attempts FROM writes WHERE status = ? AND next_attempt <= ?"
+                " ORDER BY created_at LIMIT ?",
+                (PENDING, time.time(), limit + len(exclude))
+            ).fetchall()
+        return [
+            (record_id, json.loads(payload), attempts)
+            for record_id, payload, attempts in rows if record_id not in exclude
+        ][:limit]
+
+    def complete(self, record_ids: Sequence[str]):
+        with self._lock:
+            self._db.executemany("DELETE FROM writes WHERE id = ?", [(record_id,) for record_id in record_ids])
+            self._db.commit()
+
+    def retry(self, record_id: str, attempts: int, next_attempt: float, error: str):
+        with self._lock:
+            self._db.execute(
+                "UPDATE writes SET attempts = ?, next_attempt = ?, error = ? WHERE id = ?",
+                (attempts, next_attempt, error, record_id)
+            )
+            self._db.commit()
+
+    def bury(self, record_id: str, attempts: int, error: str):
+        """Set a write aside after its last attempt (kept for inspection)"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE writes SET status = ?, attempts = ?, error = ? WHERE id = ?",
+                (DEAD, attempts, error, record_id)
+            )
+            self._db.commit()
+
+    def count(self, status: str = PENDING) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM writes WHERE status = ?", (status,)).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+FlushFunc = Callable[[List[Dict[str, Any]]], Awaitable[List[Optional[BaseException]]]]
+
+
+class WriteBehindWriter:
+    """
+    Worker pool draining a WriteBehindQueue.
+
+    `flush` receives a batch of payloads and returns one entry per payload:
+    None on success or the exception that write failed with. A write
+    cancelled while its batch is being flushed is tombstoned: `flush` should
+    check is_cancelled and discard it, and it is never retried.
+    """
+
+    POLL_INTERVAL = 0.25  # seconds between checks for retries that became due
+
+    def __init__(self, queue: WriteBehindQueue, flush: FlushFunc, workers: int = 4,
+                 batch_size: int = 32, max_attempts: int = 5,
+                 retry_base: float = 1.0, retry_max: float = 60.0):
+        self.queue = queue
+        self._flush = flush
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._claimed: Set[str] = set()
+        self._cancelled: Set[str] = set()  # claimed writes deleted mid-flush
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.stats = {"queued": 0, "flushed": 0, "retried": 0, "dead": 0}
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self):
+        """Start the workers on the running loop (idempotent)"""
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        self._loop = loop
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    def resume(self) -> bool:
+        """Start the workers if writes are pending (e.g. left by a previous run)"""
+        if self.running or self.queue.count() == 0:
+            return False
+        self.start()
+        return True
+
+    def submit_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]):
+        """Durably record writes and wake the workers"""
+        self.queue.put_many(items)
+        self.stats["queued"] += len(items)
+        self.start()
+        self._wakeup.set()
+
+    def submit(self, record_id: str, payload: Dict[str, Any]):
+        self.submit_many([(record_id, payload)])
+
+    def cancel(self, record_id: str) -> bool:
+        """Drop a write that has not been flushed (tombstoning it if in flight); False if gone"""
+        if record_id in self._claimed:
+            self._cancelled.add(record_id)
+            return True
+        return self.queue.remove(record_id)
+
+    def is_cancelled(self, record_id: str) -> bool:
+        """True for an in-flight write that was cancelled and must be discarded"""
+        return record_id in self._cancelled
+
+    async def _worker(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            batch = self.queue.due(self.batch_size, self._claimed)
+            if not batch:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            ids = [record_id for record_id, _, _ in batch]
+            self._claimed.update(ids)
+            try:
+                await self._flush_batch(batch)
+            finally:
+                self._claimed.difference_update(ids)
+                self._cancelled.difference_update(ids)
+
+    async def _flush_batch(self, batch: List[Tuple[str, Dict[str, Any], int]]):
+        try:
+            outcomes = await self._flush([payload for _, payload, _ in batch])
+        except Exception as e:
+            outcomes = [e] * len(batch)
+
+        done = []
+        for (record_id, _, attempts), outcome in zip(batch, outcomes):
+            if outcome is None or record_id in self._cancelled:
+                done.append(record_id)
+                continue
+            attempts += 1
+            if attempts >= self.max_attempts:
+                self.queue.bury(record_id, attempts, str(outcome))
+                self.stats["dead"] += 1
+                logger.error(f"Giving up on memory write {record_id} after {attempts} attempts: {outcome}")
+            else:
+                delay = min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+                self.queue.retry(record_id, attempts, time.time() + delay, str(outcome))
+                self.stats["retried"] += 1
+                logger.warning(f"Memory write {record_id} failed (attempt {attempts}), retrying in {delay:.1f}s: {outcome}")
+
+        if done:
+            self.queue.complete(done)
+            self.stats["flushed"] += len(done)
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every pending write is flushed or set aside"""
+        if self.queue.count() == 0:
+            return True
+        self.start()
+        self._wakeup.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.queue.count() > 0:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    async def stop(self, timeout: Optional[float] = 5.0):
+        """Drain (up to timeout), then stop the workers; unflushed writes stay queued"""
+        if self.running:
+            await self.drain(timeout)
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            **self.stats,
+            "pending": self.queue.count(),
+            "dead_letters": self.queue.count(DEAD),
+            "in_flight": len(self._claimed)
+        }
@@ -47,7 +47,7 @@ class FrameworkConfig:
     """Configuration for framework optimization"""
     max_concurrent_requests: int = 10
     request_timeout: int = 30
-    retry_attempts: int = 3
+    retry_attempts: int = 3  # SDK retries for LangChainOptimizer's synchronous LLM calls
     cache_enabled: bool = True
     batch_processing: bool = True
     connection_pooling: bool = True
@@ -208,6 +208,8 @@ class LangChainOptimizer(BaseFrameworkOptimizer):
                 temperature=0.7,
                 max_tokens=1000,
                 request_timeout=self.config.request_timeout,
+                # Synchronous chain calls do not go through the async LLM rate
+                # limiter, so 429s and 5xx errors are retried by the SDK
                 max_retries=self.config.retry_attempts,
                 streaming=False  # Disable streaming for better caching
             )
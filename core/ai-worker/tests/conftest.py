@@ -4,9 +4,10 @@ Pytest configuration and fixtures for Week 4 Memory System Tests
 
 import pytest
 import asyncio
+import fnmatch
 import os
 import sys
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -43,12 +44,19 @@ def memory_config():
 def mock_redis():
     """Create mock Redis client"""
     redis_mock = Mock()
-    redis_mock.ping.return_value = True
-    redis_mock.setex.return_value = True
-    redis_mock.get.return_value = None
-    redis_mock.scan_iter.return_value = []
-    redis_mock.delete.return_value = 1
-    redis_mock.exists.return_value = False
+    redis_mock.ping = AsyncMock(return_value=True)
+    redis_mock.setex = AsyncMock(return_value=True)
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.mget = AsyncMock(return_value=[])
+    redis_mock.delete = AsyncMock(return_value=1)
+    redis_mock.getdel = AsyncMock(return_value=None)
+    redis_mock.exists = AsyncMock(return_value=False)
+    redis_mock.aclose = AsyncMock()
+    redis_mock.scan_iter.return_value = MagicMock()
+    redis_mock.scan_iter.return_value.__aiter__.return_value = []
+    pipeline_mock = Mock()
+    pipeline_mock.execute = AsyncMock(return_value=[])
+    redis_mock.pipeline.return_value = pipeline_mock
     return redis_mock
 
 
@@ -95,6 +103,200 @@ def mock_memory_engine(memory_config, mock_redis, mock_mem0):
                 return engine
 
 
+def _flatten_keys(keys):
+    """SINTER/SUNION accept a list of keys or the keys as arguments"""
+    if len(keys) == 1 and isinstance(keys[0], (list, tuple)):
+        return list(keys[0])
+    return list(keys)
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for the redis.asyncio commands used by the memory engines"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.commands = []  # (name, args) of every command, pipelined or not
+        self.round_trips = 0
+
+    # Strings and keys
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _set(self, key, value):
+        self.data[key] = value
+        self.ttls.pop(key, None)
+        return True
+
+    def _setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def _getdel(self, key):
+        self.ttls.pop(key, None)
+        return self.data.pop(key, None)
+
+    def _mget(self, *keys):
+        return [self.data.get(key) for key in _flatten_keys(keys)]
+
+    def _mset(self, mapping):
+        self.data.update(mapping)
+        return True
+
+    def _delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if key in self.data:
+                removed += 1
+            self.data.pop(key, None)
+            self.ttls.pop(key, None)
+        return removed
+
+    def _exists(self, *keys):
+        return sum(1 for key in keys if key in self.data)
+
+    def _incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def _expire(self, key, ttl):
+        if key not in self.data:
+            return False
+        self.ttls[key] = ttl
+        return True
+
+    def _ttl(self, key):
+        if key not in self.data:
+            return -2
+        return self.ttls.get(key, -1)
+
+    # Sets
+    def _sadd(self, key, *members):
+        current = self.data.setdefault(key, set())
+        added = len(set(members) - current)
+        current.update(members)
+        return added
+
+    def _srem(self, key, *members):
+        current = self.data.get(key, set())
+        removed = len(current & set(members))
+        current.difference_update(members)
+        if not current:
+            self.data.pop(key, None)
+        return removed
+
+    def _smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def _sinter(self, *keys):
+        sets = [self.data.get(key, set()) for key in _flatten_keys(keys)]
+        return set.intersection(*sets) if sets else set()
+
+    def _sunion(self, *keys):
+        return set().union(*(self.data.get(key, set()) for key in _flatten_keys(keys)))
+
+    def _scard(self, key):
+        return len(self.data.get(key, set()))
+
+    # Sorted sets
+    def _zadd(self, key, mapping):
+        current = self.data.setdefault(key, {})
+        added = len(set(mapping) - set(current))
+        current.update({member: float(score) for member, score in mapping.items()})
+        return added
+
+    def _zrem(self, key, *members):
+        current = self.data.get(key, {})
+        removed = sum(1 for member in members if current.pop(member, None) is not None)
+        if not current:
+            self.data.pop(key, None)
+        return removed
+
+    def _zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def _zrevrangebyscore(self, key, max, min, start=None, num=None, withscores=False):
+        def bound(value):
+            return float(value) if not isinstance(value, str) else float(value.replace("inf", "Infinity"))
+        high, low = bound(max), bound(min)
+        # Redis orders ties by member, descending, in reverse ranges
+        entries = sorted(
+            ((member, score) for member, score in self.data.get(key, {}).items() if low <= score <= high),
+            key=lambda entry: (entry[1], entry[0]), reverse=True
+        )
+        if start is not None:
+            entries = entries[start:start + num]
+        return entries if withscores else [member for member, _ in entries]
+
+    def _run(self, name, *args, **kwargs):
+        self.commands.append((name, args))
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if not hasattr(type(self), f"_{name}"):
+            raise AttributeError(name)
+
+        async def command(*args, **kwargs):
+            self.round_trips += 1
+            return self._run(name, *args, **kwargs)
+        return command
+
+    async def execute_command(self, name, *args, **options):
+        """Raw command (options such as NEVER_DECODE have no effect here)"""
+        self.round_trips += 1
+        return self._run(name.lower(), *args)
+
+    async def ping(self):
+        return True
+
+    async def aclose(self):
+        return None
+
+    async def scan_iter(self, match="*", count=None):
+        self.round_trips += 1
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def expire_now(self, key):
+        """Simulate a key reaching its TTL"""
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+class FakePipeline:
+    """Buffers commands and runs them in one round-trip on execute()"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def __getattr__(self, name):
+        if not hasattr(FakeAsyncRedis, f"_{name}"):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        results = [self.redis._run(name, *args, **kwargs) for name, args, kwargs in self.queued]
+        self.queued = []
+        return results
+
+
+@pytest.fixture
+def fake_async_redis():
+    """In-memory async Redis double"""
+    return FakeAsyncRedis()
+
+
 @pytest.fixture
 def sample_messages():
     """Sample messages for testing different frameworks"""
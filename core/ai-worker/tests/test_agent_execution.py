@@ -130,6 +130,35 @@ class TestAgentExecution:
         assert result["execution_time"] >= 0.1
         assert result["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_agent_run_does_not_block_event_loop(self):
+        """A blocking agent.run (e.g. a sandboxed tool) runs off the event loop"""
+        from main import LangChainAgentWrapper, AgentConfig
+        import time
+
+        wrapper = LangChainAgentWrapper(AgentConfig(
+            name="Test Agent",
+            description="Test Description",
+            capabilities=["calculations"]
+        ))
+        wrapper.agent = MagicMock()
+        wrapper.agent.run.side_effect = lambda task: time.sleep(0.3) or "Slow result"
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        result = await wrapper.execute("Slow task")
+        ticking.cancel()
+
+        assert result["result"] == "Slow result"
+        assert ticks >= 5
+
 
 class TestAPIEndpoints:
     """Test API endpoints with comprehensive scenarios"""
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Persistent Agent Registry Tests
+Week 7 Implementation: Warm Restarts without Re-creating Agents
+
+This module tests snapshot stores, lazy restore and coalesced saves for
+the persistent agent registry, and snapshot round-trips for main's
+LangChain wrapper.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from frameworks.agent_registry import (
+    PersistentAgentRegistry, FileSnapshotStore, RedisSnapshotStore,
+    RegistryConfig, RegistryUnavailableError, create_agent_registry
+)
+from frameworks.conversation_history import TokenBudgetedHistory, HistoryConfig
+
+
+class FakeWrapper:
+    """Minimal wrapper with snapshot support"""
+
+    def __init__(self, agent_id, turns=None):
+        self.agent_id = agent_id
+        self.turns = list(turns or [])
+
+    def to_snapshot(self):
+        return {"agent_id": self.agent_id, "turns": list(self.turns)}
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        return cls(snapshot["agent_id"], snapshot["turns"])
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands used by RedisSnapshotStore"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+
+class TestPersistentAgentRegistry:
+    """Test suite for PersistentAgentRegistry"""
+
+    @pytest.mark.asyncio
+    async def test_lazy_restore_after_restart(self, tmp_path):
+        """A new registry lists persisted agents but restores them on access"""
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, FileSnapshotStore(str(tmp_path)))
+        registry["agent-1"] = FakeWrapper("agent-1", ["hello"])
+        registry["agent-2"] = FakeWrapper("agent-2")
+        assert await registry.save("agent-1")
+        assert await registry.save("agent-2")
+
+        factory = MagicMock(side_effect=FakeWrapper.from_snapshot)
+        restarted = PersistentAgentRegistry(factory, FileSnapshotStore(str(tmp_path)))
+        assert restarted.load_index() == 2
+
+        assert sorted(restarted) == ["agent-1", "agent-2"]
+        assert "agent-1" in restarted
+        factory.assert_not_called()
+
+        wrapper = restarted["agent-1"]
+        assert wrapper.turns == ["hello"]
+        assert restarted["agent-1"] is wrapper
+        assert factory.call_count == 1
+        assert restarted.get_statistics()["pending_restore"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_snapshot(self, tmp_path):
+        """Deleting an agent removes its snapshot"""
+        store = FileSnapshotStore(str(tmp_path))
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, store)
+        registry["agent/odd id"] = FakeWrapper("agent/odd id")
+        await registry.save("agent/odd id")
+        assert store.list_ids() == ["agent/odd id"]
+
+        del registry["agent/odd id"]
+        assert store.list_ids() == []
+        with pytest.raises(KeyError):
+            del registry["agent/odd id"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_are_coalesced(self, tmp_path):
+        """Saves requested while one is in flight collapse into one follow-up write"""
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, FileSnapshotStore(str(tmp_path)))
+        wrapper = FakeWrapper("agent-1")
+        registry["agent-1"] = wrapper
+
+        async def save_turn(i):
+            wrapper.turns.append(i)
+            await registry.save("agent-1")
+
+        await asyncio.gather(*(save_turn(i) for i in range(10)))
+
+        assert registry.snapshots_written < 10
+        assert registry.coalesced > 0
+        assert FileSnapshotStore(str(tmp_path)).load("agent-1")["turns"] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_snapshots_wait_for_running_task(self, tmp_path):
+        """Saves and flushes snapshot an agent only while no run holds its run_lock"""
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, FileSnapshotStore(str(tmp_path)))
+        wrapper = FakeWrapper("agent-1")
+        wrapper.run_lock = asyncio.Lock()
+        registry["agent-1"] = wrapper
+
+        async with wrapper.run_lock:
+            saving = asyncio.create_task(registry.save("agent-1"))
+            await asyncio.sleep(0.05)
+            assert not saving.done()
+            wrapper.turns.append("finished")
+
+        assert await saving
+        assert FileSnapshotStore(str(tmp_path)).load("agent-1")["turns"] == ["finished"]
+
+        wrapper.turns.append("later")
+        await registry.flush()
+        assert FileSnapshotStore(str(tmp_path)).load("agent-1")["turns"] == ["finished", "later"]
+
+    @pytest.mark.asyncio
+    async def test_redis_store(self):
+        """The Redis store keeps snapshots as fields of one hash"""
+        client = FakeRedis()
+        store = RedisSnapshotStore("redis://unused", "agents", client=client)
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, store)
+        registry["agent-1"] = FakeWrapper("agent-1", ["a"])
+        await registry.save("agent-1")
+
+        restarted = PersistentAgentRegistry(FakeWrapper.from_snapshot, RedisSnapshotStore("", "agents", client=client))
+        restarted.load_index()
+        assert restarted["agent-1"].turns == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_async_restore_and_remove(self, tmp_path):
+        """get_agent and remove do the store I/O in the shared executor"""
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, FileSnapshotStore(str(tmp_path)))
+        registry["agent-1"] = FakeWrapper("agent-1", ["hello"])
+        await registry.save("agent-1")
+
+        restarted = PersistentAgentRegistry(FakeWrapper.from_snapshot, FileSnapshotStore(str(tmp_path)))
+        restarted.load_index()
+        first, second = await asyncio.gather(restarted.get_agent("agent-1"), restarted.get_agent("agent-1"))
+
+        assert first is second
+        assert first.turns == ["hello"]
+        assert await restarted.remove("agent-1")
+        assert not await restarted.remove("agent-1")
+        assert FileSnapshotStore(str(tmp_path)).list_ids() == []
+        with pytest.raises(KeyError):
+            await restarted.get_agent("agent-1")
+
+    @pytest.mark.asyncio
+    async def test_load_error_keeps_agent(self):
+        """A transient store error is retryable; only a missing snapshot forgets the agent"""
+        client = FakeRedis()
+        store = RedisSnapshotStore("", "agents", client=client)
+        registry = PersistentAgentRegistry(FakeWrapper.from_snapshot, store)
+        registry["agent-1"] = FakeWrapper("agent-1", ["a"])
+        registry["agent-2"] = FakeWrapper("agent-2")
+        await registry.save("agent-1")
+        await registry.save("agent-2")
+
+        restarted = PersistentAgentRegistry(FakeWrapper.from_snapshot, RedisSnapshotStore("", "agents", client=client))
+        restarted.load_index()
+        hget = client.hget
+        client.hget = MagicMock(side_effect=ConnectionError("redis down"))
+
+        with pytest.raises(RegistryUnavailableError):
+            await restarted.get_agent("agent-1")
+        assert "agent-1" in restarted
+        assert restarted.failures == 1
+
+        client.hget = hget
+        client.hdel("agents", "agent-2")
+        assert (await restarted.get_agent("agent-1")).turns == ["a"]
+        with pytest.raises(KeyError):
+            await restarted.get_agent("agent-2")
+        assert "agent-2" not in restarted
+
+    def test_without_store_behaves_like_dict(self):
+        """No backend means a plain in-memory mapping"""
+        registry = create_agent_registry(FakeWrapper.from_snapshot, RegistryConfig(backend="none"))
+        registry["a"] = "wrapper"
+        assert registry["a"] == "wrapper"
+        assert len(registry) == 1
+        registry.clear()
+        assert len(registry) == 0
+        with pytest.raises(KeyError):
+            registry["a"]
+
+
+class TestHistorySnapshot:
+    """Conversation history round-trips through plain data"""
+
+    def test_round_trip(self):
+        """Turns, summary and counters survive to_dict/from_dict"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turns=2))
+        for i in range(4):
+            history.append(f"task {i}", f"result {i}")
+
+        restored = TokenBudgetedHistory.from_dict(history.to_dict())
+
+        assert restored.to_messages() == history.to_messages()
+        assert restored.get_statistics() == history.get_statistics()
+        assert restored.config.max_turns == 2
+
+
+class TestLangChainWrapperSnapshot:
+    """main.LangChainAgentWrapper snapshots"""
+
+    def test_snapshot_round_trip(self):
+        """Config, id and conversation memory are restored"""
+        from main import LangChainAgentWrapper, AgentConfig
+
+        wrapper = LangChainAgentWrapper(AgentConfig(
+            name="Snapshot Agent",
+            description="Test",
+            capabilities=["calculations"]
+        ))
+        snapshot = wrapper.to_snapshot()
+        restored = LangChainAgentWrapper.from_snapshot(snapshot)
+
+        assert restored.agent_id == wrapper.agent_id
+        assert restored.agent_config == wrapper.agent_config
+        assert restored.agent is None
@@ -9,7 +9,12 @@ to improve coverage and ensure production readiness.
 import pytest
 import asyncio
 import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from aiohttp import web
 from datetime import datetime, timedelta
 
 import sys
@@ -21,6 +26,8 @@ from consolidation_engine import (
     ConsolidationRule,
     MemoryPattern
 )
+from universal_memory import MemoryEntry, MemoryType
+from universal_memory import FrameworkType as UniversalFrameworkType
 
 # Create mock classes for testing
 class ConsolidationConfig:
@@ -459,3 +466,142 @@ class TestMemoryCluster:
         assert "memory_count" in summary
         assert "concepts" in summary
         assert "coherence_score" in summary
+
+
+@asynccontextmanager
+async def consolidation_api():
+    """Local memory API recording writes and the peak number in flight"""
+    state = {"in_flight": 0, "peak": 0, "stored": 0, "patched": []}
+
+    async def respond(response):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.02)
+        state["in_flight"] -= 1
+        return response
+
+    async def store(request):
+        body = await request.json()
+        if body["content"].startswith("Understanding: fail"):
+            return await respond(web.json_response({"error": "boom"}, status=500))
+        state["stored"] += 1
+        return await respond(web.json_response({"memory_id": f"sem_{state['stored']}"}, status=201))
+
+    async def patch_memory(request):
+        state["patched"].append(request.match_info["memory_id"])
+        return await respond(web.json_response({}, status=200))
+
+    app = web.Application()
+    app.router.add_post("/api/v1/memory/semantic/store", store)
+    app.router.add_patch("/api/v1/memory/{memory_id}", patch_memory)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}", state
+    finally:
+        await runner.cleanup()
+
+
+class TestConsolidationWrites:
+    """MemoryConsolidationEngine API writes are concurrent and bounded"""
+
+    @pytest.mark.asyncio
+    async def test_semantic_memories_stored_concurrently(self):
+        """Stores overlap up to BATCH_CONCURRENCY; failures do not sink the batch"""
+        async with consolidation_api() as (base_url, state):
+            async with MemoryConsolidationEngine(api_base_url=base_url) as engine:
+                engine.BATCH_CONCURRENCY = 4
+                semantic_memories = [
+                    {"content": f"Understanding: {'fail' if i == 3 else 'cause'} {i}", "concepts": []}
+                    for i in range(12)
+                ]
+
+                memory_ids = await engine._store_consolidated_memories(
+                    semantic_memories, UniversalFrameworkType.LANGCHAIN
+                )
+
+        assert len(memory_ids) == 11
+        assert 1 < state["peak"] <= 4
+
+    @pytest.mark.asyncio
+    async def test_importance_updates_coalesced_per_memory(self):
+        """Each supporting memory gets exactly one PATCH"""
+        memories = [
+            MemoryEntry(id=f"m{i % 3}", content="x", memory_type=MemoryType.EPISODIC,
+                        framework=UniversalFrameworkType.LANGCHAIN, concepts=[], importance=0.5)
+            for i in range(6)
+        ]
+        patterns = [
+            MemoryPattern("behavioral", "p1", 0.7, ["m0", "m1"], "k1", []),
+            MemoryPattern("temporal", "p2", 0.8, ["m1", "m2"], "k2", [])
+        ]
+        async with consolidation_api() as (base_url, state):
+            async with MemoryConsolidationEngine(api_base_url=base_url) as engine:
+                await engine._update_memory_importance(memories, patterns)
+
+        assert sorted(state["patched"]) == ["m0", "m1", "m2"]
+        assert state["peak"] > 1
+
+
+def episodic(memory_id, content):
+    return MemoryEntry(id=memory_id, content=content, memory_type=MemoryType.EPISODIC,
+                       framework=UniversalFrameworkType.LANGCHAIN, concepts=[], importance=0.5)
+
+
+class TestTemplatePatterns:
+    """Pattern templates are matched in one compiled pass"""
+
+    @pytest.mark.asyncio
+    async def test_all_template_types_are_matched(self):
+        engine = MemoryConsolidationEngine()
+        memories = [
+            episodic("m1", "The cache miss led to slow pages. After the deploy, alerts occurred"),
+            episodic("m2", "If tests fail, then we roll back; Redis is similar to Memcached")
+        ]
+
+        patterns = await engine._find_template_patterns(memories)
+
+        found = {(p.pattern_type, tuple(p.concepts), p.supporting_memories[0]) for p in patterns}
+        assert found == {
+            ("causal", ("the cache miss", "slow pages"), "m1"),
+            ("temporal", ("the deploy", "alerts"), "m1"),
+            ("behavioral", ("tests fail", "we roll back"), "m2"),
+            ("conceptual", ("redis", "memcached"), "m2")
+        }
+
+    @pytest.mark.asyncio
+    async def test_literal_templates_win_mid_text(self):
+        """A literal-first template beats a group-first one after a sentence boundary too"""
+        engine = MemoryConsolidationEngine()
+        memories = [episodic("m1", "Done. If retries are on, then latency grows")]
+
+        patterns = await engine._find_template_patterns(memories)
+
+        assert [(p.pattern_type, p.concepts) for p in patterns] == [
+            ("behavioral", ["retries are on", "latency grows"])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_long_content_does_not_backtrack(self):
+        """A long clause without a template match is scanned in linear time"""
+        engine = MemoryConsolidationEngine()
+        memories = [episodic("long", "word " * 20000 + "led to")]
+
+        started = time.perf_counter()
+        assert await engine._find_template_patterns(memories) == []
+        assert time.perf_counter() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_large_windows_use_executor(self):
+        """Matching moves to the executor for large batches"""
+        memories = [episodic(f"m{i}", f"step {i} led to step {i + 1}") for i in range(5)]
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            engine = MemoryConsolidationEngine(executor=pool)
+            engine.EXECUTOR_THRESHOLD = 5
+
+            patterns = await engine._find_template_patterns(memories)
+
+        assert [p.concepts for p in patterns] == [[f"step {i}", f"step {i + 1}"] for i in range(5)]
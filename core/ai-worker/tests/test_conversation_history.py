@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Conversation History Tests
+Week 7 Implementation: Bounded Conversation Memory for Agent Wrappers
+
+This module tests token budgeting, compaction and the AutoGen wrapper's
+use of the token-budgeted conversation history.
+"""
+
+import os
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from frameworks.conversation_history import TokenBudgetedHistory, HistoryConfig
+from frameworks.token_counter import count_tokens
+from frameworks.base_wrapper import AgentConfig
+
+
+class TestTokenBudgetedHistory:
+    """Test suite for TokenBudgetedHistory"""
+
+    def test_append_tracks_tokens(self):
+        """Turns carry cached token counts and totals are incremental"""
+        history = TokenBudgetedHistory()
+        turn = history.append("What is AgentOS?", "An agent operating system.")
+
+        assert turn.task_tokens == count_tokens("What is AgentOS?")
+        assert history.total_tokens == turn.tokens
+        assert history.total_turns == 1
+
+    def test_long_results_are_truncated(self):
+        """Stored turns are capped at max_turn_tokens"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turn_tokens=20))
+        turn = history.append("task", "word " * 500)
+
+        assert turn.result_tokens <= 20
+
+    def test_old_turns_are_compacted(self):
+        """Turns beyond max_turns move into the summary"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turns=3))
+        for i in range(5):
+            history.append(f"question {i}", f"answer {i}")
+
+        assert len(history) == 3
+        assert history.evicted_turns == 2
+        assert "question 0" in history.summary
+        assert history.total_turns == 5
+
+    def test_summary_is_bounded(self):
+        """The rolling summary never exceeds its token limit"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turns=1, summary_token_limit=50))
+        for i in range(100):
+            history.append(f"question number {i} " * 5, f"answer number {i} " * 5)
+
+        assert history.summary_tokens <= 50
+        assert "question number 0 " not in history.summary
+
+    def test_to_messages_respects_budget(self):
+        """Only the most recent turns that fit the budget are replayed"""
+        history = TokenBudgetedHistory()
+        for i in range(10):
+            history.append(f"question {i}", "answer " * 20)
+
+        per_turn = history.turns[-1].tokens
+        messages = history.to_messages(token_budget=per_turn * 3)
+
+        assert len(messages) == 6
+        assert messages[-2]["content"] == "question 9"
+        assert messages[0]["content"] == "question 7"
+
+    def test_to_messages_includes_summary(self):
+        """The summary is sent as a system message when it fits"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turns=1))
+        history.append("first question", "first answer")
+        history.append("second question", "second answer")
+
+        messages = history.to_messages()
+        assert messages[0]["role"] == "system"
+        assert "first question" in messages[0]["content"]
+        assert messages[1]["content"] == "second question"
+
+    def test_clear(self):
+        """clear() resets turns, summary and counters"""
+        history = TokenBudgetedHistory(HistoryConfig(max_turns=1))
+        history.append("a", "b")
+        history.append("c", "d")
+        history.clear()
+
+        assert len(history) == 0
+        assert history.summary == ""
+        assert history.get_statistics()["history_tokens"] == 0
+
+
+class TestAutoGenHistoryIntegration:
+    """AutoGen wrapper replays budgeted history"""
+
+    @pytest.mark.asyncio
+    async def test_conversation_replays_budgeted_history(self):
+        """Conversation tasks include packed history messages"""
+        from frameworks.autogen_wrapper import AutoGenAgentWrapper
+
+        wrapper = AutoGenAgentWrapper(AgentConfig(
+            name="autogen_agent",
+            description="Test agent",
+            capabilities=["text_processing"]
+        ))
+        wrapper.llm_config = {"model": "gpt-3.5-turbo", "temperature": 0.7}
+        wrapper.assistant_agent = {"system_message": "You are helpful"}
+        wrapper.conversation_history.append("earlier question", "earlier answer")
+
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="Hello"))]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}):
+            with patch('frameworks.autogen_wrapper.get_async_openai_client', return_value=client):
+                await wrapper._execute_conversation_task("Say hello")
+
+        messages = client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[1] == {"role": "user", "content": "earlier question"}
+        assert messages[2] == {"role": "assistant", "content": "earlier answer"}
+        assert messages[-1] == {"role": "user", "content": "Say hello"}
+
+    def test_memory_usage_reports_history_tokens(self):
+        """_get_memory_usage exposes history size"""
+        from frameworks.autogen_wrapper import AutoGenAgentWrapper
+
+        wrapper = AutoGenAgentWrapper(AgentConfig(
+            name="autogen_agent",
+            description="Test agent",
+            capabilities=[]
+        ))
+        wrapper.conversation_history.append("question", "answer")
+
+        usage = wrapper._get_memory_usage()
+        assert usage["conversation_history"] == 1
+        assert usage["history_tokens"] > 0
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Crew DAG Scheduler Tests
+Week 7 Implementation: Dependency-aware Concurrent Crew Execution
+
+This module tests graph validation, concurrent branch execution, output
+passing, failure propagation and critical-path reporting for crew tasks.
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from frameworks.crew_dag import CrewTaskSpec, CrewDAGScheduler, topological_order
+from frameworks.base_wrapper import AgentConfig, TaskRequest
+
+
+def diamond():
+    """research -> (analysis, pricing) -> report"""
+    return [
+        CrewTaskSpec("research", "Research the market"),
+        CrewTaskSpec("analysis", "Analyze findings", ["research"]),
+        CrewTaskSpec("pricing", "Propose pricing", ["research"]),
+        CrewTaskSpec("report", "Write report", ["analysis", "pricing"]),
+    ]
+
+
+class TestTopologicalOrder:
+    """Test suite for graph validation"""
+
+    def test_order_respects_dependencies(self):
+        """Dependencies come before dependents"""
+        order = topological_order(diamond())
+        assert order.index("research") < order.index("analysis") < order.index("report")
+        assert order.index("pricing") < order.index("report")
+
+    def test_cycle_is_rejected(self):
+        """Cyclic dependencies raise ValueError"""
+        specs = [CrewTaskSpec("a", "A", ["b"]), CrewTaskSpec("b", "B", ["a"])]
+        with pytest.raises(ValueError, match="cycle"):
+            topological_order(specs)
+
+    def test_unknown_dependency_is_rejected(self):
+        """Dependencies on missing tasks raise ValueError"""
+        with pytest.raises(ValueError, match="unknown"):
+            topological_order([CrewTaskSpec("a", "A", ["missing"])])
+
+    def test_duplicate_ids_are_rejected(self):
+        """Task ids must be unique"""
+        with pytest.raises(ValueError, match="Duplicate"):
+            topological_order([CrewTaskSpec("a", "A"), CrewTaskSpec("a", "B")])
+
+    def test_from_dict(self):
+        """Payload entries default ids and accept a single dependency string"""
+        spec = CrewTaskSpec.from_dict({"description": "Do it", "depends_on": "task_1"}, index=1)
+        assert spec.task_id == "task_2"
+        assert spec.depends_on == ["task_1"]
+
+
+class TestCrewDAGScheduler:
+    """Test suite for CrewDAGScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_independent_branches_run_concurrently(self):
+        """Wall time follows the critical path, not the sum of tasks"""
+        durations = {"research": 0.05, "analysis": 0.1, "pricing": 0.1, "report": 0.05}
+
+        async def runner(spec, upstream):
+            await asyncio.sleep(durations[spec.task_id])
+            return spec.task_id
+
+        result = await CrewDAGScheduler(runner).run(diamond())
+
+        assert result.succeeded
+        assert result.wall_time < 0.28
+        assert result.total_task_time >= 0.29
+        assert result.critical_path[0] == "research"
+        assert result.critical_path[-1] == "report"
+        assert len(result.critical_path) == 3
+        assert result.critical_path_time == pytest.approx(0.2, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_outputs_flow_along_edges(self):
+        """Each task receives the outputs of its dependencies"""
+        seen = {}
+
+        async def runner(spec, upstream):
+            seen[spec.task_id] = dict(upstream)
+            return f"{spec.task_id}-output"
+
+        result = await CrewDAGScheduler(runner).run(diamond())
+
+        assert seen["research"] == {}
+        assert seen["report"] == {"analysis": "analysis-output", "pricing": "pricing-output"}
+        assert result.sink_outputs() == {"report": "report-output"}
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_downstream(self):
+        """Tasks downstream of a failure are skipped; other branches finish"""
+        async def runner(spec, upstream):
+            if spec.task_id == "analysis":
+                raise RuntimeError("analysis failed")
+            return spec.task_id
+
+        result = await CrewDAGScheduler(runner).run(diamond())
+
+        assert not result.succeeded
+        assert result.results["analysis"].status == "failed"
+        assert result.results["pricing"].status == "completed"
+        assert result.results["report"].status == "skipped"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """No more than max_concurrency tasks run at once"""
+        active = 0
+        peak = 0
+
+        async def runner(spec, upstream):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return spec.task_id
+
+        specs = [CrewTaskSpec(f"t{i}", "independent") for i in range(6)]
+        await CrewDAGScheduler(runner, max_concurrency=2).run(specs)
+        assert peak == 2
+
+
+class TestCrewAIGraphExecution:
+    """CrewAI wrapper executes crew_tasks as a DAG"""
+
+    @pytest.fixture
+    def wrapper(self):
+        from frameworks.crewai_wrapper import CrewAIAgentWrapper
+
+        wrapper = CrewAIAgentWrapper(AgentConfig(
+            name="crew_agent",
+            description="Test agent",
+            capabilities=["web_search", "text_processing"]
+        ))
+        wrapper.is_initialized = True
+        wrapper.use_real_crewai = False
+        wrapper.crewai_agent = {"llm_config": {"api_key": "test_key", "model": "gpt-3.5-turbo"}}
+        return wrapper
+
+    @pytest.mark.asyncio
+    async def test_graph_execution(self, wrapper):
+        """crew_tasks run with dependencies and report critical-path timing"""
+        prompts = {}
+
+        async def fake_openai(description):
+            title = description.splitlines()[0]
+            prompts[title] = description
+            await asyncio.sleep(0.01)
+            return f"done: {title}"
+
+        wrapper._run_openai_task = fake_openai
+        response = await wrapper.execute(TaskRequest(
+            task="Market study",
+            context={"crew_tasks": [
+                {"id": "research", "description": "Research the market"},
+                {"id": "summary", "description": "Summarize", "depends_on": ["research"]}
+            ]}
+        ))
+
+        assert response.status == "completed"
+        assert response.result == "done: Summarize"
+        assert "done: Research the market" in prompts["Summarize"]
+        assert response.metadata["process_type"] == "dag"
+        assert response.metadata["critical_path"] == ["research", "summary"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_graph_fails(self, wrapper):
+        """Invalid graphs produce a failed response"""
+        response = await wrapper.execute(TaskRequest(
+            task="Broken",
+            context={"crew_tasks": [{"id": "a", "description": "A", "depends_on": ["a"]}]}
+        ))
+        assert response.status == "failed"
+        assert "cycle" in response.error_message
+
+    @pytest.mark.asyncio
+    async def test_concurrent_nodes_use_distinct_agents(self, wrapper):
+        """Independent nodes never share a (stateful) CrewAI agent"""
+        wrapper.use_real_crewai = True
+        in_use = set()
+        overlap = []
+        lock = threading.Lock()
+
+        def make_crew(agents, tasks, **kwargs):
+            agent = agents[0]
+
+            def kickoff():
+                with lock:
+                    if id(agent) in in_use:
+                        overlap.append(tasks)
+                    in_use.add(id(agent))
+                time.sleep(0.05)
+                with lock:
+                    in_use.discard(id(agent))
+                return "ok"
+
+            return Mock(kickoff=kickoff)
+
+        with patch('frameworks.crewai_wrapper.Agent', side_effect=lambda **kwargs: Mock()), \
+                patch('frameworks.crewai_wrapper.Task', side_effect=lambda **kwargs: Mock()), \
+                patch('frameworks.crewai_wrapper.Crew', side_effect=make_crew):
+            response = await wrapper.execute(TaskRequest(
+                task="Fan out",
+                context={"crew_tasks": [{"id": f"t{i}", "description": f"Task {i}"} for i in range(4)]}
+            ))
+
+        assert response.status == "completed"
+        assert overlap == []
+        assert len(wrapper._idle_node_agents) == 4
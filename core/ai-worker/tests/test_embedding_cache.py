@@ -0,0 +1,140 @@
+"""
+Tests for the embedding cache
+Week 7: Memory System Performance
+
+This module tests content-hash keys, the LRU and SQLite tiers, and the
+cached wrappers around mem0's and the local embedders.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from embedding_cache import EmbeddingCache, CachedEmbedder, CachedMem0Embedder, embedding_key
+from local_embeddings import HashingEmbedder
+from mem0_memory_engine import Mem0MemoryEngine, MemoryConfig, FrameworkType
+
+
+class CountingEmbedder(HashingEmbedder):
+    """Hashing embedder that records what it was asked to embed"""
+
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache"""
+
+    def test_key_normalizes_whitespace_not_case(self):
+        """Whitespace variants share a key; case and model do not"""
+        assert embedding_key("m", " hello \n world") == embedding_key("m", "hello world")
+        assert embedding_key("m", "Hello world") != embedding_key("m", "hello world")
+        assert embedding_key("a", "hello") != embedding_key("b", "hello")
+
+    def test_float16_storage(self):
+        """Vectors are stored as 2 bytes per dimension and decoded to float32"""
+        cache = EmbeddingCache(dtype="float16")
+        vector = np.linspace(-1, 1, 128, dtype=np.float32)
+        cache.put("m", "text", vector)
+
+        cached = cache.get("m", "text")
+        assert cached.dtype == np.float32
+        assert np.allclose(cached, vector, atol=1e-3)
+        assert cache.get_statistics()["bytes"] == 256
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = EmbeddingCache(max_entries=2, dtype="float32")
+        cache.put("m", "a", [1.0])
+        cache.put("m", "b", [2.0])
+        cache.get("m", "a")
+        cache.put("m", "c", [3.0])
+
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a")[0] == 1.0
+        assert len(cache) == 2
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """A new cache on the same file serves earlier embeddings"""
+        path = str(tmp_path / "embeddings.db")
+        first = EmbeddingCache(path=path)
+        first.put("m", "persisted", [0.5, -0.5])
+        first.close()
+
+        second = EmbeddingCache(path=path)
+        assert np.allclose(second.get("m", "persisted"), [0.5, -0.5])
+        assert second.stats["disk_hits"] == 1
+        second.close()
+
+
+class TestCachedEmbedders:
+    """Test suite for the cache wrappers"""
+
+    def test_local_embedder_embeds_misses_once(self):
+        """Only distinct uncached texts reach the embedder"""
+        inner = CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache())
+
+        first = embedder.embed(["alpha", "beta", "alpha"])
+        second = embedder.embed(["beta", "gamma"])
+
+        assert inner.calls == [["alpha", "beta"], ["gamma"]]
+        assert np.allclose(first[0], first[2])
+        assert np.allclose(second[0], first[1], atol=1e-3)
+
+    def test_mem0_embedder(self):
+        """mem0's embed(text, action) is served from cache on repeats"""
+        inner = Mock()
+        inner.embed.return_value = [0.25, 0.75]
+        inner.config = "kept"
+        embedder = CachedMem0Embedder(inner, EmbeddingCache(), "text-embedding-ada-002")
+
+        assert embedder.embed("same text", "add") == [0.25, 0.75]
+        assert embedder.embed("same  text", "search") == [0.25, 0.75]
+        assert inner.embed.call_count == 1
+        assert embedder.config == "kept"
+
+
+class TestEngineEmbeddingCache:
+    """Mem0MemoryEngine installs the cache in front of its embedders"""
+
+    def test_wraps_mem0_embedder(self):
+        """mem0's embedding model is replaced by the caching wrapper"""
+        memory = Mock()
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', True), \
+             patch('mem0_memory_engine.Mem0Config'), \
+             patch('mem0_memory_engine.Memory', return_value=memory):
+            engine = Mem0MemoryEngine()
+
+        assert isinstance(engine.memory.embedding_model, CachedMem0Embedder)
+
+    @pytest.mark.asyncio
+    async def test_fallback_store_and_query_reuse_embeddings(self, fake_async_redis):
+        """Re-storing and re-querying identical text hits the cache"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine()
+        engine.redis = fake_async_redis
+
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+        await engine._search_fallback_memories("agents", "alice", None, 5)
+        await engine._search_fallback_memories("agents", "bob", None, 5)
+
+        stats = engine.get_statistics()["embedding_cache"]
+        assert stats["hits"] >= 2
+        assert stats["entries"] == 2
+
+    def test_cache_can_be_disabled(self):
+        """embedding_cache_size=0 turns the cache off"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine(MemoryConfig(embedding_cache_size=0))
+        assert engine.embedding_cache is None
@@ -0,0 +1,174 @@
+"""
+Tests for the local embedding service
+Week 7: Memory System Performance
+
+This module tests micro-batching of concurrent embed requests, error
+propagation and the service's use by the memory engines.
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from embedding_service import EmbeddingService, EmbeddingServiceConfig, get_embedding_service
+from local_embeddings import HashingEmbedder
+from mem0_memory_engine import Mem0MemoryEngine, FrameworkType
+from universal_memory import UniversalMemory, MemoryEntry, MemoryType
+from universal_memory import FrameworkType as UniversalFrameworkType
+
+
+class RecordingEmbedder(HashingEmbedder):
+    """Hashing embedder recording batch sizes and the thread it runs on"""
+
+    def __init__(self):
+        super().__init__(dim=32)
+        self.batches = []
+        self.threads = set()
+
+    def embed(self, texts):
+        self.batches.append(len(texts))
+        self.threads.add(threading.current_thread().name)
+        return super().embed(texts)
+
+
+class FailingEmbedder(HashingEmbedder):
+    def embed(self, texts):
+        raise RuntimeError("model crashed")
+
+
+class TestEmbeddingService:
+    """Test suite for EmbeddingService"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batches(self):
+        """Requests arriving together are embedded in one model call"""
+        embedder = RecordingEmbedder()
+        service = EmbeddingService(lambda: embedder, EmbeddingServiceConfig(max_batch_size=64, max_wait_ms=50))
+        try:
+            results = await asyncio.gather(*(service.embed_async([f"text {i}", "shared"]) for i in range(10)))
+        finally:
+            service.close()
+
+        assert sum(embedder.batches) == 20
+        assert len(embedder.batches) < 10
+        assert embedder.threads == {"agentos-embedder"}
+        expected = HashingEmbedder(dim=32).embed(["text 3", "shared"])
+        assert np.allclose(results[3], expected)
+
+    def test_batch_size_is_bounded(self):
+        """No model call exceeds max_batch_size (unless one request does)"""
+        embedder = RecordingEmbedder()
+        service = EmbeddingService(lambda: embedder, EmbeddingServiceConfig(max_batch_size=4, max_wait_ms=50))
+        try:
+            futures = [service.submit([f"t{i}"]) for i in range(10)]
+            assert all(future.result(timeout=5).shape == (1, 32) for future in futures)
+        finally:
+            service.close()
+
+        assert max(embedder.batches) <= 4
+        assert sum(embedder.batches) == 10
+
+    def test_model_errors_reach_callers(self):
+        """A failing batch fails each of its requests"""
+        service = EmbeddingService(lambda: FailingEmbedder(dim=8), EmbeddingServiceConfig(max_wait_ms=1))
+        try:
+            with pytest.raises(RuntimeError, match="model crashed"):
+                service.embed(["x"])
+        finally:
+            service.close()
+
+    def test_load_errors_reach_callers(self):
+        """A model that fails to load fails requests instead of hanging"""
+        def load():
+            raise OSError("weights missing")
+
+        service = EmbeddingService(load, EmbeddingServiceConfig(max_wait_ms=1))
+        try:
+            with pytest.raises(RuntimeError, match="weights missing"):
+                service.embed(["x"])
+        finally:
+            service.close()
+
+    @pytest.mark.asyncio
+    async def test_lazy_model_loads_on_service_thread(self):
+        """A lazily loaded model is loaded by the service, and waiting does not block the loop"""
+        class LazyEmbedder:
+            """Loads its "model" on first access to dim, like SentenceTransformerEmbedder"""
+            name = "lazy"
+            load_thread = None
+
+            @property
+            def dim(self):
+                if self.load_thread is None:
+                    time.sleep(0.2)
+                    self.load_thread = threading.current_thread().name
+                return 8
+
+        embedder = LazyEmbedder()
+        service = EmbeddingService(lambda: embedder, EmbeddingServiceConfig(max_wait_ms=1))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            assert await service.wait_ready() is embedder
+        finally:
+            ticking.cancel()
+            service.close()
+
+        assert embedder.load_thread == "agentos-embedder"
+        assert service.dim == 8
+        assert ticks >= 5
+
+    def test_shared_per_model(self):
+        """Components asking for the same model get the same service"""
+        assert get_embedding_service("hashing") is get_embedding_service(None)
+
+
+class TestEngineIntegration:
+    """The memory engines embed through the shared service"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_engine_uses_shared_service(self, fake_async_redis):
+        """Fallback index embeddings go through the process-wide service"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine()
+        engine.redis = fake_async_redis
+        service = get_embedding_service("hashing")
+        before = service.stats["texts"]
+
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+
+        assert engine._fallback_embedder.embedder is service
+        assert service.stats["texts"] == before + 1
+
+    @pytest.mark.asyncio
+    async def test_universal_memory_attaches_embeddings(self, fake_async_redis):
+        """Stored entries carry an embedding when a service is configured"""
+        service = EmbeddingService(lambda: HashingEmbedder(dim=16), EmbeddingServiceConfig(max_wait_ms=1))
+        try:
+            async with UniversalMemory(embedding_service=service) as memory:
+                memory.redis = fake_async_redis
+                entries = [
+                    MemoryEntry(id="", content=f"scratch {i}", memory_type=MemoryType.WORKING,
+                                framework=UniversalFrameworkType.SWARMS, concepts=[], importance=0.2)
+                    for i in range(3)
+                ]
+                await memory.store_memories(entries)
+        finally:
+            service.close()
+
+        assert all(len(entry.embedding) == 16 for entry in entries)
+        assert service.stats["batches"] == 1
@@ -0,0 +1,105 @@
+"""
+Tests for the binary memory entry codec
+Week 7: Memory System Performance
+
+This module tests round-trips of memory entries through the codec, its
+size advantage over JSON, and UniversalMemory's use of it for working
+memory and cached search results (including entries cached as JSON).
+"""
+
+import json
+import pytest
+from datetime import datetime, timezone
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from entry_codec import is_encoded
+from universal_memory import UniversalMemory, MemoryEntry, MemoryType, FrameworkType, ENTRY_CODEC
+
+
+def make_entry(**overrides):
+    values = dict(
+        id="mem_1", content="Agents share plans — über fast", memory_type=MemoryType.EPISODIC,
+        framework=FrameworkType.CREWAI, concepts=["plans", "agents"], importance=0.75,
+        embedding=[0.25, -1.5, 3.0], metadata={"source_type": "user_input", "turns": 3},
+        created_at=datetime(2025, 3, 1, 12, 30, 45, 123456),
+        updated_at=datetime(2025, 3, 2, 8, 0, tzinfo=timezone.utc)
+    )
+    values.update(overrides)
+    return MemoryEntry(**values)
+
+
+class TestMemoryEntryCodec:
+    """Test suite for MemoryEntryCodec"""
+
+    def test_round_trip(self):
+        """Every field survives encoding exactly"""
+        entry = make_entry()
+        data = ENTRY_CODEC.encode(entry)
+
+        assert is_encoded(data)
+        assert ENTRY_CODEC.decode(data) == entry
+
+    def test_round_trip_without_embedding(self):
+        entry = make_entry(embedding=None, concepts=[], metadata={})
+        assert ENTRY_CODEC.decode(ENTRY_CODEC.encode(entry)) == entry
+
+    def test_embeddings_are_float32(self):
+        """Embeddings are stored as raw float32, much smaller than JSON"""
+        embedding = [i / 997 for i in range(384)]
+        entry = make_entry(embedding=embedding)
+
+        decoded = ENTRY_CODEC.decode(ENTRY_CODEC.encode(entry))
+
+        assert decoded.embedding == pytest.approx(embedding, rel=1e-6)
+        legacy = json.dumps({"embedding": embedding, "content": entry.content})
+        assert len(ENTRY_CODEC.encode(entry)) * 4 < len(legacy)
+
+    def test_list_round_trip(self):
+        entries = [make_entry(id=f"mem_{i}", memory_type=memory_type) for i, memory_type in enumerate(MemoryType)]
+        assert ENTRY_CODEC.decode_many(ENTRY_CODEC.encode_many(entries)) == entries
+
+    def test_rejects_other_versions(self):
+        data = bytearray(ENTRY_CODEC.encode(make_entry()))
+        data[2] = 99
+        with pytest.raises(ValueError, match="version"):
+            ENTRY_CODEC.decode(bytes(data))
+
+    def test_entries_are_slotted(self):
+        """MemoryEntry carries no per-instance __dict__"""
+        assert not hasattr(make_entry(), "__dict__")
+
+
+class TestUniversalMemoryCodec:
+    """UniversalMemory stores binary entries and reads legacy JSON"""
+
+    @pytest.mark.asyncio
+    async def test_search_cache_round_trip(self, fake_async_redis):
+        async with UniversalMemory() as memory:
+            memory.redis = fake_async_redis
+            entries = [make_entry(), make_entry(id="mem_2", embedding=None)]
+
+            await memory._cache_search_result("search:key", entries)
+
+            assert is_encoded(fake_async_redis.data["search:key"])
+            assert await memory._get_cached_search("search:key") == entries
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_json_entries(self, fake_async_redis):
+        """Entries cached as JSON before the codec are still readable"""
+        async with UniversalMemory() as memory:
+            memory.redis = fake_async_redis
+            fake_async_redis.data["memory:old"] = json.dumps({
+                "id": "old", "content": "cached earlier", "memory_type": "semantic",
+                "framework": "langchain", "concepts": [], "importance": 0.5,
+                "created_at": "2025-01-01T00:00:00", "updated_at": "2025-01-01T00:00:00"
+            })
+            await memory._cache_memory("memory:new", make_entry(id="new"))
+
+            old, new = await memory.get_memories(["old", "new"])
+
+            assert old.content == "cached earlier"
+            assert old.created_at == datetime(2025, 1, 1)
+            assert new == make_entry(id="new")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Batch Execution Tests
+Week 7 Implementation: Amortized Multi-task Execution per Agent
+
+This module tests the default execute_many contract on
+BaseFrameworkWrapper and AutoGen's shared-history batching.
+"""
+
+import asyncio
+import pytest
+
+from frameworks.base_wrapper import (
+    BaseFrameworkWrapper, AgentConfig, TaskRequest, FrameworkType
+)
+
+
+class EchoWrapper(BaseFrameworkWrapper):
+    """Minimal wrapper that echoes tasks"""
+
+    def __init__(self, agent_config):
+        super().__init__(agent_config)
+        self.initialize_calls = 0
+        self.active = 0
+        self.peak = 0
+
+    def _get_framework_type(self):
+        return FrameworkType.LANGCHAIN
+
+    async def initialize(self):
+        self.initialize_calls += 1
+        self.is_initialized = True
+        return True
+
+    async def execute(self, task_request):
+        if task_request.task == "explode":
+            raise RuntimeError("boom")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self._create_task_response("id", task_request.task.upper(), "completed", 0.01)
+
+    async def cleanup(self):
+        return True
+
+
+@pytest.fixture
+def agent_config():
+    return AgentConfig(name="batch_agent", description="Test agent", capabilities=[])
+
+
+class TestDefaultExecuteMany:
+    """Test suite for BaseFrameworkWrapper.execute_many"""
+
+    @pytest.mark.asyncio
+    async def test_order_concurrency_and_single_initialize(self, agent_config):
+        """Responses keep request order, concurrency is capped, initialize runs once"""
+        wrapper = EchoWrapper(agent_config)
+        requests = [TaskRequest(task=f"task {i}") for i in range(10)]
+
+        responses = await wrapper.execute_many(requests, concurrency=3)
+
+        assert [r.result for r in responses] == [f"TASK {i}" for i in range(10)]
+        assert wrapper.peak == 3
+        assert wrapper.initialize_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self, agent_config):
+        """An exception in one task becomes a failed response for that task only"""
+        wrapper = EchoWrapper(agent_config)
+        responses = await wrapper.execute_many([
+            TaskRequest(task="ok"), TaskRequest(task="explode"), TaskRequest(task="fine")
+        ])
+
+        assert [r.status for r in responses] == ["completed", "failed", "completed"]
+        assert responses[1].error_message == "boom"
+        assert responses[1].metadata["error_type"] == "RuntimeError"
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, agent_config):
+        """An empty batch does not initialize the agent"""
+        wrapper = EchoWrapper(agent_config)
+        assert await wrapper.execute_many([]) == []
+        assert wrapper.initialize_calls == 0
+
+
+class TestAutoGenExecuteMany:
+    """AutoGen batches share one history snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_shared_history_snapshot(self, agent_config):
+        """Every task sees the pre-batch history; turns are recorded in order"""
+        from frameworks.autogen_wrapper import AutoGenAgentWrapper
+
+        wrapper = AutoGenAgentWrapper(agent_config)
+        wrapper.is_initialized = True
+        wrapper.assistant_agent = {"name": "batch_agent"}
+        wrapper.conversation_history.append("earlier question", "earlier answer")
+
+        seen_histories = []
+
+        async def fake_conversation(task, history=None):
+            seen_histories.append(history)
+            await asyncio.sleep(0.01)
+            return f"answer to {task}"
+
+        wrapper._execute_conversation_task = fake_conversation
+        to_messages = wrapper.conversation_history.to_messages
+        calls = []
+
+        def counting_to_messages(*args, **kwargs):
+            calls.append(1)
+            return to_messages(*args, **kwargs)
+
+        wrapper.conversation_history.to_messages = counting_to_messages
+
+        responses = await wrapper.execute_many(
+            [TaskRequest(task=f"question {i}") for i in range(5)],
+            concurrency=5
+        )
+
+        assert all(r.status == "completed" for r in responses)
+        assert len(calls) == 1
+        assert all(h is seen_histories[0] for h in seen_histories)
+        assert seen_histories[0][0]["content"] == "earlier question"
+        assert [turn.task for turn in wrapper.conversation_history.turns] == (
+            ["earlier question"] + [f"question {i}" for i in range(5)]
+        )
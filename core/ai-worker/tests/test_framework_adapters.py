@@ -36,6 +36,9 @@ class TestBaseMemoryAdapter:
         engine.store_memory = AsyncMock(return_value="test_memory_id")
         engine.retrieve_memories = AsyncMock(return_value=[])
         engine.get_framework_memories = AsyncMock(return_value=[])
+        engine.list_memories = AsyncMock(return_value={
+            "memories": engine.get_framework_memories.return_value, "next_cursor": None
+        })
         return engine
 
     def test_base_adapter_initialization(self, mock_memory_engine):
@@ -66,6 +69,9 @@ class TestLangChainMemoryAdapter:
                 "metadata": {"conversation_id": "test_agent", "timestamp": "2024-12-27T09:00:00"}
             }
         ])
+        engine.list_memories = AsyncMock(return_value={
+            "memories": engine.get_framework_memories.return_value, "next_cursor": None
+        })
         return engine
 
     @pytest.fixture
@@ -133,11 +139,15 @@ class TestLangChainMemoryAdapter:
         assert agent_memory["memory_count"] == 1
         assert len(agent_memory["memories"]) == 1
 
-        # Verify get_framework_memories was called
-        mock_memory_engine.get_framework_memories.assert_called_once_with(
+        assert agent_memory["next_cursor"] is None
+
+        # Verify the agent timeline was read directly
+        mock_memory_engine.list_memories.assert_called_once_with(
             framework=FrameworkType.LANGCHAIN,
             user_id="test_user",
-            limit=50
+            agent_id="test_agent",
+            limit=50,
+            cursor=None
         )
 
     @pytest.mark.asyncio
@@ -173,6 +183,9 @@ class TestSwarmsMemoryAdapter:
                 "metadata": {"swarm_id": "test_swarm", "agent_count": 2}
             }
         ])
+        engine.list_memories = AsyncMock(return_value={
+            "memories": engine.get_framework_memories.return_value, "next_cursor": None
+        })
         return engine
 
     @pytest.fixture
@@ -280,6 +293,9 @@ class TestCrewAIMemoryAdapter:
                 "metadata": {"crew_id": "test_crew", "roles_involved": ["analyst", "reviewer"]}
             }
         ])
+        engine.list_memories = AsyncMock(return_value={
+            "memories": engine.get_framework_memories.return_value, "next_cursor": None
+        })
         return engine
 
     @pytest.fixture
@@ -392,6 +408,9 @@ class TestAutoGenMemoryAdapter:
                 "metadata": {"conversation_id": "test_conversation", "turn_count": 8}
             }
         ])
+        engine.list_memories = AsyncMock(return_value={
+            "memories": engine.get_framework_memories.return_value, "next_cursor": None
+        })
         return engine
 
     @pytest.fixture
@@ -0,0 +1,120 @@
+"""
+Tests for the Redis keyword index
+Week 7: Memory System Performance
+
+This module tests index maintenance, scoped BM25 queries and lazy cleanup
+of expired memories in the fallback keyword search.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from keyword_index import tokenize
+from mem0_memory_engine import Mem0MemoryEngine, MemoryConfig, FrameworkType
+
+
+@pytest.fixture
+def engine(fake_async_redis):
+    """Fallback-mode engine using the keyword index"""
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine(MemoryConfig(fallback_search="keyword"))
+    engine.redis = fake_async_redis
+    return engine
+
+
+class TestKeywordIndex:
+    """Test suite for the fallback keyword index"""
+
+    def test_tokenize(self):
+        """Stopwords and single characters are dropped"""
+        assert tokenize("The Agent is in a LOOP, x 42") == ["agent", "loop", "42"]
+
+    @pytest.mark.asyncio
+    async def test_store_maintains_sets_with_record_ttl(self, engine, fake_async_redis):
+        """Token, user and framework sets are written with the record"""
+        memory_id = await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+
+        for key in ("token:agents", "token:plan", "user:alice", "framework:langchain", "all"):
+            assert memory_id in fake_async_redis.data[f"fallback_index:{key}"]
+            assert fake_async_redis.ttls[f"fallback_index:{key}"] == engine.FALLBACK_TTL
+        assert fake_async_redis.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_search_is_scoped_and_ranked(self, engine, fake_async_redis):
+        """Matches are limited to user/framework and ranked by BM25"""
+        best = await engine.store_memory("deploy agents, then deploy more agents", FrameworkType.CREWAI, "alice")
+        await engine.store_memory("agents rest", FrameworkType.CREWAI, "alice")
+        await engine.store_memory("deploy agents", FrameworkType.CREWAI, "bob")
+        await engine.store_memory("deploy agents", FrameworkType.SWARMS, "alice")
+        await engine.store_memory("unrelated note", FrameworkType.CREWAI, "alice")
+        fake_async_redis.commands.clear()
+
+        memories = await engine._search_fallback_memories("deploy agents", "alice", FrameworkType.CREWAI, 10)
+
+        assert [m["id"] for m in memories][0] == best
+        assert len(memories) == 2
+        assert memories[0]["score"] > memories[1]["score"]
+        assert not any(name == "scan_iter" for name, _ in fake_async_redis.commands)
+        # Only matching records are fetched
+        (mget_keys,) = [args[0] for name, args in fake_async_redis.commands if name == "mget"]
+        assert len(mget_keys) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_members_are_pruned_lazily(self, engine, fake_async_redis):
+        """A query that finds an expired record removes it from the sets it touched"""
+        gone = await engine.store_memory("Agents forget", FrameworkType.AUTOGEN, "alice")
+        kept = await engine.store_memory("Agents remember", FrameworkType.AUTOGEN, "alice")
+        fake_async_redis.expire_now(f"fallback_memory:{gone}")
+
+        memories = await engine._search_fallback_memories("agents", "alice", None, 10)
+
+        assert [m["id"] for m in memories] == [kept]
+        assert gone not in fake_async_redis.data["fallback_index:token:agents"]
+        assert gone not in fake_async_redis.data["fallback_index:user:alice"]
+        assert gone not in fake_async_redis.data["fallback_index:all"]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_index_entries(self, engine, fake_async_redis):
+        """Deleting a memory removes it from every set"""
+        memory_id = await engine.store_memory("Crew roles", FrameworkType.CREWAI, "alice")
+
+        assert await engine.delete_memory(memory_id, "alice") is True
+        assert await engine.delete_memory(memory_id, "alice") is False
+
+        assert not any(key.startswith("fallback_index:") for key in fake_async_redis.data)
+
+    @pytest.mark.asyncio
+    async def test_framework_listing(self, engine):
+        """An empty query lists the newest memories in scope"""
+        result = await engine.store_memories([
+            {"content": f"step {i}", "framework": "swarms", "user_id": "alice"} for i in range(3)
+        ] + [{"content": "other", "framework": "swarms", "user_id": "bob"}])
+
+        memories = await engine.get_framework_memories(FrameworkType.SWARMS, "alice", limit=2)
+
+        assert len(memories) == 2
+        assert {m["id"] for m in memories} <= set(result.memory_ids[:3])
+
+    @pytest.mark.asyncio
+    async def test_recent_fetches_only_limit_records(self, engine, fake_async_redis):
+        """No-query listings read the scope's sorted set, skipping expired records"""
+        result = await engine.store_memories([
+            {"content": f"note {i}", "framework": "crewai" if i % 2 else "swarms", "user_id": "alice"}
+            for i in range(20)
+        ])
+        newest = sorted(result.memory_ids, key=lambda memory_id: (
+            fake_async_redis.data["fallback_index:recent:alice:*"][memory_id], memory_id
+        ), reverse=True)
+        fake_async_redis.expire_now(f"fallback_memory:{newest[0]}")
+        fake_async_redis.commands.clear()
+
+        memories = await engine._search_fallback_memories("", "alice", None, 3)
+
+        assert [m["id"] for m in memories] == newest[1:4]
+        mget_keys = [key for name, args in fake_async_redis.commands if name == "mget" for key in args[0]]
+        assert len(mget_keys) == 4
+        assert newest[0] not in fake_async_redis.data["fallback_index:recent:alice:*"]
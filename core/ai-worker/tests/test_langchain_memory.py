@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Windowed Summary Memory Tests
+Week 7 Implementation: Token-bounded LangChain Conversation Memory
+
+This module tests the LangChain memory backend that replaces
+ConversationBufferMemory in both LangChain wrappers.
+"""
+
+import pytest
+
+from frameworks.langchain_memory import WindowedSummaryMemory
+from frameworks.base_wrapper import AgentConfig
+
+
+class TestWindowedSummaryMemory:
+    """Test suite for WindowedSummaryMemory"""
+
+    def test_save_and_load_context(self):
+        """Saved turns render as a Human/AI transcript"""
+        memory = WindowedSummaryMemory(memory_key="chat_history")
+        memory.save_context({"input": "What is 2 + 2?"}, {"output": "4"})
+
+        variables = memory.load_memory_variables({"input": "next"})
+        assert memory.memory_variables == ["chat_history"]
+        assert variables["chat_history"] == "Human: What is 2 + 2?\nAI: 4"
+
+    def test_prompt_is_bounded_by_tokens(self):
+        """Rendered history stays within the token budget"""
+        memory = WindowedSummaryMemory(token_budget=100)
+        for i in range(50):
+            memory.save_context({"input": f"question {i}"}, {"output": "answer " * 30})
+
+        stats = memory.get_statistics()
+        assert stats["total_turns"] == 50
+        assert stats["messages"] <= 40
+        assert len(memory.buffer.split()) < 200
+        assert "question 49" in memory.buffer
+
+    def test_old_turns_are_summarized(self):
+        """Turns beyond the window appear in the summary"""
+        memory = WindowedSummaryMemory(max_turns=2)
+        for i in range(4):
+            memory.save_context({"input": f"question {i}"}, {"output": f"answer {i}"})
+
+        buffer = memory.buffer
+        assert buffer.startswith("System: Summary of earlier conversation")
+        assert "question 0" in buffer
+        assert memory.message_count == 4
+
+    def test_input_key_selection(self):
+        """Memory key and stop are ignored when picking the input"""
+        memory = WindowedSummaryMemory()
+        memory.save_context(
+            {"chat_history": "old", "stop": ["\n"], "input": "hello"},
+            {"output": "hi", "intermediate_steps": []}
+        )
+        assert memory.buffer == "Human: hello\nAI: hi"
+
+    def test_clear(self):
+        """clear() empties the memory"""
+        memory = WindowedSummaryMemory()
+        memory.save_context({"input": "hello"}, {"output": "hi"})
+        memory.clear()
+        assert memory.message_count == 0
+        assert memory.buffer == ""
+
+
+class TestLangChainMemoryUsage:
+    """LangChain wrapper exposes memory size"""
+
+    def test_memory_usage_reports_tokens(self):
+        """_get_memory_usage reports messages and token counts"""
+        from frameworks.langchain_wrapper import LangChainAgentWrapper
+
+        wrapper = LangChainAgentWrapper(AgentConfig(
+            name="langchain_agent",
+            description="Test agent",
+            capabilities=[]
+        ))
+        wrapper.memory = WindowedSummaryMemory()
+        wrapper.memory.save_context({"input": "hello"}, {"output": "hi there"})
+
+        usage = wrapper._get_memory_usage()
+        assert usage["conversation_length"] == 2
+        assert usage["memory_tokens"] > 0
+
+    def test_memory_usage_without_memory(self):
+        """_get_memory_usage is empty before initialization"""
+        from frameworks.langchain_wrapper import LangChainAgentWrapper
+
+        wrapper = LangChainAgentWrapper(AgentConfig(
+            name="langchain_agent",
+            description="Test agent",
+            capabilities=[]
+        ))
+        assert wrapper._get_memory_usage()["conversation_length"] == 0
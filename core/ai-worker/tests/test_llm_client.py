@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Shared LLM Client Registry Tests
+Week 7 Implementation: Process-wide OpenAI Connection Pooling
+
+This module tests client reuse, keying and cleanup of the shared
+OpenAI client registry.
+"""
+
+import os
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from frameworks.llm_client import (
+    LLMClientRegistry, LLMClientConfig, OPENAI_AVAILABLE
+)
+from frameworks.base_wrapper import AgentConfig
+
+
+@pytest.mark.skipif(not OPENAI_AVAILABLE, reason="openai package not available")
+class TestLLMClientRegistry:
+    """Test suite for LLMClientRegistry"""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a fresh registry"""
+        return LLMClientRegistry(LLMClientConfig(max_connections=10, max_keepalive_connections=5))
+
+    def test_async_client_is_reused_per_key(self, registry):
+        """Same key and base URL return the same client"""
+        first = registry.get_async_client("key-a")
+        second = registry.get_async_client("key-a")
+        assert first is second
+
+    def test_clients_are_keyed_by_api_key_and_base_url(self, registry):
+        """Different keys or base URLs get separate clients"""
+        default = registry.get_async_client("key-a")
+        other_key = registry.get_async_client("key-b")
+        other_url = registry.get_async_client("key-a", base_url="http://127.0.0.1:9999/v1")
+
+        assert default is not other_key
+        assert default is not other_url
+        assert registry.get_statistics()["async_clients"] == 3
+
+    def test_sync_and_async_clients_are_separate(self, registry):
+        """Sync clients are pooled independently of async clients"""
+        sync_client = registry.get_sync_client("key-a")
+        assert sync_client is registry.get_sync_client("key-a")
+        assert registry.get_statistics()["sync_clients"] == 1
+
+    def test_missing_api_key_raises(self, registry):
+        """Missing API key is reported instead of creating a client"""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                registry.get_async_client()
+
+    def test_base_url_from_environment(self, registry):
+        """OPENAI_BASE_URL is used when no base URL is passed"""
+        with patch.dict(os.environ, {"OPENAI_BASE_URL": "http://127.0.0.1:9999/v1"}):
+            client = registry.get_async_client("key-a")
+        assert "127.0.0.1:9999" in str(client.base_url)
+
+    @pytest.mark.asyncio
+    async def test_close_releases_clients(self, registry):
+        """close() empties the registry"""
+        registry.get_async_client("key-a")
+        registry.get_sync_client("key-a")
+
+        await registry.close()
+
+        stats = registry.get_statistics()
+        assert stats["async_clients"] == 0
+        assert stats["sync_clients"] == 0
+
+
+class TestWrapperClientUsage:
+    """Wrappers call the shared async client instead of building their own"""
+
+    @pytest.mark.asyncio
+    async def test_autogen_uses_shared_async_client(self):
+        """AutoGen conversation tasks await the shared client"""
+        from frameworks.autogen_wrapper import AutoGenAgentWrapper
+
+        wrapper = AutoGenAgentWrapper(AgentConfig(
+            name="autogen_agent",
+            description="Test agent",
+            capabilities=["text_processing"]
+        ))
+        wrapper.llm_config = {"model": "gpt-3.5-turbo", "temperature": 0.7}
+        wrapper.assistant_agent = {"system_message": "You are helpful"}
+
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="Hello"))]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}):
+            with patch('frameworks.autogen_wrapper.get_async_openai_client', return_value=client) as get_client:
+                result = await wrapper._execute_conversation_task("Say hello")
+
+        get_client.assert_called_once_with("test_key")
+        client.chat.completions.create.assert_awaited_once()
+        assert "Hello" in result
+
+    @pytest.mark.asyncio
+    async def test_crewai_uses_shared_async_client(self):
+        """CrewAI OpenAI alternative awaits the shared client"""
+        from frameworks.crewai_wrapper import CrewAIAgentWrapper
+
+        wrapper = CrewAIAgentWrapper(AgentConfig(
+            name="crew_agent",
+            description="Test agent",
+            capabilities=["calculations"]
+        ))
+        wrapper.crewai_agent = {"llm_config": {"api_key": "test_key", "model": "gpt-3.5-turbo"}}
+
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="42"))]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch('frameworks.crewai_wrapper.get_async_openai_client', return_value=client):
+            result = await wrapper._execute_with_openai_alternative("What is 6 * 7?")
+
+        client.chat.completions.create.assert_awaited_once()
+        assert "42" in result
@@ -0,0 +1,243 @@
+"""
+Tests for the bulk memory APIs
+Week 7: Memory System Performance
+
+This module tests store_memories / get_memories on Mem0MemoryEngine and
+UniversalMemory: round-trip counts, ordering and partial-failure reporting.
+"""
+
+import threading
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+from aiohttp import web
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from mem0_memory_engine import Mem0MemoryEngine, AgentOSMemoryEntry, FrameworkType
+from framework_adapters import CrewAIMemoryAdapter
+from universal_memory import UniversalMemory, MemoryEntry, MemoryType
+from universal_memory import FrameworkType as UniversalFrameworkType
+
+
+@pytest.fixture
+def fallback_engine(fake_async_redis):
+    """Fallback-mode engine on an in-memory Redis"""
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine()
+    engine.redis = fake_async_redis
+    return engine
+
+
+@asynccontextmanager
+async def semantic_store_api():
+    """Local memory API whose semantic store fails for content 'fail'"""
+    counter = {"stored": 0}
+
+    async def store(request):
+        body = await request.json()
+        if body["content"] == "fail":
+            return web.json_response({"error": "boom"}, status=500)
+        counter["stored"] += 1
+        return web.json_response({"memory_id": f"sem_{counter['stored']}"}, status=201)
+
+    app = web.Application()
+    app.router.add_post("/api/v1/memory/semantic/store", store)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+class TestMem0BulkFallback:
+    """Bulk operations without mem0"""
+
+    @pytest.mark.asyncio
+    async def test_store_batch_in_one_round_trip(self, fallback_engine, fake_async_redis):
+        """Records, cache entries and invalidation share one pipeline"""
+        batch = [
+            {"content": f"note {i}", "framework": "langchain", "user_id": "alice"}
+            for i in range(50)
+        ]
+
+        result = await fallback_engine.store_memories(batch)
+
+        assert result.ok
+        assert result.stored == 50
+        assert len(set(result.memory_ids)) == 50
+        assert fake_async_redis.round_trips == 1
+        assert fallback_engine.stats["memories_stored"] == 50
+
+    @pytest.mark.asyncio
+    async def test_partial_failures_are_reported(self, fallback_engine):
+        """Invalid items fail alone and keep their position"""
+        result = await fallback_engine.store_memories([
+            AgentOSMemoryEntry(id="", content="ok", framework=FrameworkType.SWARMS, user_id="alice"),
+            {"framework": "swarms", "user_id": "alice"},
+            {"content": "also ok", "framework": FrameworkType.CREWAI, "user_id": "bob"},
+        ])
+
+        assert result.memory_ids[0] and result.memory_ids[2]
+        assert result.memory_ids[1] is None
+        assert list(result.errors) == [1]
+        assert result.to_dict()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_memories_single_round_trip(self, fallback_engine, fake_async_redis):
+        """Lookups keep order and report misses as None"""
+        stored = await fallback_engine.store_memories([
+            {"content": f"note {i}", "framework": "autogen", "user_id": "alice"} for i in range(3)
+        ])
+        ids = [stored.memory_ids[2], "missing", stored.memory_ids[0]]
+        fake_async_redis.round_trips = 0
+
+        memories = await fallback_engine.get_memories(ids, "alice")
+
+        assert [m and m["content"] for m in memories] == ["note 2", None, "note 0"]
+        assert fake_async_redis.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_falls_back_to_record(self, fallback_engine, fake_async_redis):
+        """A memory whose cache entry expired is still found in the fallback tier"""
+        stored = await fallback_engine.store_memories([
+            {"content": "kept", "framework": "langchain", "user_id": "alice"}
+        ])
+        memory_id = stored.memory_ids[0]
+        fake_async_redis.expire_now(f"memory:{memory_id}")
+
+        memories = await fallback_engine.get_memories([memory_id])
+        assert memories[0]["id"] == memory_id
+        assert memories[0]["content"] == "kept"
+
+    @pytest.mark.asyncio
+    async def test_deleted_memory_is_not_read_back(self, fallback_engine, fake_async_redis):
+        """Deleting a memory drops its cache entry along with the record"""
+        stored = await fallback_engine.store_memories([
+            {"content": "forget me", "framework": "langchain", "user_id": "alice"}
+        ])
+        memory_id = stored.memory_ids[0]
+
+        assert await fallback_engine.delete_memory(memory_id, "alice") is True
+
+        assert await fallback_engine.get_memories([memory_id]) == [None]
+        assert f"memory:{memory_id}" not in fake_async_redis.data
+
+
+class TestAdapterBulk:
+    """Adapters ingest conversation backlogs through the bulk API"""
+
+    @pytest.mark.asyncio
+    async def test_store_conversations(self, fallback_engine, fake_async_redis):
+        """Each conversation is formatted like store_conversation, stored in one call"""
+        adapter = CrewAIMemoryAdapter(fallback_engine)
+        conversations = [
+            [{"role": "researcher", "content": f"finding {i}"}, {"role": "writer", "content": "draft"}]
+            for i in range(10)
+        ]
+
+        result = await adapter.store_conversations("alice", conversations, agent_id="crew_1")
+
+        assert result.stored == 10
+        assert fake_async_redis.round_trips == 1
+        memories = await fallback_engine.get_memories(result.memory_ids)
+        assert memories[3]["metadata"]["type"] == "crew_task"
+        assert sorted(memories[3]["metadata"]["roles_involved"]) == ["researcher", "writer"]
+
+
+class TestMem0BulkWithMem0:
+    """Bulk operations through mem0"""
+
+    @pytest.mark.asyncio
+    async def test_mem0_failures_and_backfill(self, fake_async_redis):
+        """Failed adds are reported; uncached gets come from mem0 and are cached"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine()
+        engine.redis = fake_async_redis
+        engine.memory = Mock()
+
+        def add(messages, user_id, agent_id, metadata):
+            if messages[0]["content"] == "bad":
+                raise RuntimeError("mem0 down")
+            return {"id": f"m_{messages[0]['content']}"}
+
+        engine.memory.add.side_effect = add
+        engine.memory.get.side_effect = lambda memory_id, user_id=None: (
+            {"id": memory_id, "content": "from mem0"} if memory_id == "m_remote" else None
+        )
+
+        result = await engine.store_memories([
+            {"content": "a", "framework": "langchain", "user_id": "alice"},
+            {"content": "bad", "framework": "langchain", "user_id": "alice"},
+        ])
+        assert result.memory_ids == ["m_a", None]
+        assert result.errors == {1: "mem0 down"}
+
+        memories = await engine.get_memories(["m_a", "m_remote", "m_gone"], "alice")
+        assert memories[0]["content"] == "a"
+        assert memories[1]["content"] == "from mem0"
+        assert memories[2] is None
+        assert "memory:m_remote" in fake_async_redis.data
+        assert engine.memory.get.call_count == 2
+
+        # A deleted memory is not served from the cache
+        assert await engine.delete_memory("m_a", "alice") is True
+        assert await engine.get_memories(["m_a"], "alice") == [None]
+
+
+    @pytest.mark.asyncio
+    async def test_single_store_runs_mem0_off_the_loop(self, fake_async_redis):
+        """store_memory calls the blocking mem0 add in an executor thread"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine()
+        engine.redis = fake_async_redis
+        engine.memory = Mock()
+        threads = []
+
+        def add(messages, user_id, agent_id, metadata):
+            threads.append(threading.current_thread())
+            return {"id": "m_single"}
+
+        engine.memory.add.side_effect = add
+
+        assert await engine.store_memory("note", FrameworkType.LANGCHAIN, "alice") == "m_single"
+        assert threads and threads[0] is not threading.current_thread()
+
+
+class TestUniversalMemoryBulk:
+    """Bulk operations on UniversalMemory"""
+
+    @pytest.mark.asyncio
+    async def test_mixed_batch(self, fake_async_redis):
+        """API and working memories are stored together; API failures are isolated"""
+        async with semantic_store_api() as base_url:
+            async with UniversalMemory(api_base_url=base_url) as memory:
+                memory.redis = fake_async_redis
+                entries = [
+                    MemoryEntry(id="", content="fact", memory_type=MemoryType.SEMANTIC,
+                                framework=UniversalFrameworkType.LANGCHAIN, concepts=[], importance=0.6),
+                    MemoryEntry(id="", content="fail", memory_type=MemoryType.EPISODIC,
+                                framework=UniversalFrameworkType.LANGCHAIN, concepts=[], importance=0.5),
+                    MemoryEntry(id="", content="scratch", memory_type=MemoryType.WORKING,
+                                framework=UniversalFrameworkType.SWARMS, concepts=["tmp"], importance=0.2),
+                ]
+
+                result = await memory.store_memories(entries)
+
+                assert result.memory_ids[0] == "sem_1"
+                assert result.memory_ids[1] is None
+                assert "500" in result.errors[1]
+                assert result.memory_ids[2].startswith("working_")
+                assert fake_async_redis.round_trips == 1
+
+                fetched = await memory.get_memories([result.memory_ids[2], "sem_1", "unknown"])
+                assert fetched[0].content == "scratch"
+                assert fetched[0].memory_type == MemoryType.WORKING
+                assert fetched[1].framework == UniversalFrameworkType.LANGCHAIN
+                assert fetched[2] is None
@@ -0,0 +1,115 @@
+"""
+Tests for the shared memory HTTP session
+Week 7: Memory System Performance
+
+This module tests that UniversalMemory and the consolidation engine reuse
+one pooled aiohttp session and release it on close().
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from aiohttp import web
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from http_session import SharedHTTPSession, HTTPSessionConfig
+from universal_memory import UniversalMemory, FrameworkType
+from consolidation_engine import MemoryConsolidationEngine
+
+
+@asynccontextmanager
+async def memory_api():
+    """Local memory API that records the client port of each request"""
+    peers = []
+
+    async def framework_memory(request):
+        peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"framework": request.match_info["framework"], "count": 3})
+
+    async def episodic(request):
+        peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"memories": [
+            {"id": "m1", "content": "first", "framework": "langchain"},
+            {"id": "m2", "content": "second", "framework": "langchain"}
+        ]})
+
+    app = web.Application()
+    app.router.add_get("/api/v1/memory/frameworks/{framework}", framework_memory)
+    app.router.add_get("/api/v1/memory/episodic", episodic)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}", peers
+    finally:
+        await runner.cleanup()
+
+
+class TestSharedHTTPSession:
+    """Test suite for SharedHTTPSession"""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_and_closed(self):
+        """One session per loop until close(); a new one afterwards"""
+        http = SharedHTTPSession(HTTPSessionConfig(limit=10, limit_per_host=5))
+        session = await http.get()
+        assert await http.get() is session
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 5
+
+        await http.close()
+        assert session.closed
+        assert not http.is_open
+        assert await http.get() is not session
+        assert http.sessions_created == 2
+        await http.close()
+
+    def test_config_from_env(self, monkeypatch):
+        """Limits are read from AGENTOS_MEMORY_HTTP_* variables"""
+        monkeypatch.setenv("AGENTOS_MEMORY_HTTP_LIMIT", "42")
+        monkeypatch.setenv("AGENTOS_MEMORY_HTTP_LIMIT_PER_HOST", "7")
+        config = HTTPSessionConfig.from_env()
+        assert config.limit == 42
+        assert config.limit_per_host == 7
+
+
+class TestMemoryClientsShareConnections:
+    """UniversalMemory and the consolidation engine reuse pooled connections"""
+
+    @pytest.mark.asyncio
+    async def test_universal_memory_keeps_connection_alive(self):
+        """Repeated calls reuse one session and one TCP connection"""
+        async with memory_api() as (base_url, peers):
+            async with UniversalMemory(api_base_url=base_url) as memory:
+                for _ in range(5):
+                    data = await memory.get_framework_memory(FrameworkType.LANGCHAIN)
+                    assert data["count"] == 3
+                assert memory.http.sessions_created == 1
+                http = memory.http
+
+        assert not http.is_open
+        assert len(set(peers)) == 1
+
+    @pytest.mark.asyncio
+    async def test_engine_shares_injected_session(self):
+        """An injected session is shared and left open for its owner"""
+        async with memory_api() as (base_url, peers):
+            http = SharedHTTPSession()
+            memory = UniversalMemory(api_base_url=base_url, http_session=http)
+            engine = MemoryConsolidationEngine(api_base_url=base_url, http_session=http)
+
+            await memory.get_framework_memory(FrameworkType.CREWAI)
+            memories = await engine._get_episodic_memories(FrameworkType.LANGCHAIN, timedelta(hours=1))
+            assert [m.id for m in memories] == ["m1", "m2"]
+
+            await engine.close()
+            await memory.close()
+            assert http.is_open
+            assert http.sessions_created == 1
+            assert len(set(peers)) == 1
+            await http.close()
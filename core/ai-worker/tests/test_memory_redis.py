@@ -0,0 +1,148 @@
+"""
+Tests for async Redis access in the memory engines
+Week 7: Memory System Performance
+
+This module tests the shared redis.asyncio pools, pipelined writes and
+batched scans in Mem0MemoryEngine and UniversalMemory.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+import redis_pool
+from redis_pool import get_redis_pool, close_redis_pools
+from mem0_memory_engine import Mem0MemoryEngine, FrameworkType
+from universal_memory import UniversalMemory, MemoryType
+from universal_memory import FrameworkType as UniversalFrameworkType
+
+
+def make_async_redis(scan_keys=None):
+    """Async Redis client double with a recording pipeline"""
+    redis = Mock()
+    redis.ping = AsyncMock(return_value=True)
+    redis.setex = AsyncMock(return_value=True)
+    redis.get = AsyncMock(return_value=None)
+    redis.mget = AsyncMock(side_effect=lambda keys: [json.dumps({
+        "content": f"note {key}", "metadata": {"framework": "langchain"}
+    }) for key in keys])
+    redis.scan_iter.return_value = MagicMock()
+    redis.scan_iter.return_value.__aiter__.return_value = scan_keys or []
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline.return_value = pipe
+    return redis, pipe
+
+
+@pytest.fixture
+def fallback_engine():
+    """Engine in fallback mode (no mem0)"""
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine()
+    return engine
+
+
+class TestRedisPools:
+    """Test suite for the shared pool registry"""
+
+    @pytest.mark.asyncio
+    async def test_pools_are_shared_per_database(self):
+        """Engines on the same database share one pool"""
+        await close_redis_pools()
+        pool = get_redis_pool("redis.local", 6380, 1)
+        assert get_redis_pool("redis.local", 6380, 1) is pool
+        assert get_redis_pool("redis.local", 6380, 2) is not pool
+        assert pool.connection_kwargs["decode_responses"] is True
+
+        await close_redis_pools()
+        assert redis_pool._pools == {}
+
+    def test_engines_use_shared_pool(self, fallback_engine):
+        """Both memory engines build async clients on the shared pool"""
+        memory = UniversalMemory(redis_host="localhost", redis_port=6379, redis_db=0)
+        assert fallback_engine.redis.connection_pool is get_redis_pool("localhost", 6379, 0)
+        assert memory.redis.connection_pool is fallback_engine.redis.connection_pool
+
+
+class TestMem0EngineAsyncRedis:
+    """Mem0MemoryEngine issues non-blocking, batched Redis commands"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_store_is_one_round_trip(self, fallback_engine):
+        """The fallback record and the cache entry share one pipeline"""
+        redis, pipe = make_async_redis()
+        fallback_engine.redis = redis
+
+        memory_id = await fallback_engine.store_memory("hello", FrameworkType.LANGCHAIN, "user")
+
+        keys = [call.args[0] for call in pipe.setex.call_args_list]
+        assert keys == [f"fallback_memory:{memory_id}", f"memory:{memory_id}"]
+        pipe.execute.assert_awaited_once()
+        redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_is_disabled(self, fallback_engine):
+        """A failed first ping disables Redis instead of failing every call"""
+        redis, _ = make_async_redis()
+        redis.ping = AsyncMock(side_effect=ConnectionError("refused"))
+        fallback_engine.redis = redis
+
+        memory_id = await fallback_engine.store_memory("hello", FrameworkType.LANGCHAIN, "user")
+
+        assert memory_id.startswith("fallback_")
+        assert fallback_engine.redis is None
+        assert await fallback_engine.retrieve_memories("hello", "user") == []
+
+    @pytest.mark.asyncio
+    async def test_fallback_search_batches_gets(self, fallback_engine):
+        """Scanned keys are fetched with one MGET per batch"""
+        keys = [f"fallback_memory:m{i}" for i in range(5)]
+        redis, _ = make_async_redis(keys)
+        fallback_engine.redis = redis
+        fallback_engine.SCAN_BATCH_SIZE = 2
+        fallback_engine.config.fallback_search = "scan"
+
+        memories = await fallback_engine._search_fallback_memories("note", "user", None, 10)
+
+        assert [m["id"] for m in memories] == [f"m{i}" for i in range(5)]
+        assert redis.mget.await_count == 3
+        redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_pipelines_ttl_checks(self, fallback_engine):
+        """TTLs are read in one pipeline; only persistent keys get an expiry"""
+        keys = ["fallback_memory:a", "fallback_memory:b", "fallback_memory:c"]
+        redis, pipe = make_async_redis(keys)
+        pipe.execute = AsyncMock(side_effect=[[100, -1, -2], [True]])
+        fallback_engine.redis = redis
+
+        await fallback_engine._cleanup_expired_memories()
+
+        assert pipe.ttl.call_count == 3
+        pipe.expire.assert_called_once_with("fallback_memory:b", 86400)
+        assert pipe.execute.await_count == 2
+
+
+class TestUniversalMemoryAsyncRedis:
+    """UniversalMemory awaits Redis and pipelines its writes"""
+
+    @pytest.mark.asyncio
+    async def test_working_memory_store_is_one_round_trip(self):
+        """Working memory and its cache entry share one pipeline"""
+        memory = UniversalMemory()
+        redis, pipe = make_async_redis()
+        redis.aclose = AsyncMock()
+        memory.redis = redis
+
+        memory_id = await memory.store_memory("scratch", MemoryType.WORKING, UniversalFrameworkType.CREWAI)
+
+        keys = [call.args[0] for call in pipe.setex.call_args_list]
+        assert keys == [f"working_memory:crewai:{memory_id}", f"memory:{memory_id}"]
+        pipe.execute.assert_awaited_once()
+
+        await memory.close()
+        redis.aclose.assert_awaited_once()
@@ -0,0 +1,154 @@
+"""
+Tests for memory timeline indexes
+Week 7: Memory System Performance
+
+This module tests the per-framework and per-agent timelines the memory
+engine maintains: exact framework listings, agent filtering done in Redis,
+cursor pagination across equal timestamps, lazy pruning of stale entries
+and the metadata-filter fallback for memories on no timeline.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from mem0_memory_engine import Mem0MemoryEngine, MemoryConfig, FrameworkType
+from framework_adapters import SwarmsMemoryAdapter
+
+
+def make_engine(fake_async_redis):
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine(MemoryConfig(fallback_search="keyword"))
+    engine.redis = fake_async_redis
+    return engine
+
+
+class TestFrameworkTimeline:
+    """Framework listings read from the timeline"""
+
+    @pytest.mark.asyncio
+    async def test_framework_listing_is_exact(self, fake_async_redis):
+        """get_framework_memories returns `limit` matches regardless of other frameworks"""
+        engine = make_engine(fake_async_redis)
+        await engine.store_memories(
+            [{"content": f"crew task {i}", "framework": "crewai", "user_id": "alice"} for i in range(3)] +
+            [{"content": f"chain step {i}", "framework": "langchain", "user_id": "alice"} for i in range(30)]
+        )
+
+        memories = await engine.get_framework_memories(FrameworkType.CREWAI, "alice", limit=3)
+
+        assert sorted(m["content"] for m in memories) == ["crew task 0", "crew task 1", "crew task 2"]
+
+    @pytest.mark.asyncio
+    async def test_pagination_across_equal_timestamps(self, fake_async_redis):
+        """Cursors neither skip nor repeat memories stored in the same millisecond"""
+        engine = make_engine(fake_async_redis)
+        enhance = engine._enhance_metadata
+        engine._enhance_metadata = lambda *args: {**enhance(*args), "timestamp": "2025-01-01T00:00:00"}
+        result = await engine.store_memories(
+            [{"content": f"note {i}", "framework": "swarms", "user_id": "alice"} for i in range(7)]
+        )
+
+        seen, cursor = [], None
+        while True:
+            page = await engine.list_memories(FrameworkType.SWARMS, "alice", limit=3, cursor=cursor)
+            seen.extend(m["id"] for m in page["memories"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(result.memory_ids)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_are_pruned(self, fake_async_redis):
+        """Expired memories are skipped and dropped from the timeline"""
+        engine = make_engine(fake_async_redis)
+        result = await engine.store_memories(
+            [{"content": f"note {i}", "framework": "swarms", "user_id": "alice"} for i in range(4)]
+        )
+        for memory_id in result.memory_ids[:2]:
+            fake_async_redis.expire_now(f"fallback_memory:{memory_id}")
+            fake_async_redis.expire_now(f"memory:{memory_id}")
+
+        page = await engine.list_memories(FrameworkType.SWARMS, "alice", limit=4)
+
+        assert len(page["memories"]) == 2
+        assert page["next_cursor"] is None
+        assert fake_async_redis._zcard("memory_timeline:alice:swarms") == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_timeline_entries(self, fake_async_redis):
+        """Deleted memories leave the framework and agent timelines right away"""
+        engine = make_engine(fake_async_redis)
+        kept = await engine.store_memory("kept", FrameworkType.CREWAI, "alice", metadata={"crew_id": "crew_1"})
+        gone = await engine.store_memory("gone", FrameworkType.CREWAI, "alice", metadata={"crew_id": "crew_1"})
+
+        assert await engine.delete_memory(gone, "alice") is True
+
+        assert [m["id"] for m in await engine.get_framework_memories(FrameworkType.CREWAI, "alice")] == [kept]
+        for key in ("memory_timeline:alice:crewai", "memory_timeline:alice:crewai:agent:crew_1"):
+            assert gone not in fake_async_redis.data[key]
+
+    @pytest.mark.asyncio
+    async def test_mem0_delete_removes_timeline_entries(self, fake_async_redis):
+        """mem0 deletes find the timelines through the cached metadata"""
+        engine = make_engine(fake_async_redis)
+        engine.memory = Mock()
+        engine.memory.add.return_value = {"id": "m1"}
+        memory_id = await engine.store_memory("plan", FrameworkType.SWARMS, "alice", agent_id="planner")
+
+        assert await engine.delete_memory(memory_id, "alice") is True
+
+        engine.memory.delete.assert_called_once_with("m1", user_id="alice")
+        assert not any(key.startswith("memory_timeline:") for key in fake_async_redis.data)
+
+    def test_invalid_cursor(self):
+        """Malformed cursors are rejected"""
+        with pytest.raises(ValueError):
+            Mem0MemoryEngine._decode_cursor("not-a-cursor")
+
+
+class TestAgentTimeline:
+    """Adapters page through one agent's memories"""
+
+    @pytest.mark.asyncio
+    async def test_swarm_memory_is_filtered_in_redis(self, fake_async_redis):
+        """Only the requested swarm's memories are fetched"""
+        engine = make_engine(fake_async_redis)
+        adapter = SwarmsMemoryAdapter(engine)
+        for swarm_id in ["swarm_a", "swarm_b", "swarm_a"]:
+            await adapter.store_conversation(
+                "alice", [{"agent_id": "planner", "content": f"update for {swarm_id}"}], agent_id=swarm_id
+            )
+        engine.get_memories = Mock(wraps=engine.get_memories)
+
+        first = await adapter.get_agent_memory("alice", "swarm_a", limit=1)
+        second = await adapter.get_agent_memory("alice", "swarm_a", limit=1, cursor=first["next_cursor"])
+
+        memories = first["memories"] + second["memories"]
+        assert len(memories) == 2
+        assert all(m["metadata"]["swarm_id"] == "swarm_a" for m in memories)
+        assert sum(len(call.args[0]) for call in engine.get_memories.call_args_list) == 2
+
+    @pytest.mark.asyncio
+    async def test_untimelined_memories_fall_back_to_metadata_filter(self):
+        """Without Redis the first page filters mem0's framework listing instead"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine(MemoryConfig())
+        engine.redis = None
+        engine.memory = Mock()
+        engine.memory.get_all.return_value = [
+            {"id": "m1", "content": "plan", "metadata": {"framework": "swarms", "swarm_id": "swarm_a"}},
+            {"id": "m2", "content": "other", "metadata": {"framework": "swarms", "swarm_id": "swarm_b"}},
+            {"id": "m3", "content": "chain", "metadata": {"framework": "langchain", "swarm_id": "swarm_a"}},
+        ]
+        adapter = SwarmsMemoryAdapter(engine)
+
+        memory = await adapter.get_agent_memory("alice", "swarm_a")
+
+        assert [m["id"] for m in memory["memories"]] == ["m1"]
+        assert memory["next_cursor"] is None
@@ -45,7 +45,7 @@ class TestMissingCoverage:
         with patch.dict(os.environ, {}, clear=True):
             with patch('main.LANGCHAIN_AVAILABLE', True):
                 with patch('main.OpenAI', MagicMock()):
-                    with patch('main.ConversationBufferMemory', MagicMock()):
+                    with patch('main.WindowedSummaryMemory', MagicMock()):
                         wrapper = LangChainAgentWrapper(config)
 
                         # Should have llm as None due to missing API key
@@ -279,7 +279,7 @@ class TestMissingCoverage:
 
         with patch('main.LANGCHAIN_AVAILABLE', True):
             with patch('main.OpenAI') as mock_openai:
-                with patch('main.ConversationBufferMemory') as mock_memory:
+                with patch('main.WindowedSummaryMemory') as mock_memory:
                     with patch('main.Tool') as mock_tool:
                         with patch('main.initialize_agent') as mock_init_agent:
                             with patch('main.AgentType') as mock_agent_type:
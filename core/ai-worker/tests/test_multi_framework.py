@@ -91,7 +91,7 @@ class TestLangChainIntegration:
 
     @patch('main.LANGCHAIN_AVAILABLE', True)
     @patch('main.OpenAI')
-    @patch('main.ConversationBufferMemory')
+    @patch('main.WindowedSummaryMemory')
     def test_langchain_wrapper_initialization_success(self, mock_memory, mock_openai):
         """Test successful LangChain wrapper initialization"""
         from main import LangChainAgentWrapper, AgentConfig
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - OpenAI Stub Tests
+Week 7 Implementation: Offline Provider for Deterministic Benchmarks
+
+This module tests the OpenAI-compatible stub backend (responses, streaming,
+latency distributions, error and rate-limit injection) and the wrapper
+benchmark that runs against it.
+"""
+
+import random
+import pytest
+import openai
+
+from benchmarks.openai_stub import OpenAIStubServer, StubConfig, LatencyConfig
+from benchmarks.wrapper_benchmark import BenchmarkConfig, run_benchmark, percentile
+
+
+def client_for(server, max_retries=0):
+    return openai.AsyncOpenAI(api_key="sk-test", base_url=server.base_url, max_retries=max_retries)
+
+
+class TestLatencyConfig:
+    """Test suite for latency distributions"""
+
+    def test_fixed(self):
+        """Fixed latency always returns the mean"""
+        assert LatencyConfig(mean=0.2).sample(random.Random(1)) == 0.2
+
+    @pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal"])
+    def test_distributions_are_seeded_and_clamped(self, distribution):
+        """Samples are reproducible and respect the bounds"""
+        config = LatencyConfig(distribution=distribution, mean=0.1, stddev=0.05, minimum=0.05, maximum=0.12)
+        first = [config.sample(random.Random(7)) for _ in range(20)]
+        second = [config.sample(random.Random(7)) for _ in range(20)]
+        assert first == second
+        assert all(0.05 <= value <= 0.12 for value in first)
+
+    def test_unknown_distribution(self):
+        """Unknown distributions are rejected"""
+        with pytest.raises(ValueError):
+            LatencyConfig(distribution="pareto").sample(random.Random(1))
+
+
+class TestOpenAIStubServer:
+    """Test suite for the stub endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_chat_completion(self):
+        """Chat completions are deterministic and report usage"""
+        async with OpenAIStubServer(StubConfig(latency=LatencyConfig(mean=0.0))) as server:
+            client = client_for(server)
+            messages = [{"role": "user", "content": "hello stub"}]
+            first = await client.chat.completions.create(model="gpt-4", messages=messages)
+            second = await client.chat.completions.create(model="gpt-4", messages=messages)
+            await client.close()
+
+        assert first.choices[0].message.content == second.choices[0].message.content
+        assert "hello stub" in first.choices[0].message.content
+        assert first.usage.prompt_tokens == 2
+        assert server.stats.completed == 2
+
+    @pytest.mark.asyncio
+    async def test_streaming(self):
+        """Streaming yields one chunk per token and a final stop chunk"""
+        config = StubConfig(latency=LatencyConfig(mean=0.0), response_text="one two three")
+        async with OpenAIStubServer(config) as server:
+            client = client_for(server)
+            stream = await client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "count"}],
+                stream=True
+            )
+            pieces = []
+            finish_reasons = []
+            async for chunk in stream:
+                pieces.append(chunk.choices[0].delta.content or "")
+                finish_reasons.append(chunk.choices[0].finish_reason)
+            await client.close()
+
+        assert "".join(pieces) == "one two three"
+        assert finish_reasons[-1] == "stop"
+        assert server.stats.streamed == 1
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        """error_rate=1 answers every request with a 500"""
+        async with OpenAIStubServer(StubConfig(latency=LatencyConfig(mean=0.0), error_rate=1.0)) as server:
+            client = client_for(server)
+            with pytest.raises(openai.InternalServerError):
+                await client.chat.completions.create(model="gpt-4", messages=[{"role": "user", "content": "x"}])
+            await client.close()
+        assert server.stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_injection(self):
+        """rate_limit_rate=1 answers with 429 and a retry-after header"""
+        config = StubConfig(latency=LatencyConfig(mean=0.0), rate_limit_rate=1.0, retry_after=2.5)
+        async with OpenAIStubServer(config) as server:
+            client = client_for(server)
+            with pytest.raises(openai.RateLimitError) as exc_info:
+                await client.chat.completions.create(model="gpt-4", messages=[{"role": "user", "content": "x"}])
+            await client.close()
+
+        assert exc_info.value.response.headers["retry-after"] == "2.5"
+        assert server.stats.rate_limited == 1
+
+    @pytest.mark.asyncio
+    async def test_completions_and_embeddings(self):
+        """Legacy completions and embeddings endpoints respond"""
+        async with OpenAIStubServer(StubConfig(latency=LatencyConfig(mean=0.0))) as server:
+            client = client_for(server)
+            completion = await client.completions.create(model="gpt-3.5-turbo-instruct", prompt="hi")
+            embeddings = await client.embeddings.create(model="text-embedding-ada-002", input=["a", "a", "b"])
+            models = await client.models.list()
+            await client.close()
+
+        assert completion.choices[0].text
+        assert embeddings.data[0].embedding == embeddings.data[1].embedding
+        assert embeddings.data[0].embedding != embeddings.data[2].embedding
+        assert "gpt-4" in [m.id for m in models.data]
+
+
+class TestWrapperBenchmark:
+    """Test suite for the wrapper benchmark"""
+
+    def test_percentile(self):
+        """Nearest-rank percentiles"""
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile([], 0.5) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_benchmark_drives_wrappers(self, monkeypatch):
+        """OpenAI-backed wrappers complete against the stub; others are reported"""
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+        report = await run_benchmark(
+            StubConfig(latency=LatencyConfig(mean=0.01)),
+            BenchmarkConfig(tasks=6, concurrency=3, warmup=1)
+        )
+
+        results = report["frameworks"]
+        assert set(results) == {"langchain", "swarms", "crewai", "autogen"}
+        for name in ("crewai", "autogen"):
+            assert results[name]["status"] == "completed"
+            assert results[name]["succeeded"] == 6
+            assert results[name]["stub"]["completed"] >= 6
+            assert results[name]["latency_p95"] >= results[name]["latency_p50"] > 0
+        for result in results.values():
+            assert result["status"] in ("completed", "unavailable")
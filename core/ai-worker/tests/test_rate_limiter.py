@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - LLM Rate Limiter Tests
+Week 7 Implementation: Per-model Token Buckets and Central Retry Scheduling
+
+This module tests token bucket accounting, fair queueing, 429 cooldowns
+and central retries of the shared LLM rate limiter.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from frameworks.rate_limiter import (
+    LLMRateLimiter, RateLimitConfig, ModelRateLimit, RetryPolicy, TokenBucket
+)
+from frameworks.token_counter import count_tokens, count_message_tokens
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+class RateLimitError(Exception):
+    """Minimal stand-in for a provider 429 error"""
+
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = MagicMock(headers={"retry-after": retry_after} if retry_after else {})
+
+
+class TestTokenCounter:
+    """Test suite for token counting helpers"""
+
+    def test_count_tokens(self):
+        """Non-empty text has a positive token count"""
+        assert count_tokens("") == 0
+        assert count_tokens("hello world") > 0
+
+    def test_message_overhead(self):
+        """Message counts include per-message overhead"""
+        messages = [{"role": "user", "content": "hello world"}]
+        assert count_message_tokens(messages) > count_tokens("hello world")
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def test_refill_over_time(self):
+        """Consumed tokens refill at the configured rate"""
+        clock = FakeClock()
+        bucket = TokenBucket(10, 1.0, clock)
+        bucket.consume(10)
+        assert bucket.time_until_available(5) == pytest.approx(5.0)
+
+        clock.now = 5.0
+        assert bucket.time_until_available(5) == 0.0
+
+    def test_refund_is_capped(self):
+        """Refunds never exceed capacity"""
+        bucket = TokenBucket(10, 1.0, FakeClock())
+        bucket.refund(100)
+        assert bucket.tokens == 10
+
+
+class TestLLMRateLimiter:
+    """Test suite for LLMRateLimiter"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock):
+        config = RateLimitConfig(
+            default_limit=ModelRateLimit(requests_per_minute=60, tokens_per_minute=600),
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=2.0)
+        )
+        return LLMRateLimiter(config, clock=clock, sleep=clock.sleep)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_budget(self, limiter, clock):
+        """A request that exceeds remaining TPM waits for refill"""
+        await limiter.acquire("gpt-test", 600)
+        await limiter.acquire("gpt-test", 100)
+
+        # 600 TPM refills at 10 tokens/second
+        assert sum(clock.sleeps) == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_models_are_limited_independently(self, limiter, clock):
+        """Exhausting one model does not delay another"""
+        await limiter.acquire("model-a", 600)
+        await limiter.acquire("model-b", 600)
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_fifo_ordering(self, limiter, clock):
+        """Queued callers are admitted in arrival order"""
+        limiter.set_model_limit("gpt-test", ModelRateLimit(requests_per_minute=1, tokens_per_minute=10000))
+        order = []
+
+        async def caller(name):
+            await limiter.acquire("gpt-test", 1)
+            order.append(name)
+
+        await asyncio.gather(*(caller(i) for i in range(4)))
+        assert order == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_refunds_unused_tokens(self, limiter):
+        """Actual usage lower than the estimate is refunded"""
+        response = MagicMock()
+        response.usage.total_tokens = 50
+        call = AsyncMock(return_value=response)
+
+        await limiter.execute("gpt-test", call, estimated_tokens=500)
+
+        stats = limiter.get_statistics()["gpt-test"]
+        assert stats["tokens"] == 50
+        assert stats["available_tokens"] == pytest.approx(550)
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self, limiter, clock):
+        """A 429 triggers a shared cooldown honoring retry-after"""
+        response = MagicMock()
+        response.usage.total_tokens = 10
+        call = AsyncMock(side_effect=[RateLimitError(retry_after="3"), response])
+
+        result = await limiter.execute("gpt-test", call, estimated_tokens=10)
+
+        assert result is response
+        assert call.await_count == 2
+        assert sum(clock.sleeps) >= 3.0
+        stats = limiter.get_statistics()["gpt-test"]
+        assert stats["rate_limited"] == 1
+        assert stats["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, limiter):
+        """Retryable errors propagate once attempts are exhausted"""
+        call = AsyncMock(side_effect=RateLimitError())
+
+        with pytest.raises(RateLimitError):
+            await limiter.execute("gpt-test", call, estimated_tokens=10)
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_is_raised_immediately(self, limiter):
+        """Errors that are not transient are not retried"""
+        call = AsyncMock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await limiter.execute("gpt-test", call, estimated_tokens=10)
+        assert call.await_count == 1
@@ -0,0 +1,115 @@
+"""
+Tests for stable search cache keys
+Week 7: Memory System Performance
+
+This module tests cross-process key stability and generation-based
+invalidation of cached searches in the memory engines.
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from search_cache import normalize_query, query_digest, search_cache_key
+from mem0_memory_engine import Mem0MemoryEngine, FrameworkType
+
+MEMORY_DIR = os.path.join(os.path.dirname(__file__), '..', 'memory')
+
+
+@pytest.fixture
+def engine(fake_async_redis):
+    """Fallback-mode engine on an in-memory Redis"""
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine()
+    engine.redis = fake_async_redis
+    return engine
+
+
+class TestQueryDigest:
+    """Test suite for key construction"""
+
+    def test_normalization(self):
+        """Case and whitespace differences map to one digest"""
+        assert normalize_query("  Machine\tLearning \n") == "machine learning"
+        assert query_digest("Machine  learning", limit=5) == query_digest("machine learning", limit=5)
+        assert query_digest("machine learning", limit=5) != query_digest("machine learning", limit=10)
+
+    def test_filter_order_does_not_matter(self):
+        """Filters are hashed in a canonical order"""
+        assert query_digest("q", a=1, b=2) == query_digest("q", b=2, a=1)
+
+    def test_digest_is_stable_across_processes(self):
+        """Unlike hash(), digests survive hash randomization"""
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from search_cache import query_digest; print(query_digest('agents', limit=3))"
+        )
+        digests = set()
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed}
+            output = subprocess.run(
+                [sys.executable, "-c", script, MEMORY_DIR],
+                capture_output=True, text=True, env=env, check=True
+            ).stdout.strip()
+            digests.add(output)
+        assert digests == {query_digest("agents", limit=3)}
+
+    @pytest.mark.asyncio
+    async def test_key_includes_generation(self, fake_async_redis):
+        """The scope's generation is part of the key"""
+        before = await search_cache_key(fake_async_redis, ("user", "all"), "q")
+        await fake_async_redis.incr("search_gen:user:all")
+        after = await search_cache_key(fake_async_redis, ("user", "all"), "q")
+        assert before.startswith("search:user:all:g0:")
+        assert after.startswith("search:user:all:g1:")
+
+
+class TestGenerationInvalidation:
+    """Writes and deletes invalidate exactly the affected cached searches"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_hits_cache(self, engine):
+        """Equivalent queries share a cache entry"""
+        await engine.store_memory("Agents share memory", FrameworkType.LANGCHAIN, "alice")
+
+        first = await engine.retrieve_memories("agents", "alice")
+        second = await engine.retrieve_memories("  AGENTS ", "alice")
+
+        assert len(first) == 1
+        assert second == first
+        assert engine.stats["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_store_invalidates_cached_search(self, engine):
+        """A new memory is visible to the next search"""
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+        assert len(await engine.retrieve_memories("agents", "alice")) == 1
+
+        await engine.store_memory("Agents call tools", FrameworkType.LANGCHAIN, "alice")
+        assert len(await engine.retrieve_memories("agents", "alice")) == 2
+        assert engine.stats["cache_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_scoped(self, engine):
+        """Another framework's or user's write leaves a cached search valid"""
+        await engine.store_memory("Crew roles", FrameworkType.CREWAI, "alice")
+        await engine.retrieve_memories("roles", "alice", FrameworkType.CREWAI)
+
+        await engine.store_memory("Swarm roles", FrameworkType.SWARMS, "alice")
+        await engine.store_memory("Crew roles too", FrameworkType.CREWAI, "bob")
+        await engine.retrieve_memories("roles", "alice", FrameworkType.CREWAI)
+
+        assert engine.stats["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_cached_search(self, engine):
+        """A deleted memory is not served from cache"""
+        memory_id = await engine.store_memory("Agents forget", FrameworkType.AUTOGEN, "alice")
+        assert len(await engine.retrieve_memories("forget", "alice", FrameworkType.AUTOGEN)) == 1
+
+        assert await engine.delete_memory(memory_id, "alice") is True
+        assert await engine.retrieve_memories("forget", "alice", FrameworkType.AUTOGEN) == []
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - State Persistence Tests
+Week 7 Implementation: Off-loop, Atomic Agent State Snapshots
+
+This module tests debounced state persistence and the Swarms wrapper's
+use of the shared executor and background persister.
+"""
+
+import os
+import time
+import threading
+import pytest
+from unittest.mock import Mock
+
+from frameworks.state_persistence import (
+    DebouncedStatePersister, PersistenceConfig, atomic_write_bytes, load_state
+)
+from frameworks.executor import run_in_shared_executor
+from frameworks.base_wrapper import AgentConfig
+
+
+class TestDebouncedStatePersister:
+    """Test suite for DebouncedStatePersister"""
+
+    def test_rapid_changes_are_coalesced(self, tmp_path):
+        """Many mark_dirty calls result in a single write"""
+        state = {"counter": 0}
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            lambda: dict(state),
+            PersistenceConfig(debounce_seconds=0.05, max_delay_seconds=5.0)
+        )
+
+        for i in range(20):
+            state["counter"] = i
+            persister.mark_dirty()
+
+        time.sleep(0.3)
+        assert persister.writes == 1
+        assert persister.coalesced == 19
+        assert load_state(persister.path) == {"counter": 19}
+
+    def test_max_delay_bounds_continuous_updates(self, tmp_path):
+        """Continuous updates are still written after max_delay_seconds"""
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            lambda: {"ok": True},
+            PersistenceConfig(debounce_seconds=1.0, max_delay_seconds=0.1)
+        )
+
+        deadline = time.time() + 0.5
+        while time.time() < deadline and persister.writes == 0:
+            persister.mark_dirty()
+            time.sleep(0.02)
+
+        assert persister.writes >= 1
+        persister.close()
+
+    def test_close_flushes_pending_state(self, tmp_path):
+        """close() writes pending state immediately"""
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            lambda: {"saved": True},
+            PersistenceConfig(debounce_seconds=60.0)
+        )
+        persister.mark_dirty()
+        persister.close()
+
+        assert not persister.pending
+        assert load_state(persister.path) == {"saved": True}
+
+    def test_compressed_snapshots(self, tmp_path):
+        """Compressed snapshots use a .gz path and round-trip"""
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            lambda: {"history": "x" * 1000},
+            PersistenceConfig(compress=True)
+        )
+        persister.mark_dirty()
+        persister.flush()
+
+        assert persister.path.endswith(".json.gz")
+        assert persister.get_size() < 1000
+        assert load_state(persister.path) == {"history": "x" * 1000}
+
+    def test_failed_write_stays_pending(self, tmp_path):
+        """A failing state provider keeps the change pending"""
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            Mock(side_effect=RuntimeError("boom")),
+            PersistenceConfig(debounce_seconds=60.0)
+        )
+        persister.mark_dirty()
+
+        with pytest.raises(RuntimeError):
+            persister.flush()
+        assert persister.pending
+        assert persister.failures == 1
+
+    def test_failed_background_write_is_retried(self, tmp_path):
+        """A timer-fired write that fails is rescheduled instead of waiting for the next change"""
+        provider = Mock(side_effect=[RuntimeError("disk full"), {"saved": True}])
+        persister = DebouncedStatePersister(
+            str(tmp_path / "state.json"),
+            provider,
+            PersistenceConfig(debounce_seconds=0.05, max_delay_seconds=5.0)
+        )
+        persister.mark_dirty()
+
+        deadline = time.time() + 2.0
+        while time.time() < deadline and persister.writes == 0:
+            time.sleep(0.02)
+
+        assert persister.failures == 1
+        assert persister.writes == 1
+        assert not persister.pending
+        assert load_state(persister.path) == {"saved": True}
+
+    def test_atomic_write_replaces_file(self, tmp_path):
+        """atomic_write_bytes leaves no temporary files behind"""
+        path = tmp_path / "nested" / "state.json"
+        atomic_write_bytes(str(path), b"first")
+        atomic_write_bytes(str(path), b"second")
+
+        assert path.read_bytes() == b"second"
+        assert os.listdir(path.parent) == ["state.json"]
+
+
+class TestSwarmsOffloading:
+    """Swarms runs happen on the shared executor"""
+
+    @pytest.mark.asyncio
+    async def test_run_in_shared_executor(self):
+        """Blocking callables run on agentos worker threads"""
+        thread_name = await run_in_shared_executor(lambda: threading.current_thread().name)
+        assert thread_name.startswith("agentos-worker")
+
+    @pytest.mark.asyncio
+    async def test_swarm_run_is_offloaded_and_marks_state(self, tmp_path):
+        """_run_swarm_task runs off-loop and schedules a state write"""
+        from frameworks.swarms_wrapper import SwarmAgentWrapper
+
+        wrapper = SwarmAgentWrapper(AgentConfig(
+            name="swarm_agent",
+            description="Test agent",
+            capabilities=[]
+        ))
+        run_threads = []
+
+        def run(task):
+            run_threads.append(threading.current_thread().name)
+            return f"done: {task}"
+
+        wrapper.swarm_agent = Mock(spec=["run"])
+        wrapper.swarm_agent.run = run
+        wrapper.state_persister = DebouncedStatePersister(
+            str(tmp_path / "agent.json"),
+            wrapper._capture_agent_state,
+            PersistenceConfig(debounce_seconds=60.0)
+        )
+
+        result = await wrapper._run_swarm_task(Mock(task="analyze"))
+
+        assert result == "done: analyze"
+        assert run_threads[0].startswith("agentos-worker")
+        assert wrapper.state_persister.pending
+
+        wrapper.is_initialized = True
+        assert await wrapper.cleanup() is True
+        assert load_state(wrapper.state_persister.path)["agent_name"] == "swarm_agent"
+        assert wrapper._get_memory_usage()["agent_state_size"] > 0
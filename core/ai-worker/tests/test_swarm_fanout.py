@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Swarm Fan-out Tests
+Week 7 Implementation: Parallel Multi-agent Execution for Swarms
+
+This module tests task splitting, bounded concurrent fan-out, reducers and
+the Swarms wrapper's parallel execution mode.
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from frameworks.swarm_fanout import (
+    FanOutConfig, SubTaskResult, split_task, fan_out, get_reducer, register_reducer
+)
+from frameworks.base_wrapper import AgentConfig, TaskRequest
+
+
+class TestSplitTask:
+    """Test suite for split_task"""
+
+    def test_explicit_subtasks(self):
+        """context['subtasks'] takes precedence"""
+        subtasks = split_task("ignored", {"subtasks": ["a", " b ", ""]})
+        assert subtasks == ["a", "b"]
+
+    def test_numbered_and_bulleted_items(self):
+        """List items in the task text become sub-tasks"""
+        task = "Research these:\n1. Swarms\n2) CrewAI\n- AutoGen\n* LangChain"
+        assert split_task(task) == ["Swarms", "CrewAI", "AutoGen", "LangChain"]
+
+    def test_plain_task_is_single_subtask(self):
+        """A task without list items is not split"""
+        assert split_task("Summarize the report") == ["Summarize the report"]
+
+    def test_overflow_is_folded(self):
+        """Sub-tasks beyond max_subtasks are folded into the last one"""
+        subtasks = split_task("x", {"subtasks": ["a", "b", "c", "d"]}, max_subtasks=2)
+        assert subtasks == ["a", "b\nc\nd"]
+
+
+class TestReducers:
+    """Test suite for reducers"""
+
+    @pytest.fixture
+    def results(self):
+        return [
+            SubTaskResult(0, "first", "yes"),
+            SubTaskResult(1, "second", status="failed", error="boom"),
+            SubTaskResult(2, "third", "no"),
+            SubTaskResult(3, "fourth", "yes"),
+        ]
+
+    def test_concatenate(self, results):
+        """Concatenation keeps order and skips failures"""
+        combined = get_reducer("concatenate")(results)
+        assert combined.index("first") < combined.index("third")
+        assert "second" not in combined
+
+    def test_first_success_and_majority_vote(self, results):
+        """Built-in selection reducers"""
+        assert get_reducer("first_success")(results) == "yes"
+        assert get_reducer("majority_vote")(results) == "yes"
+
+    def test_custom_reducers(self, results):
+        """Callables and registered reducers are supported"""
+        register_reducer("count", lambda rs: sum(1 for r in rs if r.succeeded))
+        assert get_reducer("count")(results) == 3
+        assert get_reducer(len)(results) == 4
+
+    def test_unknown_reducer(self):
+        """Unknown reducer names are rejected"""
+        with pytest.raises(ValueError):
+            get_reducer("does_not_exist")
+
+
+class TestFanOut:
+    """Test suite for fan_out"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """No more than max_concurrency workers run at once"""
+        active = 0
+        peak = 0
+
+        async def worker(index, subtask):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return subtask.upper()
+
+        results = await fan_out([f"t{i}" for i in range(8)], worker, FanOutConfig(max_concurrency=3))
+
+        assert peak == 3
+        assert [r.result for r in results] == [f"T{i}" for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_runs_in_parallel(self):
+        """Sub-tasks overlap instead of running sequentially"""
+        async def worker(index, subtask):
+            await asyncio.sleep(0.1)
+            return index
+
+        start = time.time()
+        await fan_out(["a", "b", "c", "d"], worker, FanOutConfig(max_concurrency=4))
+        assert time.time() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_deadlines_and_failures_are_per_subtask(self):
+        """Timeouts and errors are reported without failing the fan-out"""
+        async def worker(index, subtask):
+            if subtask == "slow":
+                await asyncio.sleep(1)
+            if subtask == "bad":
+                raise RuntimeError("bad input")
+            return "ok"
+
+        results = await fan_out(["fast", "slow", "bad"], worker, FanOutConfig(subtask_timeout=0.05))
+
+        assert [r.status for r in results] == ["completed", "timeout", "failed"]
+        assert results[2].error == "bad input"
+
+
+class TestSwarmsParallelMode:
+    """SwarmAgentWrapper parallel execution"""
+
+    @pytest.fixture
+    def wrapper(self):
+        from frameworks.swarms_wrapper import SwarmAgentWrapper
+
+        wrapper = SwarmAgentWrapper(AgentConfig(
+            name="swarm_agent",
+            description="Test agent",
+            capabilities=[]
+        ))
+        wrapper.is_initialized = True
+        wrapper.swarm_agent = Mock(agent_name="swarm_agent")
+        return wrapper
+
+    @pytest.mark.asyncio
+    async def test_parallel_execution(self, wrapper):
+        """Sub-tasks run on distinct sub-agents and results are reduced"""
+        in_use = set()
+        overlap = []
+        lock = threading.Lock()
+
+        def make_agent(**kwargs):
+            agent = Mock()
+
+            def run(task):
+                with lock:
+                    if id(agent) in in_use:
+                        overlap.append(task)
+                    in_use.add(id(agent))
+                time.sleep(0.05)
+                with lock:
+                    in_use.discard(id(agent))
+                return f"{kwargs['agent_name']} did {task}"
+
+            agent.run = run
+            return agent
+
+        with patch('frameworks.swarms_wrapper.Agent', side_effect=make_agent):
+            response = await wrapper.execute(TaskRequest(
+                task="Analyze markets",
+                context={
+                    "subtasks": ["europe", "asia", "americas", "africa", "oceania"],
+                    "fan_out": {"max_concurrency": 2}
+                }
+            ))
+
+        assert response.status == "completed"
+        assert response.metadata["execution_mode"] == "parallel"
+        assert response.metadata["completed_subtasks"] == 5
+        assert len(wrapper.sub_agents) == 2
+        assert overlap == []
+        assert "did europe" in response.result and "did oceania" in response.result
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_never_share_sub_agents(self, wrapper):
+        """Parallel requests lease sub-agents from one wrapper-level pool"""
+        in_use = set()
+        overlap = []
+        lock = threading.Lock()
+
+        def make_agent(**kwargs):
+            agent = Mock()
+
+            def run(task):
+                with lock:
+                    if id(agent) in in_use:
+                        overlap.append(task)
+                    in_use.add(id(agent))
+                time.sleep(0.05)
+                with lock:
+                    in_use.discard(id(agent))
+                return task
+
+            agent.run = run
+            return agent
+
+        def request(name):
+            return TaskRequest(
+                task=name,
+                context={"subtasks": [f"{name} {i}" for i in range(4)], "fan_out": {"max_concurrency": 2}}
+            )
+
+        with patch('frameworks.swarms_wrapper.Agent', side_effect=make_agent):
+            responses = await asyncio.gather(wrapper.execute(request("a")), wrapper.execute(request("b")))
+
+        assert [r.metadata["completed_subtasks"] for r in responses] == [4, 4]
+        assert overlap == []
+        assert len(wrapper.sub_agents) == 4
+
+    @pytest.mark.asyncio
+    async def test_all_subtasks_failing_fails_request(self, wrapper):
+        """The request fails when no sub-task succeeds"""
+        failing_agent = Mock()
+        failing_agent.run = Mock(side_effect=RuntimeError("llm down"))
+
+        with patch('frameworks.swarms_wrapper.Agent', return_value=failing_agent):
+            response = await wrapper.execute(TaskRequest(
+                task="1. first\n2. second",
+                context={"execution_mode": "parallel"}
+            ))
+
+        assert response.status == "failed"
+        assert "llm down" in response.error_message
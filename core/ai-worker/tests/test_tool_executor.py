@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Parallel Tool Executor Tests
+Week 7 Implementation: Concurrent Tool Calls within one Agent Step
+
+This module tests concurrent execution, per-tool limits, dependencies and
+ordering for batches of tool calls, and the wrappers' tool_calls context.
+"""
+
+import time
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from frameworks.tool_executor import ParallelToolExecutor, ToolCall, ToolExecutorConfig
+from frameworks.base_wrapper import AgentConfig, TaskRequest
+
+
+def slow_search(query):
+    time.sleep(0.1)
+    return f"results for {query}"
+
+
+class TestParallelToolExecutor:
+    """Test suite for ParallelToolExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_independent_calls_overlap(self):
+        """Wall time follows the slowest call, not the sum"""
+        executor = ParallelToolExecutor({"search": slow_search}.get)
+        calls = [ToolCall("search", [f"q{i}"]) for i in range(4)]
+
+        start = time.time()
+        results = await executor.run(calls)
+
+        assert time.time() - start < 0.3
+        assert [r.result for r in results] == [f"results for q{i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_per_tool_limit(self):
+        """No more than the tool's limit run at once"""
+        active = 0
+        peak = {"api": 0}
+
+        async def api_call(url):
+            nonlocal active
+            active += 1
+            peak["api"] = max(peak["api"], active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return url
+
+        executor = ParallelToolExecutor(
+            {"api": api_call}.get,
+            ToolExecutorConfig(tool_limits={"api": 2})
+        )
+        await executor.run([ToolCall("api", [f"/r{i}"]) for i in range(6)])
+        assert peak["api"] == 2
+
+    @pytest.mark.asyncio
+    async def test_saturated_tool_does_not_starve_others(self):
+        """Calls queued behind a tool's limit do not hold global slots"""
+        finished = []
+
+        async def slow(i):
+            await asyncio.sleep(0.1)
+            finished.append(f"slow{i}")
+
+        async def fast():
+            finished.append("fast")
+
+        executor = ParallelToolExecutor(
+            {"slow": slow, "fast": fast}.get,
+            ToolExecutorConfig(max_concurrency=2, tool_limits={"slow": 1})
+        )
+        await executor.run([ToolCall("slow", [i]) for i in range(3)] + [ToolCall("fast")])
+
+        assert finished[0] == "fast"
+
+    @pytest.mark.asyncio
+    async def test_dependencies_and_failures(self):
+        """Dependent calls wait; failures skip dependents and are reported per call"""
+        order = []
+
+        async def step(name):
+            await asyncio.sleep(0.01)
+            order.append(name)
+            if name == "bad":
+                raise RuntimeError("tool broke")
+            return name
+
+        executor = ParallelToolExecutor({"step": step}.get)
+        results = await executor.run([
+            ToolCall("step", ["first"]),
+            ToolCall("step", ["second"], depends_on=[0]),
+            ToolCall("step", ["bad"]),
+            ToolCall("step", ["after_bad"], depends_on=[2]),
+            ToolCall("missing"),
+        ])
+
+        assert order.index("first") < order.index("second")
+        assert [r.status for r in results] == ["completed", "completed", "failed", "skipped", "failed"]
+        assert results[2].error == "tool broke"
+        assert "Unknown tool" in results[4].error
+
+    @pytest.mark.asyncio
+    async def test_forward_dependencies_are_rejected(self):
+        """Calls may only depend on earlier calls"""
+        executor = ParallelToolExecutor({}.get)
+        with pytest.raises(ValueError):
+            await executor.run([ToolCall("a", depends_on=[1]), ToolCall("b")])
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Slow calls time out individually"""
+        async def hang():
+            await asyncio.sleep(1)
+
+        executor = ParallelToolExecutor({"hang": hang}.get, ToolExecutorConfig(timeout=0.05))
+        results = await executor.run([ToolCall("hang")])
+        assert results[0].status == "timeout"
+
+    def test_from_dict(self):
+        """Payload entries accept 'tool' and scalar args"""
+        call = ToolCall.from_dict({"tool": "web_search", "args": "agents", "depends_on": 0})
+        assert call.name == "web_search"
+        assert call.args == ["agents"]
+        assert call.depends_on == [0]
+
+
+class TestWrapperToolCalls:
+    """Wrappers run context['tool_calls'] before the model call"""
+
+    @pytest.mark.asyncio
+    async def test_autogen_tool_calls(self):
+        """AutoGen resolves tools by capability and feeds results into the task"""
+        from frameworks.autogen_wrapper import AutoGenAgentWrapper
+
+        wrapper = AutoGenAgentWrapper(AgentConfig(
+            name="tool_agent",
+            description="Test agent",
+            capabilities=["calculations", "web_search"]
+        ))
+        wrapper.is_initialized = True
+        wrapper.assistant_agent = {"name": "tool_agent"}
+        await wrapper._setup_capabilities()
+        wrapper._execute_conversation_task = AsyncMock(return_value="done")
+
+        response = await wrapper.execute(TaskRequest(
+            task="Compare",
+            context={"tool_calls": [
+                {"name": "calculations", "args": ["6 * 7"]},
+                {"name": "web_search", "args": ["agents"]}
+            ]}
+        ))
+
+        assert response.status == "completed"
+        prompt = wrapper._execute_conversation_task.call_args[0][0]
+        assert "[1] calculations: AutoGen calculation result: 42" in prompt
+        assert "[2] web_search: AutoGen web search results for: agents" in prompt
+        assert [c["status"] for c in response.metadata["tool_calls"]] == ["completed", "completed"]
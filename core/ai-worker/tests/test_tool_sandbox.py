@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+AgentOS AI Worker - Tool Sandbox Tests
+Week 7 Implementation: Process-pool Isolation for CPU-heavy Tools
+
+This module tests safe expression evaluation, the in-thread fast path and
+the process-pool sandbox's CPU, wall-clock and result-size limits.
+"""
+
+import time
+import pytest
+
+from frameworks.tool_sandbox import (
+    ToolSandbox, SandboxConfig, ToolTimeoutError, ToolResultTooLargeError,
+    evaluate_expression, text_statistics, format_text_analysis, get_tool_sandbox
+)
+from frameworks import tool_sandbox
+
+
+def spin(seconds):
+    """Burn CPU in Python bytecode"""
+    deadline = time.process_time() + seconds
+    count = 0
+    while time.process_time() < deadline:
+        count += 1
+    return count
+
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return "slept"
+
+
+def repeat(text, times):
+    return text * times
+
+
+@pytest.fixture(scope="module")
+def sandbox():
+    sandbox = ToolSandbox(SandboxConfig(max_workers=1, wall_timeout=10.0, cpu_time_limit=1))
+    sandbox.warm()
+    yield sandbox
+    sandbox.shutdown()
+
+
+class TestExpressionEvaluation:
+    """Test suite for evaluate_expression"""
+
+    def test_arithmetic_and_functions(self):
+        """Operators and math functions are supported"""
+        assert evaluate_expression("2 + 3 * 4") == 14
+        assert evaluate_expression("sqrt(16) + abs(-2)") == 6.0
+        assert evaluate_expression("7 // 2 + 7 % 2") == 4
+
+    def test_names_are_rejected(self):
+        """Only whitelisted names may be used"""
+        with pytest.raises(ValueError, match="not allowed"):
+            evaluate_expression("__import__('os')")
+
+    def test_huge_powers_are_refused(self):
+        """Integer powers that would take minutes are refused up front"""
+        with pytest.raises(ValueError, match="Exponent too large"):
+            evaluate_expression("9 ** 9 ** 9")
+
+    def test_text_statistics(self):
+        """Text statistics and the shared formatter"""
+        assert text_statistics("One two.\nThree!")["words"] == 3
+        assert format_text_analysis("AutoGen", "a b c") == "AutoGen text analysis: 5 characters, 3 words"
+
+
+class TestToolSandbox:
+    """Test suite for ToolSandbox"""
+
+    def test_call_runs_in_worker(self, sandbox):
+        """Picklable functions run in the pool and return their result"""
+        assert sandbox.call(evaluate_expression, "2 ** 10") == 1024
+        assert sandbox.get_statistics()["running"]
+
+    def test_cpu_limit(self, sandbox):
+        """CPU-bound calls past cpu_time_limit are stopped in the worker"""
+        recycles = sandbox.recycles
+        with pytest.raises(ToolTimeoutError, match="CPU"):
+            sandbox.call(spin, 30)
+        # The worker survived; no recycle was needed
+        assert sandbox.recycles == recycles
+        assert sandbox.call(evaluate_expression, "1 + 1") == 2
+
+    def test_wall_timeout_recycles_pool(self, sandbox):
+        """Calls past wall_timeout fail fast and the pool is replaced"""
+        sandbox.config.wall_timeout = 0.5
+        try:
+            start = time.time()
+            with pytest.raises(ToolTimeoutError, match="wall-clock"):
+                sandbox.call(sleep_for, 30)
+            assert time.time() - start < 5
+            assert sandbox.recycles >= 1
+        finally:
+            sandbox.config.wall_timeout = 10.0
+        assert sandbox.call(sleep_for, 0) == "slept"
+
+    def test_result_size_limit(self, sandbox):
+        """Oversized results are rejected in the worker"""
+        sandbox.config.max_result_bytes = 1000
+        try:
+            with pytest.raises(ToolResultTooLargeError):
+                sandbox.call(repeat, "x", 10_000)
+        finally:
+            sandbox.config.max_result_bytes = 64 * 1024
+
+    def test_disabled_sandbox_runs_inline(self):
+        """With the sandbox disabled, calls run on the calling thread"""
+        sandbox = ToolSandbox(SandboxConfig(enabled=False))
+        assert sandbox.call(repeat, "ab", 2) == "abab"
+        assert sandbox.get_statistics()["running"] is False
+        assert sandbox.inline_calls == 1
+
+
+class TestSandboxedTools:
+    """Routing of the shared calculator and text tools"""
+
+    def test_cheap_inputs_stay_inline(self, monkeypatch):
+        """Short expressions and small texts do not touch the pool"""
+        sandbox = ToolSandbox(SandboxConfig())
+        monkeypatch.setattr(tool_sandbox, "_sandbox_instance", sandbox)
+
+        assert tool_sandbox.calculate("1 + 2") == 3
+        assert tool_sandbox.analyze_text("hello world")["words"] == 2
+        assert sandbox.inline_calls == 2
+        assert sandbox.sandboxed_calls == 0
+        assert get_tool_sandbox() is sandbox
+
+    def test_heavy_inputs_use_the_sandbox(self, monkeypatch, sandbox):
+        """Powers and large texts are routed to the pool"""
+        monkeypatch.setattr(tool_sandbox, "_sandbox_instance", sandbox)
+        calls = sandbox.sandboxed_calls
+
+        assert tool_sandbox.calculate("2 ** 8") == 256
+        assert tool_sandbox.analyze_text("word " * 1000)["words"] == 1000
+        assert sandbox.sandboxed_calls == calls + 2
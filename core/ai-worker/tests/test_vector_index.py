@@ -0,0 +1,185 @@
+"""
+Tests for the in-process vector index
+Week 7: Memory System Performance
+
+This module tests the local embedders, the NumPy vector index and the
+vector-indexed fallback search of Mem0MemoryEngine.
+"""
+
+import time
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from local_embeddings import HashingEmbedder, create_local_embedder
+from vector_index import VectorIndex, create_vector_index, FAISS_AVAILABLE
+from mem0_memory_engine import Mem0MemoryEngine, MemoryConfig, FrameworkType
+
+
+@pytest.fixture
+def embedder():
+    return HashingEmbedder(dim=256)
+
+
+@pytest.fixture
+def engine(fake_async_redis):
+    """Fallback-mode engine on an in-memory Redis"""
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine()
+    engine.redis = fake_async_redis
+    return engine
+
+
+class TestHashingEmbedder:
+    """Test suite for the dependency-free embedder"""
+
+    def test_rows_are_normalized_and_stable(self, embedder):
+        """Embeddings are unit length and deterministic"""
+        vectors = embedder.embed(["Agents plan tasks", ""])
+        assert vectors.shape == (2, 256)
+        assert vectors.dtype == np.float32
+        assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+        assert np.allclose(vectors[0], embedder.embed(["agents  PLAN tasks"])[0])
+
+    def test_related_text_scores_higher(self, embedder):
+        """Shared words and word forms raise cosine similarity"""
+        query, related, unrelated = embedder.embed(["deploy agents", "Deploying the agent fleet", "Quarterly budget"])
+        assert related @ query > unrelated @ query
+
+    def test_factory_falls_back_to_hashing(self):
+        """Unknown models fall back when sentence-transformers is missing"""
+        with patch('local_embeddings.SENTENCE_TRANSFORMERS_AVAILABLE', False):
+            assert create_local_embedder("all-MiniLM-L6-v2").name == "hashing"
+        assert create_local_embedder().name == "hashing"
+
+
+class TestVectorIndex:
+    """Test suite for the NumPy index"""
+
+    def test_search_ranks_and_filters(self, embedder):
+        """Top-k respects user and framework filters"""
+        index = VectorIndex(embedder.dim, initial_capacity=2)
+        texts = ["python agents", "python tools", "python agents too", "cooking recipes"]
+        index.add(["a", "b", "c", "d"], embedder.embed(texts),
+                  ["alice", "alice", "bob", "alice"], ["langchain", "crewai", "langchain", "langchain"])
+
+        query = embedder.embed(["python agents"])[0]
+        assert [hit[0] for hit in index.search(query, 2, user_id="alice")] == ["a", "b"]
+        assert [hit[0] for hit in index.search(query, 5, user_id="alice", framework="crewai")] == ["b"]
+        assert index.search(query, 5, user_id="carol") == []
+        assert index.search(query, 5, user_id="alice", min_score=0.99)[0][0] == "a"
+
+    def test_remove_and_replace(self, embedder):
+        """Removal keeps the remaining rows addressable; re-adding replaces"""
+        index = VectorIndex(embedder.dim)
+        ids = [f"m{i}" for i in range(5)]
+        index.add(ids, embedder.embed([f"note {i}" for i in range(5)]), ["u"] * 5, [None] * 5)
+
+        assert index.remove(["m1", "missing"]) == 1
+        index.add(["m4"], embedder.embed(["rewritten entry"]), ["u"], [None])
+
+        assert len(index) == 4
+        assert "m1" not in index
+        top = index.search(embedder.embed(["rewritten entry"])[0], 1)
+        assert top[0][0] == "m4"
+        assert index.search(embedder.embed(["note 3"])[0], 1)[0][0] == "m3"
+
+    def test_expired_rows_are_skipped(self, embedder):
+        """Rows past their expiry are invisible to search and listing"""
+        index = VectorIndex(embedder.dim)
+        index.add(["old", "new"], embedder.embed(["note", "note"]), ["u", "u"], [None, None],
+                  [time.time() - 1, time.time() + 60])
+
+        assert [hit[0] for hit in index.search(embedder.embed(["note"])[0], 5)] == ["new"]
+        assert index.recent(5) == ["new"]
+
+    def test_expired_rows_are_evicted(self, embedder):
+        """Expired rows are removed, so the index shrinks instead of growing forever"""
+        index = VectorIndex(embedder.dim)
+        now = time.time()
+        index.add([f"m{i}" for i in range(4)], embedder.embed([f"note {i}" for i in range(4)]),
+                  ["u"] * 4, [None] * 4, [now - 1, now - 1, now + 60, now + 120])
+
+        index.search(embedder.embed(["note"])[0], 5)
+        assert len(index) == 2
+        assert "m0" not in index
+
+        assert index.evict_expired(now + 90) == 1
+        assert len(index) == 1
+        assert index.evict_expired(now + 90) == 0
+
+    def test_numpy_backend(self):
+        """Explicit numpy backend never uses FAISS"""
+        assert create_vector_index(8, "numpy").backend == "numpy"
+        expected = "faiss" if FAISS_AVAILABLE else "numpy"
+        assert create_vector_index(8, "faiss").backend == expected
+
+
+class TestIndexedFallbackSearch:
+    """Mem0MemoryEngine fallback search through the vector index"""
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_scan(self, engine, fake_async_redis):
+        """After the first load, a query is one MGET of the hits"""
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+        await engine.store_memory("Weekly grocery list", FrameworkType.LANGCHAIN, "alice")
+        await engine.store_memory("Agents plan trips", FrameworkType.LANGCHAIN, "bob")
+        await engine._search_fallback_memories("warm up", "alice", None, 5)
+        fake_async_redis.round_trips = 0
+
+        memories = await engine._search_fallback_memories("planning agents", "alice", None, 5)
+
+        assert memories[0]["content"] == "Agents plan tasks"
+        assert all(m["metadata"]["user_id"] == "alice" for m in memories)
+        assert memories[0]["score"] > 0
+        assert fake_async_redis.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_first_search_loads_existing_records(self, engine):
+        """Records written before the engine started are indexed on first use"""
+        await engine._store_fallback_memory(
+            "old", "Crew roles are assigned", {"framework": "crewai", "user_id": "alice"}
+        )
+
+        memories = await engine.retrieve_memories("roles", "alice", FrameworkType.CREWAI)
+
+        assert [m["id"] for m in memories] == ["old"]
+        assert len(engine.fallback_index) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_hits_are_dropped(self, engine, fake_async_redis):
+        """Records that expired in Redis are removed from the index lazily"""
+        memory_id = await engine.store_memory("Agents forget", FrameworkType.AUTOGEN, "alice")
+        await engine._search_fallback_memories("agents", "alice", None, 5)
+        fake_async_redis.expire_now(f"fallback_memory:{memory_id}")
+
+        assert await engine._search_fallback_memories("agents", "alice", None, 5) == []
+        assert memory_id not in engine.fallback_index
+
+    @pytest.mark.asyncio
+    async def test_empty_query_lists_framework_memories(self, engine):
+        """Framework listing uses the index without a query vector"""
+        result = await engine.store_memories([
+            {"content": f"step {i}", "framework": "swarms", "user_id": "alice"} for i in range(3)
+        ] + [{"content": "other", "framework": "crewai", "user_id": "alice"}])
+
+        memories = await engine.get_framework_memories(FrameworkType.SWARMS, "alice", limit=10)
+
+        assert sorted(m["id"] for m in memories) == sorted(result.memory_ids[:3])
+
+    @pytest.mark.asyncio
+    async def test_scan_mode_skips_index(self, fake_async_redis):
+        """fallback_search="scan" keeps the keyword scan"""
+        with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+            engine = Mem0MemoryEngine(MemoryConfig(fallback_search="scan"))
+        engine.redis = fake_async_redis
+        await engine.store_memory("Agents plan tasks", FrameworkType.LANGCHAIN, "alice")
+
+        memories = await engine._search_fallback_memories("agents", "alice", None, 5)
+
+        assert [m["content"] for m in memories] == ["Agents plan tasks"]
+        assert engine.fallback_index is None
@@ -0,0 +1,228 @@
+"""
+Tests for write-behind memory stores
+Week 7: Memory System Performance
+
+This module tests the durable write queue, the retrying worker pool and
+Mem0MemoryEngine's write-behind mode: immediate IDs, reads of unflushed
+writes and ID stability after the flush.
+"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'memory'))
+
+from write_behind import WriteBehindQueue, WriteBehindWriter, DEAD
+from mem0_memory_engine import Mem0MemoryEngine, MemoryConfig, FrameworkType
+
+
+def make_engine(fake_async_redis, mem0=None, **config):
+    with patch('mem0_memory_engine.MEM0_AVAILABLE', False):
+        engine = Mem0MemoryEngine(MemoryConfig(write_behind=True, **config))
+    engine.redis = fake_async_redis
+    engine.memory = mem0
+    return engine
+
+
+class TestWriteBehindQueue:
+    """Test suite for the durable queue"""
+
+    def test_survives_restart(self, tmp_path):
+        """Pending writes in a queue file are there after reopening"""
+        path = str(tmp_path / "writes.db")
+        queue = WriteBehindQueue(path)
+        queue.put_many([("a", {"content": "one"}), ("b", {"content": "two"})])
+        queue.close()
+
+        reopened = WriteBehindQueue(path)
+        assert reopened.count() == 2
+        assert reopened.get("b") == {"content": "two"}
+        assert [record_id for record_id, _, _ in reopened.due(10, {"a"})] == ["b"]
+        reopened.close()
+
+
+class TestWriteBehindWriter:
+    """Test suite for the worker pool"""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_retries(self):
+        """Failed writes are retried with backoff; successes are removed"""
+        calls = []
+
+        async def flush(payloads):
+            calls.append([payload["n"] for payload in payloads])
+            # Write 2 fails on its first attempt only
+            return [RuntimeError("busy") if payload["n"] == 2 and len(calls) == 1 else None for payload in payloads]
+
+        writer = WriteBehindWriter(WriteBehindQueue(), flush, workers=1, batch_size=10, retry_base=0.01)
+        writer.submit_many([(f"m{n}", {"n": n}) for n in range(4)])
+
+        assert await writer.drain(timeout=5)
+        await writer.stop()
+
+        assert calls[0] == [0, 1, 2, 3]
+        assert calls[1] == [2]
+        assert writer.stats["flushed"] == 4
+        assert writer.stats["retried"] == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """A write that keeps failing is set aside, not retried forever"""
+        async def flush(payloads):
+            return [ValueError("bad record")] * len(payloads)
+
+        queue = WriteBehindQueue()
+        writer = WriteBehindWriter(queue, flush, workers=2, max_attempts=2, retry_base=0.01)
+        writer.submit("m1", {"n": 1})
+
+        assert await writer.drain(timeout=5)
+        await writer.stop()
+
+        assert queue.count(DEAD) == 1
+        assert writer.get_statistics()["dead_letters"] == 1
+
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_flush_is_not_retried(self):
+        """A write cancelled while in flight is tombstoned and dropped, even if its flush fails"""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def flush(payloads):
+            started.set()
+            await release.wait()
+            return [RuntimeError("busy")] * len(payloads)
+
+        writer = WriteBehindWriter(WriteBehindQueue(), flush, workers=1, retry_base=0.01)
+        writer.submit("m1", {"n": 1})
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+        assert writer.cancel("m1") is True
+        assert writer.is_cancelled("m1")
+        release.set()
+
+        assert await writer.drain(timeout=5)
+        await writer.stop()
+        assert not writer.is_cancelled("m1")
+        assert writer.stats["retried"] == 0
+
+
+class TestEngineWriteBehind:
+    """Mem0MemoryEngine with config.write_behind"""
+
+    @pytest.mark.asyncio
+    async def test_store_returns_before_mem0_add(self, fake_async_redis):
+        """store_memory does not wait for mem0; reads see the queued write"""
+        release = threading.Event()
+        mem0 = Mock()
+
+        def slow_add(messages, user_id, agent_id, metadata):
+            release.wait(5)
+            return {"id": "mem0_abc"}
+
+        mem0.add.side_effect = slow_add
+        mem0.get.side_effect = lambda memory_id, user_id=None: (
+            {"id": memory_id, "content": "from mem0"} if memory_id == "mem0_abc" else None
+        )
+        engine = make_engine(fake_async_redis, mem0)
+
+        memory_id = await asyncio.wait_for(
+            engine.store_memory("Remember the deadline", FrameworkType.CREWAI, "alice"), timeout=1
+        )
+
+        assert memory_id.startswith("wb_")
+        pending = await engine.get_memory_by_id(memory_id, "alice")
+        assert pending["content"] == "Remember the deadline"
+        assert pending["pending"] is True
+
+        release.set()
+        assert await engine.flush_writes(timeout=5)
+        # The returned ID keeps working once mem0 has assigned its own
+        assert (await engine.get_memory_by_id(memory_id, "alice"))["content"] == "from mem0"
+        assert await engine.delete_memory(memory_id, "alice") is True
+        mem0.delete.assert_called_once_with("mem0_abc", user_id="alice")
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_fallback_flush_is_searchable(self, fake_async_redis):
+        """Flushed fallback writes land in Redis and the search indexes"""
+        engine = make_engine(fake_async_redis, fallback_search="keyword")
+
+        result = await engine.store_memories([
+            {"content": f"sprint note {i}", "framework": "langchain", "user_id": "alice"} for i in range(5)
+        ])
+        assert result.stored == 5
+        memories = await engine.get_memories(result.memory_ids)
+        assert [m["content"] for m in memories] == [f"sprint note {i}" for i in range(5)]
+
+        assert await engine.flush_writes(timeout=5)
+        assert f"fallback_memory:{result.memory_ids[0]}" in fake_async_redis.data
+        assert len(await engine.retrieve_memories("sprint", "alice")) == 5
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_before_flush_cancels_write(self, fake_async_redis):
+        """Deleting an unflushed memory drops the queued write"""
+        engine = make_engine(fake_async_redis)
+        engine.write_behind.start = Mock()  # keep the workers from flushing
+        engine.write_behind._wakeup = asyncio.Event()
+
+        memory_id = await engine.store_memory("scratch", FrameworkType.SWARMS, "alice")
+        assert await engine.delete_memory(memory_id, "alice") is True
+
+        assert engine.write_behind.queue.count() == 0
+        assert await engine.get_memories([memory_id]) == [None]
+
+    @pytest.mark.asyncio
+    async def test_pending_writes_resume_on_first_use(self, fake_async_redis, tmp_path):
+        """Writes a previous process left queued are flushed without a new submit"""
+        path = str(tmp_path / "writes.db")
+        crashed = make_engine(fake_async_redis, write_behind_path=path)
+        crashed.write_behind.start = Mock()  # the process dies before flushing
+        crashed.write_behind._wakeup = asyncio.Event()
+        result = await crashed.store_memories([
+            {"content": f"handoff {i}", "framework": "crewai", "user_id": "alice"} for i in range(3)
+        ])
+        crashed.write_behind.queue.close()
+
+        engine = make_engine(fake_async_redis, fallback_search="keyword", write_behind_path=path)
+        await engine.retrieve_memories("handoff", "alice")
+        for _ in range(500):
+            if engine.write_behind.queue.count() == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert engine.write_behind.queue.count() == 0
+        assert all(f"fallback_memory:{memory_id}" in fake_async_redis.data for memory_id in result.memory_ids)
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_during_flush_discards_write(self, fake_async_redis):
+        """Deleting a memory whose mem0 add is in flight undoes the add"""
+        adding, release = threading.Event(), threading.Event()
+        mem0 = Mock()
+
+        def slow_add(messages, user_id, agent_id, metadata):
+            adding.set()
+            release.wait(5)
+            return {"id": "mem0_abc"}
+
+        mem0.add.side_effect = slow_add
+        mem0.get.return_value = None
+        engine = make_engine(fake_async_redis, mem0)
+
+        memory_id = await engine.store_memory("Short-lived", FrameworkType.CREWAI, "alice")
+        await asyncio.get_running_loop().run_in_executor(None, adding.wait, 5)
+        assert await engine.delete_memory(memory_id, "alice") is True
+        assert await engine.get_memory_by_id(memory_id, "alice") is None
+        release.set()
+
+        assert await engine.flush_writes(timeout=5)
+        mem0.delete.assert_called_once_with("mem0_abc", user_id="alice")
+        assert f"memory_alias:{memory_id}" not in fake_async_redis.data
+        assert f"memory:{memory_id}" not in fake_async_redis.data
+        assert await engine.get_memories([memory_id]) == [None]
+        await engine.close()